@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from b2d_ventures.app.services import ArchiveService
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves old closed and rejected deals, with their investments, and past "
+        "meetings to the archive tables"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the rows that would be archived without moving them",
+        )
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=None,
+            help="Archive rows older than this many days (default: ARCHIVE_AFTER_DAYS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Deals or meetings moved per transaction (default: ARCHIVE_BATCH_SIZE)",
+        )
+
+    def handle(self, *args, **options):
+        report = ArchiveService.archive(
+            older_than_days=options["older_than_days"],
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+        )
+        action = "Would archive" if options["dry_run"] else "Archived"
+        self.stdout.write(
+            f"{action} {report['deals']} deals, {report['investments']} "
+            f"investments, {report['dataroom_accesses']} dataroom accesses and "
+            f"{report['meetings']} meetings"
+        )
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from b2d_ventures.app.models import Deal
+from b2d_ventures.app.services import DealImageService
+from b2d_ventures.app.services.deal_image_service import IMAGE_FIELDS
+
+
+class Command(BaseCommand):
+    help = "Generates responsive variants of deal images that do not have them"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--deal-id",
+            action="append",
+            dest="deal_ids",
+            help="Only process this deal (can be repeated)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate variants that are already up to date",
+        )
+
+    def handle(self, *args, **options):
+        has_image = Q()
+        for field in IMAGE_FIELDS:
+            has_image |= ~Q(**{field: ""}) & Q(**{f"{field}__isnull": False})
+        deals = Deal.objects.filter(has_image | ~Q(image_variants={}))
+        if options["deal_ids"]:
+            deals = deals.filter(id__in=options["deal_ids"])
+
+        processed = 0
+        for deal in deals.iterator():
+            if not DealImageService.needs_update(deal, options["force"]):
+                continue
+            fields = DealImageService.generate(deal.id, force=options["force"])
+            self.stdout.write(f"{deal.name}: {', '.join(fields) or 'cleaned up'}")
+            processed += 1
+        self.stdout.write(f"Generated image variants for {processed} deals")
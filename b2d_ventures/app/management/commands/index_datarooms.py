@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from b2d_ventures.app.models import Deal
+from b2d_ventures.app.services import DataroomIndexService
+
+
+class Command(BaseCommand):
+    help = "Extracts page text and previews of datarooms that are not indexed"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--deal-id",
+            action="append",
+            dest="deal_ids",
+            help="Only process this deal (can be repeated)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-index datarooms that are already up to date",
+        )
+
+    def handle(self, *args, **options):
+        has_dataroom = ~Q(dataroom="") & Q(dataroom__isnull=False)
+        deals = Deal.objects.filter(
+            has_dataroom | Q(dataroom_document__isnull=False)
+        ).select_related("dataroom_document")
+        if options["deal_ids"]:
+            deals = deals.filter(id__in=options["deal_ids"])
+
+        processed = 0
+        for deal in deals.iterator():
+            if not DataroomIndexService.needs_update(deal, options["force"]):
+                continue
+            document = DataroomIndexService.index(deal.id, force=options["force"])
+            if document is None:
+                self.stdout.write(f"{deal.name}: cleaned up")
+            elif document.status == "failed":
+                self.stdout.write(f"{deal.name}: failed ({document.error})")
+            else:
+                self.stdout.write(f"{deal.name}: {document.page_count} pages")
+            processed += 1
+        self.stdout.write(f"Indexed datarooms of {processed} deals")
@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+
+from b2d_ventures.app.services import CounterReconciliationService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the raised, invested and investor counters from the "
+        "investments and repairs the ones that drifted"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the drifted counters without repairing them",
+        )
+        parser.add_argument(
+            "--startup-id",
+            action="append",
+            dest="startup_ids",
+            help="Only process this startup, its deals and investors (can be repeated)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Startups or investors reconciled per transaction",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows written per bulk_update query",
+        )
+
+    def handle(self, *args, **options):
+        report = CounterReconciliationService.reconcile(
+            startup_ids=options["startup_ids"],
+            chunk_size=options["chunk_size"],
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+        )
+        for drift in report["drifts"]:
+            self.stdout.write(
+                f"{drift['model']} {drift['id']} {drift['field']}: "
+                f"{drift['stored']} -> {drift['expected']}"
+            )
+        action = "would repair" if options["dry_run"] else "repaired"
+        self.stdout.write(
+            f"Checked {report['startups']} startups, {report['deals']} deals and "
+            f"{report['investors']} investors; {action} {len(report['drifts'])} "
+            f"counters"
+        )
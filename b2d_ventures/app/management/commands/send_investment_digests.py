@@ -0,0 +1,42 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from b2d_ventures.app.services import InvestmentDigestService
+
+
+class Command(BaseCommand):
+    help = "Emails startups a digest of their new investments"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=settings.INVESTMENT_DIGEST_TOP_INVESTMENTS,
+            help="Number of largest investments listed in each digest",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep sending a digest every interval instead of exiting",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.INVESTMENT_DIGEST_INTERVAL_SECONDS,
+            help="Seconds between digests (with --loop)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            results = InvestmentDigestService.send_digests(options["top"])
+            if results["notifications"]:
+                self.stdout.write(
+                    f"Sent {results['startups']} digests covering "
+                    f"{results['notifications']} investments, "
+                    f"{results['failed']} failed"
+                )
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
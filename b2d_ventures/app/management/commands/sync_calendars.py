@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from b2d_ventures.app.services import CalendarSyncService
+
+
+class Command(BaseCommand):
+    help = "Pulls meeting changes from investors' Google Calendars"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep syncing instead of exiting after one pass",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=300.0,
+            help="Seconds to sleep between passes (with --loop)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            totals = CalendarSyncService.sync_all()
+            self.stdout.write(
+                f"Synced {totals['users']} calendars ({totals['errors']} errors): "
+                f"updated {totals['updated']}, cancelled {totals['cancelled']} meetings"
+            )
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
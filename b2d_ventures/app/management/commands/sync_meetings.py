@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from b2d_ventures.app.services import MeetingSyncService
+
+
+class Command(BaseCommand):
+    help = "Books meetings waiting for Google Calendar sync"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=20,
+            help="Number of meetings claimed per batch",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new meetings instead of exiting when idle",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep between polls when idle (with --loop)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            results = MeetingSyncService.process_pending(options["batch_size"])
+            processed = sum(results.values())
+            if processed:
+                self.stdout.write(
+                    f"Confirmed {results['confirmed']}, failed {results['failed']}, "
+                    f"retrying {results['pending_sync']}"
+                )
+            if processed < options["batch_size"]:
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
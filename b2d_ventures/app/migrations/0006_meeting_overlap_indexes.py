@@ -0,0 +1,84 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:56
+
+import logging
+
+from django.db import migrations, models
+
+EXCLUSION_CONSTRAINTS = {
+    "meeting_investor_no_overlap": "investor_id",
+    "meeting_startup_no_overlap": "startup_id",
+}
+
+
+def add_exclusion_constraints(apps, schema_editor):
+    """
+    Forbid overlapping meetings per investor and per startup on PostgreSQL.
+
+    Other backends rely on the application-level overlap check only. The
+    constraints are skipped, with a warning, when the table already holds
+    overlapping meetings or btree_gist is not available.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'btree_gist'"
+        )
+        if cursor.fetchone() is None:
+            logging.warning("btree_gist is not available; skipping meeting constraints")
+            return
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+        for name, column in EXCLUSION_CONSTRAINTS.items():
+            cursor.execute(f"""
+                SELECT 1 FROM app_meeting a JOIN app_meeting b
+                  ON a.{column} = b.{column} AND a.id < b.id
+                 AND a.start_time < b.end_time AND b.start_time < a.end_time
+                LIMIT 1
+                """)
+            if cursor.fetchone() is not None:
+                logging.warning(f"Overlapping meetings exist; skipping {name}")
+                continue
+            schema_editor.execute(f"""
+                ALTER TABLE app_meeting ADD CONSTRAINT {name}
+                EXCLUDE USING gist (
+                    {column} WITH =,
+                    tstzrange(start_time, end_time) WITH &&
+                )
+                WHERE (start_time IS NOT NULL AND end_time IS NOT NULL)
+                """)
+
+
+def remove_exclusion_constraints(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in EXCLUSION_CONSTRAINTS:
+        schema_editor.execute(
+            f"ALTER TABLE app_meeting DROP CONSTRAINT IF EXISTS {name}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0005_alter_user_role"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="meeting",
+            index=models.Index(
+                fields=["investor", "start_time", "end_time"],
+                name="meeting_investor_time_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="meeting",
+            index=models.Index(
+                fields=["startup", "start_time", "end_time"],
+                name="meeting_startup_time_idx",
+            ),
+        ),
+        migrations.RunPython(add_exclusion_constraints, remove_exclusion_constraints),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:01
+
+from django.db import migrations, models
+
+EXCLUSION_CONSTRAINTS = {
+    "meeting_investor_no_overlap": "investor_id",
+    "meeting_startup_no_overlap": "startup_id",
+}
+ACTIVE_MEETING = "start_time IS NOT NULL AND end_time IS NOT NULL"
+
+
+def replace_exclusion_constraints(schema_editor, condition):
+    """
+    Recreate the PostgreSQL overlap constraints with a new WHERE condition.
+
+    Only constraints that exist (see 0006) are replaced.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for name, column in EXCLUSION_CONSTRAINTS.items():
+            cursor.execute("SELECT 1 FROM pg_constraint WHERE conname = %s", [name])
+            if cursor.fetchone() is None:
+                continue
+            schema_editor.execute(f"ALTER TABLE app_meeting DROP CONSTRAINT {name}")
+            schema_editor.execute(f"""
+                ALTER TABLE app_meeting ADD CONSTRAINT {name}
+                EXCLUDE USING gist (
+                    {column} WITH =,
+                    tstzrange(start_time, end_time) WITH &&
+                )
+                WHERE ({condition})
+                """)
+
+
+def ignore_failed_meetings(apps, schema_editor):
+    replace_exclusion_constraints(
+        schema_editor, f"{ACTIVE_MEETING} AND status <> 'failed'"
+    )
+
+
+def include_failed_meetings(apps, schema_editor):
+    replace_exclusion_constraints(schema_editor, ACTIVE_MEETING)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0006_meeting_overlap_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="meeting",
+            name="last_sync_error",
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="meeting",
+            name="next_sync_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="meeting",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending_sync", "Pending sync"),
+                    ("confirmed", "Confirmed"),
+                    ("failed", "Failed"),
+                ],
+                default="confirmed",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="meeting",
+            name="sync_attempts",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="meeting",
+            index=models.Index(
+                fields=["status", "next_sync_at"], name="meeting_sync_queue_idx"
+            ),
+        ),
+        migrations.RunPython(ignore_failed_meetings, include_failed_meetings),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:04
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+from b2d_ventures.app.migrations._meeting_constraints import (
+    ACTIVE_MEETING,
+    replace_exclusion_constraints,
+)
+
+
+def ignore_cancelled_meetings(apps, schema_editor):
+    replace_exclusion_constraints(
+        schema_editor,
+        f"{ACTIVE_MEETING} AND status NOT IN ('failed', 'cancelled')",
+    )
+
+
+def include_cancelled_meetings(apps, schema_editor):
+    replace_exclusion_constraints(
+        schema_editor, f"{ACTIVE_MEETING} AND status <> 'failed'"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0007_meeting_sync_status"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="meeting",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending_sync", "Pending sync"),
+                    ("confirmed", "Confirmed"),
+                    ("failed", "Failed"),
+                    ("cancelled", "Cancelled"),
+                ],
+                default="confirmed",
+                max_length=20,
+            ),
+        ),
+        migrations.CreateModel(
+            name="CalendarSyncState",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("calendar_id", models.CharField(default="primary", max_length=255)),
+                ("sync_token", models.TextField(blank=True, null=True)),
+                ("last_synced_at", models.DateTimeField(blank=True, null=True)),
+                ("last_full_sync_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="calendar_sync_state",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(ignore_cancelled_meetings, include_cancelled_meetings),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:20
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0008_calendar_sync_state"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="startup",
+            name="investment_digest_enabled",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.CreateModel(
+            name="InvestmentNotification",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "net_investment",
+                    models.DecimalField(decimal_places=2, max_digits=15),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "deal",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="investment_notifications",
+                        to="app.deal",
+                    ),
+                ),
+                (
+                    "investment",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notification",
+                        to="app.investment",
+                    ),
+                ),
+                (
+                    "startup",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="investment_notifications",
+                        to="app.startup",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["sent_at", "startup", "created_at"],
+                        name="notification_pending_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:24
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0009_investment_digest"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataroomAccessLog",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("status_code", models.PositiveSmallIntegerField()),
+                ("range_start", models.BigIntegerField(blank=True, null=True)),
+                ("range_end", models.BigIntegerField(blank=True, null=True)),
+                ("ip_address", models.GenericIPAddressField(blank=True, null=True)),
+                (
+                    "user_agent",
+                    models.CharField(blank=True, default="", max_length=255),
+                ),
+                (
+                    "accessed_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "deal",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dataroom_accesses",
+                        to="app.deal",
+                    ),
+                ),
+                (
+                    "investor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dataroom_accesses",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["deal", "accessed_at"], name="dataroom_access_deal_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0010_dataroom_access_log"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="deal",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:38
+
+import b2d_ventures.app.models.deal
+import b2d_ventures.utils.storage
+import django.core.validators
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0011_deal_image_variants"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="deal",
+            name="dataroom",
+            field=models.FileField(
+                blank=True,
+                null=True,
+                storage=b2d_ventures.utils.storage.raw_media_storage,
+                upload_to=b2d_ventures.app.models.deal.dataroom_upload_path,
+                validators=[
+                    django.core.validators.FileExtensionValidator(
+                        allowed_extensions=["pdf"]
+                    )
+                ],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="deal",
+            name="image_background",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                storage=b2d_ventures.utils.storage.media_storage,
+                upload_to=b2d_ventures.app.models.deal.deal_image_upload_path,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="deal",
+            name="image_content",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                storage=b2d_ventures.utils.storage.media_storage,
+                upload_to=b2d_ventures.app.models.deal.deal_image_upload_path,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="deal",
+            name="image_logo",
+            field=models.ImageField(
+                blank=True,
+                null=True,
+                storage=b2d_ventures.utils.storage.media_storage,
+                upload_to=b2d_ventures.app.models.deal.deal_image_upload_path,
+            ),
+        ),
+        migrations.CreateModel(
+            name="StoredBlob",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("backend", models.CharField(max_length=32)),
+                ("sha256", models.CharField(max_length=64)),
+                ("name", models.CharField(max_length=255)),
+                ("size", models.BigIntegerField()),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["backend", "name"], name="stored_blob_name_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("backend", "sha256"), name="stored_blob_unique_hash"
+                    )
+                ],
+            },
+        ),
+    ]
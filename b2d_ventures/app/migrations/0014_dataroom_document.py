@@ -0,0 +1,84 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:50
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0013_dataroom_upload"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataroomDocument",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("source", models.CharField(max_length=255)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("complete", "Complete"), ("failed", "Failed")],
+                        default="complete",
+                        max_length=20,
+                    ),
+                ),
+                ("error", models.CharField(blank=True, default="", max_length=255)),
+                ("page_count", models.PositiveIntegerField(default=0)),
+                ("thumbnail", models.CharField(blank=True, default="", max_length=255)),
+                ("search_text", models.TextField(blank=True, default="")),
+                ("processed_at", models.DateTimeField()),
+                (
+                    "deal",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dataroom_document",
+                        to="app.deal",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="DataroomPage",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("number", models.PositiveIntegerField()),
+                ("text", models.TextField(blank=True, default="")),
+                (
+                    "document",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pages",
+                        to="app.dataroomdocument",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["number"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("document", "number"),
+                        name="dataroom_page_unique_number",
+                    )
+                ],
+            },
+        ),
+    ]
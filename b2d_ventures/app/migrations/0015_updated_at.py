@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0014_dataroom_document"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="deal",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="investment",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="meeting",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name="deal",
+            index=models.Index(
+                fields=["startup", "updated_at"], name="deal_startup_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="investment",
+            index=models.Index(
+                fields=["investor", "updated_at"], name="investment_investor_upd_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="investment",
+            index=models.Index(
+                fields=["deal", "updated_at"], name="investment_deal_upd_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="meeting",
+            index=models.Index(
+                fields=["investor", "updated_at"], name="meeting_investor_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="meeting",
+            index=models.Index(
+                fields=["startup", "updated_at"], name="meeting_startup_updated_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:19
+
+import b2d_ventures.app.models.abstract_model
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0015_updated_at"),
+    ]
+
+    # Only the Python-side default of the ids changes: existing UUIDv4 rows
+    # keep their ids and new rows get UUIDv7 ones. The columns are untouched,
+    # so no SQL is run, which also spares SQLite from rebuilding the tables.
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="investment",
+                    name="id",
+                    field=models.UUIDField(
+                        default=b2d_ventures.app.models.abstract_model.uuid7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="meeting",
+                    name="id",
+                    field=models.UUIDField(
+                        default=b2d_ventures.app.models.abstract_model.uuid7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+            ],
+        ),
+    ]
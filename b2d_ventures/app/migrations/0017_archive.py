@@ -0,0 +1,219 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:47
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0016_time_ordered_ids"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedDeal",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(editable=False, primary_key=True, serialize=False),
+                ),
+                ("name", models.CharField(default="", max_length=255)),
+                ("description", models.TextField(default="")),
+                ("content", models.TextField(default="")),
+                (
+                    "image_background",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                ("image_logo", models.CharField(blank=True, max_length=255, null=True)),
+                (
+                    "image_content",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                ("image_variants", models.JSONField(blank=True, default=dict)),
+                (
+                    "target_amount",
+                    models.DecimalField(decimal_places=2, default=0.0, max_digits=15),
+                ),
+                (
+                    "price_per_unit",
+                    models.DecimalField(decimal_places=2, default=0.0, max_digits=10),
+                ),
+                (
+                    "minimum_investment",
+                    models.DecimalField(decimal_places=2, default=0.0, max_digits=15),
+                ),
+                ("type", models.TextField(default="")),
+                (
+                    "amount_raised",
+                    models.DecimalField(decimal_places=2, default=0.0, max_digits=15),
+                ),
+                ("start_date", models.DateTimeField()),
+                ("end_date", models.DateTimeField()),
+                ("investor_count", models.PositiveIntegerField(default=0)),
+                ("dataroom", models.CharField(blank=True, max_length=255, null=True)),
+                ("status", models.CharField(max_length=20)),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "archived_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "startup",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_deals",
+                        to="app.startup",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArchivedDataroomAccess",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(editable=False, primary_key=True, serialize=False),
+                ),
+                ("status_code", models.PositiveSmallIntegerField()),
+                ("range_start", models.BigIntegerField(blank=True, null=True)),
+                ("range_end", models.BigIntegerField(blank=True, null=True)),
+                ("ip_address", models.GenericIPAddressField(blank=True, null=True)),
+                (
+                    "user_agent",
+                    models.CharField(blank=True, default="", max_length=255),
+                ),
+                ("accessed_at", models.DateTimeField()),
+                (
+                    "archived_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "investor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_dataroom_accesses",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "deal",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dataroom_accesses",
+                        to="app.archiveddeal",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArchivedInvestment",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(editable=False, primary_key=True, serialize=False),
+                ),
+                (
+                    "investment_amount",
+                    models.DecimalField(decimal_places=2, max_digits=15),
+                ),
+                ("investment_date", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "archived_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "deal",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="investments",
+                        to="app.archiveddeal",
+                    ),
+                ),
+                (
+                    "investor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_investments",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArchivedMeeting",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(editable=False, primary_key=True, serialize=False),
+                ),
+                ("title", models.CharField(max_length=255)),
+                ("description", models.TextField(null=True)),
+                ("start_time", models.DateTimeField(null=True)),
+                ("end_time", models.DateTimeField(null=True)),
+                ("investor_event_id", models.CharField(max_length=255, null=True)),
+                ("status", models.CharField(max_length=20)),
+                ("sync_attempts", models.PositiveIntegerField(default=0)),
+                ("last_sync_error", models.TextField(blank=True, null=True)),
+                ("next_sync_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "archived_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "investor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_meetings",
+                        to="app.investor",
+                    ),
+                ),
+                (
+                    "startup",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_meetings",
+                        to="app.startup",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-start_time"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="archiveddeal",
+            index=models.Index(
+                fields=["startup", "end_date"], name="archived_deal_startup_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archiveddeal",
+            index=models.Index(
+                fields=["archived_at"], name="archived_deal_archived_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedinvestment",
+            index=models.Index(
+                fields=["investor", "investment_date"],
+                name="archived_investment_inv_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedmeeting",
+            index=models.Index(
+                fields=["startup", "start_time"], name="archived_meeting_startup_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedmeeting",
+            index=models.Index(
+                fields=["investor", "start_time"], name="archived_meeting_investor_idx"
+            ),
+        ),
+    ]
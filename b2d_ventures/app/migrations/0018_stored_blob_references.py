@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:47
+
+from collections import Counter
+
+from django.db import migrations, models
+
+IMAGE_FIELDS = ("image_background", "image_logo", "image_content")
+
+
+def count_references(apps, schema_editor):
+    """Count the names deals, archived deals and previews hold per Cloudinary file."""
+    counts = Counter()
+    for model_name in ("Deal", "ArchivedDeal"):
+        deals = apps.get_model("app", model_name).objects.values_list(
+            *IMAGE_FIELDS, "dataroom", "image_variants"
+        )
+        for *images, dataroom, variants in deals.iterator():
+            names = [name for name in images if name]
+            for entry in (variants or {}).values():
+                for sizes in entry.values():
+                    if isinstance(sizes, dict):
+                        names.extend(sizes.values())
+            counts.update(("cloudinary_media", name) for name in names)
+            if dataroom:
+                counts["cloudinary_raw", dataroom] += 1
+    thumbnails = apps.get_model("app", "DataroomDocument").objects.exclude(
+        thumbnail=""
+    )
+    counts.update(
+        ("cloudinary_media", name)
+        for name in thumbnails.values_list("thumbnail", flat=True)
+    )
+
+    StoredBlob = apps.get_model("app", "StoredBlob")
+    blobs = list(StoredBlob.objects.filter(backend__startswith="cloudinary_"))
+    for blob in blobs:
+        # Files no record names any more are kept with one reference.
+        blob.references = max(counts[blob.backend, blob.name], 1)
+    StoredBlob.objects.bulk_update(blobs, ["references"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0017_archive"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="storedblob",
+            name="references",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.RunPython(count_references, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+"""
+Helpers for migrations that change the meeting overlap constraints.
+
+0007 keeps its own copy of these, as it was written before this module.
+"""
+
+EXCLUSION_CONSTRAINTS = {
+    "meeting_investor_no_overlap": "investor_id",
+    "meeting_startup_no_overlap": "startup_id",
+}
+ACTIVE_MEETING = "start_time IS NOT NULL AND end_time IS NOT NULL"
+
+
+def replace_exclusion_constraints(schema_editor, condition):
+    """
+    Recreate the PostgreSQL overlap constraints with a new WHERE condition.
+
+    Only constraints that exist (see 0006) are replaced.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for name, column in EXCLUSION_CONSTRAINTS.items():
+            cursor.execute("SELECT 1 FROM pg_constraint WHERE conname = %s", [name])
+            if cursor.fetchone() is None:
+                continue
+            schema_editor.execute(f"ALTER TABLE app_meeting DROP CONSTRAINT {name}")
+            schema_editor.execute(f"""
+                ALTER TABLE app_meeting ADD CONSTRAINT {name}
+                EXCLUDE USING gist (
+                    {column} WITH =,
+                    tstzrange(start_time, end_time) WITH &&
+                )
+                WHERE ({condition})
+                """)
@@ -5,3 +5,15 @@ from b2d_ventures.app.models.startup import Startup
 from b2d_ventures.app.models.deal import Deal
 from b2d_ventures.app.models.meeting import Meeting
 from b2d_ventures.app.models.investment import Investment
+from b2d_ventures.app.models.calendar_sync_state import CalendarSyncState
+from b2d_ventures.app.models.investment_notification import InvestmentNotification
+from b2d_ventures.app.models.dataroom_access_log import DataroomAccessLog
+from b2d_ventures.app.models.stored_blob import StoredBlob
+from b2d_ventures.app.models.dataroom_upload import DataroomUpload
+from b2d_ventures.app.models.dataroom_document import DataroomDocument, DataroomPage
+from b2d_ventures.app.models.archive import (
+    ArchivedDeal,
+    ArchivedInvestment,
+    ArchivedDataroomAccess,
+    ArchivedMeeting,
+)
@@ -1,6 +1,46 @@
+import secrets
+import threading
+import time
 import uuid
 from django.db import models
 
+_uuid7_lock = threading.Lock()
+_uuid7_last_ms = 0
+_uuid7_counter = 0
+
+
+def uuid7():
+    """
+    Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds and the next 12 a
+    counter, so IDs generated by one process are increasing even within a
+    millisecond or if the clock steps back. The last 62 bits are random.
+
+    :return: UUID
+    """
+    global _uuid7_last_ms, _uuid7_counter
+    with _uuid7_lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _uuid7_last_ms:
+            _uuid7_last_ms = now_ms
+            _uuid7_counter = 0
+        else:
+            _uuid7_counter += 1
+            if _uuid7_counter > 0xFFF:
+                # Borrow the next millisecond rather than wrap the counter.
+                _uuid7_last_ms += 1
+                _uuid7_counter = 0
+        timestamp, counter = _uuid7_last_ms, _uuid7_counter
+    value = (
+        (timestamp & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | secrets.randbits(62)
+    )
+    return uuid.UUID(int=value)
+
 
 class AbstractModel(models.Model):
     """Abstract model class for generate unique id for each model."""
@@ -15,3 +55,26 @@ class AbstractModel(models.Model):
     def __str__(self):
         """Unicode representation of Model."""
         return str(self.id)
+
+
+class TimeOrderedAbstractModel(AbstractModel):
+    """
+    Abstract model class with time-ordered UUIDv7 ids, for insert-heavy tables.
+
+    Random UUIDv4 keys land anywhere in the primary key index, so every
+    insert touches a different page. UUIDv7 keys start with their creation
+    time, so new rows are appended to the right edge of the index.
+
+    Migrating a model only changes the default of its id: the column is
+    still a UUID, existing UUIDv4 rows keep their ids and foreign keys, and
+    only rows created afterwards get UUIDv7 ids. No data migration is
+    needed. Do not rely on ordering by id, since the old random ids do not
+    sort by time; order by a timestamp column instead.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+
+    class Meta:
+        """Meta definition for Model."""
+
+        abstract = True
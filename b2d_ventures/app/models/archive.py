@@ -0,0 +1,139 @@
+from django.db import models
+from django.utils import timezone
+
+from b2d_ventures.app.models import Investor, Startup, User
+
+
+class ArchivedDeal(models.Model):
+    """
+    A closed or rejected deal moved out of the deal table, see ArchiveService.
+
+    Rows keep the id and column values of the deal. Images and the dataroom
+    stay in storage and only their names are kept.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    startup = models.ForeignKey(
+        Startup, on_delete=models.CASCADE, related_name="archived_deals"
+    )
+    name = models.CharField(max_length=255, default="")
+    description = models.TextField(default="")
+    content = models.TextField(default="")
+    image_background = models.CharField(max_length=255, null=True, blank=True)
+    image_logo = models.CharField(max_length=255, null=True, blank=True)
+    image_content = models.CharField(max_length=255, null=True, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True)
+    target_amount = models.DecimalField(max_digits=15, decimal_places=2, default=0.00)
+    price_per_unit = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    minimum_investment = models.DecimalField(
+        max_digits=15, decimal_places=2, default=0.00
+    )
+    type = models.TextField(default="")
+    amount_raised = models.DecimalField(max_digits=15, decimal_places=2, default=0.00)
+    start_date = models.DateTimeField()
+    end_date = models.DateTimeField()
+    investor_count = models.PositiveIntegerField(default=0)
+    dataroom = models.CharField(max_length=255, null=True, blank=True)
+    status = models.CharField(max_length=20)
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Archived deal: {self.name}"
+
+    class Meta:
+        app_label = "app"
+        indexes = [
+            models.Index(
+                fields=["startup", "end_date"], name="archived_deal_startup_idx"
+            ),
+            models.Index(fields=["archived_at"], name="archived_deal_archived_idx"),
+        ]
+
+
+class ArchivedInvestment(models.Model):
+    id = models.UUIDField(primary_key=True, editable=False)
+    deal = models.ForeignKey(
+        ArchivedDeal, on_delete=models.CASCADE, related_name="investments"
+    )
+    investor = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="archived_investments"
+    )
+    investment_amount = models.DecimalField(max_digits=15, decimal_places=2)
+    investment_date = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Archived investment: {self.deal_id} - ${self.investment_amount}"
+
+    class Meta:
+        app_label = "app"
+        indexes = [
+            models.Index(
+                fields=["investor", "investment_date"],
+                name="archived_investment_inv_idx",
+            ),
+        ]
+
+
+class ArchivedDataroomAccess(models.Model):
+    """Dataroom access log of an archived deal, kept for auditing."""
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    investor = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="archived_dataroom_accesses"
+    )
+    deal = models.ForeignKey(
+        ArchivedDeal, on_delete=models.CASCADE, related_name="dataroom_accesses"
+    )
+    status_code = models.PositiveSmallIntegerField()
+    range_start = models.BigIntegerField(null=True, blank=True)
+    range_end = models.BigIntegerField(null=True, blank=True)
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    user_agent = models.CharField(max_length=255, blank=True, default="")
+    accessed_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Archived dataroom access: {self.deal_id} by {self.investor_id}"
+
+    class Meta:
+        app_label = "app"
+
+
+class ArchivedMeeting(models.Model):
+    id = models.UUIDField(primary_key=True, editable=False)
+    investor = models.ForeignKey(
+        Investor, on_delete=models.CASCADE, related_name="archived_meetings"
+    )
+    startup = models.ForeignKey(
+        Startup, on_delete=models.CASCADE, related_name="archived_meetings"
+    )
+    title = models.CharField(max_length=255)
+    description = models.TextField(null=True)
+    start_time = models.DateTimeField(null=True)
+    end_time = models.DateTimeField(null=True)
+    investor_event_id = models.CharField(max_length=255, null=True)
+    status = models.CharField(max_length=20)
+    sync_attempts = models.PositiveIntegerField(default=0)
+    last_sync_error = models.TextField(null=True, blank=True)
+    next_sync_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Archived meeting: {self.title}"
+
+    class Meta:
+        app_label = "app"
+        ordering = ["-start_time"]
+        indexes = [
+            models.Index(
+                fields=["startup", "start_time"], name="archived_meeting_startup_idx"
+            ),
+            models.Index(
+                fields=["investor", "start_time"],
+                name="archived_meeting_investor_idx",
+            ),
+        ]
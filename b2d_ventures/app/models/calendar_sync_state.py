@@ -0,0 +1,20 @@
+from django.db import models
+
+from b2d_ventures.app.models import User
+from b2d_ventures.app.models.abstract_model import AbstractModel
+
+
+class CalendarSyncState(AbstractModel):
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, related_name="calendar_sync_state"
+    )
+    calendar_id = models.CharField(max_length=255, default="primary")
+    sync_token = models.TextField(null=True, blank=True)
+    last_synced_at = models.DateTimeField(null=True, blank=True)
+    last_full_sync_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Calendar sync: {self.user.username} ({self.calendar_id})"
+
+    class Meta:
+        app_label = "app"
@@ -0,0 +1,31 @@
+from django.db import models
+from django.utils import timezone
+
+from b2d_ventures.app.models import Deal, User
+from b2d_ventures.app.models.abstract_model import AbstractModel
+
+
+class DataroomAccessLog(AbstractModel):
+    investor = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="dataroom_accesses"
+    )
+    deal = models.ForeignKey(
+        Deal, on_delete=models.CASCADE, related_name="dataroom_accesses"
+    )
+    status_code = models.PositiveSmallIntegerField()
+    range_start = models.BigIntegerField(null=True, blank=True)
+    range_end = models.BigIntegerField(null=True, blank=True)
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    user_agent = models.CharField(max_length=255, blank=True, default="")
+    accessed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Dataroom access: {self.deal_id} by {self.investor_id}"
+
+    class Meta:
+        app_label = "app"
+        indexes = [
+            models.Index(
+                fields=["deal", "accessed_at"], name="dataroom_access_deal_idx"
+            ),
+        ]
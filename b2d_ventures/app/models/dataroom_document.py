@@ -0,0 +1,54 @@
+from django.db import models
+
+from b2d_ventures.app.models import Deal
+from b2d_ventures.app.models.abstract_model import AbstractModel
+
+
+class DataroomDocument(AbstractModel):
+    """Page index and preview of a deal's dataroom, see DataroomIndexService."""
+
+    deal = models.OneToOneField(
+        Deal, on_delete=models.CASCADE, related_name="dataroom_document"
+    )
+    # Name of the dataroom file this was extracted from.
+    source = models.CharField(max_length=255)
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ("complete", "Complete"),
+            ("failed", "Failed"),
+        ],
+        default="complete",
+    )
+    error = models.CharField(max_length=255, blank=True, default="")
+    page_count = models.PositiveIntegerField(default=0)
+    thumbnail = models.CharField(max_length=255, blank=True, default="")
+    # Normalized text of all indexed pages, searched by deal search.
+    search_text = models.TextField(blank=True, default="")
+    processed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"Dataroom document: {self.source}"
+
+    class Meta:
+        app_label = "app"
+
+
+class DataroomPage(AbstractModel):
+    document = models.ForeignKey(
+        DataroomDocument, on_delete=models.CASCADE, related_name="pages"
+    )
+    number = models.PositiveIntegerField()
+    text = models.TextField(blank=True, default="")
+
+    def __str__(self):
+        return f"Dataroom page {self.number} of {self.document_id}"
+
+    class Meta:
+        app_label = "app"
+        ordering = ["number"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["document", "number"], name="dataroom_page_unique_number"
+            ),
+        ]
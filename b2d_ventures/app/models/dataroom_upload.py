@@ -0,0 +1,41 @@
+from django.db import models
+from django.utils import timezone
+
+from b2d_ventures.app.models import Deal, Startup
+from b2d_ventures.app.models.abstract_model import AbstractModel
+
+
+class DataroomUpload(AbstractModel):
+    """A chunked dataroom upload, resumable from ``offset``."""
+
+    startup = models.ForeignKey(
+        Startup, on_delete=models.CASCADE, related_name="dataroom_uploads"
+    )
+    deal = models.ForeignKey(
+        Deal, on_delete=models.CASCADE, related_name="dataroom_uploads"
+    )
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    offset = models.BigIntegerField(default=0)
+    sha256 = models.CharField(max_length=64, blank=True, default="")
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ("active", "Active"),
+            ("complete", "Complete"),
+        ],
+        default="active",
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"Dataroom upload: {self.filename} for {self.deal_id}"
+
+    class Meta:
+        app_label = "app"
+        indexes = [
+            models.Index(
+                fields=["status", "expires_at"], name="dataroom_upload_expiry_idx"
+            ),
+        ]
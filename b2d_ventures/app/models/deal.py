@@ -1,10 +1,10 @@
-from cloudinary_storage.storage import RawMediaCloudinaryStorage, MediaCloudinaryStorage
 from django.core.validators import FileExtensionValidator
 from django.db import models
 from django.utils import timezone
 
 from b2d_ventures.app.models import Startup
 from b2d_ventures.app.models.abstract_model import AbstractModel
+from b2d_ventures.utils.storage import media_storage, raw_media_storage
 
 
 def dataroom_upload_path(instance, filename):
@@ -22,22 +22,25 @@ class Deal(AbstractModel):
     content = models.TextField(default="")
     image_background = models.ImageField(
         upload_to=deal_image_upload_path,
-        storage=MediaCloudinaryStorage(),
+        storage=media_storage,
         blank=True,
         null=True,
     )
     image_logo = models.ImageField(
         upload_to=deal_image_upload_path,
-        storage=MediaCloudinaryStorage(),
+        storage=media_storage,
         blank=True,
         null=True,
     )
     image_content = models.ImageField(
         upload_to=deal_image_upload_path,
-        storage=MediaCloudinaryStorage(),
+        storage=media_storage,
         blank=True,
         null=True,
     )
+    # Responsive variants of the images, keyed by image field name; written
+    # by DealImageService after each upload.
+    image_variants = models.JSONField(default=dict, blank=True)
     target_amount = models.DecimalField(max_digits=15, decimal_places=2, default=0.00)
     price_per_unit = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
     minimum_investment = models.DecimalField(
@@ -50,7 +53,7 @@ class Deal(AbstractModel):
     investor_count = models.PositiveIntegerField(default=0)
     dataroom = models.FileField(
         upload_to=dataroom_upload_path,
-        storage=RawMediaCloudinaryStorage(),
+        storage=raw_media_storage,
         validators=[FileExtensionValidator(allowed_extensions=["pdf"])],
         null=True,
         blank=True,
@@ -65,9 +68,15 @@ class Deal(AbstractModel):
         ],
         default="pending",
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.name} - {self.startup.name}"
 
     class Meta:
         app_label = "app"
+        indexes = [
+            models.Index(
+                fields=["startup", "updated_at"], name="deal_startup_updated_idx"
+            ),
+        ]
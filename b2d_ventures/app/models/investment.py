@@ -1,10 +1,10 @@
 from django.db import models
 
 from b2d_ventures.app.models import User, Deal
-from b2d_ventures.app.models.abstract_model import AbstractModel
+from b2d_ventures.app.models.abstract_model import TimeOrderedAbstractModel
 
 
-class Investment(AbstractModel):
+class Investment(TimeOrderedAbstractModel):
     deal = models.ForeignKey(
         Deal, on_delete=models.CASCADE, related_name="deal_investors"
     )
@@ -13,6 +13,7 @@ class Investment(AbstractModel):
     )
     investment_amount = models.DecimalField(max_digits=15, decimal_places=2)
     investment_date = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return (
@@ -21,3 +22,9 @@ class Investment(AbstractModel):
 
     class Meta:
         app_label = "app"
+        indexes = [
+            models.Index(
+                fields=["investor", "updated_at"], name="investment_investor_upd_idx"
+            ),
+            models.Index(fields=["deal", "updated_at"], name="investment_deal_upd_idx"),
+        ]
@@ -0,0 +1,31 @@
+from django.db import models
+
+from b2d_ventures.app.models import Deal, Investment, Startup
+from b2d_ventures.app.models.abstract_model import AbstractModel
+
+
+class InvestmentNotification(AbstractModel):
+    startup = models.ForeignKey(
+        Startup, on_delete=models.CASCADE, related_name="investment_notifications"
+    )
+    deal = models.ForeignKey(
+        Deal, on_delete=models.CASCADE, related_name="investment_notifications"
+    )
+    investment = models.OneToOneField(
+        Investment, on_delete=models.CASCADE, related_name="notification"
+    )
+    net_investment = models.DecimalField(max_digits=15, decimal_places=2)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Notification: {self.deal.name} - ${self.net_investment}"
+
+    class Meta:
+        app_label = "app"
+        indexes = [
+            models.Index(
+                fields=["sent_at", "startup", "created_at"],
+                name="notification_pending_idx",
+            ),
+        ]
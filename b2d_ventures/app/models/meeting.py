@@ -1,10 +1,17 @@
 from django.db import models
 
 from b2d_ventures.app.models import Investor, Startup
-from b2d_ventures.app.models.abstract_model import AbstractModel
+from b2d_ventures.app.models.abstract_model import TimeOrderedAbstractModel
 
 
-class Meeting(AbstractModel):
+class Meeting(TimeOrderedAbstractModel):
+    PENDING_SYNC = "pending_sync"
+    CONFIRMED = "confirmed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    # Meetings in these states no longer hold their time slot.
+    INACTIVE_STATUSES = (FAILED, CANCELLED)
+
     investor = models.ForeignKey(
         Investor, on_delete=models.CASCADE, related_name="meetings"
     )
@@ -16,6 +23,20 @@ class Meeting(AbstractModel):
     start_time = models.DateTimeField(null=True)
     end_time = models.DateTimeField(null=True)
     investor_event_id = models.CharField(max_length=255, null=True)
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            (PENDING_SYNC, "Pending sync"),
+            (CONFIRMED, "Confirmed"),
+            (FAILED, "Failed"),
+            (CANCELLED, "Cancelled"),
+        ],
+        default=CONFIRMED,
+    )
+    sync_attempts = models.PositiveIntegerField(default=0)
+    last_sync_error = models.TextField(null=True, blank=True)
+    next_sync_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"Meeting: {self.title} - {self.start_time.strftime('%Y-%m-%d %H:%M')}"
@@ -23,3 +44,25 @@ class Meeting(AbstractModel):
     class Meta:
         app_label = "app"
         ordering = ["-start_time"]
+        indexes = [
+            models.Index(
+                fields=["investor", "start_time", "end_time"],
+                name="meeting_investor_time_idx",
+            ),
+            models.Index(
+                fields=["startup", "start_time", "end_time"],
+                name="meeting_startup_time_idx",
+            ),
+            models.Index(
+                fields=["status", "next_sync_at"],
+                name="meeting_sync_queue_idx",
+            ),
+            models.Index(
+                fields=["investor", "updated_at"],
+                name="meeting_investor_updated_idx",
+            ),
+            models.Index(
+                fields=["startup", "updated_at"],
+                name="meeting_startup_updated_idx",
+            ),
+        ]
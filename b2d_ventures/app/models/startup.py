@@ -7,6 +7,9 @@ class Startup(User):
     description = models.TextField()
     fundraising_goal = models.DecimalField(max_digits=15, decimal_places=2, default=0)
     total_raised = models.DecimalField(max_digits=15, decimal_places=2, default=0)
+    # When enabled, new investments are summarized by `send_investment_digests`
+    # instead of emailing the startup once per investment.
+    investment_digest_enabled = models.BooleanField(default=False)
 
     def save(self, *args, **kwargs):
         if not self.pk:
@@ -0,0 +1,34 @@
+from django.db import models
+from django.utils import timezone
+
+from b2d_ventures.app.models.abstract_model import AbstractModel
+
+
+class StoredBlob(AbstractModel):
+    """
+    Hash index of uploaded file contents, per storage backend.
+
+    ``references`` counts the saved names sharing a Cloudinary file; local
+    blobs are counted by their hard links instead.
+    """
+
+    backend = models.CharField(max_length=32)
+    sha256 = models.CharField(max_length=64)
+    name = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    references = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Stored blob: {self.sha256} in {self.backend}"
+
+    class Meta:
+        app_label = "app"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["backend", "sha256"], name="stored_blob_unique_hash"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["backend", "name"], name="stored_blob_name_idx"),
+        ]
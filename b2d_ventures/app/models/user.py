@@ -26,3 +26,4 @@ class User(AbstractUser, AbstractModel):
     refresh_token = EncryptedCharField(
         max_length=150, null=True, default="", blank=True
     )
+    updated_at = models.DateTimeField(auto_now=True)
@@ -5,3 +5,9 @@ from b2d_ventures.app.serializers.startup import StartupSerializer
 from b2d_ventures.app.serializers.deal import DealSerializer
 from b2d_ventures.app.serializers.meeting import MeetingSerializer
 from b2d_ventures.app.serializers.investment import InvestmentSerializer
+from b2d_ventures.app.serializers.archive import (
+    ArchivedDealSerializer,
+    ArchivedDealDetailSerializer,
+    ArchivedInvestmentSerializer,
+    ArchivedMeetingSerializer,
+)
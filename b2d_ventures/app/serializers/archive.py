@@ -0,0 +1,117 @@
+from rest_framework import serializers
+
+from b2d_ventures.app.models import (
+    ArchivedDeal,
+    ArchivedInvestment,
+    ArchivedMeeting,
+    Deal,
+)
+
+
+class ArchivedInvestmentSerializer(serializers.ModelSerializer):
+    investor = serializers.StringRelatedField()
+
+    class Meta:
+        model = ArchivedInvestment
+        fields = [
+            "id",
+            "investor",
+            "investor_id",
+            "deal_id",
+            "investment_amount",
+            "investment_date",
+            "updated_at",
+            "archived_at",
+        ]
+        read_only_fields = fields
+
+
+class ArchivedDealSerializer(serializers.ModelSerializer):
+    startup = serializers.StringRelatedField()
+    dataroom_url = serializers.SerializerMethodField()
+    image_background_url = serializers.SerializerMethodField()
+    image_logo_url = serializers.SerializerMethodField()
+    image_content_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ArchivedDeal
+        fields = [
+            "id",
+            "startup",
+            "startup_id",
+            "name",
+            "description",
+            "content",
+            "image_background",
+            "image_background_url",
+            "image_logo",
+            "image_logo_url",
+            "image_content",
+            "image_content_url",
+            "target_amount",
+            "price_per_unit",
+            "minimum_investment",
+            "type",
+            "amount_raised",
+            "start_date",
+            "end_date",
+            "investor_count",
+            "status",
+            "dataroom",
+            "dataroom_url",
+            "updated_at",
+            "archived_at",
+        ]
+        read_only_fields = fields
+
+    def get_dataroom_url(self, obj):
+        return self._url(obj, "dataroom")
+
+    def get_image_background_url(self, obj):
+        return self._url(obj, "image_background")
+
+    def get_image_logo_url(self, obj):
+        return self._url(obj, "image_logo")
+
+    def get_image_content_url(self, obj):
+        return self._url(obj, "image_content")
+
+    @staticmethod
+    def _url(obj, field):
+        """Files stay in the storage of the deal they were uploaded for."""
+        name = getattr(obj, field)
+        if name:
+            return Deal._meta.get_field(field).storage.url(name)
+        return None
+
+
+class ArchivedDealDetailSerializer(ArchivedDealSerializer):
+    investments = ArchivedInvestmentSerializer(many=True, read_only=True)
+
+    class Meta(ArchivedDealSerializer.Meta):
+        fields = ArchivedDealSerializer.Meta.fields + ["investments"]
+        read_only_fields = fields
+
+
+class ArchivedMeetingSerializer(serializers.ModelSerializer):
+    investor = serializers.StringRelatedField()
+    startup = serializers.StringRelatedField()
+
+    class Meta:
+        model = ArchivedMeeting
+        fields = [
+            "id",
+            "investor",
+            "investor_id",
+            "startup",
+            "startup_id",
+            "title",
+            "description",
+            "start_time",
+            "end_time",
+            "investor_event_id",
+            "status",
+            "updated_at",
+            "archived_at",
+        ]
+        read_only_fields = fields
@@ -3,6 +3,7 @@ from rest_framework import serializers
 
 from b2d_ventures.app.models import Deal, Startup
 from b2d_ventures.app.serializers import StartupSerializer
+from b2d_ventures.utils.image_variants import VARIANT_FORMATS
 
 
 class DealSerializer(serializers.ModelSerializer):
@@ -14,6 +15,7 @@ class DealSerializer(serializers.ModelSerializer):
     image_background_url = serializers.SerializerMethodField()
     image_logo_url = serializers.SerializerMethodField()
     image_content_url = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
 
     class Meta:
         model = Deal
@@ -30,6 +32,7 @@ class DealSerializer(serializers.ModelSerializer):
             "image_logo_url",
             "image_content",
             "image_content_url",
+            "image_variants",
             "target_amount",
             "price_per_unit",
             "minimum_investment",
@@ -41,6 +44,7 @@ class DealSerializer(serializers.ModelSerializer):
             "status",
             "dataroom",
             "dataroom_url",
+            "updated_at",
         ]
         read_only_fields = [
             "id",
@@ -49,6 +53,7 @@ class DealSerializer(serializers.ModelSerializer):
             "image_background_url",
             "image_logo_url",
             "image_content_url",
+            "image_variants",
         ]
 
     def get_dataroom_url(self, obj):
@@ -71,6 +76,34 @@ class DealSerializer(serializers.ModelSerializer):
             return obj.image_content.url
         return None
 
+    def get_image_variants(self, obj):
+        """
+        Describe the responsive variants of each image.
+
+        ``srcset`` holds one ready-to-use srcset string per format, e.g.
+        ``"https://.../logo_320w.webp 320w, https://.../logo_640w.webp 640w"``.
+        Images whose variants are still being generated are left out.
+        """
+        images = {}
+        for field, entry in obj.image_variants.items():
+            storage = Deal._meta.get_field(field).storage
+            images[field] = {
+                "width": entry["width"],
+                "height": entry["height"],
+                "placeholder": entry["placeholder"],
+                "srcset": {
+                    variant_format: ", ".join(
+                        f"{storage.url(name)} {width}w"
+                        for width, name in sorted(
+                            entry.get(variant_format, {}).items(),
+                            key=lambda item: int(item[0]),
+                        )
+                    )
+                    for variant_format in VARIANT_FORMATS
+                },
+            }
+        return images
+
     def validate_dataroom(self, value):
         if value:
             if value.size > 10 * 1024 * 1024:  # 10 MB
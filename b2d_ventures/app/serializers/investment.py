@@ -15,6 +15,7 @@ class InvestmentSerializer(serializers.ModelSerializer):
             "deal",
             "investment_amount",
             "investment_date",
+            "updated_at",
         ]
         read_only_fields = [
             "id",
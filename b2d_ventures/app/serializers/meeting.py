@@ -27,8 +27,11 @@ class MeetingSerializer(serializers.ModelSerializer):
             "start_time",
             "end_time",
             "investor_event_id",
+            "status",
+            "last_sync_error",
+            "updated_at",
         ]
-        read_only_fields = ["id", "investor_event_id"]
+        read_only_fields = ["id", "investor_event_id", "status", "last_sync_error"]
 
     def create(self, validated_data):
         return Meeting.objects.create(**validated_data)
@@ -1,5 +1,25 @@
 from b2d_ventures.app.services.auth_service import AuthService, AuthError
+from b2d_ventures.app.services.deal_cache_service import DealCacheService
 from b2d_ventures.app.services.admin_service import AdminService, AdminError
 from b2d_ventures.app.services.startup_service import StartupService, StartupError
 from b2d_ventures.app.services.investor_service import InvestorService, InvestorError
 from b2d_ventures.app.services.calendar_service import CalendarService, CalendarError
+from b2d_ventures.app.services.meeting_sync_service import MeetingSyncService
+from b2d_ventures.app.services.calendar_sync_service import CalendarSyncService
+from b2d_ventures.app.services.allocation_service import (
+    AllocationService,
+    AllocationError,
+    AllocationConflictError,
+)
+from b2d_ventures.app.services.investment_digest_service import InvestmentDigestService
+from b2d_ventures.app.services.dataroom_service import DataroomService, DataroomError
+from b2d_ventures.app.services.deal_image_service import DealImageService
+from b2d_ventures.app.services.dataroom_index_service import DataroomIndexService
+from b2d_ventures.app.services.dataroom_upload_service import (
+    DataroomUploadService,
+    DataroomUploadError,
+)
+from b2d_ventures.app.services.counter_reconciliation_service import (
+    CounterReconciliationService,
+)
+from b2d_ventures.app.services.archive_service import ArchiveService, ArchiveError
@@ -1,12 +1,23 @@
 """The module defines the AdminService class and AdminError."""
 
+import logging
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Sum
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Sum
 from django.utils import timezone
 
-from b2d_ventures.app.models import User, Deal, Investment, Meeting
+from b2d_ventures.app.models import User, Deal, Investment, Meeting, Investor, Startup
+from b2d_ventures.app.services.auth_service import AuthService, AuthError
+from b2d_ventures.app.services.calendar_service import CalendarService, CalendarError
 from b2d_ventures.utils import EmailService
 
+MAX_BULK_MEETINGS = 500
+
 
 class AdminError(Exception):
     """Custom Exception for admin-related errors."""
@@ -68,14 +79,8 @@ class AdminService:
             deal.save()
 
             email_service = EmailService()
-            subject, body = email_service.build_deal_notification_content(
-                deal, "approved"
-            )
-            email_sent = email_service.send_email_with_attachment(
-                to_email=deal.startup.email, subject=subject, body=body
-            )
-            if not email_sent:
-                print(f"Warning: Failed to send notification email for deal {deal.id}")
+            email = email_service.build_deal_notification_content(deal, "approved")
+            email_service.send_rendered_email(deal.startup.email, email, wait=False)
 
             return deal
         except Deal.DoesNotExist:
@@ -97,14 +102,8 @@ class AdminService:
             deal.save()
 
             email_service = EmailService()
-            subject, body = email_service.build_deal_notification_content(
-                deal, "rejected"
-            )
-            email_sent = email_service.send_email_with_attachment(
-                to_email=deal.startup.email, subject=subject, body=body
-            )
-            if not email_sent:
-                print(f"Warning: Failed to send notification email for deal {deal.id}")
+            email = email_service.build_deal_notification_content(deal, "rejected")
+            email_service.send_rendered_email(deal.startup.email, email, wait=False)
 
             return deal
         except Deal.DoesNotExist:
@@ -236,3 +235,250 @@ class AdminService:
             raise ObjectDoesNotExist(f"Deal with id {deal_id} does not exist")
         except Exception as e:
             raise AdminError(f"Error deleting deal: {str(e)}")
+
+    @staticmethod
+    def bulk_schedule_meetings(items):
+        """
+        Schedule many investor-startup meetings at once, e.g. for a demo day.
+
+        Requests are validated and checked for overlaps locally, then the
+        calendar inserts are grouped per investor (the event organizer) and
+        sent as batch requests, with a bounded number of investors handled
+        concurrently. Successful meetings are stored with one bulk_create.
+
+        :param items: List of dictionaries with investor_id, startup_id,
+            start_time, end_time and optional title and description
+        :return: List aligned with ``items`` of dictionaries with ``index``,
+            ``status`` ("created" or "failed") and either ``meeting`` or
+            ``detail``
+        """
+        if not isinstance(items, list) or not items:
+            raise AdminError("meetings must be a non-empty list")
+        if len(items) > MAX_BULK_MEETINGS:
+            raise AdminError(
+                f"At most {MAX_BULK_MEETINGS} meetings can be scheduled at once"
+            )
+
+        results = [None] * len(items)
+
+        def fail(index, detail):
+            results[index] = {"index": index, "status": "failed", "detail": detail}
+
+        requests = AdminService._parse_meeting_requests(items, fail)
+        requests = AdminService._reject_overlapping_requests(requests, fail)
+
+        by_investor = defaultdict(list)
+        for request in requests:
+            by_investor[request["investor"].id].append(request)
+
+        booked = []
+        if by_investor:
+            workers = min(settings.CALENDAR_BULK_CONCURRENCY, len(by_investor))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = executor.map(
+                    AdminService._book_investor_meetings, by_investor.values()
+                )
+                for investor_requests, investor_outcomes in zip(
+                    by_investor.values(), outcomes
+                ):
+                    for request, outcome in zip(investor_requests, investor_outcomes):
+                        if isinstance(outcome, Exception):
+                            fail(request["index"], str(outcome))
+                        else:
+                            request["meeting"].investor_event_id = outcome["id"]
+                            booked.append(request)
+
+        for request, meeting in AdminService._store_meetings(booked):
+            if meeting is None:
+                fail(
+                    request["index"],
+                    "The requested time slot was booked by another request",
+                )
+            else:
+                results[request["index"]] = {
+                    "index": request["index"],
+                    "status": "created",
+                    "meeting": meeting,
+                }
+        return results
+
+    @staticmethod
+    def _parse_meeting_requests(items, fail):
+        """Validate bulk meeting items, loading investors and startups in bulk."""
+        parsed = []
+        for index, item in enumerate(items):
+            try:
+                start_time = CalendarService.parse_datetime(item["start_time"])
+                end_time = CalendarService.parse_datetime(item["end_time"])
+                investor_id = uuid.UUID(str(item["investor_id"]))
+                startup_id = uuid.UUID(str(item["startup_id"]))
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                fail(index, f"Invalid meeting request: {str(e)}")
+                continue
+            if end_time <= start_time:
+                fail(index, "end_time must be after start_time")
+                continue
+            parsed.append((index, item, investor_id, startup_id, start_time, end_time))
+
+        investors = Investor.objects.in_bulk({entry[2] for entry in parsed})
+        startups = Startup.objects.in_bulk({entry[3] for entry in parsed})
+
+        requests = []
+        for index, item, investor_id, startup_id, start_time, end_time in parsed:
+            investor = investors.get(investor_id)
+            startup = startups.get(startup_id)
+            if investor is None:
+                fail(index, f"Investor with id {investor_id} does not exist")
+            elif startup is None:
+                fail(index, f"Startup with id {startup_id} does not exist")
+            elif not investor.refresh_token:
+                fail(index, "Investor does not have a valid refresh token")
+            else:
+                requests.append(
+                    {
+                        "index": index,
+                        "investor": investor,
+                        "startup": startup,
+                        "meeting": Meeting(
+                            investor=investor,
+                            startup=startup,
+                            start_time=start_time,
+                            end_time=end_time,
+                            title=item.get("title") or "Investor-Startup Meeting",
+                            description=item.get("description", ""),
+                        ),
+                    }
+                )
+        return requests
+
+    @staticmethod
+    def _reject_overlapping_requests(requests, fail):
+        """
+        Drop requests overlapping a stored meeting or an earlier request.
+
+        Stored meetings of every involved investor and startup are read with
+        a single query.
+        """
+        if not requests:
+            return []
+        range_start = min(r["meeting"].start_time for r in requests)
+        range_end = max(r["meeting"].end_time for r in requests)
+        stored = (
+            Meeting.objects.filter(
+                Q(investor_id__in={r["investor"].id for r in requests})
+                | Q(startup_id__in={r["startup"].id for r in requests}),
+                start_time__lt=range_end,
+                end_time__gt=range_start,
+            )
+            .exclude(status__in=Meeting.INACTIVE_STATUSES)
+            .values_list("investor_id", "startup_id", "start_time", "end_time")
+        )
+        taken = defaultdict(list)
+        for investor_id, startup_id, start_time, end_time in stored:
+            taken[("investor", investor_id)].append((start_time, end_time))
+            taken[("startup", startup_id)].append((start_time, end_time))
+
+        accepted = []
+        for request in requests:
+            meeting = request["meeting"]
+            parties = [
+                ("investor", request["investor"].id),
+                ("startup", request["startup"].id),
+            ]
+            conflict = next(
+                (
+                    party
+                    for party in parties
+                    if any(
+                        meeting.start_time < end and start < meeting.end_time
+                        for start, end in taken[party]
+                    )
+                ),
+                None,
+            )
+            if conflict is not None:
+                fail(
+                    request["index"],
+                    f"The requested time slot is not available for the {conflict[0]}",
+                )
+                continue
+            for party in parties:
+                taken[party].append((meeting.start_time, meeting.end_time))
+            accepted.append(request)
+        return accepted
+
+    @staticmethod
+    def _book_investor_meetings(requests):
+        """
+        Insert one investor's meetings into their calendar.
+
+        Runs in a worker thread and only talks to Google, never the database.
+
+        :return: List aligned with ``requests`` of events or exceptions
+        """
+        investor = requests[0]["investor"]
+        try:
+            access_token = AuthService().refresh_access_token(investor.refresh_token)
+            for request in requests:
+                request["access_token"] = access_token
+            return CalendarService.batch_schedule_investor_startup_meetings(
+                access_token,
+                [
+                    {
+                        "title": r["meeting"].title,
+                        "description": r["meeting"].description,
+                        "start_time": r["meeting"].start_time,
+                        "end_time": r["meeting"].end_time,
+                        "startup_email": r["startup"].email,
+                        "event_id": r["meeting"].id.hex,
+                    }
+                    for r in requests
+                ],
+            )
+        except (AuthError, CalendarError) as e:
+            return [e] * len(requests)
+
+    @staticmethod
+    def _store_meetings(requests):
+        """
+        Store booked meetings with a single bulk_create.
+
+        If that hits the overlap constraint (a concurrent booking), fall back
+        to saving them one by one.
+
+        :return: List of (request, meeting or None) pairs
+        """
+        if not requests:
+            return []
+        try:
+            with transaction.atomic():
+                Meeting.objects.bulk_create([r["meeting"] for r in requests])
+            return [(r, r["meeting"]) for r in requests]
+        except IntegrityError:
+            logging.warning("Bulk meeting insert conflicted; saving individually")
+
+        stored = []
+        for request in requests:
+            try:
+                with transaction.atomic():
+                    request["meeting"].save(force_insert=True)
+                stored.append((request, request["meeting"]))
+            except IntegrityError:
+                logging.warning(
+                    f"Meeting {request['meeting'].id} was booked in Google Calendar "
+                    f"but conflicts with a stored meeting; deleting the event"
+                )
+                AdminService._cancel_event(request)
+                stored.append((request, None))
+        return stored
+
+    @staticmethod
+    def _cancel_event(request):
+        """Delete the calendar event of a meeting that could not be stored."""
+        event_id = request["meeting"].investor_event_id
+        try:
+            CalendarService.cancel_investor_startup_meeting(
+                request["access_token"], event_id
+            )
+        except CalendarError as e:
+            logging.error(f"Could not delete orphaned calendar event {event_id}: {e}")
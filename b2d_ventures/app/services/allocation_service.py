@@ -0,0 +1,422 @@
+"""The module defines the AllocationService class and AllocationError."""
+
+import time
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from b2d_ventures.app.models import Investor, Startup, Meeting
+from b2d_ventures.app.services.calendar_service import CalendarService
+
+MAX_SLOTS = 200
+MAX_SLOT_MINUTES = 8 * 60
+DEFAULT_TIME_LIMIT_SECONDS = 5.0
+
+
+class AllocationError(Exception):
+    """Custom Exception for meeting allocation errors."""
+
+
+class AllocationConflictError(AllocationError):
+    """Raised when allocated slots were booked by another request meanwhile."""
+
+
+def _popcount(mask):
+    return bin(mask).count("1")
+
+
+def _lowest_slot(mask):
+    return (mask & -mask).bit_length() - 1
+
+
+def _slots(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class _Schedule:
+    """
+    Mutable schedule state for the allocation engine.
+
+    Free slots of every investor and startup are kept as integer bitmasks,
+    so "is there a slot free for both" is a single AND.
+    """
+
+    def __init__(self, investor_free, startup_free):
+        self.investor_free = dict(investor_free)
+        self.startup_free = dict(startup_free)
+        self.investor_at = defaultdict(dict)
+        self.startup_at = defaultdict(dict)
+        self.slot_of = {}
+        self.meetings_of = defaultdict(int)
+
+    def place(self, investor, startup, slot):
+        bit = 1 << slot
+        self.investor_free[investor] &= ~bit
+        self.startup_free[startup] &= ~bit
+        self.investor_at[investor][slot] = startup
+        self.startup_at[startup][slot] = investor
+        self.slot_of[(investor, startup)] = slot
+        self.meetings_of[investor] += 1
+
+    def remove(self, investor, startup):
+        slot = self.slot_of.pop((investor, startup))
+        bit = 1 << slot
+        self.investor_free[investor] |= bit
+        self.startup_free[startup] |= bit
+        del self.investor_at[investor][slot]
+        del self.startup_at[startup][slot]
+        self.meetings_of[investor] -= 1
+        return slot
+
+    def blockers(self, investor, startup, slot):
+        """Meetings occupying ``slot`` for the investor or the startup."""
+        blocking = []
+        if slot in self.investor_at[investor]:
+            blocking.append((investor, self.investor_at[investor][slot]))
+        if slot in self.startup_at[startup]:
+            blocking.append((self.startup_at[startup][slot], startup))
+        return blocking
+
+
+class AllocationService:
+    """
+    Decide who meets whom on a demo day.
+
+    Investors rank the startups they want to meet; investors and startups
+    each have a set of available slots on a fixed grid. The engine builds a
+    conflict-free schedule (nobody is in two meetings in the same slot) that
+    maximizes the weight of satisfied preferences, where a higher-ranked
+    startup weighs more but every satisfied preference weighs at least 1.
+    """
+
+    @staticmethod
+    def preference_weight(rank, count):
+        """
+        Weight of a satisfied preference.
+
+        :param rank: 0-based position in the investor's ranking
+        :param count: Length of the investor's ranking
+        :return: Weight in (1, 2]
+        """
+        return 2.0 - rank / count
+
+    @staticmethod
+    def allocate(
+        preferences,
+        investor_availability,
+        startup_availability,
+        slot_count,
+        max_meetings_per_investor=None,
+        time_limit=DEFAULT_TIME_LIMIT_SECONDS,
+    ):
+        """
+        Compute a conflict-free demo-day schedule.
+
+        A greedy pass books preferences by descending weight, scarcest pairs
+        first, in the earliest common free slot. Local search then retries
+        every unsatisfied preference by relocating the meetings blocking a
+        slot to another slot, or by replacing blocking meetings of lower total
+        weight, until a pass makes no improvement or ``time_limit`` runs out.
+
+        :param preferences: Dictionary of investor key to startup keys, most
+            preferred first
+        :param investor_availability: Dictionary of investor key to a bitmask
+            of available slots; missing investors are available in every slot
+        :param startup_availability: Same for startups
+        :param slot_count: Number of slots in the grid
+        :param max_meetings_per_investor: Optional cap on meetings per investor
+        :param time_limit: Seconds the local search may run
+        :return: Dictionary with ``assignments`` (list of (investor, startup,
+            slot)) and quality ``metrics``
+        """
+        started = time.perf_counter()
+        all_slots = (1 << slot_count) - 1
+        cap = max_meetings_per_investor or slot_count
+
+        weights = {}
+        for investor, ranked in preferences.items():
+            ranked = list(dict.fromkeys(ranked))
+            for rank, startup in enumerate(ranked):
+                weights[(investor, startup)] = AllocationService.preference_weight(
+                    rank, len(ranked)
+                )
+
+        startups = {startup for _, startup in weights}
+        investor_mask = {
+            investor: investor_availability.get(investor, all_slots) & all_slots
+            for investor in preferences
+        }
+        startup_mask = {
+            startup: startup_availability.get(startup, all_slots) & all_slots
+            for startup in startups
+        }
+        schedule = _Schedule(investor_mask, startup_mask)
+
+        order = sorted(
+            weights,
+            key=lambda pair: (
+                -weights[pair],
+                _popcount(investor_mask[pair[0]] & startup_mask[pair[1]]),
+            ),
+        )
+        for investor, startup in order:
+            if schedule.meetings_of[investor] >= cap:
+                continue
+            free = schedule.investor_free[investor] & schedule.startup_free[startup]
+            if free:
+                schedule.place(investor, startup, _lowest_slot(free))
+        greedy_assignments = len(schedule.slot_of)
+        greedy_score = sum(weights[pair] for pair in schedule.slot_of)
+
+        passes = 0
+        deadline = started + time_limit
+        while time.perf_counter() < deadline:
+            passes += 1
+            improved = False
+            for investor, startup in order:
+                if (investor, startup) in schedule.slot_of:
+                    continue
+                if schedule.meetings_of[investor] >= cap:
+                    continue
+                if AllocationService._improve(
+                    schedule,
+                    weights,
+                    investor,
+                    startup,
+                    investor_mask[investor] & startup_mask[startup],
+                ):
+                    improved = True
+                if time.perf_counter() >= deadline:
+                    break
+            if not improved:
+                break
+
+        assignments = [
+            (investor, startup, slot)
+            for (investor, startup), slot in schedule.slot_of.items()
+        ]
+        metrics = AllocationService._metrics(
+            preferences, weights, investor_mask, startup_mask, cap, schedule
+        )
+        metrics.update(
+            {
+                "greedy_meetings": greedy_assignments,
+                "greedy_score": round(greedy_score, 3),
+                "local_search_passes": passes,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+        )
+        return {"assignments": assignments, "metrics": metrics}
+
+    @staticmethod
+    def _improve(schedule, weights, investor, startup, candidates):
+        """Try to book one unsatisfied preference; return whether it worked."""
+        free = schedule.investor_free[investor] & schedule.startup_free[startup]
+        if free:
+            schedule.place(investor, startup, _lowest_slot(free))
+            return True
+
+        # Relocation: move every meeting blocking a slot somewhere else.
+        for slot in _slots(candidates):
+            moved = []
+            for blocker in schedule.blockers(investor, startup, slot):
+                alternatives = (
+                    schedule.investor_free[blocker[0]]
+                    & schedule.startup_free[blocker[1]]
+                    & ~(1 << slot)
+                )
+                if not alternatives:
+                    break
+                schedule.remove(*blocker)
+                schedule.place(*blocker, _lowest_slot(alternatives))
+                moved.append(blocker)
+            else:
+                schedule.place(investor, startup, slot)
+                return True
+            for blocker in reversed(moved):
+                schedule.remove(*blocker)
+                schedule.place(*blocker, slot)
+
+        # Replacement: drop blocking meetings that are worth less in total.
+        weight = weights[(investor, startup)]
+        best_slot, best_loss = None, weight
+        for slot in _slots(candidates):
+            loss = sum(
+                weights[blocker]
+                for blocker in schedule.blockers(investor, startup, slot)
+            )
+            if loss < best_loss:
+                best_slot, best_loss = slot, loss
+        if best_slot is None:
+            return False
+        for blocker in schedule.blockers(investor, startup, best_slot):
+            schedule.remove(*blocker)
+        schedule.place(investor, startup, best_slot)
+        return True
+
+    @staticmethod
+    def _metrics(preferences, weights, investor_mask, startup_mask, cap, schedule):
+        """Quality metrics of a schedule, with an upper bound for comparison."""
+        demand = defaultdict(int)
+        for _, startup in weights:
+            demand[startup] += 1
+        investor_bound = sum(
+            min(len(set(ranked)), _popcount(investor_mask[investor]), cap)
+            for investor, ranked in preferences.items()
+        )
+        startup_bound = sum(
+            min(count, _popcount(startup_mask[startup]))
+            for startup, count in demand.items()
+        )
+        upper_bound = min(investor_bound, startup_bound)
+
+        scheduled = len(schedule.slot_of)
+        ranked_investors = [i for i, ranked in preferences.items() if ranked]
+        first_choices = sum(
+            (investor, preferences[investor][0]) in schedule.slot_of
+            for investor in ranked_investors
+        )
+        investors_met = sum(
+            schedule.meetings_of[investor] > 0 for investor in ranked_investors
+        )
+        return {
+            "requested": len(weights),
+            "meetings": scheduled,
+            "upper_bound": upper_bound,
+            "satisfaction_rate": round(scheduled / len(weights), 4) if weights else 0,
+            "bound_ratio": round(scheduled / upper_bound, 4) if upper_bound else 0,
+            "score": round(sum(weights[pair] for pair in schedule.slot_of), 3),
+            "first_choice_rate": (
+                round(first_choices / len(ranked_investors), 4)
+                if ranked_investors
+                else 0
+            ),
+            "investors_with_meeting": investors_met,
+        }
+
+    @staticmethod
+    def allocate_demo_day(attributes, commit=False):
+        """
+        Allocate demo-day meetings and optionally store them.
+
+        Slots already taken by stored meetings of any involved investor or
+        startup are treated as unavailable. Stored meetings are created as
+        ``pending_sync`` so the calendar sync worker books them in Google
+        Calendar.
+
+        :param attributes: Dictionary with ``start_time``, ``slot_minutes``,
+            ``slot_count``, ``preferences`` (list of ``investor_id`` and
+            ranked ``startup_ids``), optional ``availability`` (list of
+            ``user_id`` and available slot indices), optional
+            ``max_meetings_per_investor`` and optional ``title``
+        :param commit: Whether to write the allocated meetings
+        :return: Dictionary with ``meetings`` (list of Meeting objects, saved
+            only when committed) and ``metrics``
+        :raises AllocationConflictError: If committing hits a meeting stored
+            by a concurrent request
+        """
+        try:
+            start_time = CalendarService.parse_datetime(attributes["start_time"])
+            slot_minutes = int(attributes.get("slot_minutes", 15))
+            slot_count = int(attributes["slot_count"])
+            preferences = {
+                uuid.UUID(str(entry["investor_id"])): [
+                    uuid.UUID(str(startup_id)) for startup_id in entry["startup_ids"]
+                ]
+                for entry in attributes["preferences"]
+            }
+            availability = {
+                uuid.UUID(str(entry["user_id"])): sum(
+                    1 << int(slot) for slot in set(entry["slots"])
+                )
+                for entry in attributes.get("availability", [])
+            }
+            cap = attributes.get("max_meetings_per_investor")
+            cap = int(cap) if cap is not None else None
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise AllocationError(f"Invalid allocation request: {str(e)}")
+
+        if not 0 < slot_count <= MAX_SLOTS:
+            raise AllocationError(f"slot_count must be between 1 and {MAX_SLOTS}")
+        if not 0 < slot_minutes <= MAX_SLOT_MINUTES:
+            raise AllocationError(
+                f"slot_minutes must be between 1 and {MAX_SLOT_MINUTES}"
+            )
+        if cap is not None and cap < 1:
+            raise AllocationError("max_meetings_per_investor must be positive")
+
+        startup_ids = {s for ranked in preferences.values() for s in ranked}
+        investors = Investor.objects.in_bulk(preferences.keys())
+        startups = Startup.objects.in_bulk(startup_ids)
+        missing = (set(preferences) - set(investors)) | (startup_ids - set(startups))
+        if missing:
+            raise AllocationError(
+                f"Unknown investor or startup ids: {', '.join(sorted(map(str, missing)))}"
+            )
+
+        slot_length = timedelta(minutes=slot_minutes)
+        grid_end = start_time + slot_length * slot_count
+        all_slots = (1 << slot_count) - 1
+        masks = {user_id: availability.get(user_id, all_slots) for user_id in investors}
+        masks.update(
+            {user_id: availability.get(user_id, all_slots) for user_id in startups}
+        )
+        stored = (
+            Meeting.objects.filter(
+                Q(investor_id__in=investors.keys()) | Q(startup_id__in=startups.keys()),
+                start_time__lt=grid_end,
+                end_time__gt=start_time,
+            )
+            .exclude(status__in=Meeting.INACTIVE_STATUSES)
+            .values_list("investor_id", "startup_id", "start_time", "end_time")
+        )
+        for investor_id, startup_id, meeting_start, meeting_end in stored:
+            first = max((meeting_start - start_time) // slot_length, 0)
+            last = min(-((start_time - meeting_end) // slot_length), slot_count)
+            taken = sum(1 << slot for slot in range(first, last))
+            for user_id in (investor_id, startup_id):
+                if user_id in masks:
+                    masks[user_id] &= ~taken
+
+        result = AllocationService.allocate(
+            preferences,
+            {i: masks[i] for i in investors},
+            {s: masks[s] for s in startups},
+            slot_count,
+            max_meetings_per_investor=cap,
+        )
+
+        title = attributes.get("title") or "Demo Day Meeting"
+        now = timezone.now()
+        meetings = [
+            Meeting(
+                investor=investors[investor_id],
+                startup=startups[startup_id],
+                start_time=start_time + slot_length * slot,
+                end_time=start_time + slot_length * (slot + 1),
+                title=title,
+                description="",
+                status=Meeting.PENDING_SYNC,
+                next_sync_at=now,
+            )
+            for investor_id, startup_id, slot in sorted(
+                result["assignments"], key=lambda assignment: assignment[2]
+            )
+        ]
+        if commit:
+            try:
+                with transaction.atomic():
+                    Meeting.objects.bulk_create(meetings)
+            except IntegrityError:
+                raise AllocationConflictError(
+                    "Some allocated slots were booked by another request; "
+                    "allocate again"
+                )
+        return {"meetings": meetings, "metrics": result["metrics"]}
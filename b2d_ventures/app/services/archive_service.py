@@ -0,0 +1,245 @@
+"""The module defines the ArchiveService class and ArchiveError."""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.utils import timezone
+
+from b2d_ventures.app.models import (
+    ArchivedDataroomAccess,
+    ArchivedDeal,
+    ArchivedInvestment,
+    ArchivedMeeting,
+    DataroomAccessLog,
+    Deal,
+    Investment,
+    Meeting,
+)
+from b2d_ventures.utils.keyset import keyset_chunks
+
+ARCHIVABLE_DEAL_STATUSES = ("closed", "rejected")
+MAX_ARCHIVE_PAGE_SIZE = 1000
+
+
+class ArchiveError(Exception):
+    """Custom exception for archive-related errors."""
+
+
+class ArchiveService:
+    """
+    Move old deals and meetings out of the hot tables into archive tables.
+
+    Closed and rejected deals that ended before the cutoff are copied to
+    ArchivedDeal with their investments and dataroom access logs, and then
+    deleted. Meetings have no deal, so they are archived on their own once
+    they ended before the cutoff; meetings still waiting for their calendar
+    sync are left alone. Rows are picked by when they ended, not by
+    updated_at, since rows older than that column all carry the time it was
+    added.
+
+    Rows are selected by keyset over their ids and moved in batches, each in
+    its own transaction, so a batch is either archived and deleted or left in
+    place. Deletes go through the ORM, so cascades, signals and cache
+    invalidation run as for any other delete. Counters are left as they are:
+    archived investments still count towards the startup's total_raised and
+    the investor's total_invested, see CounterReconciliationService.
+    """
+
+    @staticmethod
+    def archive(older_than_days=None, batch_size=None, dry_run=False):
+        """
+        Archive the deals and meetings older than the cutoff.
+
+        :param older_than_days: Age in days after which rows are archived,
+            ARCHIVE_AFTER_DAYS if None
+        :param batch_size: Number of deals or meetings per transaction,
+            ARCHIVE_BATCH_SIZE if None
+        :param dry_run: Count the rows that would be archived without moving them
+        :return: Dictionary with the number of deals, investments, dataroom
+            accesses and meetings archived
+        """
+        if older_than_days is None:
+            older_than_days = settings.ARCHIVE_AFTER_DAYS
+        if batch_size is None:
+            batch_size = settings.ARCHIVE_BATCH_SIZE
+        cutoff = timezone.now() - timedelta(days=older_than_days)
+        report = {"deals": 0, "investments": 0, "dataroom_accesses": 0, "meetings": 0}
+
+        deals = ArchiveService._archivable_deals(cutoff).values_list("id", flat=True)
+        for chunk in keyset_chunks(deals, batch_size):
+            with transaction.atomic():
+                ArchiveService._archive_deals(
+                    chunk, cutoff, batch_size, dry_run, report
+                )
+
+        meetings = ArchiveService._archivable_meetings(cutoff).values_list(
+            "id", flat=True
+        )
+        for chunk in keyset_chunks(meetings, batch_size):
+            with transaction.atomic():
+                ArchiveService._archive_meetings(
+                    chunk, cutoff, batch_size, dry_run, report
+                )
+
+        logging.info(
+            f"Archived {report['deals']} deals, {report['investments']} "
+            f"investments, {report['dataroom_accesses']} dataroom accesses and "
+            f"{report['meetings']} meetings older than {older_than_days} days"
+            + (" (dry run)" if dry_run else "")
+        )
+        return report
+
+    @staticmethod
+    def list_deals(startup_id=None, limit=100, offset=0):
+        """
+        List archived deals, most recently ended first.
+
+        :param startup_id: Only list the deals of this startup
+        :param limit: Maximum number of deals to return
+        :param offset: Number of deals to skip
+        :return: List of ArchivedDeal objects
+        """
+        try:
+            deals = ArchivedDeal.objects.select_related("startup").order_by(
+                "-end_date", "id"
+            )
+            if startup_id:
+                deals = deals.filter(startup_id=startup_id)
+            return list(deals[ArchiveService._page(limit, offset)])
+        except ArchiveError:
+            raise
+        except Exception as e:
+            raise ArchiveError(f"Error listing archived deals: {str(e)}")
+
+    @staticmethod
+    def get_deal(deal_id):
+        """
+        Get an archived deal with its investments.
+
+        :param deal_id: ID of the archived deal
+        :return: ArchivedDeal object
+        """
+        try:
+            return (
+                ArchivedDeal.objects.select_related("startup")
+                .prefetch_related("investments__investor")
+                .get(id=deal_id)
+            )
+        except ArchivedDeal.DoesNotExist:
+            raise ObjectDoesNotExist(f"Archived deal with id {deal_id} does not exist")
+        except Exception as e:
+            raise ArchiveError(f"Error retrieving archived deal: {str(e)}")
+
+    @staticmethod
+    def list_meetings(investor_id=None, startup_id=None, limit=100, offset=0):
+        """
+        List archived meetings, most recent first.
+
+        :param investor_id: Only list the meetings of this investor
+        :param startup_id: Only list the meetings of this startup
+        :param limit: Maximum number of meetings to return
+        :param offset: Number of meetings to skip
+        :return: List of ArchivedMeeting objects
+        """
+        try:
+            meetings = ArchivedMeeting.objects.select_related(
+                "investor", "startup"
+            ).order_by("-start_time", "id")
+            if investor_id:
+                meetings = meetings.filter(investor_id=investor_id)
+            if startup_id:
+                meetings = meetings.filter(startup_id=startup_id)
+            return list(meetings[ArchiveService._page(limit, offset)])
+        except ArchiveError:
+            raise
+        except Exception as e:
+            raise ArchiveError(f"Error listing archived meetings: {str(e)}")
+
+    @staticmethod
+    def _archivable_deals(cutoff):
+        return Deal.objects.filter(
+            status__in=ARCHIVABLE_DEAL_STATUSES,
+            end_date__lt=cutoff,
+        ).order_by("id")
+
+    @staticmethod
+    def _archivable_meetings(cutoff):
+        return (
+            Meeting.objects.filter(end_time__lt=cutoff)
+            .exclude(status=Meeting.PENDING_SYNC)
+            .order_by("id")
+        )
+
+    @staticmethod
+    def _archive_deals(deal_ids, cutoff, batch_size, dry_run, report):
+        # Selected again under lock, in case a deal changed since the keyset scan.
+        deals = ArchiveService._archivable_deals(cutoff).filter(id__in=deal_ids)
+        if not dry_run:
+            deals = deals.select_for_update()
+        deal_ids = list(deals.values_list("id", flat=True))
+        investments = Investment.objects.filter(deal_id__in=deal_ids)
+        accesses = DataroomAccessLog.objects.filter(deal_id__in=deal_ids)
+        if dry_run:
+            report["deals"] += len(deal_ids)
+            report["investments"] += investments.count()
+            report["dataroom_accesses"] += accesses.count()
+            return
+
+        now = timezone.now()
+        report["deals"] += ArchiveService._copy(
+            Deal.objects.filter(id__in=deal_ids), ArchivedDeal, now, batch_size
+        )
+        report["investments"] += ArchiveService._copy(
+            investments, ArchivedInvestment, now, batch_size
+        )
+        report["dataroom_accesses"] += ArchiveService._copy(
+            accesses, ArchivedDataroomAccess, now, batch_size
+        )
+        # Cascades to the investments, access logs and the rest of the deal.
+        Deal.objects.filter(id__in=deal_ids).delete()
+
+    @staticmethod
+    def _archive_meetings(meeting_ids, cutoff, batch_size, dry_run, report):
+        meetings = ArchiveService._archivable_meetings(cutoff).filter(
+            id__in=meeting_ids
+        )
+        if dry_run:
+            report["meetings"] += meetings.count()
+            return
+        meeting_ids = list(meetings.select_for_update().values_list("id", flat=True))
+        meetings = Meeting.objects.filter(id__in=meeting_ids)
+        report["meetings"] += ArchiveService._copy(
+            meetings, ArchivedMeeting, timezone.now(), batch_size
+        )
+        meetings.delete()
+
+    @staticmethod
+    def _copy(queryset, archive_model, archived_at, batch_size):
+        """Insert the rows of a queryset into the archive table with the same columns."""
+        columns = [
+            field.attname
+            for field in archive_model._meta.concrete_fields
+            if field.name != "archived_at"
+        ]
+        rows = [
+            archive_model(**row, archived_at=archived_at)
+            for row in queryset.values(*columns)
+        ]
+        archive_model.objects.bulk_create(rows, batch_size=batch_size)
+        return len(rows)
+
+    @staticmethod
+    def _page(limit, offset):
+        try:
+            limit, offset = int(limit), int(offset)
+        except (TypeError, ValueError):
+            raise ArchiveError("limit and offset must be integers")
+        if not 0 < limit <= MAX_ARCHIVE_PAGE_SIZE or offset < 0:
+            raise ArchiveError(
+                f"limit must be between 1 and {MAX_ARCHIVE_PAGE_SIZE} and offset "
+                f"must not be negative"
+            )
+        return slice(offset, offset + limit)
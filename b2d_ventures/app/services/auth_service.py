@@ -1,16 +1,93 @@
 """The module defines the AuthorizationService class."""
 
+import logging
+import threading
+import time
 from urllib.parse import parse_qs, urlparse
 
+import jwt
 from django.conf import settings
 
 from b2d_ventures.utils import HTTPRequestHandler
 
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
 
 class AuthError(Exception):
     """Custom Exception for authorization errors."""
 
 
+class GoogleKeyCache:
+    """
+    Process-wide cache of Google's ID-token signing keys (JWKS).
+
+    The key set is fetched lazily, kept for ``GOOGLE_JWKS_CACHE_SECONDS`` and
+    refetched early when a token is signed with a key id we have not seen,
+    which is how Google rotates keys. Unknown key ids trigger at most one
+    refetch per ``GOOGLE_JWKS_MIN_REFRESH_SECONDS`` so bad tokens cannot be
+    used to hammer the JWKS endpoint.
+    """
+
+    def __init__(self):
+        self._keys = {}
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Drop all cached keys."""
+        with self._lock:
+            self._keys = {}
+            self._fetched_at = None
+
+    def get_signing_key(self, key_id):
+        """
+        Return the public key for a key id, refreshing the key set if needed.
+
+        :param key_id: The ``kid`` header of the token.
+        :return: Public key object usable by ``jwt.decode``.
+        """
+        key = self._lookup(key_id)
+        if key is not None:
+            return key
+
+        with self._lock:
+            key = self._lookup(key_id)
+            if key is None and self._may_refresh(key_id):
+                self._refresh()
+                key = self._keys.get(key_id)
+
+        if key is None:
+            raise AuthError(f"Unknown ID token signing key: {key_id}")
+        return key
+
+    def _lookup(self, key_id):
+        if self._fetched_at is None:
+            return None
+        if time.monotonic() - self._fetched_at >= settings.GOOGLE_JWKS_CACHE_SECONDS:
+            return None
+        return self._keys.get(key_id)
+
+    def _may_refresh(self, key_id):
+        if self._fetched_at is None:
+            return True
+        age = time.monotonic() - self._fetched_at
+        if age >= settings.GOOGLE_JWKS_CACHE_SECONDS:
+            return True
+        return age >= settings.GOOGLE_JWKS_MIN_REFRESH_SECONDS
+
+    def _refresh(self):
+        try:
+            data = HTTPRequestHandler.make_request("GET", settings.GOOGLE_JWKS_URL)
+            key_set = jwt.PyJWKSet.from_dict(data)
+        except Exception as e:
+            raise AuthError(f"Error fetching Google signing keys: {str(e)}")
+        self._keys = {key.key_id: key.key for key in key_set.keys}
+        self._fetched_at = time.monotonic()
+
+
+google_key_cache = GoogleKeyCache()
+
+
 class AuthService:
     """Class definition for AuthorizationService."""
 
@@ -56,6 +133,68 @@ class AuthService:
         headers = {"Authorization": f"Bearer {access_token}"}
         return HTTPRequestHandler.make_request("GET", url, headers=headers)
 
+    @staticmethod
+    def verify_id_token(id_token):
+        """
+        Verify a Google ID token locally and return its claims.
+
+        The signature is checked against the cached Google key set, so no
+        request to Google is made while the keys are fresh.
+
+        :param id_token: Signed ID token from the token response.
+        :return: Verified token claims.
+        """
+        try:
+            header = jwt.get_unverified_header(id_token)
+            key = google_key_cache.get_signing_key(header.get("kid"))
+            claims = jwt.decode(
+                id_token,
+                key=key,
+                algorithms=["RS256"],
+                audience=settings.GOOGLE_CLIENT_ID,
+                leeway=settings.GOOGLE_ID_TOKEN_LEEWAY_SECONDS,
+                options={"require": ["exp", "iat", "iss", "aud", "sub"]},
+            )
+        except jwt.PyJWTError as e:
+            raise AuthError(f"Invalid ID token: {str(e)}")
+
+        if claims.get("iss") not in GOOGLE_ISSUERS:
+            raise AuthError("Invalid ID token: unexpected issuer")
+        return claims
+
+    @staticmethod
+    def get_user_profile_from_tokens(tokens):
+        """
+        Retrieve a user profile from a token response.
+
+        The profile is read from the verified ``id_token`` when it carries a
+        verified email and a name; otherwise the userinfo endpoint is used.
+
+        :param tokens: Token data returned by exchange_code_for_token.
+        :return: User profile information.
+        """
+        id_token = tokens.get("id_token")
+        if id_token:
+            try:
+                claims = AuthService.verify_id_token(id_token)
+                if (
+                    claims.get("email")
+                    and claims.get("email_verified", False)
+                    and claims.get("name")
+                ):
+                    return {
+                        "id": claims["sub"],
+                        "email": claims["email"],
+                        "verified_email": True,
+                        "name": claims["name"],
+                        "given_name": claims.get("given_name"),
+                        "family_name": claims.get("family_name"),
+                        "picture": claims.get("picture"),
+                    }
+            except AuthError as e:
+                logging.warning(f"Falling back to userinfo endpoint: {e}")
+        return AuthService.get_user_profile(tokens["access_token"])
+
     @staticmethod
     def refresh_access_token(refresh_token):
         """
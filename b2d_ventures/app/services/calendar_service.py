@@ -1,15 +1,140 @@
-from datetime import timezone
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import Resource, build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest, HttpRequest, build_http
+
+# Google accepts at most 50 calls in one batch request.
+MAX_BATCH_SIZE = 50
 
 
 class CalendarError(Exception):
     """Custom Exception for calendar-related errors."""
 
 
+class CalendarSlotUnavailableError(CalendarError):
+    """Raised when the requested time slot is already taken in the calendar."""
+
+
+class CalendarSyncTokenExpiredError(CalendarError):
+    """Raised when Google invalidates a sync token and a full sync is needed."""
+
+
+class _AuthorizedRequest:
+    """An API request that executes with per-request credentials."""
+
+    def __init__(self, request, http):
+        self._request = request
+        self._http = http
+
+    def execute(self, http=None, **kwargs):
+        return self._request.execute(http=http or self._http, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._request, name)
+
+
+class _AuthorizedBatch:
+    """A batch request that executes with per-request credentials."""
+
+    def __init__(self, batch, http):
+        self._batch = batch
+        self._http = http
+
+    def add(self, request, callback=None, request_id=None):
+        if isinstance(request, _AuthorizedRequest):
+            request = request._request
+        self._batch.add(request, callback=callback, request_id=request_id)
+
+    def execute(self, http=None):
+        return self._batch.execute(http=http or self._http)
+
+    def __getattr__(self, name):
+        return getattr(self._batch, name)
+
+
+class _AuthorizedResource:
+    """
+    Binds per-request credentials to a shared, process-wide API resource.
+
+    Every request built through this view is executed with the bound HTTP
+    transport, so the cached resource itself never holds credentials.
+    Nested resources (``events()``, ``freebusy()``) are built once and cached
+    on the shared resource as well.
+    """
+
+    def __init__(self, resource, http, nested_cache):
+        self._resource = resource
+        self._http = http
+        self._nested_cache = nested_cache
+
+    def __getattr__(self, name):
+        attr = getattr(self._resource, name)
+        if not callable(attr):
+            return attr
+
+        cache_key = (id(self._resource), name)
+
+        def call(*args, **kwargs):
+            if not args and not kwargs and cache_key in self._nested_cache:
+                return _AuthorizedResource(
+                    self._nested_cache[cache_key], self._http, self._nested_cache
+                )
+            result = attr(*args, **kwargs)
+            if isinstance(result, Resource):
+                if not args and not kwargs:
+                    self._nested_cache[cache_key] = result
+                return _AuthorizedResource(result, self._http, self._nested_cache)
+            if isinstance(result, HttpRequest):
+                return _AuthorizedRequest(result, self._http)
+            if isinstance(result, BatchHttpRequest):
+                return _AuthorizedBatch(result, self._http)
+            return result
+
+        return call
+
+
 class CalendarService:
+    _resource = None
+    _nested_resources = {}
+    _resource_lock = threading.Lock()
+
+    @staticmethod
+    def _build_http():
+        """Create the base HTTP transport for a single request."""
+        return build_http()
+
+    @classmethod
+    def _get_resource(cls):
+        """
+        Build the Calendar API resource once per process.
+
+        The resource is built from the discovery document bundled with
+        google-api-python-client, so no discovery request is ever made. It
+        carries no credentials; those are bound per request in get_service.
+        """
+        if cls._resource is None:
+            with cls._resource_lock:
+                if cls._resource is None:
+                    document = get_static_doc("calendar", "v3")
+                    if document is None:
+                        cls._resource = build(
+                            "calendar",
+                            "v3",
+                            http=build_http(),
+                            static_discovery=False,
+                            cache_discovery=False,
+                        )
+                    else:
+                        cls._resource = build_from_document(document, http=build_http())
+                    cls._nested_resources = {}
+        return cls._resource
+
     @staticmethod
     def get_service(credentials):
         """
@@ -19,8 +144,11 @@ class CalendarService:
         :return: Google Calendar service object
         """
         try:
-            service = build("calendar", "v3", credentials=credentials)
-            return service
+            resource = CalendarService._get_resource()
+            http = AuthorizedHttp(credentials, http=CalendarService._build_http())
+            return _AuthorizedResource(
+                resource, http, CalendarService._nested_resources
+            )
         except Exception as e:
             raise CalendarError(f"Failed to build calendar service: {str(e)}")
 
@@ -80,7 +208,14 @@ class CalendarService:
 
     @staticmethod
     def schedule_meeting(
-        service, calendar_id, summary, description, start_time, end_time, attendees
+        service,
+        calendar_id,
+        summary,
+        description,
+        start_time,
+        end_time,
+        attendees,
+        event_id=None,
     ):
         """
         Schedule a meeting in the calendar.
@@ -92,8 +227,45 @@ class CalendarService:
         :param start_time: Start time of the event
         :param end_time: End time of the event
         :param attendees: List of attendee email addresses
+        :param event_id: Optional client-chosen event ID (base32hex), which
+            makes retried inserts safe
         :return: The created event object
         """
+        event = CalendarService.build_event(
+            summary, description, start_time, end_time, attendees, event_id
+        )
+
+        try:
+            event = (
+                service.events()
+                .insert(calendarId=calendar_id, body=event, sendUpdates="all")
+                .execute()
+            )
+            return event
+        except HttpError as error:
+            if event_id and error.resp.status == 409:
+                existing = CalendarService.get_event(service, calendar_id, event_id)
+                if existing is not None:
+                    return existing
+            raise CalendarError(
+                f"An error occurred while scheduling the meeting: {error}"
+            )
+
+    @staticmethod
+    def build_event(
+        summary, description, start_time, end_time, attendees, event_id=None
+    ):
+        """
+        Build the body of an events.insert request.
+
+        :param summary: Title of the event
+        :param description: Description of the event
+        :param start_time: Start time of the event
+        :param end_time: End time of the event
+        :param attendees: List of attendee email addresses
+        :param event_id: Optional client-chosen event ID (base32hex)
+        :return: Event resource dictionary
+        """
         event = {
             "summary": summary,
             "description": description,
@@ -114,18 +286,112 @@ class CalendarService:
                 ],
             },
         }
+        if event_id:
+            event["id"] = event_id
+        return event
 
+    @staticmethod
+    def get_event(service, calendar_id, event_id):
+        """
+        Get an event by ID.
+
+        :param service: Google Calendar service object
+        :param calendar_id: ID of the calendar holding the event
+        :param event_id: ID of the event
+        :return: The event object, or None if it does not exist or was deleted
+        """
         try:
             event = (
-                service.events()
-                .insert(calendarId=calendar_id, body=event, sendUpdates="all")
-                .execute()
+                service.events().get(calendarId=calendar_id, eventId=event_id).execute()
             )
-            return event
         except HttpError as error:
-            raise CalendarError(
-                f"An error occurred while scheduling the meeting: {error}"
-            )
+            if error.resp.status in (404, 410):
+                return None
+            raise CalendarError(f"An error occurred while getting the event: {error}")
+        if event.get("status") == "cancelled":
+            return None
+        return event
+
+    @staticmethod
+    def delete_event(service, calendar_id, event_id):
+        """
+        Delete an event and send its attendees a cancellation.
+
+        :param service: Google Calendar service object
+        :param calendar_id: ID of the calendar holding the event
+        :param event_id: ID of the event
+        """
+        try:
+            service.events().delete(
+                calendarId=calendar_id, eventId=event_id, sendUpdates="all"
+            ).execute()
+        except HttpError as error:
+            if error.resp.status in (404, 410):
+                return
+            raise CalendarError(f"An error occurred while deleting the event: {error}")
+
+    @staticmethod
+    def list_event_changes(
+        service,
+        calendar_id,
+        sync_token=None,
+        time_min=None,
+        page_size=250,
+        max_pages=None,
+    ):
+        """
+        List events changed since a sync token, following every page.
+
+        Without a sync token this is a full listing from ``time_min``, which
+        also yields the first sync token. Deleted events are included with
+        ``status="cancelled"``.
+
+        :param service: Google Calendar service object
+        :param calendar_id: ID of the calendar to read
+        :param sync_token: nextSyncToken from the previous sync, if any
+        :param time_min: Lower bound for a full listing (ignored with a token)
+        :param page_size: Events requested per page
+        :param max_pages: Stop after this many pages; no sync token is returned
+            when the listing is cut short
+        :return: Tuple of (events, next sync token or None)
+        """
+        params = {
+            "calendarId": calendar_id,
+            "showDeleted": True,
+            "singleEvents": True,
+            "maxResults": page_size,
+            "fields": (
+                "nextPageToken,nextSyncToken,items(id,status,summary,"
+                "description,start,end,attendees(email,responseStatus))"
+            ),
+        }
+        if sync_token:
+            params["syncToken"] = sync_token
+        elif time_min is not None:
+            params["timeMin"] = CalendarService.to_utc(time_min).isoformat()
+
+        events = []
+        pages = 0
+        while True:
+            try:
+                response = service.events().list(**params).execute()
+            except HttpError as error:
+                if error.resp.status == 410:
+                    raise CalendarSyncTokenExpiredError(
+                        "Sync token is no longer valid; a full sync is required"
+                    )
+                raise CalendarError(
+                    f"An error occurred while listing calendar changes: {error}"
+                )
+            events.extend(response.get("items", []))
+            pages += 1
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return events, response.get("nextSyncToken")
+            if max_pages is not None and pages >= max_pages:
+                return events, None
+            params["pageToken"] = page_token
 
     @staticmethod
     def get_free_busy(service, time_min, time_max, calendars):
@@ -139,8 +405,8 @@ class CalendarService:
         :return: Dictionary with free/busy information
         """
         body = {
-            "timeMin": time_min.isoformat() + "Z",
-            "timeMax": time_max.isoformat() + "Z",
+            "timeMin": CalendarService.to_utc(time_min).isoformat(),
+            "timeMax": CalendarService.to_utc(time_max).isoformat(),
             "items": [{"id": calendar} for calendar in calendars],
         }
         try:
@@ -150,29 +416,194 @@ class CalendarService:
                 f"An error occurred while getting free/busy information: {error}"
             )
 
+    @staticmethod
+    def to_utc(value):
+        """
+        Return a timezone-aware UTC datetime, treating naive values as UTC.
+
+        :param value: datetime to normalize
+        :return: datetime in UTC
+        """
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    @staticmethod
+    def parse_datetime(value):
+        """
+        Parse an RFC 3339 timestamp as returned by the Calendar API.
+
+        :param value: Timestamp string, e.g. "2024-01-01T10:00:00Z"
+        :return: datetime in UTC
+        """
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return CalendarService.to_utc(datetime.fromisoformat(value))
+
+    @staticmethod
+    def extract_busy_intervals(free_busy):
+        """
+        Collect the busy intervals of every calendar in a free/busy response.
+
+        Calendars that could not be read (for example a startup calendar that
+        is not shared with the investor) are skipped.
+
+        :param free_busy: Response of get_free_busy
+        :return: List of (start, end) datetimes
+        """
+        intervals = []
+        for calendar_id, calendar in free_busy.get("calendars", {}).items():
+            if calendar.get("errors"):
+                logging.warning(
+                    f"Free/busy unavailable for calendar {calendar_id}: "
+                    f"{calendar['errors']}"
+                )
+            for busy in calendar.get("busy", []):
+                intervals.append(
+                    (
+                        CalendarService.parse_datetime(busy["start"]),
+                        CalendarService.parse_datetime(busy["end"]),
+                    )
+                )
+        return intervals
+
+    @staticmethod
+    def merge_busy_intervals(intervals):
+        """
+        Merge overlapping or touching busy intervals.
+
+        Intervals are sorted by start time and swept once, extending the
+        current interval while the next one starts before it ends.
+
+        :param intervals: Iterable of (start, end) datetimes
+        :return: Sorted list of disjoint (start, end) datetimes
+        """
+        merged = []
+        for start, end in sorted(intervals):
+            if end <= start:
+                continue
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1][1] = end
+            else:
+                merged.append([start, end])
+        return [(start, end) for start, end in merged]
+
+    @staticmethod
+    def find_free_slots(
+        busy, time_min, time_max, duration, limit, granularity=timedelta(minutes=15)
+    ):
+        """
+        Find the earliest free windows of a given duration.
+
+        Slots start on multiples of ``granularity`` and never overlap a busy
+        interval or each other.
+
+        :param busy: Iterable of (start, end) busy datetimes
+        :param time_min: Start of the search range
+        :param time_max: End of the search range
+        :param duration: timedelta length of each slot
+        :param limit: Maximum number of slots to return
+        :param granularity: timedelta that slot start times are aligned to
+        :return: List of (start, end) datetimes
+        """
+        time_min = CalendarService.to_utc(time_min)
+        time_max = CalendarService.to_utc(time_max)
+        merged = CalendarService.merge_busy_intervals(
+            (CalendarService.to_utc(start), CalendarService.to_utc(end))
+            for start, end in busy
+        )
+        merged.append((time_max, time_max))
+
+        slots = []
+        cursor = time_min
+        for busy_start, busy_end in merged:
+            cursor = CalendarService._align(cursor, granularity)
+            gap_end = min(busy_start, time_max)
+            while cursor + duration <= gap_end and len(slots) < limit:
+                slots.append((cursor, cursor + duration))
+                cursor += duration
+            if len(slots) >= limit or busy_start >= time_max:
+                break
+            cursor = max(cursor, busy_end)
+        return slots
+
+    @staticmethod
+    def _align(value, granularity):
+        step = granularity.total_seconds()
+        if step <= 0:
+            return value
+        offset = value.timestamp() % step
+        if offset == 0:
+            return value
+        return value + timedelta(seconds=step - offset)
+
+    @staticmethod
+    def suggest_investor_startup_slots(
+        token, startup_email, time_min, time_max, duration, limit, extra_busy=()
+    ):
+        """
+        Suggest meeting slots that are free for both an investor and a startup.
+
+        Both calendars are read with a single free/busy query and combined
+        with any extra busy intervals, such as meetings already stored by us.
+
+        :param token: Investor's access token
+        :param startup_email: Email address (calendar ID) of the startup
+        :param time_min: Start of the search range
+        :param time_max: End of the search range
+        :param duration: timedelta length of the meeting
+        :param limit: Maximum number of slots to return
+        :param extra_busy: Additional (start, end) busy intervals
+        :return: List of (start, end) datetimes
+        """
+        try:
+            credentials = Credentials(token=token)
+            service = CalendarService.get_service(credentials)
+            free_busy = CalendarService.get_free_busy(
+                service, time_min, time_max, ["primary", startup_email]
+            )
+            busy = CalendarService.extract_busy_intervals(free_busy)
+            busy.extend(extra_busy)
+            return CalendarService.find_free_slots(
+                busy, time_min, time_max, duration, limit
+            )
+        except Exception as e:
+            raise CalendarError(f"Error suggesting meeting slots: {str(e)}")
+
     @staticmethod
     def schedule_investor_startup_meeting(
-        token, title, description, start_time, end_time, startup_email
+        token, title, description, start_time, end_time, startup_email, event_id=None
     ):
         """
         Schedule a meeting between an investor and a startup.
 
+        When ``event_id`` is given and an event with that ID already exists
+        (an earlier attempt succeeded but its result was lost), that event is
+        returned instead of booking the slot twice.
+
         :param token: Token containing the authorization token
         :param title: Title of the event
         :param description: Description of the event
         :param start_time: Start time of the event
         :param end_time: End time of the event
         :param startup_email: Email address of the startup
+        :param event_id: Optional client-chosen event ID (base32hex)
         :return: The created event object
         """
         try:
             credentials = Credentials(token=token)
             service = CalendarService.get_service(credentials)
 
+            if event_id:
+                existing = CalendarService.get_event(service, "primary", event_id)
+                if existing is not None:
+                    return existing
+
             if not CalendarService.check_availability(
                 service, "primary", start_time, end_time
             ):
-                raise CalendarError(
+                raise CalendarSlotUnavailableError(
                     "The requested time slot is not available for the investor"
                 )
 
@@ -184,9 +615,140 @@ class CalendarService:
                 start_time,
                 end_time,
                 [startup_email],
+                event_id=event_id,
             )
 
             return event
 
+        except CalendarSlotUnavailableError:
+            raise
         except Exception as e:
             raise CalendarError(f"Error scheduling investor-startup meeting: {str(e)}")
+
+    @staticmethod
+    def cancel_investor_startup_meeting(token, event_id):
+        """
+        Delete a meeting from the investor's calendar and uninvite the startup.
+
+        :param token: Investor's access token
+        :param event_id: ID of the event to delete
+        """
+        try:
+            credentials = Credentials(token=token)
+            service = CalendarService.get_service(credentials)
+            CalendarService.delete_event(service, "primary", event_id)
+        except CalendarError:
+            raise
+        except Exception as e:
+            raise CalendarError(f"Error cancelling investor-startup meeting: {str(e)}")
+
+    @staticmethod
+    def batch_schedule_investor_startup_meetings(
+        token, meetings, batch_size=MAX_BATCH_SIZE
+    ):
+        """
+        Schedule many meetings organized by one investor.
+
+        Availability is read with a single free/busy query covering all the
+        meetings, and the inserts are sent as batch requests of up to
+        ``batch_size`` calls instead of one round trip each.
+
+        :param token: Investor's access token
+        :param meetings: List of dictionaries with title, description,
+            start_time, end_time, startup_email and optional event_id
+        :param batch_size: Maximum number of inserts per batch request
+        :return: List aligned with ``meetings`` holding either the created
+            event or the CalendarError for that meeting
+        """
+        if not meetings:
+            return []
+        try:
+            credentials = Credentials(token=token)
+            service = CalendarService.get_service(credentials)
+            free_busy = CalendarService.get_free_busy(
+                service,
+                min(meeting["start_time"] for meeting in meetings),
+                max(meeting["end_time"] for meeting in meetings),
+                ["primary"],
+            )
+            busy = CalendarService.merge_busy_intervals(
+                CalendarService.extract_busy_intervals(free_busy)
+            )
+        except CalendarError:
+            raise
+        except Exception as e:
+            raise CalendarError(f"Error checking investor availability: {str(e)}")
+
+        results = [None] * len(meetings)
+        pending = []
+        for index, meeting in enumerate(meetings):
+            start = CalendarService.to_utc(meeting["start_time"])
+            end = CalendarService.to_utc(meeting["end_time"])
+            if any(
+                start < busy_end and busy_start < end for busy_start, busy_end in busy
+            ):
+                results[index] = CalendarSlotUnavailableError(
+                    "The requested time slot is not available for the investor"
+                )
+            else:
+                pending.append(index)
+
+        conflicts = []
+
+        def store_result(request_id, response, exception):
+            index = int(request_id)
+            if (
+                isinstance(exception, HttpError)
+                and exception.resp.status == 409
+                and meetings[index].get("event_id")
+            ):
+                # A retried insert: the event was created by an earlier attempt.
+                conflicts.append(index)
+            elif exception is not None:
+                results[index] = CalendarError(
+                    f"An error occurred while scheduling the meeting: {exception}"
+                )
+            else:
+                results[index] = response
+
+        for offset in range(0, len(pending), batch_size):
+            batch = service.new_batch_http_request(callback=store_result)
+            for index in pending[offset : offset + batch_size]:
+                meeting = meetings[index]
+                body = CalendarService.build_event(
+                    meeting["title"],
+                    meeting["description"],
+                    meeting["start_time"],
+                    meeting["end_time"],
+                    [meeting["startup_email"]],
+                    meeting.get("event_id"),
+                )
+                batch.add(
+                    service.events().insert(
+                        calendarId="primary", body=body, sendUpdates="all"
+                    ),
+                    request_id=str(index),
+                )
+            try:
+                batch.execute()
+            except Exception as e:
+                for index in pending[offset : offset + batch_size]:
+                    if results[index] is None:
+                        results[index] = CalendarError(
+                            f"Batch request to Calendar API failed: {str(e)}"
+                        )
+
+        for index in conflicts:
+            if results[index] is not None:
+                continue
+            try:
+                existing = CalendarService.get_event(
+                    service, "primary", meetings[index]["event_id"]
+                )
+            except CalendarError as e:
+                results[index] = e
+                continue
+            results[index] = existing or CalendarError(
+                "An event with this ID already exists and was cancelled"
+            )
+        return results
@@ -0,0 +1,221 @@
+"""The module defines the CalendarSyncService class."""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from google.oauth2.credentials import Credentials
+
+from b2d_ventures.app.models import CalendarSyncState, Investor, Meeting
+from b2d_ventures.app.services.auth_service import AuthService, AuthError
+from b2d_ventures.app.services.calendar_service import (
+    CalendarService,
+    CalendarError,
+    CalendarSyncTokenExpiredError,
+)
+
+EVENT_ID_CHUNK_SIZE = 500
+SYNCED_FIELDS = [
+    "status",
+    "start_time",
+    "end_time",
+    "title",
+    "description",
+    "updated_at",
+]
+
+
+class CalendarSyncService:
+    """
+    Pull changes made in Google Calendar back into the Meeting table.
+
+    Each investor's calendar is read incrementally with the nextSyncToken
+    stored in CalendarSyncState, so only events changed since the last run
+    are transferred. Moved events update the meeting times; deleted events,
+    or events the startup declined, cancel the meeting.
+    """
+
+    @staticmethod
+    def sync_all():
+        """
+        Sync the calendars of every investor with a booked meeting.
+
+        Errors for one investor are logged and do not stop the others.
+
+        :return: Dictionary with the number of synced users, errors, and
+            updated and cancelled meetings
+        """
+        totals = {"users": 0, "errors": 0, "updated": 0, "cancelled": 0}
+        investors = Investor.objects.filter(
+            meetings__investor_event_id__isnull=False
+        ).distinct()
+        for investor in investors:
+            try:
+                result = CalendarSyncService.sync_user(investor)
+            except (AuthError, CalendarError) as e:
+                logging.error(f"Calendar sync failed for user {investor.id}: {e}")
+                totals["errors"] += 1
+                continue
+            totals["users"] += 1
+            totals["updated"] += result["updated"]
+            totals["cancelled"] += result["cancelled"]
+        return totals
+
+    @staticmethod
+    def sync_user(investor):
+        """
+        Apply the calendar changes of one investor since the last sync.
+
+        Without a stored token, or when Google rejects it with 410 Gone, a
+        full resync bounded by CALENDAR_FULL_SYNC_DAYS and
+        CALENDAR_FULL_SYNC_MAX_PAGES is done instead.
+
+        :param investor: Investor whose calendar is read
+        :return: Dictionary with updated and cancelled counts and whether a
+            full sync was needed
+        """
+        if not investor.refresh_token:
+            raise AuthError("Investor does not have a valid refresh token")
+
+        state, _ = CalendarSyncState.objects.get_or_create(user=investor)
+        access_token = AuthService().refresh_access_token(investor.refresh_token)
+        service = CalendarService.get_service(Credentials(token=access_token))
+
+        full_sync = not state.sync_token
+        if not full_sync:
+            try:
+                events, next_sync_token = CalendarService.list_event_changes(
+                    service,
+                    state.calendar_id,
+                    sync_token=state.sync_token,
+                    page_size=settings.CALENDAR_SYNC_PAGE_SIZE,
+                )
+            except CalendarSyncTokenExpiredError:
+                logging.warning(
+                    f"Sync token expired for user {investor.id}; doing a full sync"
+                )
+                full_sync = True
+
+        now = timezone.now()
+        if full_sync:
+            events, next_sync_token = CalendarService.list_event_changes(
+                service,
+                state.calendar_id,
+                time_min=now - timedelta(days=settings.CALENDAR_FULL_SYNC_DAYS),
+                page_size=settings.CALENDAR_SYNC_PAGE_SIZE,
+                max_pages=settings.CALENDAR_FULL_SYNC_MAX_PAGES,
+            )
+            if next_sync_token is None:
+                logging.warning(
+                    f"Full sync for user {investor.id} stopped after "
+                    f"{settings.CALENDAR_FULL_SYNC_MAX_PAGES} pages"
+                )
+            state.last_full_sync_at = now
+
+        result = CalendarSyncService.apply_changes(investor, events)
+
+        state.sync_token = next_sync_token
+        state.last_synced_at = now
+        state.save(update_fields=["sync_token", "last_synced_at", "last_full_sync_at"])
+        result["full_sync"] = full_sync
+        return result
+
+    @staticmethod
+    def apply_changes(investor, events):
+        """
+        Update or cancel the investor's meetings matching changed events.
+
+        Meetings are looked up by investor_event_id and written back with a
+        single bulk update. If that update hits the overlap constraint, the
+        meetings are saved one by one and the conflicting ones are skipped.
+
+        :param investor: Investor who organizes the events
+        :param events: Event resources from list_event_changes
+        :return: Dictionary with updated and cancelled counts
+        """
+        events_by_id = {event["id"]: event for event in events if "id" in event}
+        event_ids = list(events_by_id)
+        changed = []
+        cancelled = 0
+        for offset in range(0, len(event_ids), EVENT_ID_CHUNK_SIZE):
+            meetings = (
+                Meeting.objects.filter(
+                    investor=investor,
+                    investor_event_id__in=event_ids[
+                        offset : offset + EVENT_ID_CHUNK_SIZE
+                    ],
+                )
+                .exclude(status__in=Meeting.INACTIVE_STATUSES)
+                .select_related("startup")
+            )
+            for meeting in meetings:
+                event = events_by_id[meeting.investor_event_id]
+                if CalendarSyncService._is_cancelled(event, meeting.startup.email):
+                    meeting.status = Meeting.CANCELLED
+                    changed.append(meeting)
+                    cancelled += 1
+                elif CalendarSyncService._update_from_event(meeting, event):
+                    changed.append(meeting)
+
+        if not changed:
+            return {"updated": 0, "cancelled": 0}
+        # bulk_update() does not apply auto_now.
+        now = timezone.now()
+        for meeting in changed:
+            meeting.updated_at = now
+        try:
+            with transaction.atomic():
+                Meeting.objects.bulk_update(changed, SYNCED_FIELDS)
+        except IntegrityError:
+            changed = CalendarSyncService._save_individually(changed)
+            cancelled = sum(m.status == Meeting.CANCELLED for m in changed)
+        return {"updated": len(changed) - cancelled, "cancelled": cancelled}
+
+    @staticmethod
+    def _save_individually(meetings):
+        saved = []
+        for meeting in meetings:
+            try:
+                with transaction.atomic():
+                    meeting.save(update_fields=SYNCED_FIELDS)
+            except IntegrityError:
+                logging.warning(
+                    f"Skipping calendar change to meeting {meeting.id}: "
+                    f"it overlaps another meeting"
+                )
+                continue
+            saved.append(meeting)
+        return saved
+
+    @staticmethod
+    def _is_cancelled(event, startup_email):
+        if event.get("status") == "cancelled":
+            return True
+        return any(
+            attendee.get("email", "").lower() == startup_email.lower()
+            and attendee.get("responseStatus") == "declined"
+            for attendee in event.get("attendees", [])
+        )
+
+    @staticmethod
+    def _update_from_event(meeting, event):
+        """Copy times and text from the event; return whether anything changed."""
+        values = {}
+        start = event.get("start", {}).get("dateTime")
+        end = event.get("end", {}).get("dateTime")
+        if start and end:
+            values["start_time"] = CalendarService.parse_datetime(start)
+            values["end_time"] = CalendarService.parse_datetime(end)
+        if "summary" in event:
+            values["title"] = event["summary"][:255]
+        if "description" in event:
+            values["description"] = event["description"]
+
+        modified = False
+        for field, value in values.items():
+            if getattr(meeting, field) != value:
+                setattr(meeting, field, value)
+                modified = True
+        return modified
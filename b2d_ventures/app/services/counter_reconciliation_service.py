@@ -0,0 +1,228 @@
+"""The module defines the CounterReconciliationService class."""
+
+import logging
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from b2d_ventures.app.models import (
+    ArchivedInvestment,
+    Deal,
+    Investment,
+    Investor,
+    Startup,
+)
+from b2d_ventures.app.services.deal_cache_service import DealCacheService
+from b2d_ventures.utils.email_service import CENTS, net_of_platform_fee
+from b2d_ventures.utils.keyset import keyset_chunks
+from b2d_ventures.utils.model_cache import model_cache
+
+ZERO = Decimal("0.00")
+
+
+class CounterReconciliationService:
+    """
+    Recompute the counters create_investment maintains by hand.
+
+    ``Deal.amount_raised``, ``Deal.investor_count``, ``Startup.total_raised``
+    and ``Investor.total_invested`` are incremented per investment and not
+    decremented when investments or deals are deleted. They are recomputed
+    from the investments with grouped aggregates, following create_investment:
+    the deal and startup figures are net of the platform fee, which is taken
+    from each investment and rounded to the cent, the investor figure is
+    gross, and investor_count counts investments. Investments of
+    archived deals still count towards the startup and investor totals.
+
+    Startups, and then investors, are processed in chunks of ids. Each chunk
+    is repaired in its own short transaction, which locks only the counter
+    rows of that chunk.
+    """
+
+    @staticmethod
+    def reconcile(startup_ids=None, chunk_size=500, batch_size=500, dry_run=False):
+        """
+        Find and repair counters that drifted from the investments.
+
+        :param startup_ids: Only check these startups, their deals and their
+            investors; all of them if None
+        :param chunk_size: Number of startups or investors per chunk
+        :param batch_size: Number of rows per bulk_update query
+        :param dry_run: Report the drift without repairing it
+        :return: Dictionary with the number of startups, deals and investors
+            checked and the list of drifts, each with model, id, field,
+            stored and expected values
+        """
+        report = {"startups": 0, "deals": 0, "investors": 0, "drifts": []}
+
+        startups = Startup.objects.order_by("id").values_list("id", flat=True)
+        investors = Investor.objects.order_by("id").values_list("id", flat=True)
+        if startup_ids is not None:
+            startups = startups.filter(id__in=startup_ids)
+            investors = investors.filter(
+                Q(deal_investments__deal__startup_id__in=startup_ids)
+                | Q(archived_investments__deal__startup_id__in=startup_ids)
+            ).distinct()
+
+        for chunk in keyset_chunks(startups, chunk_size):
+            with transaction.atomic():
+                CounterReconciliationService._reconcile_startups(
+                    chunk, batch_size, dry_run, report
+                )
+        for chunk in keyset_chunks(investors, chunk_size):
+            with transaction.atomic():
+                CounterReconciliationService._reconcile_investors(
+                    chunk, batch_size, dry_run, report
+                )
+
+        logging.info(
+            f"Reconciled counters of {report['startups']} startups, "
+            f"{report['deals']} deals and {report['investors']} investors: "
+            f"{len(report['drifts'])} drifted" + (" (dry run)" if dry_run else "")
+        )
+        return report
+
+    @staticmethod
+    def _reconcile_startups(startup_ids, batch_size, dry_run, report):
+        deals = Deal.objects.filter(startup_id__in=startup_ids).only(
+            "id", "startup_id", "amount_raised", "investor_count"
+        )
+        startups = Startup.objects.filter(id__in=startup_ids).only("id", "total_raised")
+        if not dry_run:
+            deals = deals.select_for_update()
+            startups = startups.select_for_update()
+        deals, startups = list(deals), list(startups)
+
+        net, count = CounterReconciliationService._net_totals(
+            Investment.objects.filter(deal__startup_id__in=startup_ids), "deal_id"
+        )
+
+        raised = defaultdict(lambda: ZERO)
+        changed_deals = []
+        for deal in deals:
+            expected = {"amount_raised": net[deal.id], "investor_count": count[deal.id]}
+            raised[deal.startup_id] += expected["amount_raised"]
+            if CounterReconciliationService._diff(deal, expected, report):
+                changed_deals.append(deal)
+        archived, _ = CounterReconciliationService._net_totals(
+            ArchivedInvestment.objects.filter(deal__startup_id__in=startup_ids),
+            "deal__startup_id",
+        )
+        for startup_id, amount in archived.items():
+            raised[startup_id] += amount
+
+        changed_startups = [
+            startup
+            for startup in startups
+            if CounterReconciliationService._diff(
+                startup, {"total_raised": raised[startup.id]}, report
+            )
+        ]
+        report["startups"] += len(startups)
+        report["deals"] += len(deals)
+        if dry_run:
+            return
+
+        CounterReconciliationService._save(
+            Deal, changed_deals, ["amount_raised", "investor_count"], batch_size
+        )
+        CounterReconciliationService._save(
+            Startup, changed_startups, ["total_raised"], batch_size
+        )
+        # Deal payloads include the startup.
+        changed_deal_ids = {deal.id for deal in changed_deals}
+        changed_startup_ids = {startup.id for startup in changed_startups}
+        for deal in deals:
+            if deal.id in changed_deal_ids or deal.startup_id in changed_startup_ids:
+                DealCacheService.invalidate(deal.id)
+
+    @staticmethod
+    def _reconcile_investors(investor_ids, batch_size, dry_run, report):
+        investors = Investor.objects.filter(id__in=investor_ids).only(
+            "id", "total_invested"
+        )
+        if not dry_run:
+            investors = investors.select_for_update()
+        investors = list(investors)
+
+        totals = defaultdict(lambda: ZERO)
+        for model in (Investment, ArchivedInvestment):
+            for investor_id, gross in (
+                model.objects.filter(investor_id__in=investor_ids)
+                .values("investor_id")
+                .annotate(gross=Sum("investment_amount"))
+                .values_list("investor_id", "gross")
+            ):
+                totals[investor_id] += gross
+        changed = [
+            investor
+            for investor in investors
+            if CounterReconciliationService._diff(
+                investor,
+                {"total_invested": totals[investor.id].quantize(CENTS)},
+                report,
+            )
+        ]
+        report["investors"] += len(investors)
+        if not dry_run:
+            CounterReconciliationService._save(
+                Investor, changed, ["total_invested"], batch_size
+            )
+
+    @staticmethod
+    def _diff(instance, expected, report):
+        """Record the drifted fields of a row and set them to their values."""
+        drifted = False
+        for field, value in expected.items():
+            stored = getattr(instance, field)
+            if stored != value:
+                report["drifts"].append(
+                    {
+                        "model": instance._meta.model_name,
+                        "id": str(instance.id),
+                        "field": field,
+                        "stored": stored,
+                        "expected": value,
+                    }
+                )
+                setattr(instance, field, value)
+                drifted = True
+        return drifted
+
+    @staticmethod
+    def _save(model, instances, fields, batch_size):
+        """Write repaired rows without signals, so invalidate them by hand."""
+        if not instances:
+            return
+        now = timezone.now()
+        for instance in instances:
+            instance.updated_at = now
+        model.objects.bulk_update(
+            instances, [*fields, "updated_at"], batch_size=batch_size
+        )
+        for instance in instances:
+            model_cache.invalidate(model, instance.id)
+            transaction.on_commit(
+                lambda pk=instance.id: model_cache.invalidate(model, pk), robust=True
+            )
+
+    @staticmethod
+    def _net_totals(investments, key):
+        """
+        Sum the investments' amounts net of the fee, and count them, per key.
+
+        create_investment rounds the net of each investment, so the fee is
+        taken per investment rather than from the summed gross. Investments
+        are grouped by amount as well, so each distinct amount is netted once.
+        """
+        net, count = defaultdict(lambda: ZERO), defaultdict(int)
+        for group, amount, investments in (
+            investments.values_list(key, "investment_amount")
+            .annotate(investments=Count("id"))
+            .order_by()
+        ):
+            net[group] += net_of_platform_fee(amount) * investments
+            count[group] += investments
+        return net, count
@@ -0,0 +1,284 @@
+"""The module defines the DataroomIndexService class."""
+
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+
+import requests
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from b2d_ventures.app.models import DataroomDocument, DataroomPage, Deal
+from b2d_ventures.utils.pdf_preview import (
+    extract_pdf,
+    limit_memory,
+    normalize_text,
+    run_with_cpu_limit,
+)
+
+# Seconds the parent waits beyond the CPU limit before killing the pool,
+# e.g. for a worker blocked without using CPU.
+WALL_CLOCK_GRACE_SECONDS = 5
+# Remote datarooms are written to a temporary file in chunks of this size.
+SPOOL_CHUNK_SIZE = 1024 * 1024
+REMOTE_TIMEOUT_SECONDS = 30
+
+_dispatcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dataroom-index")
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool():
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=settings.DATAROOM_INDEX_WORKERS,
+                    initializer=limit_memory,
+                    initargs=(settings.DATAROOM_INDEX_MEMORY_BYTES,),
+                )
+    return _process_pool
+
+
+def _reset_process_pool(pool):
+    """Kill the workers of a pool that timed out or broke, and drop it."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    # ProcessPoolExecutor cannot cancel a running task, so its processes
+    # are terminated directly.
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+class DataroomIndexService:
+    """
+    Extract page text and a preview from datarooms after upload.
+
+    Each dataroom is parsed in a process pool whose workers have capped
+    memory and CPU time, so a malicious PDF only fails its own extraction.
+    The page count, normalized text per page and a first-page WebP
+    thumbnail are recorded in DataroomDocument and DataroomPage, and the
+    text is searched by search_deals.
+    """
+
+    @staticmethod
+    def schedule(deal):
+        """
+        Index the deal's dataroom after the current transaction.
+
+        With DATAROOM_INDEX_ASYNC the work is handed to a background thread,
+        so the upload request does not wait for it.
+
+        :param deal: Deal whose dataroom was uploaded or changed
+        """
+        if not DataroomIndexService.needs_update(deal):
+            return
+        if settings.DATAROOM_INDEX_ASYNC:
+            transaction.on_commit(
+                lambda: _dispatcher.submit(DataroomIndexService._run, deal.id)
+            )
+        else:
+            transaction.on_commit(lambda: DataroomIndexService.index(deal.id))
+
+    @staticmethod
+    def needs_update(deal, force=False):
+        """
+        Check whether the deal's dataroom index is missing or out of date.
+
+        :param deal: Deal to check
+        :param force: Treat an existing index as out of date
+        :return: True if index would change anything
+        """
+        try:
+            document = deal.dataroom_document
+        except DataroomDocument.DoesNotExist:
+            return bool(deal.dataroom)
+        return force or document.source != deal.dataroom.name
+
+    @staticmethod
+    def index(deal_id, force=False):
+        """
+        Extract and store the page index and preview of a deal's dataroom.
+
+        :param deal_id: ID of the deal
+        :param force: Re-index even if the index is up to date
+        :return: DataroomDocument, or None if nothing was indexed
+        """
+        deal = Deal.objects.get(id=deal_id)
+        if not DataroomIndexService.needs_update(deal, force):
+            return None
+        if not deal.dataroom:
+            DataroomIndexService._delete_thumbnail(DataroomIndexService._delete(deal))
+            return None
+
+        source = deal.dataroom.name
+        try:
+            with DataroomIndexService._local_path(
+                deal.dataroom.storage, source
+            ) as path:
+                result = DataroomIndexService._extract(path)
+        except Exception as e:
+            logging.error(f"Could not index dataroom of deal {deal.id}: {e}")
+            result = {"error": str(e) or type(e).__name__}
+
+        thumbnail = ""
+        if result.get("thumbnail"):
+            storage = Deal._meta.get_field("image_background").storage
+            name = f"{os.path.splitext(source)[0]}_preview.webp"
+            thumbnail = storage.save(name, ContentFile(result["thumbnail"]))
+
+        pages = result.get("pages", [])
+        with transaction.atomic():
+            deal = Deal.objects.select_for_update().get(id=deal_id)
+            if deal.dataroom.name != source:
+                # Replaced while extracting; the new upload schedules its own.
+                old_thumbnail, document = thumbnail, None
+            else:
+                old_thumbnail = DataroomIndexService._delete(deal)
+                document = DataroomDocument.objects.create(
+                    deal=deal,
+                    source=source,
+                    status="failed" if "error" in result else "complete",
+                    error=result.get("error", "")[:255],
+                    page_count=result.get("page_count", 0),
+                    thumbnail=thumbnail,
+                    search_text=normalize_text(" ".join(pages))[
+                        : settings.DATAROOM_SEARCH_TEXT_MAX_CHARS
+                    ],
+                    processed_at=timezone.now(),
+                )
+                DataroomPage.objects.bulk_create(
+                    DataroomPage(document=document, number=number, text=text)
+                    for number, text in enumerate(pages, start=1)
+                )
+        DataroomIndexService._delete_thumbnail(old_thumbnail)
+        return document
+
+    @staticmethod
+    def search_deals(queryset, term):
+        """
+        Filter deals by a search term, including their dataroom text.
+
+        :param queryset: Deals to search
+        :param term: Search term
+        :return: Filtered queryset
+        """
+        return queryset.filter(
+            Q(name__icontains=term)
+            | Q(description__icontains=term)
+            | Q(content__icontains=term)
+            | Q(dataroom_document__search_text__icontains=term)
+        )
+
+    @staticmethod
+    def matching_pages(deal_ids, term):
+        """
+        Find the dataroom pages mentioning a search term.
+
+        :param deal_ids: IDs of the deals to look in
+        :param term: Search term
+        :return: Dictionary of deal ID to sorted page numbers
+        """
+        pages = {}
+        for deal_id, number in (
+            DataroomPage.objects.filter(
+                document__deal_id__in=deal_ids, text__icontains=term
+            )
+            .order_by("number")
+            .values_list("document__deal_id", "number")
+        ):
+            pages.setdefault(deal_id, []).append(number)
+        return pages
+
+    @staticmethod
+    @contextmanager
+    def _local_path(storage, name):
+        """
+        Get a path the pool workers can open a stored dataroom at.
+
+        Remote files are streamed to a temporary file, which is removed
+        afterwards, so the dataroom is never held in memory.
+        """
+        try:
+            path = storage.path(name)
+        except NotImplementedError:
+            path = None
+        if path is not None:
+            yield path
+            return
+        with tempfile.NamedTemporaryFile(
+            suffix=".pdf", dir=settings.FILE_UPLOAD_TEMP_DIR
+        ) as file:
+            with requests.get(
+                storage.url(name), stream=True, timeout=REMOTE_TIMEOUT_SECONDS
+            ) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(SPOOL_CHUNK_SIZE):
+                    file.write(chunk)
+            file.flush()
+            yield file.name
+
+    @staticmethod
+    def _extract(path):
+        """Parse a PDF file in the process pool under the configured limits."""
+        pool = _get_process_pool()
+        cpu_limit = settings.DATAROOM_INDEX_CPU_SECONDS
+        future = pool.submit(
+            run_with_cpu_limit,
+            cpu_limit,
+            extract_pdf,
+            path,
+            settings.DATAROOM_INDEX_MAX_PAGES,
+            settings.DATAROOM_PAGE_TEXT_MAX_CHARS,
+            settings.DATAROOM_THUMBNAIL_WIDTH,
+        )
+        try:
+            return future.result(timeout=cpu_limit + WALL_CLOCK_GRACE_SECONDS)
+        except FutureTimeoutError:
+            _reset_process_pool(pool)
+            raise TimeoutError("Dataroom extraction timed out")
+        except BrokenProcessPool:
+            # The worker was killed, e.g. by SIGXCPU past the CPU limit.
+            _reset_process_pool(pool)
+            raise RuntimeError("Dataroom extraction exceeded its resource limits")
+
+    @staticmethod
+    def _delete(deal):
+        """Delete the deal's index and return its old thumbnail name."""
+        document = DataroomDocument.objects.filter(deal=deal).first()
+        if document is None:
+            return None
+        document.delete()
+        return document.thumbnail
+
+    @staticmethod
+    def _delete_thumbnail(name):
+        if not name:
+            return
+        try:
+            Deal._meta.get_field("image_background").storage.delete(name)
+        except Exception as e:
+            logging.warning(f"Could not delete dataroom preview {name}: {e}")
+
+    @staticmethod
+    def _run(deal_id):
+        try:
+            DataroomIndexService.index(deal_id)
+        except Deal.DoesNotExist:
+            pass
+        except Exception:
+            logging.exception(f"Indexing dataroom of deal {deal_id} failed")
+        finally:
+            connection.close()
@@ -0,0 +1,288 @@
+"""The module defines the DataroomService class and DataroomError."""
+
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone as dt_timezone
+
+import requests
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.http import HttpResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils import timezone
+
+from b2d_ventures.app.models import DataroomAccessLog, Deal
+
+SIGNER_SALT = "b2d_ventures.dataroom-download"
+CACHE_KEY_PREFIX = "dataroom-link:"
+STREAM_CHUNK_SIZE = 64 * 1024
+REMOTE_TIMEOUT_SECONDS = 30
+# Headers copied from the storage backend when proxying a remote file.
+PROXIED_HEADERS = (
+    "Content-Length",
+    "Content-Range",
+    "Content-Type",
+    "Accept-Ranges",
+    "ETag",
+    "Last-Modified",
+)
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+DataroomLink = namedtuple(
+    "DataroomLink", ["deal_id", "investor_id", "name", "expires_at"]
+)
+
+_access_log_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="dataroom-access-log"
+)
+
+
+class DataroomError(Exception):
+    """Custom Exception for invalid or expired dataroom links."""
+
+
+class RangeNotSatisfiableError(Exception):
+    """The requested byte range lies outside the file."""
+
+
+class DataroomService:
+    """
+    Issue and serve short-lived dataroom download links.
+
+    A link carries the deal, investor, file name and expiry time, signed
+    with HMAC using SECRET_KEY, so serving a download needs no database
+    query. Verified links are cached until they expire, which makes repeat
+    and resumed downloads of the same link cheaper still.
+    """
+
+    @staticmethod
+    def sign_download(investor, deal):
+        """
+        Create a signed download token for an investor.
+
+        :param investor: Investor requesting the dataroom
+        :param deal: Deal whose dataroom is downloaded
+        :return: Tuple of the token and its expiry as an aware datetime
+        """
+        expires_at = int(time.time()) + settings.DATAROOM_LINK_TTL_SECONDS
+        token = signing.Signer(salt=SIGNER_SALT).sign_object(
+            {
+                "d": str(deal.id),
+                "i": str(investor.id),
+                "n": deal.dataroom.name,
+                "e": expires_at,
+            }
+        )
+        return token, datetime.fromtimestamp(expires_at, tz=dt_timezone.utc)
+
+    @staticmethod
+    def download_path(token):
+        """
+        Get the URL path of the download endpoint for a token.
+
+        :param token: Token returned by sign_download
+        :return: URL path
+        """
+        return reverse("api:dataroom-detail", args=[token])
+
+    @staticmethod
+    def verify_token(token):
+        """
+        Check a download token and decode it.
+
+        :param token: Token from the download URL
+        :return: DataroomLink
+        """
+        cache_key = CACHE_KEY_PREFIX + hashlib.sha256(token.encode()).hexdigest()
+        link = cache.get(cache_key)
+        if link is None:
+            try:
+                payload = signing.Signer(salt=SIGNER_SALT).unsign_object(token)
+                link = DataroomLink(
+                    payload["d"], payload["i"], payload["n"], payload["e"]
+                )
+            except (signing.BadSignature, KeyError, TypeError, ValueError):
+                raise DataroomError("Invalid dataroom download link")
+            cached = False
+        else:
+            cached = True
+
+        remaining = link.expires_at - time.time()
+        if remaining <= 0:
+            raise DataroomError("Dataroom download link has expired")
+        if not cached:
+            cache.set(cache_key, link, timeout=max(int(remaining), 1))
+        return link
+
+    @staticmethod
+    def download(link, request):
+        """
+        Stream the dataroom file, honouring Range and If-Range headers.
+
+        Files in local storage are read directly; files in remote storage
+        such as Cloudinary are proxied with the Range header forwarded, so
+        only the requested bytes are transferred.
+
+        :param link: DataroomLink from verify_token
+        :param request: The download request
+        :return: StreamingHttpResponse with status 200 or 206, or an
+            HttpResponse with status 416
+        """
+        storage = Deal._meta.get_field("dataroom").storage
+        try:
+            path = storage.path(link.name)
+        except NotImplementedError:
+            response = DataroomService._proxy_remote(storage.url(link.name), request)
+        else:
+            response = DataroomService._serve_local(path, request)
+
+        response["Content-Disposition"] = (
+            f'attachment; filename="{os.path.basename(link.name)}"'
+        )
+        response["Cache-Control"] = "private, no-store"
+        DataroomService.log_access(link, request, response)
+        return response
+
+    @staticmethod
+    def parse_range(header, size):
+        """
+        Parse a single-range Range header.
+
+        Multiple ranges and malformed headers are ignored, as RFC 9110
+        allows, and the whole file is served instead.
+
+        :param header: Value of the Range header, or None
+        :param size: File size in bytes
+        :return: Tuple (start, end) with an inclusive end, or None for the
+            whole file
+        """
+        match = RANGE_PATTERN.match(header or "")
+        if not match or match.group(1) == match.group(2) == "":
+            return None
+        start, end = match.groups()
+        if start == "":
+            start, end = max(size - int(end), 0), size - 1
+        else:
+            start = int(start)
+            end = min(int(end), size - 1) if end else size - 1
+        if start >= size or start > end:
+            raise RangeNotSatisfiableError()
+        return start, end
+
+    @staticmethod
+    def _serve_local(path, request):
+        stat = os.stat(path)
+        size = stat.st_size
+        etag = f'"{size:x}-{int(stat.st_mtime):x}"'
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+        byte_range = None
+        if_range = request.headers.get("If-Range")
+        if if_range is None or if_range == etag:
+            try:
+                byte_range = DataroomService.parse_range(
+                    request.headers.get("Range"), size
+                )
+            except RangeNotSatisfiableError:
+                response = HttpResponse(status=416)
+                response["Content-Range"] = f"bytes */{size}"
+                return response
+
+        start, end = byte_range or (0, size - 1)
+        response = StreamingHttpResponse(
+            DataroomService._read_file(path, start, end - start + 1),
+            status=206 if byte_range else 200,
+            content_type=content_type,
+        )
+        if byte_range:
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = str(end - start + 1)
+        response["Accept-Ranges"] = "bytes"
+        response["ETag"] = etag
+        return response
+
+    @staticmethod
+    def _read_file(path, offset, length):
+        with open(path, "rb") as file:
+            file.seek(offset)
+            while length > 0:
+                chunk = file.read(min(STREAM_CHUNK_SIZE, length))
+                if not chunk:
+                    break
+                length -= len(chunk)
+                yield chunk
+
+    @staticmethod
+    def _proxy_remote(url, request):
+        headers = {
+            name: request.headers[name]
+            for name in ("Range", "If-Range")
+            if name in request.headers
+        }
+        upstream = requests.get(
+            url, headers=headers, stream=True, timeout=REMOTE_TIMEOUT_SECONDS
+        )
+        if upstream.status_code not in (200, 206, 416):
+            upstream.close()
+            raise DataroomError(
+                f"Dataroom storage responded with status {upstream.status_code}"
+            )
+
+        def stream():
+            try:
+                yield from upstream.iter_content(STREAM_CHUNK_SIZE)
+            finally:
+                upstream.close()
+
+        response = StreamingHttpResponse(stream(), status=upstream.status_code)
+        for name in PROXIED_HEADERS:
+            if name in upstream.headers:
+                response[name] = upstream.headers[name]
+        return response
+
+    @staticmethod
+    def log_access(link, request, response):
+        """
+        Record a download in DataroomAccessLog.
+
+        The row is written by a background thread unless
+        DATAROOM_ACCESS_LOG_ASYNC is disabled, so logging never delays the
+        download.
+
+        :param link: DataroomLink that was served
+        :param request: The download request
+        :param response: The download response
+        """
+        byte_range = re.match(r"bytes (\d+)-(\d+)/", response.get("Content-Range", ""))
+        entry = DataroomAccessLog(
+            investor_id=link.investor_id,
+            deal_id=link.deal_id,
+            status_code=response.status_code,
+            range_start=int(byte_range.group(1)) if byte_range else None,
+            range_end=int(byte_range.group(2)) if byte_range else None,
+            ip_address=request.META.get("REMOTE_ADDR") or None,
+            user_agent=request.headers.get("User-Agent", "")[:255],
+            accessed_at=timezone.now(),
+        )
+        if settings.DATAROOM_ACCESS_LOG_ASYNC:
+            _access_log_executor.submit(DataroomService._save_access_log, entry, True)
+        else:
+            DataroomService._save_access_log(entry)
+
+    @staticmethod
+    def _save_access_log(entry, close_connection=False):
+        try:
+            entry.save(force_insert=True)
+        except DatabaseError as e:
+            logging.error(f"Could not log dataroom access to deal {entry.deal_id}: {e}")
+        finally:
+            if close_connection:
+                connection.close()
@@ -0,0 +1,297 @@
+"""The module defines the DataroomUploadService class and its errors."""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from b2d_ventures.app.models import DataroomUpload, Deal, Startup
+from b2d_ventures.app.models.deal import dataroom_upload_path
+from b2d_ventures.app.serializers import DealSerializer
+from b2d_ventures.app.services.dataroom_index_service import DataroomIndexService
+
+READ_CHUNK_SIZE = 64 * 1024
+PDF_SIGNATURE = b"%PDF-"
+# Hash states of recent uploads kept in memory, so each chunk only hashes
+# its own bytes; other workers rehash the staged bytes instead.
+MAX_CACHED_HASH_STATES = 256
+
+_hash_states = OrderedDict()
+_hash_states_lock = threading.Lock()
+
+
+class DataroomUploadError(Exception):
+    """Custom Exception for invalid dataroom uploads."""
+
+
+class UploadOffsetError(DataroomUploadError):
+    """The chunk does not start where the upload left off."""
+
+    def __init__(self, offset):
+        super().__init__(f"Upload is at offset {offset}")
+        self.offset = offset
+
+
+class UploadTooLargeError(DataroomUploadError):
+    """The chunk or the whole upload exceeds its size limit."""
+
+
+class DataroomUploadService:
+    """
+    Chunked, resumable dataroom uploads.
+
+    An upload is started with the file name and size, its chunks are sent
+    with PUT requests carrying the ``Upload-Offset`` they start at, and it
+    is finalized once every byte has arrived. Chunks are streamed to a
+    staging file, so memory use does not grow with the file, and a dropped
+    connection only loses the unfinished chunk: the upload resumes from the
+    offset reported by get_upload. On finalize the staged file is stored in
+    the deal's dataroom storage.
+    """
+
+    @staticmethod
+    def start_upload(pk, attributes):
+        """
+        Start a chunked dataroom upload.
+
+        :param pk: ID of the startup
+        :param attributes: Dictionary with deal_id, filename and size
+        :return: Response with the upload
+        """
+        startup = Startup.objects.get(id=pk)
+        deal = Deal.objects.get(id=attributes.get("deal_id"), startup=startup)
+        filename = os.path.basename(str(attributes.get("filename") or ""))
+        if not filename.lower().endswith(".pdf"):
+            raise DataroomUploadError("Dataroom must be a PDF file.")
+        try:
+            size = int(attributes.get("size"))
+        except (TypeError, ValueError):
+            raise DataroomUploadError("Upload size must be an integer.")
+        if size <= 0:
+            raise DataroomUploadError("Upload size must be positive.")
+        limit = settings.DATAROOM_UPLOAD_MAX_BYTES
+        if size > limit:
+            raise UploadTooLargeError(f"Dataroom cannot exceed {limit} bytes.")
+
+        DataroomUploadService.purge_expired()
+        upload = DataroomUpload.objects.create(
+            startup=startup,
+            deal=deal,
+            filename=filename,
+            size=size,
+            expires_at=timezone.now()
+            + timedelta(seconds=settings.DATAROOM_UPLOAD_TTL_SECONDS),
+        )
+        os.makedirs(settings.DATAROOM_UPLOAD_STAGING_DIR, exist_ok=True)
+        open(DataroomUploadService.staging_path(upload), "wb").close()
+        return Response(
+            DataroomUploadService._serialize(upload), status=status.HTTP_201_CREATED
+        )
+
+    @staticmethod
+    def get_upload(pk, upload_id):
+        """
+        Get the state of an upload, e.g. to resume it.
+
+        :param pk: ID of the startup
+        :param upload_id: ID of the upload
+        :return: Response with the upload and its offset
+        """
+        upload = DataroomUploadService._get(pk, upload_id)
+        return DataroomUploadService._offset_response(upload)
+
+    @staticmethod
+    def write_chunk(pk, upload_id, offset, length, stream):
+        """
+        Append a chunk to an upload.
+
+        :param pk: ID of the startup
+        :param upload_id: ID of the upload
+        :param offset: Offset the chunk starts at, from Upload-Offset
+        :param length: Chunk length from Content-Length
+        :param stream: File-like request body
+        :return: Response with the new offset
+        """
+        limit = settings.DATAROOM_UPLOAD_CHUNK_MAX_BYTES
+        if length > limit:
+            raise UploadTooLargeError(f"Chunks cannot exceed {limit} bytes.")
+        with transaction.atomic():
+            upload = DataroomUploadService._get(pk, upload_id, for_update=True)
+            if upload.status != "active":
+                raise DataroomUploadError("Upload is already finalized.")
+            if offset != upload.offset:
+                raise UploadOffsetError(upload.offset)
+            if offset + length > upload.size:
+                raise UploadTooLargeError("Chunk extends past the upload size.")
+
+            path = DataroomUploadService.staging_path(upload)
+            digest = DataroomUploadService._hash_state(upload, path)
+            with open(path, "r+b") as file:
+                # Drop bytes left by a chunk that was cut off earlier.
+                file.truncate(offset)
+                file.seek(offset)
+                remaining = length
+                while remaining > 0:
+                    data = stream.read(min(READ_CHUNK_SIZE, remaining))
+                    if not data:
+                        break
+                    file.write(data)
+                    digest.update(data)
+                    remaining -= len(data)
+
+            upload.offset = offset + length - remaining
+            upload.save(update_fields=["offset"])
+            DataroomUploadService._remember_hash_state(upload, digest)
+        return DataroomUploadService._offset_response(upload)
+
+    @staticmethod
+    def finalize_upload(pk, upload_id):
+        """
+        Store a complete upload as the deal's dataroom.
+
+        :param pk: ID of the startup
+        :param upload_id: ID of the upload
+        :return: Response with the upload and the updated deal
+        """
+        with transaction.atomic():
+            upload = DataroomUploadService._get(pk, upload_id, for_update=True)
+            if upload.status != "active":
+                raise DataroomUploadError("Upload is already finalized.")
+            if upload.offset != upload.size:
+                raise UploadOffsetError(upload.offset)
+
+            path = DataroomUploadService.staging_path(upload)
+            with open(path, "rb") as file:
+                if file.read(len(PDF_SIGNATURE)) != PDF_SIGNATURE:
+                    raise DataroomUploadError("Dataroom must be a PDF file.")
+            deal = upload.deal
+            upload.sha256 = DataroomUploadService._hash_state(upload, path).hexdigest()
+
+            storage = Deal._meta.get_field("dataroom").storage
+            name = dataroom_upload_path(deal, upload.filename)
+            with open(path, "rb") as file:
+                deal.dataroom.name = storage.save(name, File(file, name))
+            deal.save(update_fields=["dataroom", "updated_at"])
+            DataroomIndexService.schedule(deal)
+            upload.status = "complete"
+            upload.save(update_fields=["sha256", "status"])
+
+        DataroomUploadService._discard(upload)
+        data = DataroomUploadService._serialize(upload)
+        data["attributes"]["deal"] = DealSerializer(deal).data
+        return Response(data, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def abort_upload(pk, upload_id):
+        """
+        Cancel an upload and delete its staged bytes.
+
+        :param pk: ID of the startup
+        :param upload_id: ID of the upload
+        :return: Response with status 204
+        """
+        upload = DataroomUploadService._get(pk, upload_id)
+        DataroomUploadService._discard(upload)
+        upload.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @staticmethod
+    def purge_expired():
+        """Delete unfinished uploads past their expiry and their staged bytes."""
+        expired = DataroomUpload.objects.filter(
+            status="active", expires_at__lt=timezone.now()
+        )
+        for upload in expired:
+            DataroomUploadService._discard(upload)
+        expired.delete()
+
+    @staticmethod
+    def staging_path(upload):
+        """
+        Get the path of the staging file of an upload.
+
+        :param upload: DataroomUpload
+        :return: Absolute path
+        """
+        return os.path.join(settings.DATAROOM_UPLOAD_STAGING_DIR, f"{upload.id}.part")
+
+    @staticmethod
+    def _get(pk, upload_id, for_update=False):
+        uploads = DataroomUpload.objects.filter(startup_id=pk)
+        if for_update:
+            uploads = uploads.select_for_update()
+        upload = uploads.select_related("deal__startup").get(id=upload_id)
+        if upload.status == "active" and upload.expires_at < timezone.now():
+            raise DataroomUploadError("Upload has expired.")
+        return upload
+
+    @staticmethod
+    def _offset_response(upload):
+        response = Response(
+            DataroomUploadService._serialize(upload), status=status.HTTP_200_OK
+        )
+        response["Upload-Offset"] = str(upload.offset)
+        return response
+
+    @staticmethod
+    def _serialize(upload):
+        return {
+            "type": "dataroom_upload",
+            "id": str(upload.id),
+            "attributes": {
+                "deal_id": str(upload.deal_id),
+                "filename": upload.filename,
+                "size": upload.size,
+                "offset": upload.offset,
+                "status": upload.status,
+                "sha256": upload.sha256 or None,
+                "chunk_max_bytes": settings.DATAROOM_UPLOAD_CHUNK_MAX_BYTES,
+                "expires_at": upload.expires_at,
+            },
+        }
+
+    @staticmethod
+    def _hash_state(upload, path):
+        """Get the SHA-256 state of the staged bytes up to the upload offset."""
+        with _hash_states_lock:
+            cached = _hash_states.pop(upload.id, None)
+        if cached is not None and cached[0] == upload.offset:
+            return cached[1]
+
+        digest = hashlib.sha256()
+        remaining = upload.offset
+        with open(path, "rb") as file:
+            while remaining > 0:
+                data = file.read(min(READ_CHUNK_SIZE, remaining))
+                if not data:
+                    break
+                digest.update(data)
+                remaining -= len(data)
+        return digest
+
+    @staticmethod
+    def _remember_hash_state(upload, digest):
+        with _hash_states_lock:
+            _hash_states[upload.id] = (upload.offset, digest.copy())
+            while len(_hash_states) > MAX_CACHED_HASH_STATES:
+                _hash_states.popitem(last=False)
+
+    @staticmethod
+    def _discard(upload):
+        with _hash_states_lock:
+            _hash_states.pop(upload.id, None)
+        try:
+            os.remove(DataroomUploadService.staging_path(upload))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"Could not delete staged upload {upload.id}: {e}")
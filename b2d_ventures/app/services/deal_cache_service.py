@@ -0,0 +1,258 @@
+"""The module defines the DealCacheService class."""
+
+import json
+import logging
+import math
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from rest_framework.utils.encoders import JSONEncoder
+
+from b2d_ventures.app.models import Deal, Investment, Startup, User
+from b2d_ventures.app.serializers import DealSerializer
+from b2d_ventures.utils.db_router import use_primary
+from b2d_ventures.utils.model_cache import is_shared, model_cache
+
+KEY_PREFIX = "deal_payload"
+# Interval at which requests waiting for another worker's rebuild poll.
+WAIT_POLL_SECONDS = 0.02
+
+_flights = {}
+_flights_lock = threading.Lock()
+_counters = {
+    "hits": 0,
+    "misses": 0,
+    "bypasses": 0,
+    "early_refreshes": 0,
+    "waits": 0,
+    "rebuilds": 0,
+}
+_counters_lock = threading.Lock()
+
+
+class DealCacheService:
+    """
+    Read-through cache of serialized deal payloads.
+
+    Payloads are stored as JSON bytes under a key that embeds the deal's
+    model-cache version, which is bumped when the deal, its investments or
+    its startup are written, so invalidation never races a rebuild.
+
+    A missing payload is rebuilt by a single request: threads of the same
+    process wait for it on an event, and other workers wait on a lock in
+    the cache. Payloads are also refreshed early with a probability that
+    grows as they near expiry (XFetch), so popular deals rarely miss.
+
+    Like the model cache, payloads are only cached when the cache is shared
+    by all workers; otherwise every read serializes the deal.
+    """
+
+    @staticmethod
+    def get_payload(deal_id):
+        """
+        Get the DealSerializer data of a deal.
+
+        :param deal_id: ID of the deal
+        :return: Dictionary of deal data
+        :raises Deal.DoesNotExist: If there is no such deal
+        """
+        if not is_shared():
+            DealCacheService._count("bypasses")
+            return json.loads(DealCacheService._serialize(deal_id)[0])
+        try:
+            key = f"{KEY_PREFIX}:{deal_id}:{model_cache.version(Deal, deal_id)}"
+        except Exception as e:
+            logging.warning(f"Deal cache unavailable: {e}")
+            return json.loads(DealCacheService._serialize(deal_id)[0])
+
+        entry = DealCacheService._read(key)
+        if entry is None:
+            DealCacheService._count("misses")
+            return json.loads(DealCacheService._single_flight(deal_id, key))
+
+        payload, delta, expires_at = entry
+        if DealCacheService._should_refresh(delta, expires_at):
+            if DealCacheService._lock(key):
+                DealCacheService._count("early_refreshes")
+                try:
+                    payload = DealCacheService._rebuild(deal_id, key)
+                finally:
+                    DealCacheService._unlock(key)
+                return json.loads(payload)
+        DealCacheService._count("hits")
+        return json.loads(payload)
+
+    @staticmethod
+    def invalidate(deal_id):
+        """
+        Make the cached payload of a deal stale, now and after the commit.
+
+        :param deal_id: ID of the deal
+        """
+        model_cache.invalidate(Deal, deal_id)
+        transaction.on_commit(
+            lambda: model_cache.invalidate(Deal, deal_id), robust=True
+        )
+
+    @staticmethod
+    def metrics():
+        """
+        Get the counters of this process.
+
+        :return: Dictionary with hits, misses, bypasses, early_refreshes,
+            waits, rebuilds and hit_rate
+        """
+        with _counters_lock:
+            counters = dict(_counters)
+        reads = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = round(counters["hits"] / reads, 4) if reads else None
+        return counters
+
+    @staticmethod
+    def reset_metrics():
+        """Zero the counters."""
+        with _counters_lock:
+            for name in _counters:
+                _counters[name] = 0
+
+    @staticmethod
+    def connect_signals():
+        """Invalidate payloads when investments or startups are written."""
+        post_save.connect(
+            DealCacheService._investment_changed,
+            sender=Investment,
+            dispatch_uid="deal_cache_investment_save",
+        )
+        post_delete.connect(
+            DealCacheService._investment_changed,
+            sender=Investment,
+            dispatch_uid="deal_cache_investment_delete",
+        )
+        for sender in (Startup, User):
+            post_save.connect(
+                DealCacheService._startup_changed,
+                sender=sender,
+                dispatch_uid=f"deal_cache_{sender._meta.model_name}_save",
+            )
+
+    @staticmethod
+    def _single_flight(deal_id, key):
+        """Rebuild a missing payload once per process, the others wait."""
+        with _flights_lock:
+            flight = _flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _flights[key] = threading.Event()
+        if not leader:
+            flight.wait(settings.DEAL_CACHE_LOCK_SECONDS)
+            entry = DealCacheService._read(key)
+            if entry is not None:
+                DealCacheService._count("waits")
+                return entry[0]
+            return DealCacheService._fetch_locked(deal_id, key)
+        try:
+            return DealCacheService._fetch_locked(deal_id, key)
+        finally:
+            with _flights_lock:
+                _flights.pop(key, None)
+            flight.set()
+
+    @staticmethod
+    def _fetch_locked(deal_id, key):
+        """Rebuild a missing payload once across workers, the others wait."""
+        deadline = time.monotonic() + settings.DEAL_CACHE_LOCK_SECONDS
+        while True:
+            if DealCacheService._lock(key):
+                try:
+                    return DealCacheService._rebuild(deal_id, key)
+                finally:
+                    DealCacheService._unlock(key)
+            entry = DealCacheService._read(key)
+            if entry is not None:
+                DealCacheService._count("waits")
+                return entry[0]
+            if time.monotonic() >= deadline:
+                # The lock holder is slow or gone; rebuild without it.
+                return DealCacheService._rebuild(deal_id, key)
+            time.sleep(WAIT_POLL_SECONDS)
+
+    @staticmethod
+    def _rebuild(deal_id, key):
+        payload, delta = DealCacheService._serialize(deal_id)
+        timeout = settings.DEAL_CACHE_TIMEOUT
+        try:
+            cache.set(key, (payload, delta, time.time() + timeout), timeout)
+        except Exception as e:
+            logging.warning(f"Could not cache deal {deal_id}: {e}")
+        DealCacheService._count("rebuilds")
+        return payload
+
+    @staticmethod
+    def _serialize(deal_id):
+        """Serialize a deal to JSON bytes and time how long it took."""
+        started = time.monotonic()
+        with use_primary():
+            deal = Deal.objects.select_related("startup").get(id=deal_id)
+            payload = json.dumps(DealSerializer(deal).data, cls=JSONEncoder).encode()
+        return payload, time.monotonic() - started
+
+    @staticmethod
+    def _should_refresh(delta, expires_at):
+        """
+        Decide on an early refresh with XFetch.
+
+        The payload is refreshed when now - delta * beta * log(U) passes its
+        expiry, for U uniform in (0, 1]: almost never while it is fresh, and
+        more likely the closer it gets and the longer it takes to rebuild.
+        """
+        beta = settings.DEAL_CACHE_EARLY_REFRESH_BETA
+        return time.time() - delta * beta * math.log(1.0 - random.random()) >= (
+            expires_at
+        )
+
+    @staticmethod
+    def _read(key):
+        try:
+            return cache.get(key)
+        except Exception as e:
+            logging.warning(f"Deal cache unavailable: {e}")
+            return None
+
+    @staticmethod
+    def _lock(key):
+        try:
+            return cache.add(f"{key}:lock", 1, timeout=settings.DEAL_CACHE_LOCK_SECONDS)
+        except Exception as e:
+            logging.warning(f"Deal cache unavailable: {e}")
+            return True
+
+    @staticmethod
+    def _unlock(key):
+        try:
+            cache.delete(f"{key}:lock")
+        except Exception as e:
+            logging.warning(f"Could not release deal cache lock {key}: {e}")
+
+    @staticmethod
+    def _count(counter):
+        with _counters_lock:
+            _counters[counter] += 1
+
+    @staticmethod
+    def _investment_changed(sender, instance, **kwargs):
+        DealCacheService.invalidate(instance.deal_id)
+
+    @staticmethod
+    def _startup_changed(sender, instance, **kwargs):
+        # Deal payloads include their startup.
+        if sender is User and instance.role != "startup":
+            return
+        for deal_id in Deal.objects.filter(startup_id=instance.pk).values_list(
+            "id", flat=True
+        ):
+            DealCacheService.invalidate(deal_id)
@@ -0,0 +1,221 @@
+"""The module defines the DealImageService class."""
+
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+
+from b2d_ventures.app.models import Deal
+from b2d_ventures.utils.image_variants import VARIANT_FORMATS, render_variants
+
+IMAGE_FIELDS = ("image_background", "image_logo", "image_content")
+
+_dispatcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deal-images")
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool():
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=settings.DEAL_IMAGE_WORKERS
+                )
+    return _process_pool
+
+
+class DealImageService:
+    """
+    Generate responsive variants of deal images after upload.
+
+    Each image is resized to DEAL_IMAGE_WIDTHS (never upscaled) as WebP and
+    JPEG, plus a tiny blurred WebP placeholder stored inline. The resizing
+    runs in a process pool once the upload transaction commits, and the
+    result is recorded in ``Deal.image_variants``.
+    """
+
+    @staticmethod
+    def schedule(deal):
+        """
+        Generate the deal's image variants after the current transaction.
+
+        With DEAL_IMAGE_VARIANTS_ASYNC the work is handed to a background
+        thread, so the upload request does not wait for it.
+
+        :param deal: Deal whose images were uploaded or changed
+        """
+        if not DealImageService.needs_update(deal):
+            return
+        if settings.DEAL_IMAGE_VARIANTS_ASYNC:
+            transaction.on_commit(
+                lambda: _dispatcher.submit(DealImageService._run, deal.id)
+            )
+        else:
+            transaction.on_commit(lambda: DealImageService.generate(deal.id))
+
+    @staticmethod
+    def needs_update(deal, force=False):
+        """
+        Check whether the deal's variants differ from its current images.
+
+        :param deal: Deal to check
+        :param force: Treat every uploaded image as out of date
+        :return: True if generate would change anything
+        """
+        return bool(
+            DealImageService.pending_fields(deal, force)
+            or DealImageService._removed_fields(deal)
+        )
+
+    @staticmethod
+    def pending_fields(deal, force=False):
+        """
+        List the image fields whose variants are missing or out of date.
+
+        Variants are tied to the name of the image they were made from, so
+        a field is pending only after a new upload.
+
+        :param deal: Deal to check
+        :param force: Treat every uploaded image as pending
+        :return: List of image field names
+        """
+        return [
+            field
+            for field in IMAGE_FIELDS
+            if getattr(deal, field)
+            and (
+                force
+                or deal.image_variants.get(field, {}).get("source")
+                != getattr(deal, field).name
+            )
+        ]
+
+    @staticmethod
+    def generate(deal_id, force=False):
+        """
+        Render and store the missing image variants of a deal.
+
+        Running it again for unchanged images does nothing. Every stored
+        variant is a reference to its file, so the variants of replaced
+        images, and of images replaced while rendering, are deleted.
+
+        :param deal_id: ID of the deal
+        :param force: Regenerate variants even if they are up to date
+        :return: List of image fields whose variants were generated
+        """
+        deal = Deal.objects.get(id=deal_id)
+        if not DealImageService.needs_update(deal, force):
+            return []
+        fields = DealImageService.pending_fields(deal, force)
+
+        sources = {field: getattr(deal, field).name for field in fields}
+        rendered = DealImageService._render(deal, sources)
+        variants = {
+            field: DealImageService._store(field, sources[field], result)
+            for field, result in rendered.items()
+        }
+
+        with transaction.atomic():
+            deal = Deal.objects.select_for_update().get(id=deal_id)
+            replaced = []
+            for field, entry in variants.items():
+                if getattr(deal, field).name != entry["source"]:
+                    # Replaced while rendering; the new upload schedules its own.
+                    replaced.append((field, entry))
+                    continue
+                replaced.append((field, deal.image_variants.get(field)))
+                deal.image_variants[field] = entry
+            for field in DealImageService._removed_fields(deal):
+                replaced.append((field, deal.image_variants.pop(field)))
+            deal.save(update_fields=["image_variants", "updated_at"])
+
+        DealImageService._delete_variants(replaced)
+        return [field for field in fields if field in variants]
+
+    @staticmethod
+    def _removed_fields(deal):
+        return [
+            field
+            for field in IMAGE_FIELDS
+            if not getattr(deal, field) and field in deal.image_variants
+        ]
+
+    @staticmethod
+    def _run(deal_id):
+        try:
+            DealImageService.generate(deal_id)
+        except Deal.DoesNotExist:
+            pass
+        except Exception:
+            logging.exception(f"Generating image variants for deal {deal_id} failed")
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _render(deal, sources):
+        """Resize the images in the process pool, or inline when synchronous."""
+        jobs = {}
+        for field, name in sources.items():
+            try:
+                with getattr(deal, field).storage.open(name, "rb") as file:
+                    data = file.read()
+            except Exception as e:
+                logging.error(f"Could not read {field} of deal {deal.id}: {e}")
+                continue
+            jobs[field] = (
+                data,
+                settings.DEAL_IMAGE_WIDTHS,
+                settings.DEAL_IMAGE_QUALITY,
+            )
+
+        if settings.DEAL_IMAGE_VARIANTS_ASYNC:
+            pool = _get_process_pool()
+            jobs = {
+                field: pool.submit(render_variants, *args)
+                for field, args in jobs.items()
+            }
+        results = {}
+        for field, job in jobs.items():
+            try:
+                if settings.DEAL_IMAGE_VARIANTS_ASYNC:
+                    results[field] = job.result()
+                else:
+                    results[field] = render_variants(*job)
+            except Exception as e:
+                logging.error(f"Could not render {field} of deal {deal.id}: {e}")
+        return results
+
+    @staticmethod
+    def _store(field, source, result):
+        storage = Deal._meta.get_field(field).storage
+        stem = os.path.splitext(source)[0]
+        entry = {
+            "source": source,
+            "width": result["width"],
+            "height": result["height"],
+            "placeholder": result["placeholder"],
+        }
+        for variant_format, width, data in result["variants"]:
+            name = storage.save(f"{stem}_{width}w.{variant_format}", ContentFile(data))
+            entry.setdefault(variant_format, {})[str(width)] = name
+        return entry
+
+    @staticmethod
+    def _delete_variants(replaced):
+        """Release the variant files of replaced images."""
+        for field, entry in replaced:
+            if not entry:
+                continue
+            storage = Deal._meta.get_field(field).storage
+            for variant_format in VARIANT_FORMATS:
+                for name in entry.get(variant_format, {}).values():
+                    try:
+                        storage.delete(name)
+                    except Exception as e:
+                        logging.warning(f"Could not delete image variant {name}: {e}")
@@ -0,0 +1,159 @@
+"""The module defines the InvestmentDigestService class."""
+
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import Count, F, Sum, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from b2d_ventures.app.models import InvestmentNotification, Startup
+from b2d_ventures.utils import EmailService
+
+
+class InvestmentDigestService:
+    """
+    Summarize new investments in one email per startup.
+
+    Startups with ``investment_digest_enabled`` get an InvestmentNotification
+    row per investment instead of an email. Each run of send_digests claims
+    every pending notification and sends each startup a single email with
+    the count, total, per-deal figures and largest investments.
+    """
+
+    @staticmethod
+    def queue_notification(investment, net_investment):
+        """
+        Record an investment for the startup's next digest.
+
+        :param investment: The new Investment
+        :param net_investment: Investment amount after the platform fee
+        :return: The created InvestmentNotification
+        """
+        deal = investment.deal
+        return InvestmentNotification.objects.create(
+            startup=deal.startup,
+            deal=deal,
+            investment=investment,
+            net_investment=net_investment,
+        )
+
+    @staticmethod
+    def send_digests(top_count=None):
+        """
+        Send one digest email per startup with pending notifications.
+
+        Pending rows are claimed with a single UPDATE that stamps sent_at, so
+        concurrent runs never send the same notification twice. The figures
+        are aggregated by the database and the emails are handed to the
+        sender pool together; if a startup's email cannot be built or sent
+        its notifications are released again for the next run.
+
+        :param top_count: Number of largest investments listed per startup,
+            defaults to INVESTMENT_DIGEST_TOP_INVESTMENTS
+        :return: Dictionary with the number of startups emailed, failed
+            startups and notifications covered
+        """
+        if top_count is None:
+            top_count = settings.INVESTMENT_DIGEST_TOP_INVESTMENTS
+        now = timezone.now()
+        claimed = InvestmentNotification.objects.filter(
+            sent_at__isnull=True, created_at__lte=now
+        ).update(sent_at=now)
+        results = {"startups": 0, "failed": 0, "notifications": claimed}
+        if not claimed:
+            return results
+
+        batch = InvestmentNotification.objects.filter(sent_at=now)
+        try:
+            deals = InvestmentDigestService._deal_summaries(batch)
+            top_investments = InvestmentDigestService._top_investments(batch, top_count)
+            startups = list(
+                Startup.objects.filter(id__in=deals).only("id", "username", "email")
+            )
+        except Exception:
+            batch.update(sent_at=None)
+            raise
+
+        email_service = EmailService()
+        sends = []
+        for startup in startups:
+            startup_deals = deals[startup.id]
+            try:
+                email = EmailService.build_investment_digest_content(
+                    startup,
+                    sum(deal["investments"] for deal in startup_deals),
+                    sum(deal["total"] for deal in startup_deals),
+                    startup_deals,
+                    top_investments[startup.id],
+                )
+                future = email_service.send_rendered_email(
+                    startup.email, email, wait=False
+                )
+            except Exception as e:
+                logging.error(f"Investment digest for startup {startup.id} failed: {e}")
+                InvestmentDigestService._release(batch, startup, results)
+                continue
+            sends.append((startup, future))
+
+        for startup, future in sends:
+            try:
+                sent = future.result()
+            except Exception as e:
+                logging.error(f"Investment digest for startup {startup.id} failed: {e}")
+                sent = False
+            if sent:
+                results["startups"] += 1
+            else:
+                logging.error(f"Investment digest for startup {startup.id} not sent")
+                InvestmentDigestService._release(batch, startup, results)
+        return results
+
+    @staticmethod
+    def _release(batch, startup, results):
+        """Hand a startup's claimed notifications back to the next run."""
+        batch.filter(startup_id=startup.id).update(sent_at=None)
+        results["failed"] += 1
+
+    @staticmethod
+    def _deal_summaries(batch):
+        """Per-deal counts and totals of the batch, grouped by startup."""
+        rows = (
+            batch.values("startup_id", "deal_id")
+            .annotate(
+                name=F("deal__name"),
+                amount_raised=F("deal__amount_raised"),
+                investor_count=F("deal__investor_count"),
+                investments=Count("id"),
+                total=Sum("net_investment"),
+            )
+            .order_by("startup_id", "-total")
+        )
+        deals = defaultdict(list)
+        for row in rows:
+            deals[row["startup_id"]].append(row)
+        return deals
+
+    @staticmethod
+    def _top_investments(batch, top_count):
+        """The largest investments of the batch, grouped by startup."""
+        rows = (
+            batch.annotate(
+                rank=Window(
+                    RowNumber(),
+                    partition_by=[F("startup_id")],
+                    order_by=[F("net_investment").desc(), F("created_at").asc()],
+                ),
+                amount=F("net_investment"),
+                investor=F("investment__investor__username"),
+                deal_name=F("deal__name"),
+            )
+            .filter(rank__lte=top_count)
+            .values("startup_id", "amount", "investor", "deal_name")
+            .order_by("startup_id", "rank")
+        )
+        top_investments = defaultdict(list)
+        for row in rows:
+            top_investments[row["startup_id"]].append(row)
+        return top_investments
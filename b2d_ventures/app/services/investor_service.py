@@ -1,22 +1,47 @@
 """The module defines the InvestorService class and InvestorError."""
 
-from datetime import datetime
+import logging
+from datetime import datetime, timedelta
 from decimal import Decimal
 
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.response import Response
 
-from b2d_ventures.app.models import Investor, Deal, Investment, Startup, Meeting
+from b2d_ventures.app.models import (
+    DataroomDocument,
+    Investor,
+    Deal,
+    Investment,
+    Startup,
+    Meeting,
+)
 from b2d_ventures.app.serializers import (
+    DealSerializer,
     InvestorSerializer,
     InvestmentSerializer,
     MeetingSerializer,
 )
 from b2d_ventures.app.services import AuthService
 from b2d_ventures.app.services.calendar_service import CalendarService, CalendarError
+from b2d_ventures.app.services.dataroom_index_service import DataroomIndexService
+from b2d_ventures.app.services.dataroom_service import DataroomService
+from b2d_ventures.app.services.deal_cache_service import DealCacheService
+from b2d_ventures.app.services.investment_digest_service import (
+    InvestmentDigestService,
+)
 from b2d_ventures.utils import EmailService
+from b2d_ventures.utils.email_service import net_of_platform_fee
+from b2d_ventures.utils.model_cache import model_cache
+
+MAX_SLOT_SEARCH_DAYS = 31
+MAX_SUGGESTED_SLOTS = 50
+MAX_SEARCH_RESULTS = 50
+PREVIEW_EXCERPT_CHARS = 300
 
 
 class InvestorError(Exception):
@@ -30,7 +55,7 @@ class InvestorService:
     def get_profile(pk):
         """Get investor's profile."""
         try:
-            investor = Investor.objects.get(id=pk)
+            investor = model_cache.get(Investor, pk)
             serializer = InvestorSerializer(investor)
             response_data = {"attributes": serializer.data}
             return Response(response_data, status=status.HTTP_200_OK)
@@ -69,8 +94,7 @@ class InvestorService:
                     f"The minimum investment amount for this deal is ${deal.minimum_investment}"
                 )
 
-            platform_fee = investment_amount * Decimal("0.03")
-            net_investment = investment_amount - platform_fee
+            net_investment = net_of_platform_fee(investment_amount)
 
             investor.total_invested += investment_amount
             investor.save()
@@ -88,23 +112,23 @@ class InvestorService:
 
             email_service = EmailService()
 
-            investor_subject, investor_body = (
+            email_service.send_rendered_email(
+                investor.email,
                 email_service.build_investment_notification_content(
                     investment, "investor"
-                )
-            )
-            email_service.send_email_with_attachment(
-                to_email=investor.email, subject=investor_subject, body=investor_body
+                ),
+                wait=False,
             )
-
-            startup_subject, startup_body = (
-                email_service.build_investment_notification_content(
-                    investment, "startup"
+            if deal.startup.investment_digest_enabled:
+                InvestmentDigestService.queue_notification(investment, net_investment)
+            else:
+                email_service.send_rendered_email(
+                    deal.startup.email,
+                    email_service.build_investment_notification_content(
+                        investment, "startup"
+                    ),
+                    wait=False,
                 )
-            )
-            email_service.send_email_with_attachment(
-                to_email=deal.startup.email, subject=startup_subject, body=startup_body
-            )
 
             serializer = InvestmentSerializer(investment)
             response_data = {"attributes": serializer.data}
@@ -140,8 +164,15 @@ class InvestorService:
             raise InvestorError(f"Error getting investment details: {str(e)}")
 
     @staticmethod
-    def request_dataroom(pk, deal_id):
-        """Request access to a deal's dataroom and send it via email."""
+    def request_dataroom(pk, deal_id, request=None):
+        """
+        Email an investor a short-lived, signed link to a deal's dataroom.
+
+        :param pk: Investor ID
+        :param deal_id: Deal ID
+        :param request: Current request, used to build an absolute link
+        :return: Response confirming the email was sent
+        """
         try:
             investor = Investor.objects.get(id=pk)
             deal = Deal.objects.get(id=deal_id)
@@ -149,23 +180,17 @@ class InvestorService:
             if not deal.dataroom:
                 raise InvestorError("No dataroom file available for this deal.")
 
-            investor_email = investor.email
-            dataroom_url = deal.dataroom.url
+            token, expires_at = DataroomService.sign_download(investor, deal)
+            dataroom_url = DataroomService.download_path(token)
+            if request is not None:
+                dataroom_url = request.build_absolute_uri(dataroom_url)
 
             email_service = EmailService()
-            email_subject = f"Dataroom Access for {deal.name}"
-            email_body = (
-                f"Dear {investor.username},\n\n"
-                f"You have requested access to the dataroom for the deal: {deal.name}.\n"
-                f"Please download the file using the following link:\n\n"
-                f"{dataroom_url}\n\n"
-                f"Best regards,\nThe Team"
-            )
-
-            email_service.send_email_with_attachment(
-                to_email=investor_email,
-                subject=email_subject,
-                body=email_body,
+            email_service.send_rendered_email(
+                investor.email,
+                email_service.build_dataroom_access_content(
+                    investor, deal, dataroom_url, expires_at
+                ),
             )
 
             return Response(
@@ -181,21 +206,147 @@ class InvestorService:
         except Exception as e:
             raise InvestorError(f"Error sending dataroom: {str(e)}")
 
+    @staticmethod
+    def search_deals(pk, term):
+        """
+        Search approved deals by name, description, content and dataroom text.
+
+        :param pk: Investor ID
+        :param term: Search term
+        :return: Response with the matching deals, each with the numbers of
+            the dataroom pages mentioning the term
+        """
+        try:
+            Investor.objects.get(id=pk)
+            term = (term or "").strip()
+            if not term:
+                raise InvestorError("A search term is required.")
+
+            deals = list(
+                DataroomIndexService.search_deals(
+                    Deal.objects.filter(status="approved"), term
+                ).order_by("-start_date")[:MAX_SEARCH_RESULTS]
+            )
+            pages = DataroomIndexService.matching_pages(
+                [deal.id for deal in deals], term
+            )
+            serializer = DealSerializer(deals, many=True)
+            response_data = [
+                {
+                    "type": "deal",
+                    "id": deal_data["id"],
+                    "attributes": deal_data,
+                    "meta": {"dataroom_pages": pages.get(deal.id, [])},
+                }
+                for deal, deal_data in zip(deals, serializer.data)
+            ]
+            return Response({"data": response_data}, status=status.HTTP_200_OK)
+        except Investor.DoesNotExist:
+            raise ObjectDoesNotExist(f"Investor with id {pk} does not exist")
+        except InvestorError as e:
+            raise InvestorError(str(e))
+        except Exception as e:
+            raise InvestorError(f"Error searching deals: {str(e)}")
+
+    @staticmethod
+    def get_deal(pk, deal_id):
+        """
+        Get details of an approved deal.
+
+        :param pk: Investor ID
+        :param deal_id: Deal ID
+        :return: Response with the deal
+        """
+        try:
+            model_cache.get(Investor, pk)
+            deal_data = DealCacheService.get_payload(deal_id)
+            if deal_data["status"] != "approved":
+                raise Deal.DoesNotExist()
+            response_data = {"attributes": deal_data}
+            return Response(response_data, status=status.HTTP_200_OK)
+        except Investor.DoesNotExist:
+            raise ObjectDoesNotExist(f"Investor with id {pk} does not exist")
+        except Deal.DoesNotExist:
+            raise ObjectDoesNotExist(f"Deal with id {deal_id} does not exist")
+        except Exception as e:
+            raise InvestorError(f"Error getting deal details: {str(e)}")
+
+    @staticmethod
+    def get_dataroom_preview(pk, deal_id):
+        """
+        Get the page count, thumbnail and page excerpts of a deal's dataroom.
+
+        :param pk: Investor ID
+        :param deal_id: Deal ID
+        :return: Response with the preview
+        """
+        try:
+            Investor.objects.get(id=pk)
+            deal = Deal.objects.get(id=deal_id, status="approved")
+            document = DataroomDocument.objects.filter(
+                deal=deal, source=deal.dataroom.name, status="complete"
+            ).first()
+            if not deal.dataroom or document is None:
+                raise InvestorError("No dataroom preview available for this deal.")
+
+            thumbnail_url = None
+            if document.thumbnail:
+                storage = Deal._meta.get_field("image_background").storage
+                thumbnail_url = storage.url(document.thumbnail)
+            response_data = {
+                "type": "dataroom_preview",
+                "id": str(document.id),
+                "attributes": {
+                    "deal_id": str(deal.id),
+                    "page_count": document.page_count,
+                    "thumbnail_url": thumbnail_url,
+                    "pages": [
+                        {"number": number, "excerpt": text[:PREVIEW_EXCERPT_CHARS]}
+                        for number, text in document.pages.values_list("number", "text")
+                    ],
+                },
+            }
+            return Response(response_data, status=status.HTTP_200_OK)
+        except Investor.DoesNotExist:
+            raise ObjectDoesNotExist(f"Investor with id {pk} does not exist")
+        except Deal.DoesNotExist:
+            raise ObjectDoesNotExist(f"Deal with id {deal_id} does not exist")
+        except InvestorError as e:
+            raise InvestorError(str(e))
+        except Exception as e:
+            raise InvestorError(f"Error getting dataroom preview: {str(e)}")
+
     @staticmethod
     def schedule_meeting(investor_id, startup_id, attributes):
         try:
             investor = Investor.objects.get(id=investor_id)
             startup = Startup.objects.get(id=startup_id)
 
-            start_time = datetime.fromisoformat(attributes.get("start_time"))
-            end_time = datetime.fromisoformat(attributes.get("end_time"))
+            start_time = CalendarService.to_utc(
+                datetime.fromisoformat(attributes.get("start_time"))
+            )
+            end_time = CalendarService.to_utc(
+                datetime.fromisoformat(attributes.get("end_time"))
+            )
             title = attributes.get("title", "Investor-Startup Meeting")
             description = attributes.get("description", "")
 
+            if end_time <= start_time:
+                raise InvestorError("end_time must be after start_time")
+
+            InvestorService.check_local_availability(
+                investor, startup, start_time, end_time
+            )
+
             refresh_token = investor.refresh_token
             if not refresh_token:
                 raise InvestorError("Investor does not have a valid refresh token")
 
+            if settings.MEETING_SYNC_ASYNC:
+                return InvestorService._enqueue_meeting(
+                    investor, startup, start_time, end_time, title, description
+                )
+
             auth_service = AuthService()
             access_token = auth_service.refresh_access_token(refresh_token)
 
@@ -203,15 +354,23 @@ class InvestorService:
                 access_token, title, description, start_time, end_time, startup.email
             )
 
-            meeting = Meeting.objects.create(
-                investor=investor,
-                startup=startup,
-                start_time=start_time,
-                end_time=end_time,
-                title=title,
-                description=description,
-                investor_event_id=event["id"],
-            )
+            try:
+                with transaction.atomic():
+                    meeting = Meeting.objects.create(
+                        investor=investor,
+                        startup=startup,
+                        start_time=start_time,
+                        end_time=end_time,
+                        title=title,
+                        description=description,
+                        investor_event_id=event["id"],
+                    )
+            except IntegrityError:
+                # The event and the startup's invite were already sent.
+                InvestorService._cancel_event(access_token, event["id"])
+                raise InvestorError(
+                    "The requested time slot was booked by another request"
+                )
 
             serializer = MeetingSerializer(meeting)
             response_data = {"attributes": serializer.data}
@@ -221,7 +380,159 @@ class InvestorService:
             raise ObjectDoesNotExist(f"Investor with id {investor_id} does not exist")
         except Startup.DoesNotExist:
             raise ObjectDoesNotExist(f"Startup with id {startup_id} does not exist")
+        except InvestorError as e:
+            raise InvestorError(str(e))
         except CalendarError as e:
             raise InvestorError(str(e))
         except Exception as e:
             raise InvestorError(f"Error scheduling meeting: {str(e)}")
+
+    @staticmethod
+    def _cancel_event(access_token, event_id):
+        """Delete a calendar event whose meeting could not be stored."""
+        try:
+            CalendarService.cancel_investor_startup_meeting(access_token, event_id)
+        except CalendarError as e:
+            logging.error(f"Could not delete orphaned calendar event {event_id}: {e}")
+
+    @staticmethod
+    def _enqueue_meeting(investor, startup, start_time, end_time, title, description):
+        """
+        Store a meeting for the background calendar sync and answer 202.
+
+        The slot is reserved locally right away; `sync_meetings` books it in
+        Google Calendar and marks it confirmed or failed.
+        """
+        try:
+            with transaction.atomic():
+                meeting = Meeting.objects.create(
+                    investor=investor,
+                    startup=startup,
+                    start_time=start_time,
+                    end_time=end_time,
+                    title=title,
+                    description=description,
+                    status=Meeting.PENDING_SYNC,
+                    next_sync_at=timezone.now(),
+                )
+        except IntegrityError:
+            raise InvestorError("The requested time slot was booked by another request")
+
+        serializer = MeetingSerializer(meeting)
+        response_data = {"attributes": serializer.data}
+        return Response(response_data, status=status.HTTP_202_ACCEPTED)
+
+    @staticmethod
+    def check_local_availability(investor, startup, start_time, end_time):
+        """
+        Reject a slot that overlaps a stored meeting of either party.
+
+        This is a single indexed query, so conflicts we already know about
+        never reach Google Calendar.
+        """
+        conflict = (
+            Meeting.objects.filter(
+                Q(investor=investor) | Q(startup=startup),
+                start_time__lt=end_time,
+                end_time__gt=start_time,
+            )
+            .exclude(status__in=Meeting.INACTIVE_STATUSES)
+            .only("investor_id", "startup_id")
+            .first()
+        )
+        if conflict is None:
+            return
+        if conflict.investor_id == investor.id:
+            raise InvestorError(
+                "The requested time slot is not available for the investor"
+            )
+        raise InvestorError("The requested time slot is not available for the startup")
+
+    @staticmethod
+    def suggest_meeting_slots(investor_id, startup_id, params):
+        """
+        Suggest free meeting slots shared by an investor and a startup.
+
+        Busy times come from one free/busy query covering both calendars plus
+        the meetings we already store for either party.
+        """
+        try:
+            investor = Investor.objects.get(id=investor_id)
+            startup = Startup.objects.get(id=startup_id)
+
+            try:
+                time_min = CalendarService.to_utc(
+                    datetime.fromisoformat(params.get("start_time"))
+                )
+                time_max = CalendarService.to_utc(
+                    datetime.fromisoformat(params.get("end_time"))
+                )
+                duration = timedelta(minutes=int(params.get("duration", 60)))
+                limit = int(params.get("limit", 5))
+            except (TypeError, ValueError):
+                raise InvestorError(
+                    "start_time and end_time must be ISO 8601 datetimes and "
+                    "duration and limit must be integers"
+                )
+
+            if time_max <= time_min:
+                raise InvestorError("end_time must be after start_time")
+            if time_max - time_min > timedelta(days=MAX_SLOT_SEARCH_DAYS):
+                raise InvestorError(
+                    f"The search range cannot exceed {MAX_SLOT_SEARCH_DAYS} days"
+                )
+            if duration <= timedelta(0):
+                raise InvestorError("duration must be a positive number of minutes")
+            if not 0 < limit <= MAX_SUGGESTED_SLOTS:
+                raise InvestorError(
+                    f"limit must be between 1 and {MAX_SUGGESTED_SLOTS}"
+                )
+
+            refresh_token = investor.refresh_token
+            if not refresh_token:
+                raise InvestorError("Investor does not have a valid refresh token")
+
+            existing_meetings = (
+                Meeting.objects.filter(
+                    Q(investor=investor) | Q(startup=startup),
+                    start_time__lt=time_max,
+                    end_time__gt=time_min,
+                )
+                .exclude(status__in=Meeting.INACTIVE_STATUSES)
+                .values_list("start_time", "end_time")
+            )
+
+            auth_service = AuthService()
+            access_token = auth_service.refresh_access_token(refresh_token)
+
+            slots = CalendarService.suggest_investor_startup_slots(
+                access_token,
+                startup.email,
+                time_min,
+                time_max,
+                duration,
+                limit,
+                extra_busy=list(existing_meetings),
+            )
+
+            response_data = [
+                {
+                    "attributes": {
+                        "start_time": start.isoformat(),
+                        "end_time": end.isoformat(),
+                    }
+                }
+                for start, end in slots
+            ]
+            return Response(response_data, status=status.HTTP_200_OK)
+
+        except Investor.DoesNotExist:
+            raise ObjectDoesNotExist(f"Investor with id {investor_id} does not exist")
+        except Startup.DoesNotExist:
+            raise ObjectDoesNotExist(f"Startup with id {startup_id} does not exist")
+        except InvestorError as e:
+            raise InvestorError(str(e))
+        except CalendarError as e:
+            raise InvestorError(str(e))
+        except Exception as e:
+            raise InvestorError(f"Error suggesting meeting slots: {str(e)}")
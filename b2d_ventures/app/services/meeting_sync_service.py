@@ -0,0 +1,160 @@
+"""The module defines the MeetingSyncService class."""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from b2d_ventures.app.models import Meeting
+from b2d_ventures.app.services.auth_service import AuthService, AuthError
+from b2d_ventures.app.services.calendar_service import (
+    CalendarService,
+    CalendarError,
+    CalendarSlotUnavailableError,
+)
+
+
+class MeetingSyncService:
+    """
+    Background worker that books pending meetings in Google Calendar.
+
+    Meetings accepted with ``status=pending_sync`` are claimed in batches,
+    booked in the investor's calendar and marked confirmed, or retried with
+    exponential backoff until MEETING_SYNC_MAX_ATTEMPTS is reached.
+    """
+
+    @staticmethod
+    def claim_due_meetings(batch_size):
+        """
+        Claim pending meetings that are due for a sync attempt.
+
+        Claimed rows get their attempt counter bumped and are leased for
+        MEETING_SYNC_LEASE_SECONDS, so concurrent workers skip them and a
+        crashed worker's meetings are picked up again later.
+
+        :param batch_size: Maximum number of meetings to claim
+        :return: List of claimed meetings
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(
+                Meeting.objects.select_for_update(skip_locked=True)
+                .filter(status=Meeting.PENDING_SYNC, next_sync_at__lte=now)
+                .order_by("next_sync_at")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            Meeting.objects.filter(id__in=ids).update(
+                sync_attempts=F("sync_attempts") + 1,
+                next_sync_at=now
+                + timedelta(seconds=settings.MEETING_SYNC_LEASE_SECONDS),
+            )
+        return list(
+            Meeting.objects.filter(id__in=ids)
+            .select_related("investor", "startup")
+            .order_by("next_sync_at")
+        )
+
+    @staticmethod
+    def sync_meeting(meeting):
+        """
+        Book one claimed meeting in the investor's Google Calendar.
+
+        The meeting ID doubles as the Calendar event ID, so a retry after a
+        lost response finds the existing event instead of booking it twice.
+
+        :param meeting: Meeting returned by claim_due_meetings
+        :return: The updated meeting
+        """
+        refresh_token = meeting.investor.refresh_token
+        if not refresh_token:
+            return MeetingSyncService._mark_failed(
+                meeting, "Investor does not have a valid refresh token"
+            )
+
+        try:
+            access_token = AuthService().refresh_access_token(refresh_token)
+            event = CalendarService.schedule_investor_startup_meeting(
+                access_token,
+                meeting.title,
+                meeting.description or "",
+                meeting.start_time,
+                meeting.end_time,
+                meeting.startup.email,
+                event_id=meeting.id.hex,
+            )
+        except CalendarSlotUnavailableError as e:
+            return MeetingSyncService._mark_failed(meeting, str(e))
+        except (AuthError, CalendarError) as e:
+            return MeetingSyncService._schedule_retry(meeting, str(e))
+
+        meeting.status = Meeting.CONFIRMED
+        meeting.investor_event_id = event["id"]
+        meeting.last_sync_error = None
+        meeting.next_sync_at = None
+        meeting.save(
+            update_fields=[
+                "status",
+                "investor_event_id",
+                "last_sync_error",
+                "next_sync_at",
+                "updated_at",
+            ]
+        )
+        return meeting
+
+    @staticmethod
+    def process_pending(batch_size=20):
+        """
+        Claim and sync one batch of due meetings.
+
+        :param batch_size: Maximum number of meetings to process
+        :return: Dictionary counting confirmed, failed and retried meetings
+        """
+        results = {Meeting.CONFIRMED: 0, Meeting.FAILED: 0, Meeting.PENDING_SYNC: 0}
+        for meeting in MeetingSyncService.claim_due_meetings(batch_size):
+            try:
+                meeting = MeetingSyncService.sync_meeting(meeting)
+            except Exception as e:
+                logging.exception(f"Unexpected error syncing meeting {meeting.id}")
+                meeting = MeetingSyncService._schedule_retry(meeting, str(e))
+            results[meeting.status] += 1
+        return results
+
+    @staticmethod
+    def retry_delay(attempts):
+        """
+        Exponential backoff delay after a failed attempt.
+
+        :param attempts: Number of attempts made so far
+        :return: timedelta to wait before the next attempt
+        """
+        seconds = settings.MEETING_SYNC_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+        return timedelta(seconds=min(seconds, settings.MEETING_SYNC_RETRY_MAX_SECONDS))
+
+    @staticmethod
+    def _schedule_retry(meeting, error):
+        if meeting.sync_attempts >= settings.MEETING_SYNC_MAX_ATTEMPTS:
+            return MeetingSyncService._mark_failed(meeting, error)
+        logging.warning(
+            f"Meeting {meeting.id} sync attempt {meeting.sync_attempts} failed: {error}"
+        )
+        meeting.last_sync_error = error
+        meeting.next_sync_at = timezone.now() + MeetingSyncService.retry_delay(
+            meeting.sync_attempts
+        )
+        meeting.save(update_fields=["last_sync_error", "next_sync_at", "updated_at"])
+        return meeting
+
+    @staticmethod
+    def _mark_failed(meeting, error):
+        logging.error(f"Meeting {meeting.id} could not be synced: {error}")
+        meeting.status = Meeting.FAILED
+        meeting.last_sync_error = error
+        meeting.next_sync_at = None
+        meeting.save(
+            update_fields=["status", "last_sync_error", "next_sync_at", "updated_at"]
+        )
+        return meeting
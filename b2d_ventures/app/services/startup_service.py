@@ -10,6 +10,10 @@ from b2d_ventures.app.serializers import (
     DealSerializer,
     InvestmentSerializer,
 )
+from b2d_ventures.app.services.dataroom_index_service import DataroomIndexService
+from b2d_ventures.app.services.deal_cache_service import DealCacheService
+from b2d_ventures.app.services.deal_image_service import DealImageService
+from b2d_ventures.utils.model_cache import model_cache
 
 
 class StartupError(Exception):
@@ -23,7 +27,7 @@ class StartupService:
     def get_profile(pk):
         """Get startup's profile."""
         try:
-            startup = Startup.objects.get(id=pk)
+            startup = model_cache.get(Startup, pk)
             serializer = StartupSerializer(startup)
             response_data = {"attributes": serializer.data}
             return Response(response_data, status=status.HTTP_200_OK)
@@ -71,7 +75,9 @@ class StartupService:
             attributes["startup"] = startup.id
             serializer = DealSerializer(data=attributes)
             if serializer.is_valid():
-                serializer.save()
+                deal = serializer.save()
+                DealImageService.schedule(deal)
+                DataroomIndexService.schedule(deal)
                 response_data = {"attributes": serializer.data}
                 return Response(response_data, status=status.HTTP_201_CREATED)
             else:
@@ -85,10 +91,11 @@ class StartupService:
     def get_deal_details(pk, deal_id):
         """Get details of a specific deal."""
         try:
-            startup = Startup.objects.get(id=pk)
-            deal = Deal.objects.get(id=deal_id, startup=startup)
-            serializer = DealSerializer(deal)
-            response_data = {"attributes": serializer.data}
+            startup = model_cache.get(Startup, pk)
+            deal_data = DealCacheService.get_payload(deal_id)
+            if deal_data["startup"]["id"] != str(startup.id):
+                raise Deal.DoesNotExist()
+            response_data = {"attributes": deal_data}
             return Response(response_data, status=status.HTTP_200_OK)
         except Startup.DoesNotExist:
             raise ObjectDoesNotExist(f"Startup with id {pk} does not exist")
@@ -107,7 +114,9 @@ class StartupService:
             deal = Deal.objects.get(id=deal_id, startup=startup)
             serializer = DealSerializer(deal, data=attributes, partial=True)
             if serializer.is_valid():
-                serializer.save()
+                deal = serializer.save()
+                DealImageService.schedule(deal)
+                DataroomIndexService.schedule(deal)
                 response_data = {"attributes": serializer.data}
                 return Response(response_data, status=status.HTTP_200_OK)
             else:
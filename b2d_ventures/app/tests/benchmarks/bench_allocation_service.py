@@ -0,0 +1,79 @@
+"""
+Benchmark of the demo-day allocation engine at full demo-day scale.
+
+Run with:
+    python manage.py test b2d_ventures/app/tests/benchmarks -p "bench_allocation*.py"
+
+500 investors each rank 10 of 100 startups, with popularity skewed towards a
+few startups, over a 40-slot grid where every party is available in roughly
+three quarters of the slots. The schedule is checked for conflicts and its
+quality is compared with the greedy start and an upper bound.
+"""
+
+import random
+from collections import defaultdict
+
+from django.test import SimpleTestCase
+
+from b2d_ventures.app.services import AllocationService
+
+INVESTORS = 500
+STARTUPS = 100
+SLOTS = 40
+PREFERENCES_PER_INVESTOR = 10
+AVAILABILITY = 0.75
+TIME_LIMIT_SECONDS = 10
+
+
+def random_mask(rng):
+    return sum(1 << slot for slot in range(SLOTS) if rng.random() < AVAILABILITY)
+
+
+def build_instance(seed=7):
+    rng = random.Random(seed)
+    startups = [f"startup-{i}" for i in range(STARTUPS)]
+    popularity = [1 / (rank + 1) ** 0.8 for rank in range(STARTUPS)]
+    preferences = {}
+    for i in range(INVESTORS):
+        ranked = []
+        while len(ranked) < PREFERENCES_PER_INVESTOR:
+            startup = rng.choices(startups, weights=popularity)[0]
+            if startup not in ranked:
+                ranked.append(startup)
+        preferences[f"investor-{i}"] = ranked
+    investor_availability = {investor: random_mask(rng) for investor in preferences}
+    startup_availability = {startup: random_mask(rng) for startup in startups}
+    return preferences, investor_availability, startup_availability
+
+
+class AllocationBenchmark(SimpleTestCase):
+    """Allocate 500 investors x 100 startups x 40 slots."""
+
+    def test_demo_day_scale(self):
+        preferences, investor_availability, startup_availability = build_instance()
+
+        result = AllocationService.allocate(
+            preferences,
+            investor_availability,
+            startup_availability,
+            SLOTS,
+            time_limit=TIME_LIMIT_SECONDS,
+        )
+
+        investor_slots = defaultdict(set)
+        startup_slots = defaultdict(set)
+        for investor, startup, slot in result["assignments"]:
+            self.assertTrue(investor_availability[investor] >> slot & 1)
+            self.assertTrue(startup_availability[startup] >> slot & 1)
+            self.assertNotIn(slot, investor_slots[investor])
+            self.assertNotIn(slot, startup_slots[startup])
+            investor_slots[investor].add(slot)
+            startup_slots[startup].add(slot)
+
+        metrics = result["metrics"]
+        self.assertGreaterEqual(metrics["score"], metrics["greedy_score"])
+        self.assertLess(metrics["elapsed_ms"], TIME_LIMIT_SECONDS * 1000 + 1000)
+        print(
+            f"\n{INVESTORS} investors x {STARTUPS} startups x {SLOTS} slots:\n"
+            + "\n".join(f"  {name:24} {value}" for name, value in metrics.items())
+        )
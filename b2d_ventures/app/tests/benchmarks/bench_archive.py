@@ -0,0 +1,189 @@
+"""
+Benchmark of listing latency with and without archived history.
+
+Run with:
+    python manage.py test b2d_ventures/app/tests/benchmarks -p "bench_archive*.py"
+
+Times the investor deal search, the investor investments list and the
+startup meetings list against 20 live deals, investments and meetings.
+It runs them three times: with no history, after adding 5 years of closed
+deals with their investments and past meetings, and after those are moved to
+the archive tables by ArchiveService. The deal search filters the deal
+table by status and text and returns the same 20 deals each time. The two
+lists also return the history of that investor and startup, so they grow
+with the hot tables until the history is archived.
+"""
+
+import statistics
+import time
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from b2d_ventures.app.models import (
+    ArchivedDeal,
+    Deal,
+    Investment,
+    Investor,
+    Meeting,
+    Startup,
+)
+from b2d_ventures.app.services import ArchiveService
+
+REQUESTS = 20
+LIVE_ROWS = 20
+HISTORY_MONTHS = 60
+DEALS_PER_MONTH = 200
+INVESTMENTS_PER_DEAL = 20
+MEETINGS_PER_MONTH = 200
+STARTUPS = 20
+INVESTORS = 200
+BATCH = 10_000
+
+
+class ArchiveListingBenchmark(TestCase):
+    """Compare listing latency before and after archiving old deals."""
+
+    def setUp(self):
+        self.startups = [
+            Startup.objects.create(
+                email=f"startup{i}@example.com", username=f"startup{i}"
+            )
+            for i in range(STARTUPS)
+        ]
+        self.investors = [
+            Investor.objects.create(
+                email=f"investor{i}@example.com", username=f"investor{i}"
+            )
+            for i in range(INVESTORS)
+        ]
+        self.startup, self.investor = self.startups[0], self.investors[0]
+        now = timezone.now()
+        for i in range(LIVE_ROWS):
+            deal = Deal.objects.create(
+                name=f"Live deal {i}",
+                description="Seed round of a fintech startup",
+                startup=self.startup,
+                status="approved",
+                end_date=now + timedelta(days=30),
+            )
+            Investment.objects.create(
+                deal=deal, investor=self.investor, investment_amount=100
+            )
+            Meeting.objects.create(
+                investor=self.investor,
+                startup=self.startup,
+                start_time=now + timedelta(days=1, hours=i),
+                end_time=now + timedelta(days=1, hours=i, minutes=30),
+            )
+
+    def _add_history(self):
+        """Add 5 years of closed deals, their investments and past meetings."""
+        now = timezone.now()
+        deals = []
+        for month in range(1, HISTORY_MONTHS + 1):
+            end = now - timedelta(days=30 * month + 365)
+            deals.extend(
+                Deal(
+                    name=f"Closed deal {month}-{i}",
+                    description="Seed round of a fintech startup",
+                    startup=self.startups[i % STARTUPS],
+                    status="closed",
+                    start_date=end - timedelta(days=60),
+                    end_date=end,
+                )
+                for i in range(DEALS_PER_MONTH)
+            )
+        Deal.objects.bulk_create(deals, batch_size=BATCH)
+        Investment.objects.bulk_create(
+            (
+                Investment(
+                    deal=deal,
+                    investor=self.investors[(n + i) % INVESTORS],
+                    investment_amount=100,
+                )
+                for n, deal in enumerate(deals)
+                for i in range(INVESTMENTS_PER_DEAL)
+            ),
+            batch_size=BATCH,
+        )
+        Meeting.objects.bulk_create(
+            (
+                Meeting(
+                    investor=self.investors[i % INVESTORS],
+                    startup=self.startups[i % STARTUPS],
+                    start_time=now - timedelta(days=30 * month + 365, hours=i),
+                    end_time=now - timedelta(days=30 * month + 365, hours=i - 1),
+                )
+                for month in range(1, HISTORY_MONTHS + 1)
+                for i in range(MEETINGS_PER_MONTH)
+            ),
+            batch_size=BATCH,
+        )
+
+    def _time(self, user, url):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        timings = []
+        for _ in range(REQUESTS):
+            started = time.perf_counter()
+            response = client.get(url)
+            timings.append(time.perf_counter() - started)
+        self.assertEqual(response.status_code, 200)
+        data = response.data
+        rows = len(data["data"] if isinstance(data, dict) else data)
+        return statistics.median(timings) * 1000, rows
+
+    def _measure(self):
+        endpoints = [
+            (
+                "investor deal search",
+                self.investor,
+                f"/api/investor/{self.investor.id}/deals/search/?filter[search]=fintech",
+            ),
+            (
+                "investor investments",
+                self.investor,
+                f"/api/investor/{self.investor.id}/investments/",
+            ),
+            (
+                "startup meetings",
+                self.startup,
+                f"/api/startup/{self.startup.id}/meetings/",
+            ),
+        ]
+        return {name: self._time(user, url) for name, user, url in endpoints}
+
+    def _sizes(self):
+        return (
+            f"{Deal.objects.count()} deals, {Investment.objects.count()} "
+            f"investments, {Meeting.objects.count()} meetings"
+        )
+
+    def test_listing_latency(self):
+        runs = [("no history", self._sizes(), self._measure())]
+        self._add_history()
+        runs.append(("5 years of history", self._sizes(), self._measure()))
+
+        started = time.perf_counter()
+        report = ArchiveService.archive(batch_size=1000)
+        archived_in = time.perf_counter() - started
+        self.assertEqual(report["deals"], HISTORY_MONTHS * DEALS_PER_MONTH)
+        self.assertEqual(ArchivedDeal.objects.count(), report["deals"])
+        runs.append(("history archived", self._sizes(), self._measure()))
+
+        lines = [
+            f"\nListing latency, median of {REQUESTS} requests ({connection.vendor}):"
+        ]
+        for label, sizes, results in runs:
+            lines.append(f"  {label} ({sizes}):")
+            for name, (median_ms, rows) in results.items():
+                lines.append(f"    {name:22} {median_ms:8.2f} ms ({rows} rows)")
+        lines.append(
+            f"  archived {report['deals']} deals, {report['investments']} "
+            f"investments and {report['meetings']} meetings in {archived_in:.1f} s"
+        )
+        print("\n".join(lines))
@@ -0,0 +1,74 @@
+"""
+Benchmark of the setup cost of CalendarService.schedule_investor_startup_meeting.
+
+Run with:
+    python manage.py test b2d_ventures/app/tests/benchmarks -p "bench_calendar*.py"
+
+The Google transport is mocked, so the numbers measure only our own setup work
+(discovery parsing, resource building, credential binding, request building).
+"""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpMockSequence
+
+from b2d_ventures.app.services import CalendarService
+
+ITERATIONS = 200
+
+
+def mocked_transport():
+    """Transport answering one events.list and one events.insert call."""
+    return HttpMockSequence(
+        [
+            ({"status": "200"}, json.dumps({"items": []})),
+            ({"status": "200"}, json.dumps({"id": "event_id"})),
+        ]
+    )
+
+
+def build_per_request(credentials):
+    """The previous behaviour: build the resource from discovery every time."""
+    return build("calendar", "v3", http=mocked_transport(), static_discovery=True)
+
+
+class CalendarServiceSetupBenchmark(SimpleTestCase):
+    """Compare per-request discovery builds with the cached resource."""
+
+    def _run(self):
+        start_time = datetime.now(timezone.utc)
+        end_time = start_time + timedelta(hours=1)
+        started = time.perf_counter()
+        for _ in range(ITERATIONS):
+            event = CalendarService.schedule_investor_startup_meeting(
+                "token",
+                "Investor-Startup Meeting",
+                "Benchmark",
+                start_time,
+                end_time,
+                "startup@example.com",
+            )
+            self.assertEqual(event["id"], "event_id")
+        return (time.perf_counter() - started) / ITERATIONS * 1000
+
+    def test_schedule_meeting_setup_cost(self):
+        with patch.object(CalendarService, "get_service", build_per_request):
+            per_request_ms = self._run()
+
+        CalendarService._resource = None
+        with patch.object(
+            CalendarService, "_build_http", side_effect=lambda: mocked_transport()
+        ):
+            cached_ms = self._run()
+
+        print(
+            f"\nschedule_investor_startup_meeting over {ITERATIONS} calls:\n"
+            f"  build per request: {per_request_ms:8.3f} ms/call\n"
+            f"  cached resource:   {cached_ms:8.3f} ms/call\n"
+            f"  speedup:           {per_request_ms / cached_ms:8.1f}x"
+        )
@@ -0,0 +1,88 @@
+"""
+Benchmark of conditional GETs.
+
+Run with:
+    python manage.py test b2d_ventures/app/tests/benchmarks -p "bench_conditional*.py"
+
+Polls the startup ``deals`` action (50 deals) and the investor ``meetings``
+action (50 meetings) 100 times each, once without validators and once with
+the ETag of the previous response, which is answered with 304 after one
+aggregate query.
+"""
+
+import time
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from b2d_ventures.app.models import Deal, Investor, Meeting, Startup
+
+POLLS = 100
+ROWS = 50
+
+
+class ConditionalGetBenchmark(TestCase):
+    """Compare full responses with the 304 path."""
+
+    def setUp(self):
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        self.investor = Investor.objects.create(
+            email="investor@example.com", username="investor"
+        )
+        start = timezone.now()
+        for i in range(ROWS):
+            Deal.objects.create(name=f"Deal {i}", startup=self.startup)
+            Meeting.objects.create(
+                investor=self.investor,
+                startup=self.startup,
+                start_time=start + timedelta(hours=i),
+                end_time=start + timedelta(hours=i, minutes=30),
+            )
+
+    def _poll(self, user, url, conditional):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        headers = {}
+        if conditional:
+            headers["HTTP_IF_NONE_MATCH"] = client.get(url)["ETag"]
+        queries = []
+
+        def count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        with connection.execute_wrapper(count):
+            for _ in range(POLLS):
+                response = client.get(url, **headers)
+        elapsed = time.perf_counter() - started
+        self.assertEqual(response.status_code, 304 if conditional else 200)
+        return elapsed, len(queries) / POLLS
+
+    def test_poll_deals_and_meetings(self):
+        endpoints = [
+            ("startup deals", self.startup, f"/api/startup/{self.startup.id}/deals/"),
+            (
+                "investor meetings",
+                self.investor,
+                f"/api/investor/{self.investor.id}/meetings/",
+            ),
+        ]
+        lines = [f"\n{POLLS} polls of {ROWS} rows:"]
+        for name, user, url in endpoints:
+            full, full_queries = self._poll(user, url, conditional=False)
+            cached, cached_queries = self._poll(user, url, conditional=True)
+            lines.append(
+                f"  {name}:\n"
+                f"    200 OK:           {full * 1000 / POLLS:7.2f} ms/request "
+                f"({full_queries:.0f} queries)\n"
+                f"    304 Not Modified: {cached * 1000 / POLLS:7.2f} ms/request "
+                f"({cached_queries:.0f} queries)\n"
+                f"    speedup:          {full / cached:7.1f}x"
+            )
+        print("\n".join(lines))
@@ -0,0 +1,83 @@
+"""
+Benchmark of extracting dataroom text and previews.
+
+Run with:
+    python manage.py test b2d_ventures/app/tests/benchmarks -p "bench_dataroom*.py"
+
+Extracts the page text and first-page thumbnail of every
+contentMockup/*/*_dataroom.pdf sample, repeated to 240 files, once serially
+in this process and once in a process pool with the per-file CPU limit and
+per-worker memory limit used by DataroomIndexService.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from b2d_ventures.utils.pdf_preview import (
+    extract_pdf,
+    limit_memory,
+    run_with_cpu_limit,
+)
+
+FILES = 240
+WORKERS = 4
+
+
+def samples():
+    paths = sorted(Path(settings.ROOT_DIR).glob("contentMockup/*/*_dataroom.pdf"))
+    return [str(paths[i % len(paths)]) for i in range(FILES)]
+
+
+def extract_args():
+    return (
+        settings.DATAROOM_INDEX_MAX_PAGES,
+        settings.DATAROOM_PAGE_TEXT_MAX_CHARS,
+        settings.DATAROOM_THUMBNAIL_WIDTH,
+    )
+
+
+class DataroomExtractionBenchmark(SimpleTestCase):
+    """Compare serial extraction with the limited process pool."""
+
+    def test_extract_datarooms(self):
+        files = samples()
+        started = time.perf_counter()
+        serial = [extract_pdf(path, *extract_args()) for path in files]
+        serial_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ProcessPoolExecutor(
+            max_workers=WORKERS,
+            initializer=limit_memory,
+            initargs=(settings.DATAROOM_INDEX_MEMORY_BYTES,),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    run_with_cpu_limit,
+                    settings.DATAROOM_INDEX_CPU_SECONDS,
+                    extract_pdf,
+                    path,
+                    *extract_args(),
+                )
+                for path in files
+            ]
+            pooled = [future.result() for future in futures]
+        pool_seconds = time.perf_counter() - started
+
+        self.assertEqual(
+            [result["pages"] for result in pooled],
+            [result["pages"] for result in serial],
+        )
+        pages = sum(result["page_count"] for result in serial)
+        print(
+            f"\n{FILES} datarooms ({pages} pages):\n"
+            f"  serial:             {serial_seconds:7.2f} s "
+            f"({FILES / serial_seconds:6.1f} files/s)\n"
+            f"  pool of {WORKERS} workers: {pool_seconds:7.2f} s "
+            f"({FILES / pool_seconds:6.1f} files/s)\n"
+            f"  speedup:            {serial_seconds / pool_seconds:7.1f}x"
+        )
@@ -0,0 +1,100 @@
+"""
+Benchmark of concurrent deal-detail reads.
+
+Run with:
+    python manage.py test b2d_ventures/app/tests/benchmarks -p "bench_deal_cache*.py"
+
+Sends 1,000 concurrent reads of 10 deals (DealCacheService.get_payload, from
+50 threads released together on a cold cache) three times: straight from the
+database, through the payload cache without single-flight, where every
+request that misses rebuilds the payload, and through the payload cache,
+where one request per deal rebuilds it and the others wait.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TransactionTestCase
+
+from b2d_ventures.app.models import Deal, Startup
+from b2d_ventures.app.services import DealCacheService
+
+REQUESTS = 1_000
+THREADS = 50
+DEALS = 10
+
+
+def uncached_payload(deal_id):
+    """Serialize the deal on every read."""
+    return DealCacheService._serialize(deal_id)[0]
+
+
+def unprotected_fetch(deal_id, key):
+    """Rebuild a missing payload in every request that misses it."""
+    return DealCacheService._rebuild(deal_id, key)
+
+
+class DealCacheBenchmark(TransactionTestCase):
+    """Count database queries per 1,000 concurrent deal reads."""
+
+    def setUp(self):
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        self.deal_ids = [
+            Deal.objects.create(name=f"Deal {i}", startup=self.startup).id
+            for i in range(DEALS)
+        ]
+
+    def _run(self):
+        cache.clear()
+        DealCacheService.reset_metrics()
+        queries = []
+        barrier = threading.Barrier(THREADS)
+
+        def count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        def worker(offset):
+            barrier.wait()
+            try:
+                with connection.execute_wrapper(count):
+                    for i in range(offset, REQUESTS, THREADS):
+                        DealCacheService.get_payload(self.deal_ids[i % DEALS])
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=worker, args=(offset,)) for offset in range(THREADS)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - started, len(queries)
+
+    def test_concurrent_reads(self):
+        with patch.object(DealCacheService, "get_payload", uncached_payload):
+            database, database_queries = self._run()
+        with patch.object(DealCacheService, "_single_flight", unprotected_fetch):
+            unprotected, unprotected_queries = self._run()
+        cached, cached_queries = self._run()
+        rebuilds = DealCacheService.metrics()["rebuilds"]
+
+        self.assertEqual(rebuilds, DEALS)
+        self.assertLess(cached_queries, unprotected_queries)
+        print(
+            f"\n{REQUESTS} concurrent reads of {DEALS} deals "
+            f"from {THREADS} threads, cold cache:\n"
+            f"  database:                  {database:6.2f} s "
+            f"({database_queries} queries)\n"
+            f"  cache, no single-flight:   {unprotected:6.2f} s "
+            f"({unprotected_queries} queries)\n"
+            f"  cache with single-flight:  {cached:6.2f} s "
+            f"({cached_queries} queries, {rebuilds} rebuilds)"
+        )
@@ -0,0 +1,64 @@
+"""
+Benchmark of rendering notification emails.
+
+Run with:
+    python manage.py test b2d_ventures/app/tests/benchmarks -p "bench_email*.py"
+
+Renders 10,000 investment notifications (subject, plain text and HTML),
+once compiling the templates for every notification and once with the
+precompiled templates from EmailTemplateRegistry.
+"""
+
+import time
+from decimal import Decimal
+
+from django.template import Engine
+from django.test import SimpleTestCase
+
+from b2d_ventures.utils.email_templates import (
+    EMAIL_TEMPLATE_DIR,
+    EmailTemplate,
+    EmailTemplateRegistry,
+)
+
+NOTIFICATIONS = 10_000
+
+
+def contexts():
+    for i in range(NOTIFICATIONS):
+        amount = Decimal(1000 + i).quantize(Decimal("0.01"))
+        fee = (amount * Decimal("0.03")).quantize(Decimal("0.01"))
+        yield {
+            "recipient_name": f"investor{i}",
+            "deal_name": f"Deal {i % 50}",
+            "investment_amount": amount,
+            "platform_fee": fee,
+            "net_investment": amount - fee,
+        }
+
+
+class EmailTemplateBenchmark(SimpleTestCase):
+    """Compare compiling per notification with the template registry."""
+
+    def test_render_notifications(self):
+        engine = Engine(dirs=[str(EMAIL_TEMPLATE_DIR)])
+        started = time.perf_counter()
+        for context in contexts():
+            EmailTemplate(engine, "investment_investor").render(context)
+        per_render = time.perf_counter() - started
+
+        EmailTemplateRegistry.clear()
+        started = time.perf_counter()
+        template = EmailTemplateRegistry.get("investment_investor")
+        emails = list(template.render_many(contexts()))
+        precompiled = time.perf_counter() - started
+
+        self.assertEqual(len(emails), NOTIFICATIONS)
+        print(
+            f"\n{NOTIFICATIONS} investment notifications:\n"
+            f"  compile per notification: {per_render:7.2f} s "
+            f"({NOTIFICATIONS / per_render:8.0f}/s)\n"
+            f"  precompiled registry:     {precompiled:7.2f} s "
+            f"({NOTIFICATIONS / precompiled:8.0f}/s)\n"
+            f"  speedup:                  {per_render / precompiled:7.1f}x"
+        )
@@ -0,0 +1,101 @@
+"""
+Benchmark of deal-detail reads.
+
+Run with:
+    python manage.py test b2d_ventures/app/tests/benchmarks -p "bench_model*.py"
+
+Serves 2,000 deal-detail reads (StartupService.get_deal_details, spread over
+50 deals) once straight from the database and once through the model and
+deal payload caches, with one deal updated every 100 reads so the caches see
+invalidations. The caches only serve reads when the cache backend is
+shared, so the benchmark runs them on a file-based cache.
+"""
+
+import json
+import tempfile
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from b2d_ventures.app.models import Deal, Startup
+from b2d_ventures.app.services import DealCacheService, StartupService
+from b2d_ventures.utils.model_cache import model_cache
+
+READS = 2_000
+DEALS = 50
+UPDATE_EVERY = 100
+
+
+def uncached_get(model, pk, related=()):
+    """The previous behaviour: query every row on every read."""
+    instance = model.objects.get(pk=pk)
+    for name in related:
+        getattr(instance, name)
+    return instance
+
+
+def uncached_payload(deal_id):
+    """The previous behaviour: serialize the deal on every read."""
+    return json.loads(DealCacheService._serialize(deal_id)[0])
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": tempfile.mkdtemp(prefix="b2d-bench-cache-"),
+        }
+    }
+)
+class ModelCacheBenchmark(TestCase):
+    """Compare deal-detail reads from the database and the model cache."""
+
+    def setUp(self):
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        self.deals = [
+            Deal.objects.create(name=f"Deal {i}", startup=self.startup)
+            for i in range(DEALS)
+        ]
+
+    def _run(self):
+        queries = []
+
+        def count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        with connection.execute_wrapper(count):
+            for i in range(READS):
+                deal = self.deals[i % DEALS]
+                if i % UPDATE_EVERY == 0:
+                    deal.save()
+                StartupService.get_deal_details(self.startup.id, deal.id)
+        return time.perf_counter() - started, len(queries)
+
+    def test_deal_detail_reads(self):
+        with patch.object(model_cache, "get", uncached_get), patch.object(
+            DealCacheService, "get_payload", uncached_payload
+        ):
+            uncached, uncached_queries = self._run()
+
+        cache.clear()
+        DealCacheService.reset_metrics()
+        cached, cached_queries = self._run()
+
+        hit_rate = DealCacheService.metrics()["hit_rate"]
+        self.assertLess(cached_queries, uncached_queries)
+        print(
+            f"\n{READS} deal-detail reads over {DEALS} deals:\n"
+            f"  database:    {uncached:6.2f} s "
+            f"({READS / uncached:7.0f}/s, {uncached_queries} queries)\n"
+            f"  caches:      {cached:6.2f} s "
+            f"({READS / cached:7.0f}/s, {cached_queries} queries, "
+            f"deal hit rate {hit_rate:.1%})\n"
+            f"  speedup:     {uncached / cached:6.1f}x"
+        )
@@ -0,0 +1,99 @@
+"""
+Benchmark of Investment inserts with UUIDv4 and UUIDv7 primary keys.
+
+Run with:
+    python manage.py test b2d_ventures/app/tests/benchmarks -p "bench_uuid7*.py"
+
+Inserts 1,000,000 Investment rows in batches of 10,000, once with random
+UUIDv4 ids and once with time-ordered UUIDv7 ids. It reports the insert rate,
+end to end and counting only the time spent in the database, and the size of
+the primary key index. Random keys land on any page of the index, so inserts
+touch and split pages all over it; time-ordered keys fill the rightmost page.
+On PostgreSQL (DATABASE_URL) random splits also leave pages half full, which
+SQLite mostly avoids by rebalancing siblings.
+"""
+
+import time
+import uuid
+
+from django.db import connection
+from django.test import TestCase
+
+from b2d_ventures.app.models import Deal, Investment, Investor, Startup
+from b2d_ventures.app.models.abstract_model import uuid7
+
+ROWS = 1_000_000
+BATCH = 10_000
+
+
+class UUID7InsertBenchmark(TestCase):
+    """Compare inserts with random and time-ordered primary keys."""
+
+    def setUp(self):
+        startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        self.investor = Investor.objects.create(
+            email="investor@example.com", username="investor"
+        )
+        self.deal = Deal.objects.create(name="Deal", startup=startup)
+
+    def _insert(self, make_id):
+        table = Investment._meta.db_table
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(f"TRUNCATE {table} CASCADE")
+            else:
+                cursor.execute(f"DELETE FROM {table}")
+
+        database = 0.0
+
+        def timed(execute, sql, params, many, context):
+            nonlocal database
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                database += time.perf_counter() - started
+
+        started = time.perf_counter()
+        with connection.execute_wrapper(timed):
+            for _ in range(ROWS // BATCH):
+                Investment.objects.bulk_create(
+                    Investment(
+                        id=make_id(),
+                        deal=self.deal,
+                        investor=self.investor,
+                        investment_amount=100,
+                    )
+                    for _ in range(BATCH)
+                )
+        total = time.perf_counter() - started
+        return ROWS / total, ROWS / database, self._index_bytes(table)
+
+    @staticmethod
+    def _index_bytes(table):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    "SELECT pg_relation_size(indexrelid) FROM pg_index "
+                    "WHERE indrelid = %s::regclass AND indisprimary",
+                    [table],
+                )
+                return cursor.fetchone()[0]
+            cursor.execute(f"PRAGMA index_list({table})")
+            index = next(row[1] for row in cursor.fetchall() if row[3] == "pk")
+            cursor.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = %s", [index])
+            return cursor.fetchone()[0]
+
+    def test_inserts(self):
+        results = {"UUIDv4": self._insert(uuid.uuid4), "UUIDv7": self._insert(uuid7)}
+
+        self.assertEqual(Investment.objects.count(), ROWS)
+        lines = [f"\n{ROWS} Investment inserts ({connection.vendor}):"]
+        for name, (rate, database_rate, index_bytes) in results.items():
+            lines.append(
+                f"  {name}: {rate:8.0f} rows/s, {database_rate:8.0f} rows/s in "
+                f"the database, primary key index {index_bytes / 2**20:6.1f} MiB"
+            )
+        print("\n".join(lines))
@@ -1,11 +1,13 @@
+from datetime import datetime, timezone as dt_timezone
 from unittest.mock import patch
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError
 from django.test import TestCase
 from django.utils import timezone
 
 from b2d_ventures.app.models import User, Deal, Investment, Meeting, Investor, Startup
-from b2d_ventures.app.services import AdminService
+from b2d_ventures.app.services import AdminService, AdminError, CalendarError
 
 
 class AdminServiceTestCase(TestCase):
@@ -165,3 +167,130 @@ class AdminServiceTestCase(TestCase):
         deal = Deal.objects.create(name="Test Deal", startup=startup)
         self.service.delete_deal(deal.id)
         self.assertFalse(Deal.objects.filter(id=deal.id).exists())
+
+    @patch(
+        "b2d_ventures.app.services.admin_service.CalendarService.batch_schedule_investor_startup_meetings"
+    )
+    @patch(
+        "b2d_ventures.app.services.admin_service.AuthService.refresh_access_token",
+        return_value="mock_access_token",
+    )
+    def test_bulk_schedule_meetings(self, mock_refresh, mock_batch):
+        """Test bulk scheduling reports failures per item and stores the rest."""
+        investors = [
+            Investor.objects.create(
+                email=f"investor{i}@example.com",
+                username=f"investor{i}",
+                refresh_token="mock_refresh_token",
+            )
+            for i in range(2)
+        ]
+        startups = [
+            Startup.objects.create(
+                name=f"Startup {i}",
+                email=f"startup{i}@example.com",
+                username=f"startup{i}",
+            )
+            for i in range(2)
+        ]
+        day = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+        Meeting.objects.create(
+            investor=investors[1],
+            startup=startups[0],
+            start_time=day.replace(hour=9),
+            end_time=day.replace(hour=10),
+        )
+
+        def book(token, meetings):
+            return [
+                (
+                    CalendarError("Backend error")
+                    if meeting["title"] == "Broken"
+                    else {"id": meeting["event_id"]}
+                )
+                for meeting in meetings
+            ]
+
+        mock_batch.side_effect = book
+
+        def item(investor, startup, hour, **extra):
+            return dict(
+                investor_id=str(investor.id),
+                startup_id=str(startup.id),
+                start_time=day.replace(hour=hour).isoformat(),
+                end_time=day.replace(hour=hour + 1).isoformat(),
+                **extra,
+            )
+
+        items = [
+            item(investors[0], startups[0], 10),
+            item(investors[0], startups[1], 10),  # overlaps the previous item
+            item(investors[1], startups[1], 9),  # overlaps a stored meeting
+            item(investors[1], startups[1], 11),
+            item(investors[1], startups[0], 13, title="Broken"),
+            {"investor_id": "not-a-uuid", "startup_id": str(startups[0].id)},
+        ]
+
+        results = self.service.bulk_schedule_meetings(items)
+
+        self.assertEqual(
+            [result["status"] for result in results],
+            ["created", "failed", "failed", "created", "failed", "failed"],
+        )
+        self.assertIn("investor", results[1]["detail"])
+        self.assertIn("investor", results[2]["detail"])
+        self.assertEqual(results[4]["detail"], "Backend error")
+        self.assertEqual(mock_batch.call_count, 2)
+        self.assertEqual(mock_refresh.call_count, 2)
+        created = Meeting.objects.get(id=results[3]["meeting"].id)
+        self.assertEqual(created.investor_event_id, created.id.hex)
+        self.assertEqual(Meeting.objects.count(), 3)
+
+    @patch(
+        "b2d_ventures.app.services.admin_service.CalendarService.cancel_investor_startup_meeting"
+    )
+    @patch(
+        "b2d_ventures.app.services.admin_service.CalendarService.batch_schedule_investor_startup_meetings"
+    )
+    @patch(
+        "b2d_ventures.app.services.admin_service.AuthService.refresh_access_token",
+        return_value="mock_access_token",
+    )
+    def test_bulk_schedule_meetings_conflict_deletes_event(
+        self, mock_refresh, mock_batch, mock_cancel
+    ):
+        """Test that a meeting losing the race has its calendar event deleted."""
+        investor = Investor.objects.create(
+            email="investor@example.com",
+            username="investor0",
+            refresh_token="mock_refresh_token",
+        )
+        startup = Startup.objects.create(
+            name="Startup", email="startup@example.com", username="startup0"
+        )
+        mock_batch.side_effect = lambda token, meetings: [
+            {"id": meeting["event_id"]} for meeting in meetings
+        ]
+        day = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+        items = [
+            {
+                "investor_id": str(investor.id),
+                "startup_id": str(startup.id),
+                "start_time": day.replace(hour=9).isoformat(),
+                "end_time": day.replace(hour=10).isoformat(),
+            }
+        ]
+
+        with patch.object(
+            Meeting.objects, "bulk_create", side_effect=IntegrityError
+        ), patch.object(Meeting, "save", side_effect=IntegrityError):
+            results = self.service.bulk_schedule_meetings(items)
+
+        self.assertEqual(results[0]["status"], "failed")
+        event_id = mock_batch.call_args[0][1][0]["event_id"]
+        mock_cancel.assert_called_once_with("mock_access_token", event_id)
+
+    def test_bulk_schedule_meetings_requires_list(self):
+        """Test bulk scheduling without any meetings."""
+        with self.assertRaises(AdminError):
+            self.service.bulk_schedule_meetings([])
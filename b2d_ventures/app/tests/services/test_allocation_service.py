@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+
+from django.test import TestCase
+
+from b2d_ventures.app.models import Investor, Startup, Meeting
+from b2d_ventures.app.services import AllocationService, AllocationError
+
+
+class AllocationEngineTestCase(TestCase):
+    """Test case for the allocation engine itself."""
+
+    def test_local_search_relocates_blocking_meeting(self):
+        """Test that a meeting is moved to free the only slot of another pair."""
+        result = AllocationService.allocate(
+            {"i1": ["s1"], "i2": ["s2", "s1"]},
+            {"i2": 0b01},
+            {"s2": 0b10},
+            slot_count=2,
+        )
+
+        self.assertEqual(
+            sorted(result["assignments"]), [("i1", "s1", 1), ("i2", "s1", 0)]
+        )
+        self.assertEqual(result["metrics"]["greedy_meetings"], 1)
+        self.assertEqual(result["metrics"]["meetings"], 2)
+        self.assertEqual(result["metrics"]["upper_bound"], 2)
+
+    def test_respects_availability_and_cap(self):
+        """Test that nobody is double-booked or booked outside availability."""
+        preferences = {"i1": ["s1", "s2", "s3"], "i2": ["s1", "s2", "s3"]}
+        result = AllocationService.allocate(
+            preferences,
+            {"i1": 0b0111, "i2": 0b1110},
+            {"s3": 0b0001},
+            slot_count=4,
+            max_meetings_per_investor=2,
+        )
+
+        assignments = result["assignments"]
+        for investor in preferences:
+            slots = [slot for i, _, slot in assignments if i == investor]
+            self.assertLessEqual(len(slots), 2)
+            self.assertEqual(len(slots), len(set(slots)))
+        for startup in ("s1", "s2", "s3"):
+            slots = [slot for _, s, slot in assignments if s == startup]
+            self.assertEqual(len(slots), len(set(slots)))
+        self.assertNotIn(("i2", "s3", 0), assignments)
+        self.assertIn(("i1", "s1"), {(i, s) for i, s, _ in assignments})
+        self.assertEqual(result["metrics"]["meetings"], 4)
+
+
+class AllocationServiceTestCase(TestCase):
+    """Test case for allocating and storing demo-day meetings."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.investors = [
+            Investor.objects.create(email=f"i{i}@example.com", username=f"i{i}")
+            for i in range(2)
+        ]
+        self.startups = [
+            Startup.objects.create(email=f"s{i}@example.com", username=f"s{i}")
+            for i in range(2)
+        ]
+        self.start = datetime(2024, 1, 1, 9, tzinfo=timezone.utc)
+        self.attributes = {
+            "start_time": self.start.isoformat(),
+            "slot_minutes": 30,
+            "slot_count": 2,
+            "preferences": [
+                {
+                    "investor_id": str(investor.id),
+                    "startup_ids": [str(startup.id) for startup in self.startups],
+                }
+                for investor in self.investors
+            ],
+        }
+
+    def test_allocate_demo_day_commit(self):
+        """Test that committed meetings are stored for the calendar sync."""
+        result = AllocationService.allocate_demo_day(self.attributes, commit=True)
+
+        self.assertEqual(result["metrics"]["meetings"], 4)
+        meetings = Meeting.objects.all()
+        self.assertEqual(meetings.count(), 4)
+        for meeting in meetings:
+            self.assertEqual(meeting.status, Meeting.PENDING_SYNC)
+            self.assertEqual(
+                meeting.end_time - meeting.start_time, timedelta(minutes=30)
+            )
+
+    def test_allocate_demo_day_avoids_stored_meetings(self):
+        """Test that slots taken by stored meetings are not used."""
+        Meeting.objects.create(
+            investor=self.investors[0],
+            startup=self.startups[0],
+            start_time=self.start + timedelta(minutes=10),
+            end_time=self.start + timedelta(minutes=20),
+        )
+
+        result = AllocationService.allocate_demo_day(self.attributes)
+
+        first_slot = self.start + timedelta(minutes=30)
+        for meeting in result["meetings"]:
+            if (
+                self.investors[0] == meeting.investor
+                or self.startups[0] == meeting.startup
+            ):
+                self.assertEqual(meeting.start_time, first_slot)
+        self.assertGreaterEqual(result["metrics"]["meetings"], 2)
+        self.assertEqual(Meeting.objects.count(), 1)
+
+    def test_allocate_demo_day_unknown_startup(self):
+        """Test allocating with an unknown startup id."""
+        self.attributes["preferences"][0]["startup_ids"].append(
+            "00000000-0000-0000-0000-000000000000"
+        )
+        with self.assertRaises(AllocationError):
+            AllocationService.allocate_demo_day(self.attributes)
@@ -0,0 +1,216 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from b2d_ventures.app.models import (
+    ArchivedDataroomAccess,
+    ArchivedDeal,
+    ArchivedInvestment,
+    ArchivedMeeting,
+    DataroomAccessLog,
+    Deal,
+    Investment,
+    Investor,
+    Meeting,
+    Startup,
+)
+from b2d_ventures.app.services import (
+    ArchiveError,
+    ArchiveService,
+    CounterReconciliationService,
+    DealCacheService,
+)
+
+
+class ArchiveServiceTestCase(TestCase):
+    """Test case for archiving old deals and meetings."""
+
+    def setUp(self):
+        """An old closed deal with an investment, a current deal and meetings."""
+        cache.clear()
+        self.long_ago = timezone.now() - timedelta(days=800)
+        self.investor = Investor.objects.create(
+            email="investor@example.com",
+            username="investor",
+            total_invested=Decimal("3000.00"),
+        )
+        self.startup = Startup.objects.create(
+            email="startup@example.com",
+            username="startup",
+            name="Startup",
+            total_raised=Decimal("2910.00"),
+        )
+        self.old_deal = self._deal("Old deal", Decimal("1000.00"))
+        self.old_deal.dataroom = "datarooms/Startup/old.pdf"
+        self.old_deal.save()
+        self.current_deal = self._deal("Current deal", Decimal("2000.00"))
+        self.access = DataroomAccessLog.objects.create(
+            investor=self.investor, deal=self.old_deal, status_code=200
+        )
+        self._age(Deal, self.old_deal.id, status="closed", end_date=self.long_ago)
+
+        self.old_meeting = self._meeting()
+        self.pending_meeting = self._meeting(status=Meeting.PENDING_SYNC)
+        self.upcoming_meeting = self._meeting()
+        for meeting in (self.old_meeting, self.pending_meeting):
+            self._age(Meeting, meeting.id, end_time=self.long_ago)
+
+    def _deal(self, name, amount):
+        deal = Deal.objects.create(
+            name=name,
+            startup=self.startup,
+            amount_raised=amount - amount * Decimal("0.03"),
+            investor_count=1,
+            status="approved",
+        )
+        Investment.objects.create(
+            deal=deal, investor=self.investor, investment_amount=amount
+        )
+        return deal
+
+    def _meeting(self, status=Meeting.CONFIRMED):
+        start = timezone.now() + timedelta(days=1)
+        return Meeting.objects.create(
+            investor=self.investor,
+            startup=self.startup,
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            status=status,
+        )
+
+    def _age(self, model, pk, **fields):
+        model.objects.filter(id=pk).update(**fields)
+
+    def test_archive(self):
+        """Test that only old closed deals and finished meetings are moved."""
+        report = ArchiveService.archive(older_than_days=365, batch_size=1)
+
+        self.assertEqual(
+            report,
+            {"deals": 1, "investments": 1, "dataroom_accesses": 1, "meetings": 1},
+        )
+        self.assertFalse(Deal.objects.filter(id=self.old_deal.id).exists())
+        self.assertFalse(Investment.objects.filter(deal_id=self.old_deal.id).exists())
+        self.assertTrue(Deal.objects.filter(id=self.current_deal.id).exists())
+        archived = ArchivedDeal.objects.get(id=self.old_deal.id)
+        self.assertEqual(archived.status, "closed")
+        self.assertEqual(archived.end_date, self.long_ago)
+        self.assertEqual(archived.dataroom, "datarooms/Startup/old.pdf")
+        self.assertEqual(archived.investments.get().investor_id, self.investor.id)
+        self.assertEqual(
+            ArchivedDataroomAccess.objects.get().id,
+            self.access.id,
+        )
+        self.assertEqual(ArchivedMeeting.objects.get().id, self.old_meeting.id)
+        self.assertEqual(
+            set(Meeting.objects.values_list("id", flat=True)),
+            {self.pending_meeting.id, self.upcoming_meeting.id},
+        )
+
+    def test_approved_deal_is_kept(self):
+        """Test that deals that are not closed or rejected are not archived."""
+        self._age(Deal, self.old_deal.id, status="approved")
+
+        self.assertEqual(ArchiveService.archive()["deals"], 0)
+
+    def test_dry_run(self):
+        """Test that a dry run counts the rows without moving them."""
+        out = StringIO()
+
+        call_command("archive_deals", "--dry-run", stdout=out)
+
+        self.assertIn(
+            "Would archive 1 deals, 1 investments, 1 dataroom accesses and "
+            "1 meetings",
+            out.getvalue(),
+        )
+        self.assertTrue(Deal.objects.filter(id=self.old_deal.id).exists())
+        self.assertFalse(ArchivedDeal.objects.exists())
+
+    def test_invalidates_cached_deal(self):
+        """Test that an archived deal is not served from the deal cache."""
+        DealCacheService.get_payload(self.old_deal.id)
+
+        ArchiveService.archive()
+
+        with self.assertRaises(Deal.DoesNotExist):
+            DealCacheService.get_payload(self.old_deal.id)
+
+    def test_counters_include_archived_investments(self):
+        """Test that reconciling after archiving leaves the totals alone."""
+        ArchiveService.archive()
+
+        report = CounterReconciliationService.reconcile()
+
+        self.assertEqual(report["drifts"], [])
+        self.assertEqual(
+            ArchivedInvestment.objects.get().investment_amount, Decimal("1000.00")
+        )
+
+    def test_read_path(self):
+        """Test listing and retrieving archived rows."""
+        ArchiveService.archive()
+
+        deals = ArchiveService.list_deals(startup_id=self.startup.id)
+        self.assertEqual([deal.id for deal in deals], [self.old_deal.id])
+        deal = ArchiveService.get_deal(self.old_deal.id)
+        self.assertEqual(len(deal.investments.all()), 1)
+        meetings = ArchiveService.list_meetings(investor_id=self.investor.id)
+        self.assertEqual([meeting.id for meeting in meetings], [self.old_meeting.id])
+        with self.assertRaises(ObjectDoesNotExist):
+            ArchiveService.get_deal(self.current_deal.id)
+        with self.assertRaises(ArchiveError):
+            ArchiveService.list_deals(limit="all")
+
+
+class ArchiveExistingHistoryTestCase(TransactionTestCase):
+    """Test case for archiving rows created before updated_at was added."""
+
+    before = [("app", "0014_dataroom_document")]
+
+    def test_archive_rows_from_before_updated_at(self):
+        """Test that history stamped by the updated_at migration is archived."""
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.before)
+        apps = executor.loader.project_state(self.before).apps
+        long_ago = timezone.now() - timedelta(days=800)
+        startup = apps.get_model("app", "Startup").objects.create(
+            email="startup@example.com", username="startup"
+        )
+        investor = apps.get_model("app", "Investor").objects.create(
+            email="investor@example.com", username="investor"
+        )
+        deal = apps.get_model("app", "Deal").objects.create(
+            name="Old deal", startup=startup, status="closed", end_date=long_ago
+        )
+        apps.get_model("app", "Investment").objects.create(
+            deal=deal, investor=investor, investment_amount=Decimal("100.00")
+        )
+        meeting = apps.get_model("app", "Meeting").objects.create(
+            investor=investor,
+            startup=startup,
+            start_time=long_ago - timedelta(hours=1),
+            end_time=long_ago,
+        )
+
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+        self.assertGreater(
+            Deal.objects.get(id=deal.id).updated_at, timezone.now() - timedelta(1)
+        )
+        report = ArchiveService.archive(older_than_days=365)
+
+        self.assertEqual(
+            report,
+            {"deals": 1, "investments": 1, "dataroom_accesses": 0, "meetings": 1},
+        )
+        self.assertTrue(ArchivedDeal.objects.filter(id=deal.id).exists())
+        self.assertTrue(ArchivedMeeting.objects.filter(id=meeting.id).exists())
@@ -1,11 +1,45 @@
 """Test module for the AuthService class."""
 
+import json
+import time
 from unittest.mock import patch
 
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
 from django.conf import settings
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from jwt.algorithms import RSAAlgorithm
 
-from b2d_ventures.app.services.auth_service import AuthService, AuthError
+from b2d_ventures.app.services.auth_service import (
+    AuthService,
+    AuthError,
+    google_key_cache,
+)
+
+
+def generate_signing_key(key_id):
+    """Generate a local RSA key pair and its public JWKS entry."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": key_id, "use": "sig", "alg": "RS256"})
+    return private_key, jwk
+
+
+def build_id_token(private_key, key_id, **overrides):
+    """Sign an ID token the way Google would."""
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": "test-client-id",
+        "sub": "1234567890",
+        "email": "test@example.com",
+        "email_verified": True,
+        "name": "Test User",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": key_id})
 
 
 class AuthServiceTestCase(TestCase):
@@ -111,3 +145,133 @@ class AuthServiceTestCase(TestCase):
         self.assertTrue(hasattr(settings, "GOOGLE_CLIENT_ID"))
         self.assertTrue(hasattr(settings, "GOOGLE_CLIENT_SECRET"))
         self.assertTrue(hasattr(settings, "REDIRECT_URI"))
+
+
+@override_settings(GOOGLE_CLIENT_ID="test-client-id")
+class IdTokenVerificationTestCase(TestCase):
+    """
+    Test case for local ID token verification.
+
+    Tokens are signed with locally generated keys and the JWKS endpoint is
+    mocked, so no request leaves the process.
+    """
+
+    def setUp(self):
+        """Set up a fresh key cache and a local signing key."""
+        google_key_cache.clear()
+        self.auth_service = AuthService()
+        self.private_key, self.jwk = generate_signing_key("key-1")
+
+    def tearDown(self):
+        """Do not leak test keys into other test cases."""
+        google_key_cache.clear()
+
+    @patch("b2d_ventures.utils.HTTPRequestHandler.make_request")
+    def test_verify_id_token(self, mock_make_request):
+        """A token signed by a published key is accepted."""
+        mock_make_request.return_value = {"keys": [self.jwk]}
+        token = build_id_token(self.private_key, "key-1")
+
+        claims = self.auth_service.verify_id_token(token)
+
+        self.assertEqual(claims["email"], "test@example.com")
+        mock_make_request.assert_called_once_with("GET", settings.GOOGLE_JWKS_URL)
+
+    @patch("b2d_ventures.utils.HTTPRequestHandler.make_request")
+    def test_verify_id_token_uses_cached_keys(self, mock_make_request):
+        """The key set is fetched once and reused for later logins."""
+        mock_make_request.return_value = {"keys": [self.jwk]}
+
+        for _ in range(3):
+            self.auth_service.verify_id_token(build_id_token(self.private_key, "key-1"))
+
+        mock_make_request.assert_called_once()
+
+    @patch("b2d_ventures.utils.HTTPRequestHandler.make_request")
+    def test_verify_id_token_refreshes_on_key_rotation(self, mock_make_request):
+        """A token signed with a new key id triggers a refetch of the key set."""
+        rotated_key, rotated_jwk = generate_signing_key("key-2")
+        mock_make_request.side_effect = [
+            {"keys": [self.jwk]},
+            {"keys": [self.jwk, rotated_jwk]},
+        ]
+        self.auth_service.verify_id_token(build_id_token(self.private_key, "key-1"))
+
+        with override_settings(GOOGLE_JWKS_MIN_REFRESH_SECONDS=0):
+            claims = self.auth_service.verify_id_token(
+                build_id_token(rotated_key, "key-2")
+            )
+
+        self.assertEqual(claims["sub"], "1234567890")
+        self.assertEqual(mock_make_request.call_count, 2)
+
+    @patch("b2d_ventures.utils.HTTPRequestHandler.make_request")
+    def test_verify_id_token_wrong_audience(self, mock_make_request):
+        """A token issued for another client is rejected."""
+        mock_make_request.return_value = {"keys": [self.jwk]}
+        token = build_id_token(self.private_key, "key-1", aud="other-client")
+
+        with self.assertRaises(AuthError):
+            self.auth_service.verify_id_token(token)
+
+    @patch("b2d_ventures.utils.HTTPRequestHandler.make_request")
+    def test_verify_id_token_expired(self, mock_make_request):
+        """An expired token is rejected."""
+        mock_make_request.return_value = {"keys": [self.jwk]}
+        token = build_id_token(self.private_key, "key-1", exp=int(time.time()) - 3600)
+
+        with self.assertRaises(AuthError):
+            self.auth_service.verify_id_token(token)
+
+    @patch("b2d_ventures.utils.HTTPRequestHandler.make_request")
+    def test_verify_id_token_forged_signature(self, mock_make_request):
+        """A token signed by an unpublished key with a known key id is rejected."""
+        mock_make_request.return_value = {"keys": [self.jwk]}
+        forged_key, _ = generate_signing_key("key-1")
+        token = build_id_token(forged_key, "key-1")
+
+        with self.assertRaises(AuthError):
+            self.auth_service.verify_id_token(token)
+
+    @patch("b2d_ventures.app.services.AuthService.get_user_profile")
+    @patch("b2d_ventures.utils.HTTPRequestHandler.make_request")
+    def test_get_user_profile_from_tokens(self, mock_make_request, mock_userinfo):
+        """The profile is read from the ID token without calling userinfo."""
+        mock_make_request.return_value = {"keys": [self.jwk]}
+        tokens = {
+            "access_token": "test_token",
+            "id_token": build_id_token(self.private_key, "key-1"),
+        }
+
+        profile = self.auth_service.get_user_profile_from_tokens(tokens)
+
+        self.assertEqual(profile["email"], "test@example.com")
+        self.assertEqual(profile["name"], "Test User")
+        mock_userinfo.assert_not_called()
+
+    @patch("b2d_ventures.app.services.AuthService.get_user_profile")
+    @patch("b2d_ventures.utils.HTTPRequestHandler.make_request")
+    def test_get_user_profile_from_tokens_fallback(
+        self, mock_make_request, mock_userinfo
+    ):
+        """An unverifiable ID token falls back to the userinfo endpoint."""
+        mock_make_request.side_effect = Exception("Network error")
+        mock_userinfo.return_value = {"email": "test@example.com", "name": "Test"}
+        tokens = {
+            "access_token": "test_token",
+            "id_token": build_id_token(self.private_key, "key-1"),
+        }
+
+        profile = self.auth_service.get_user_profile_from_tokens(tokens)
+
+        self.assertEqual(profile["name"], "Test")
+        mock_userinfo.assert_called_once_with("test_token")
+
+    @patch("b2d_ventures.app.services.AuthService.get_user_profile")
+    def test_get_user_profile_from_tokens_without_id_token(self, mock_userinfo):
+        """Token responses without an ID token use the userinfo endpoint."""
+        mock_userinfo.return_value = {"email": "test@example.com", "name": "Test"}
+
+        self.auth_service.get_user_profile_from_tokens({"access_token": "t"})
+
+        mock_userinfo.assert_called_once_with("t")
@@ -1,7 +1,12 @@
+import email
+import json
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
 
+import httplib2
 from django.test import TestCase
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build_from_document
 from googleapiclient.errors import HttpError
 
 from b2d_ventures.app.services import CalendarService, CalendarError
@@ -157,3 +162,337 @@ class CalendarServiceTestCase(TestCase):
             self.service.schedule_investor_startup_meeting(
                 token, title, description, start_time, end_time, startup_email
             )
+
+    @patch("b2d_ventures.app.services.CalendarService.get_service")
+    def test_schedule_investor_startup_meeting_existing_event(self, mock_get_service):
+        """Test that a retried booking returns the event created earlier."""
+        mock_service = MagicMock()
+        mock_get_service.return_value = mock_service
+        mock_service.events().get().execute.return_value = {
+            "id": "abc123",
+            "status": "confirmed",
+        }
+        start_time = datetime.now(timezone.utc)
+
+        event = self.service.schedule_investor_startup_meeting(
+            "mock_token",
+            "Investor-Startup Meeting",
+            "",
+            start_time,
+            start_time + timedelta(hours=1),
+            "startup@example.com",
+            event_id="abc123",
+        )
+        self.assertEqual(event["id"], "abc123")
+        mock_service.events().insert.assert_not_called()
+
+    def test_schedule_meeting_duplicate_event_id(self):
+        """Test that a 409 on a client-chosen event ID returns the stored event."""
+        mock_service = MagicMock()
+        mock_service.events().insert().execute.side_effect = HttpError(
+            resp=MagicMock(status=409), content=b"Conflict"
+        )
+        mock_service.events().get().execute.return_value = {"id": "abc123"}
+        start_time = datetime.now(timezone.utc)
+
+        event = self.service.schedule_meeting(
+            mock_service,
+            "primary",
+            "Test Meeting",
+            "",
+            start_time,
+            start_time + timedelta(hours=1),
+            ["attendee@example.com"],
+            event_id="abc123",
+        )
+        self.assertEqual(event["id"], "abc123")
+
+    def test_delete_event(self):
+        """Test that deleting an event notifies the attendees."""
+        mock_service = MagicMock()
+
+        self.service.delete_event(mock_service, "primary", "abc123")
+
+        mock_service.events().delete.assert_called_with(
+            calendarId="primary", eventId="abc123", sendUpdates="all"
+        )
+
+    def test_delete_event_already_gone(self):
+        """Test that deleting an event that no longer exists is not an error."""
+        mock_service = MagicMock()
+        mock_service.events().delete().execute.side_effect = HttpError(
+            resp=MagicMock(status=410), content=b"Gone"
+        )
+
+        self.service.delete_event(mock_service, "primary", "abc123")
+
+
+class FreeSlotTestCase(TestCase):
+    """Test case for merging busy intervals and finding free slots."""
+
+    def setUp(self):
+        """Set up a search range on a fixed day."""
+        self.day = datetime(2024, 1, 1, 9, 0, tzinfo=timezone.utc)
+
+    def at(self, hour, minute=0):
+        return self.day.replace(hour=hour, minute=minute)
+
+    def test_merge_busy_intervals(self):
+        """Overlapping and touching intervals are merged in one sweep."""
+        merged = CalendarService.merge_busy_intervals(
+            [
+                (self.at(13), self.at(14)),
+                (self.at(9), self.at(10)),
+                (self.at(9, 30), self.at(11)),
+                (self.at(11), self.at(11, 30)),
+                (self.at(12), self.at(12)),
+            ]
+        )
+        self.assertEqual(
+            merged, [(self.at(9), self.at(11, 30)), (self.at(13), self.at(14))]
+        )
+
+    def test_find_free_slots(self):
+        """Slots fill the gaps between busy intervals in chronological order."""
+        busy = [(self.at(9), self.at(10)), (self.at(10, 30), self.at(12))]
+        slots = CalendarService.find_free_slots(
+            busy, self.at(9), self.at(14), timedelta(minutes=30), limit=5
+        )
+        self.assertEqual(
+            slots,
+            [
+                (self.at(10), self.at(10, 30)),
+                (self.at(12), self.at(12, 30)),
+                (self.at(12, 30), self.at(13)),
+                (self.at(13), self.at(13, 30)),
+                (self.at(13, 30), self.at(14)),
+            ],
+        )
+
+    def test_find_free_slots_respects_limit_and_alignment(self):
+        """Slots start on the granularity grid and stop at the limit."""
+        busy = [(self.at(9), self.at(9, 10))]
+        slots = CalendarService.find_free_slots(
+            busy, self.at(9), self.at(17), timedelta(hours=1), limit=2
+        )
+        self.assertEqual(
+            slots,
+            [(self.at(9, 15), self.at(10, 15)), (self.at(10, 15), self.at(11, 15))],
+        )
+
+    def test_find_free_slots_fully_busy(self):
+        """No slot is returned when the range is busy."""
+        busy = [(self.at(8), self.at(18))]
+        slots = CalendarService.find_free_slots(
+            busy, self.at(9), self.at(17), timedelta(minutes=30), limit=3
+        )
+        self.assertEqual(slots, [])
+
+    def test_extract_busy_intervals_skips_unreadable_calendars(self):
+        """Calendars reported with errors contribute no busy time."""
+        free_busy = {
+            "calendars": {
+                "primary": {
+                    "busy": [
+                        {"start": "2024-01-01T09:00:00Z", "end": "2024-01-01T10:00:00Z"}
+                    ]
+                },
+                "startup@example.com": {
+                    "errors": [{"domain": "global", "reason": "notFound"}],
+                    "busy": [],
+                },
+            }
+        }
+        intervals = CalendarService.extract_busy_intervals(free_busy)
+        self.assertEqual(intervals, [(self.at(9), self.at(10))])
+
+    @patch("b2d_ventures.app.services.CalendarService.get_service")
+    def test_suggest_investor_startup_slots_single_query(self, mock_get_service):
+        """Both calendars are read with one batched free/busy query."""
+        mock_service = MagicMock()
+        mock_get_service.return_value = mock_service
+        mock_service.freebusy().query().execute.return_value = {
+            "calendars": {
+                "primary": {
+                    "busy": [
+                        {"start": "2024-01-01T09:00:00Z", "end": "2024-01-01T10:00:00Z"}
+                    ]
+                },
+                "startup@example.com": {
+                    "busy": [
+                        {"start": "2024-01-01T10:00:00Z", "end": "2024-01-01T11:00:00Z"}
+                    ]
+                },
+            }
+        }
+        mock_service.freebusy().query.reset_mock()
+
+        slots = CalendarService.suggest_investor_startup_slots(
+            "token",
+            "startup@example.com",
+            self.at(9),
+            self.at(13),
+            timedelta(hours=1),
+            limit=3,
+            extra_busy=[(self.at(11), self.at(12))],
+        )
+
+        self.assertEqual(slots, [(self.at(12), self.at(13))])
+        mock_service.freebusy().query.assert_called_once()
+        body = mock_service.freebusy().query.call_args.kwargs["body"]
+        self.assertEqual(
+            body["items"], [{"id": "primary"}, {"id": "startup@example.com"}]
+        )
+
+
+class RecordingHttp:
+    """Fake HTTP transport that records requests and replays responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        self.requests.append({"uri": uri, "method": method, "headers": headers})
+        response = MagicMock(status=200, reason="OK")
+        response.__getitem__.side_effect = {"status": "200"}.__getitem__
+        return response, json.dumps(self.responses.pop(0)).encode()
+
+
+class CalendarServiceCacheTestCase(TestCase):
+    """Test case for the process-wide Calendar API resource."""
+
+    def test_get_service_builds_resource_once(self):
+        """The discovery-based resource is shared between services."""
+        with patch(
+            "b2d_ventures.app.services.calendar_service.build_from_document",
+            wraps=build_from_document,
+        ) as mock_build:
+            CalendarService._resource = None
+            CalendarService.get_service(Credentials(token="first"))
+            CalendarService.get_service(Credentials(token="second"))
+
+        mock_build.assert_called_once()
+
+    def test_get_service_binds_credentials_per_request(self):
+        """Each service sends its own access token over its own transport."""
+        first_http = RecordingHttp([{"items": []}])
+        second_http = RecordingHttp([{"items": [{"id": "1"}]}])
+        start_time = datetime.now(timezone.utc)
+        end_time = start_time + timedelta(hours=1)
+
+        with patch.object(
+            CalendarService, "_build_http", side_effect=[first_http, second_http]
+        ):
+            first = CalendarService.get_service(Credentials(token="first"))
+            second = CalendarService.get_service(Credentials(token="second"))
+
+        self.assertTrue(
+            CalendarService.check_availability(first, "primary", start_time, end_time)
+        )
+        self.assertFalse(
+            CalendarService.check_availability(second, "primary", start_time, end_time)
+        )
+        self.assertEqual(
+            first_http.requests[0]["headers"]["authorization"], "Bearer first"
+        )
+        self.assertEqual(
+            second_http.requests[0]["headers"]["authorization"], "Bearer second"
+        )
+
+
+class BatchHttp:
+    """Fake HTTP transport answering free/busy queries and batch inserts."""
+
+    def __init__(self, busy=(), existing=()):
+        self.busy = list(busy)
+        self.existing = set(existing)
+        self.batch_sizes = []
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        if "freeBusy" in uri:
+            content = {"calendars": {"primary": {"busy": self.busy}}}
+            return httplib2.Response({"status": "200"}), json.dumps(content).encode()
+        if method == "GET" and "/events/" in uri:
+            event_id = uri.split("/events/")[1].split("?")[0]
+            content = {"id": event_id, "status": "confirmed"}
+            return httplib2.Response({"status": "200"}), json.dumps(content).encode()
+
+        batch = email.message_from_string(
+            f"Content-Type: {headers['content-type']}\r\n\r\n{body}"
+        )
+        parts = []
+        for part in batch.get_payload():
+            request = part.get_payload().replace("\r\n", "\n")
+            event = json.loads(request.split("\n\n", 1)[1])
+            response_id = "<response-" + part["Content-ID"][1:]
+            status_line, content = "200 OK", event
+            if event.get("id") in self.existing:
+                status_line = "409 Conflict"
+                content = {"error": {"code": 409, "message": "Duplicate"}}
+            parts.append(
+                "--batch_boundary\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: {response_id}\r\n\r\n"
+                f"HTTP/1.1 {status_line}\r\nContent-Type: application/json\r\n\r\n"
+                f"{json.dumps(content)}\r\n"
+            )
+        self.batch_sizes.append(len(parts))
+        response = httplib2.Response(
+            {
+                "status": "200",
+                "content-type": "multipart/mixed; boundary=batch_boundary",
+            }
+        )
+        return response, ("".join(parts) + "--batch_boundary--").encode()
+
+
+class CalendarServiceBatchTestCase(TestCase):
+    """Test case for batched meeting inserts."""
+
+    def meeting(self, hour, event_id):
+        start = datetime(2024, 1, 1, hour, tzinfo=timezone.utc)
+        return {
+            "title": f"Meeting {hour}",
+            "description": "",
+            "start_time": start,
+            "end_time": start + timedelta(hours=1),
+            "startup_email": "startup@example.com",
+            "event_id": event_id,
+        }
+
+    def test_batch_schedule_meetings(self):
+        """Inserts are chunked into batches and busy slots are rejected."""
+        http = BatchHttp(
+            busy=[{"start": "2024-01-01T10:30:00Z", "end": "2024-01-01T11:00:00Z"}]
+        )
+        meetings = [
+            self.meeting(9, "event9"),
+            self.meeting(10, "event10"),
+            self.meeting(11, "event11"),
+            self.meeting(12, "event12"),
+        ]
+
+        with patch.object(CalendarService, "_build_http", return_value=http):
+            results = CalendarService.batch_schedule_investor_startup_meetings(
+                "token", meetings, batch_size=2
+            )
+
+        self.assertEqual(results[0]["id"], "event9")
+        self.assertIsInstance(results[1], CalendarError)
+        self.assertEqual(results[2]["id"], "event11")
+        self.assertEqual(results[3]["id"], "event12")
+        self.assertEqual(results[3]["summary"], "Meeting 12")
+        self.assertEqual(http.batch_sizes, [2, 1])
+
+    def test_batch_schedule_meetings_retried_insert(self):
+        """A 409 on a client-chosen event ID returns the existing event."""
+        http = BatchHttp(existing={"event9"})
+
+        with patch.object(CalendarService, "_build_http", return_value=http):
+            results = CalendarService.batch_schedule_investor_startup_meetings(
+                "token", [self.meeting(9, "event9"), self.meeting(10, "event10")]
+            )
+
+        self.assertEqual(results[0]["id"], "event9")
+        self.assertEqual(results[1]["id"], "event10")
@@ -0,0 +1,233 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest.mock import patch, MagicMock
+
+from django.test import TestCase, override_settings
+from googleapiclient.errors import HttpError
+
+from b2d_ventures.app.models import Investor, Startup, Meeting, CalendarSyncState
+from b2d_ventures.app.services import CalendarSyncService, CalendarService
+
+
+class FakeRequest:
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self):
+        return self.response()
+
+
+class FakeCalendarApi:
+    """
+    In-memory stand-in for the events collection of the Calendar API.
+
+    Every change bumps a version number; sync tokens are the version seen,
+    so a sync token lists only events changed after it.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self.oldest_valid_token = 0
+        self.items = {}
+        self.changed_at = {}
+        self.list_calls = []
+
+    def put(self, event):
+        self.version += 1
+        self.items[event["id"]] = event
+        self.changed_at[event["id"]] = self.version
+
+    def expire_sync_tokens(self):
+        self.oldest_valid_token = self.version + 1
+
+    def events(self):
+        return self
+
+    def list(self, **params):
+        self.list_calls.append(params)
+        return FakeRequest(lambda: self._list(params))
+
+    def _list(self, params):
+        if "syncToken" in params:
+            since = int(params["syncToken"])
+            if since < self.oldest_valid_token:
+                raise HttpError(resp=MagicMock(status=410), content=b"Gone")
+            items = [e for i, e in self.items.items() if self.changed_at[i] > since]
+        else:
+            time_min = CalendarService.parse_datetime(params["timeMin"])
+            items = [
+                e
+                for e in self.items.values()
+                if CalendarService.parse_datetime(e["end"]["dateTime"]) >= time_min
+            ]
+        offset = int(params.get("pageToken", 0))
+        end = offset + params["maxResults"]
+        response = {"items": items[offset:end]}
+        if end < len(items):
+            response["nextPageToken"] = str(end)
+        else:
+            response["nextSyncToken"] = str(self.version)
+        return response
+
+
+def calendar_event(event_id, start, hours=1, status="confirmed", **extra):
+    event = {
+        "id": event_id,
+        "status": status,
+        "summary": "Investor-Startup Meeting",
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": (start + timedelta(hours=hours)).isoformat()},
+    }
+    event.update(extra)
+    return event
+
+
+@override_settings(
+    CALENDAR_SYNC_PAGE_SIZE=2,
+    CALENDAR_FULL_SYNC_DAYS=30,
+    CALENDAR_FULL_SYNC_MAX_PAGES=20,
+)
+class CalendarSyncServiceTestCase(TestCase):
+    """Test case for the CalendarSyncService class against a fake Calendar API."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.api = FakeCalendarApi()
+        patches = [
+            patch(
+                "b2d_ventures.app.services.calendar_sync_service.AuthService.refresh_access_token",
+                return_value="mock_access_token",
+            ),
+            patch(
+                "b2d_ventures.app.services.calendar_sync_service.CalendarService.get_service",
+                return_value=self.api,
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+        self.investor = Investor.objects.create(
+            email="investor@example.com",
+            username="investor",
+            refresh_token="mock_refresh_token",
+        )
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Test Startup"
+        )
+        self.start = datetime.now(dt_timezone.utc).replace(microsecond=0) + timedelta(
+            days=1
+        )
+        self.meetings = []
+        for index in range(3):
+            start = self.start + timedelta(hours=2 * index)
+            self.meetings.append(
+                Meeting.objects.create(
+                    investor=self.investor,
+                    startup=self.startup,
+                    start_time=start,
+                    end_time=start + timedelta(hours=1),
+                    investor_event_id=f"event{index}",
+                )
+            )
+            self.api.put(calendar_event(f"event{index}", start))
+
+    def test_first_sync_is_bounded_full_sync(self):
+        """Test that the first sync lists from timeMin and stores the token."""
+        result = CalendarSyncService.sync_user(self.investor)
+
+        self.assertTrue(result["full_sync"])
+        self.assertEqual(result, {"updated": 0, "cancelled": 0, "full_sync": True})
+        self.assertIn("timeMin", self.api.list_calls[0])
+        self.assertNotIn("syncToken", self.api.list_calls[0])
+        self.assertEqual(len(self.api.list_calls), 2)  # three events, two per page
+        state = CalendarSyncState.objects.get(user=self.investor)
+        self.assertEqual(state.sync_token, str(self.api.version))
+        self.assertIsNotNone(state.last_full_sync_at)
+
+    def test_incremental_sync_updates_and_cancels(self):
+        """Test that only changed events are pulled and applied."""
+        CalendarSyncService.sync_user(self.investor)
+        moved_start = self.start + timedelta(days=2)
+        self.api.put(calendar_event("event0", moved_start, summary="Moved"))
+        self.api.put(calendar_event("event1", self.start, status="cancelled"))
+        self.api.list_calls.clear()
+
+        result = CalendarSyncService.sync_user(self.investor)
+
+        self.assertEqual(result, {"updated": 1, "cancelled": 1, "full_sync": False})
+        self.assertEqual(len(self.api.list_calls), 1)
+        self.assertIn("syncToken", self.api.list_calls[0])
+        self.assertTrue(self.api.list_calls[0]["showDeleted"])
+        moved = Meeting.objects.get(id=self.meetings[0].id)
+        self.assertEqual(moved.start_time, moved_start)
+        self.assertEqual(moved.end_time, moved_start + timedelta(hours=1))
+        self.assertEqual(moved.title, "Moved")
+        self.assertEqual(
+            Meeting.objects.get(id=self.meetings[1].id).status, Meeting.CANCELLED
+        )
+        self.assertEqual(
+            Meeting.objects.get(id=self.meetings[2].id).status, Meeting.CONFIRMED
+        )
+
+    def test_startup_declined_cancels_meeting(self):
+        """Test that a meeting the startup declined is cancelled."""
+        CalendarSyncService.sync_user(self.investor)
+        self.api.put(
+            calendar_event(
+                "event2",
+                self.start + timedelta(hours=4),
+                attendees=[
+                    {"email": "Startup@example.com", "responseStatus": "declined"}
+                ],
+            )
+        )
+
+        result = CalendarSyncService.sync_user(self.investor)
+
+        self.assertEqual(result["cancelled"], 1)
+        self.assertEqual(
+            Meeting.objects.get(id=self.meetings[2].id).status, Meeting.CANCELLED
+        )
+
+    def test_expired_sync_token_triggers_full_sync(self):
+        """Test that a 410 response falls back to a bounded full resync."""
+        CalendarSyncService.sync_user(self.investor)
+        self.api.put(calendar_event("event1", self.start, status="cancelled"))
+        self.api.expire_sync_tokens()
+        self.api.list_calls.clear()
+
+        result = CalendarSyncService.sync_user(self.investor)
+
+        self.assertTrue(result["full_sync"])
+        self.assertEqual(result["cancelled"], 1)
+        self.assertIn("syncToken", self.api.list_calls[0])
+        self.assertIn("timeMin", self.api.list_calls[1])
+        state = CalendarSyncState.objects.get(user=self.investor)
+        self.assertEqual(state.sync_token, str(self.api.version))
+
+    @override_settings(CALENDAR_FULL_SYNC_MAX_PAGES=1)
+    def test_full_sync_page_limit(self):
+        """Test that a truncated full sync stores no token and retries later."""
+        CalendarSyncService.sync_user(self.investor)
+
+        self.assertEqual(len(self.api.list_calls), 1)
+        state = CalendarSyncState.objects.get(user=self.investor)
+        self.assertIsNone(state.sync_token)
+
+    def test_sync_all_skips_investor_without_refresh_token(self):
+        """Test that one failing investor does not stop the others."""
+        other = Investor.objects.create(
+            email="other@example.com", username="other", refresh_token=""
+        )
+        Meeting.objects.create(
+            investor=other,
+            startup=self.startup,
+            start_time=self.start - timedelta(days=1),
+            end_time=self.start - timedelta(days=1, hours=-1),
+            investor_event_id="other_event",
+        )
+
+        totals = CalendarSyncService.sync_all()
+
+        self.assertEqual(totals["users"], 1)
+        self.assertEqual(totals["errors"], 1)
@@ -0,0 +1,138 @@
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+
+from b2d_ventures.app.models import Deal, Investment, Investor, Startup
+from b2d_ventures.app.services import (
+    AdminService,
+    CounterReconciliationService,
+    DealCacheService,
+    InvestorService,
+)
+
+
+class CounterReconciliationServiceTestCase(TestCase):
+    """Test case for the counter reconciliation job."""
+
+    def setUp(self):
+        """Two startups with a deal each and investments whose counters match."""
+        cache.clear()
+        self.investor = Investor.objects.create(
+            email="investor@example.com",
+            username="investor",
+            total_invested=Decimal("3000.00"),
+        )
+        self.startups, self.deals, self.investments = [], [], []
+        for i, amount in enumerate([Decimal("1000.00"), Decimal("2000.00")]):
+            net = amount - amount * Decimal("0.03")
+            startup = Startup.objects.create(
+                email=f"startup{i}@example.com",
+                username=f"startup{i}",
+                name=f"Startup {i}",
+                total_raised=net,
+            )
+            deal = Deal.objects.create(
+                name=f"Deal {i}",
+                startup=startup,
+                amount_raised=net,
+                investor_count=1,
+            )
+            self.investments.append(
+                Investment.objects.create(
+                    deal=deal, investor=self.investor, investment_amount=amount
+                )
+            )
+            self.startups.append(startup)
+            self.deals.append(deal)
+
+    def test_consistent_counters(self):
+        """Test that matching counters are left alone."""
+        report = CounterReconciliationService.reconcile(chunk_size=1)
+
+        self.assertEqual(report["drifts"], [])
+        self.assertEqual(report["startups"], 2)
+        self.assertEqual(report["deals"], 2)
+        self.assertEqual(report["investors"], 1)
+
+    def test_repairs_after_delete(self):
+        """Test that deleting an investment is reconciled in all four counters."""
+        AdminService.delete_investment(self.investments[0].id)
+
+        report = CounterReconciliationService.reconcile(chunk_size=1)
+
+        drifted = {(drift["model"], drift["field"]) for drift in report["drifts"]}
+        self.assertEqual(
+            drifted,
+            {
+                ("deal", "amount_raised"),
+                ("deal", "investor_count"),
+                ("startup", "total_raised"),
+                ("investor", "total_invested"),
+            },
+        )
+        deal = Deal.objects.get(id=self.deals[0].id)
+        self.assertEqual(deal.amount_raised, Decimal("0.00"))
+        self.assertEqual(deal.investor_count, 0)
+        startup = Startup.objects.get(id=self.startups[0].id)
+        self.assertEqual(startup.total_raised, Decimal("0.00"))
+        investor = Investor.objects.get(id=self.investor.id)
+        self.assertEqual(investor.total_invested, Decimal("2000.00"))
+        self.assertEqual(CounterReconciliationService.reconcile()["drifts"], [])
+
+    @patch("b2d_ventures.app.services.investor_service.EmailService")
+    def test_fee_rounded_per_investment(self, mock_email_service):
+        """Test that counters of non-round investments match create_investment."""
+        deal = Deal.objects.create(
+            name="Deal 2", startup=self.startups[0], status="approved"
+        )
+        for amount in ("100.50", "100.50", "33.35"):
+            InvestorService.create_investment(
+                self.investor.id, deal.id, {"investment_amount": amount}
+            )
+
+        report = CounterReconciliationService.reconcile()
+
+        self.assertEqual(report["drifts"], [])
+        # 97.48 twice and 32.35, rather than 3% of the 234.35 total.
+        self.assertEqual(Deal.objects.get(id=deal.id).amount_raised, Decimal("227.31"))
+
+    def test_dry_run(self):
+        """Test that a dry run reports without writing."""
+        Deal.objects.filter(id=self.deals[1].id).update(investor_count=5)
+        out = StringIO()
+
+        call_command("reconcile_counters", "--dry-run", stdout=out)
+
+        self.assertIn("investor_count: 5 -> 1", out.getvalue())
+        self.assertIn("would repair 1 counters", out.getvalue())
+        self.assertEqual(Deal.objects.get(id=self.deals[1].id).investor_count, 5)
+
+    def test_startup_filter(self):
+        """Test that only the given startups and their investors are checked."""
+        Deal.objects.filter(id__in=[deal.id for deal in self.deals]).update(
+            investor_count=5
+        )
+
+        report = CounterReconciliationService.reconcile(
+            startup_ids=[self.startups[1].id]
+        )
+
+        self.assertEqual(report["startups"], 1)
+        self.assertEqual(report["investors"], 1)
+        self.assertEqual(Deal.objects.get(id=self.deals[0].id).investor_count, 5)
+        self.assertEqual(Deal.objects.get(id=self.deals[1].id).investor_count, 1)
+
+    def test_invalidates_cached_deals(self):
+        """Test that repaired deals are not served stale from the cache."""
+        Deal.objects.filter(id=self.deals[0].id).update(amount_raised=1)
+        stale = DealCacheService.get_payload(self.deals[0].id)
+        self.assertEqual(Decimal(stale["amount_raised"]), Decimal("1.00"))
+
+        CounterReconciliationService.reconcile()
+
+        payload = DealCacheService.get_payload(self.deals[0].id)
+        self.assertEqual(Decimal(payload["amount_raised"]), Decimal("970.00"))
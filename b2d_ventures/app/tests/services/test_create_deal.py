@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.test import TransactionTestCase, override_settings
+
+from b2d_ventures.app.models import Deal, Startup, StoredBlob
+from b2d_ventures.utils.create_deal import FILE_FIELDS, MOCK_DEALS
+from b2d_ventures.utils.storage import ContentAddressedStorage
+
+
+@override_settings(DATAROOM_INDEX_ASYNC=False)
+class CreateMockDealsTestCase(TransactionTestCase):
+    """Test case for the create_mock_deals command."""
+
+    def setUp(self):
+        """Store the uploaded files in a temporary local storage."""
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        self.storage = ContentAddressedStorage(location=self.media_root)
+        for field in FILE_FIELDS:
+            storage_patch = patch.object(
+                Deal._meta.get_field(field), "storage", self.storage
+            )
+            storage_patch.start()
+            self.addCleanup(storage_patch.stop)
+
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+
+    def seed(self, workers):
+        out = StringIO()
+        call_command(
+            "create_mock_deals",
+            startup_id=str(self.startup.id),
+            workers=workers,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def test_seeding_is_idempotent(self):
+        """Test that a re-run updates the deals and uploads nothing new."""
+        output = self.seed(workers=1)
+        self.assertIn(f"Created {len(MOCK_DEALS)} and updated 0", output)
+        blobs = set(StoredBlob.objects.values_list("sha256", flat=True))
+
+        deal = Deal.objects.get(startup=self.startup, name="GreenSpark Series B")
+        self.assertEqual(deal.status, "approved")
+        self.assertEqual(deal.image_logo.name, "GreenSpark/greenspark_logo.png")
+        with deal.dataroom.open("rb") as file:
+            self.assertEqual(file.read(5), b"%PDF-")
+        ecothread = Deal.objects.get(name="EcoThread Bridge Round")
+        self.assertFalse(ecothread.image_content)
+
+        Deal.objects.filter(id=deal.id).update(description="Edited")
+        output = self.seed(workers=1)
+        self.assertIn(f"Created 0 and updated {len(MOCK_DEALS)}", output)
+        self.assertEqual(Deal.objects.count(), len(MOCK_DEALS))
+        self.assertEqual(
+            set(StoredBlob.objects.values_list("sha256", flat=True)), blobs
+        )
+        deal.refresh_from_db()
+        self.assertEqual(deal.image_logo.name, "GreenSpark/greenspark_logo.png")
+        self.assertNotEqual(deal.description, "Edited")
+        # The deal files plus the dataroom preview, which is not redone.
+        self.assertEqual(
+            len(os.listdir(os.path.join(self.media_root, "GreenSpark"))),
+            len(FILE_FIELDS) + 1,
+        )
+        self.assertTrue(self.storage.exists(deal.dataroom_document.thumbnail))
+
+    def test_parallel_uploads(self):
+        """Test that the upload pool stores every file of every deal."""
+        storage = FileSystemStorage(location=self.media_root)
+        for field in FILE_FIELDS:
+            storage_patch = patch.object(
+                Deal._meta.get_field(field), "storage", storage
+            )
+            storage_patch.start()
+            self.addCleanup(storage_patch.stop)
+
+        output = self.seed(workers=4)
+
+        self.assertIn(f"Created {len(MOCK_DEALS)} and updated 0", output)
+        for deal in Deal.objects.all():
+            self.assertTrue(deal.dataroom)
+            self.assertTrue(storage.exists(deal.image_logo.name))
@@ -0,0 +1,191 @@
+import shutil
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from b2d_ventures.app.models import DataroomDocument, Deal, Investor, Startup
+from b2d_ventures.app.services import (
+    DataroomIndexService,
+    InvestorError,
+    InvestorService,
+)
+from b2d_ventures.utils.pdf_preview import extract_pdf
+
+SAMPLE_PDF = (
+    Path(settings.ROOT_DIR) / "contentMockup" / "CleanWave" / "cleanwave_dataroom.pdf"
+)
+EXTRACT = "b2d_ventures.app.services.dataroom_index_service.extract_pdf"
+REQUESTS_GET = "b2d_ventures.app.services.dataroom_index_service.requests.get"
+
+
+def burn_cpu(*args):
+    while True:
+        pass
+
+
+class ExtractPdfTestCase(TestCase):
+    """Test case for extracting text and a thumbnail from a PDF."""
+
+    def test_extract_pdf(self):
+        """Test the page count, normalized text and WebP thumbnail."""
+        result = extract_pdf(str(SAMPLE_PDF), 500, 100, 160)
+
+        self.assertEqual(result["page_count"], 2)
+        self.assertEqual(len(result["pages"]), 2)
+        self.assertTrue(result["pages"][0].startswith("CleanWave Data Room"))
+        self.assertNotIn("\n", result["pages"][0])
+        self.assertLessEqual(len(result["pages"][0]), 100)
+        with Image.open(BytesIO(result["thumbnail"])) as thumbnail:
+            self.assertEqual((thumbnail.format, thumbnail.width), ("WEBP", 160))
+
+    def test_extract_pdf_page_limit(self):
+        """Test that pages past the limit are counted but not extracted."""
+        result = extract_pdf(str(SAMPLE_PDF), 1, 100, 160)
+
+        self.assertEqual((result["page_count"], len(result["pages"])), (2, 1))
+
+
+@override_settings(DATAROOM_INDEX_ASYNC=False, DATAROOM_THUMBNAIL_WIDTH=160)
+class DataroomIndexServiceTestCase(TestCase):
+    """Test case for the DataroomIndexService class."""
+
+    def setUp(self):
+        """Store datarooms and previews in a temporary local storage."""
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        self.storage = FileSystemStorage(location=self.media_root, base_url="/media/")
+        for field in ("dataroom", "image_background"):
+            storage_patch = patch.object(
+                Deal._meta.get_field(field), "storage", self.storage
+            )
+            storage_patch.start()
+            self.addCleanup(storage_patch.stop)
+
+        self.investor = Investor.objects.create(
+            email="investor@example.com", username="investor"
+        )
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        self.deal = Deal.objects.create(
+            name="Ocean Deal", startup=self.startup, status="approved"
+        )
+        self.upload(SAMPLE_PDF.read_bytes())
+
+    def upload(self, data, name="datarooms/Startup/room.pdf"):
+        self.deal.dataroom.name = self.storage.save(name, ContentFile(data))
+        self.deal.save()
+
+    def test_index(self):
+        """Test that pages, search text and a thumbnail are stored."""
+        document = DataroomIndexService.index(self.deal.id)
+
+        self.assertEqual(document.status, "complete")
+        self.assertEqual(document.page_count, 2)
+        self.assertEqual(document.pages.count(), 2)
+        self.assertIn("San Francisco", document.search_text)
+        self.assertTrue(self.storage.exists(document.thumbnail))
+        self.assertIsNone(DataroomIndexService.index(self.deal.id))
+
+    def test_schedule_on_upload(self):
+        """Test that a new dataroom is indexed once the upload commits."""
+        DataroomIndexService.index(self.deal.id)
+        old_thumbnail = DataroomDocument.objects.get().thumbnail
+
+        self.upload(b"%PDF-1.4 broken", name="datarooms/Startup/new.pdf")
+        with self.captureOnCommitCallbacks(execute=True):
+            DataroomIndexService.schedule(self.deal)
+
+        document = DataroomDocument.objects.get()
+        self.assertEqual(document.source, "datarooms/Startup/new.pdf")
+        self.assertEqual(document.status, "failed")
+        self.assertEqual(document.pages.count(), 0)
+        self.assertFalse(self.storage.exists(old_thumbnail))
+
+    def test_reindex_releases_old_thumbnail(self):
+        """Test that a forced re-index leaves only the new preview behind."""
+        old_thumbnail = DataroomIndexService.index(self.deal.id).thumbnail
+
+        document = DataroomIndexService.index(self.deal.id, force=True)
+
+        self.assertTrue(self.storage.exists(document.thumbnail))
+        self.assertNotEqual(document.thumbnail, old_thumbnail)
+        self.assertFalse(self.storage.exists(old_thumbnail))
+
+    def test_index_remote_dataroom(self):
+        """Test that a remote dataroom is streamed to a file for extraction."""
+        data = SAMPLE_PDF.read_bytes()
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = iter([data[:1000], data[1000:]])
+        local_path = self.storage.path
+
+        def remote_path(name):
+            if name == self.deal.dataroom.name:
+                raise NotImplementedError
+            return local_path(name)
+
+        with patch.object(self.storage, "path", remote_path), patch(
+            REQUESTS_GET, return_value=response
+        ) as get:
+            document = DataroomIndexService.index(self.deal.id)
+
+        self.assertEqual(document.status, "complete")
+        self.assertEqual(document.page_count, 2)
+        self.assertEqual(get.call_args.args, (self.deal.dataroom.url,))
+        self.assertTrue(get.call_args.kwargs["stream"])
+
+    @override_settings(DATAROOM_INDEX_CPU_SECONDS=1)
+    def test_cpu_limit(self):
+        """Test that a runaway extraction is killed and the pool recovers."""
+        with patch(EXTRACT, burn_cpu):
+            document = DataroomIndexService.index(self.deal.id)
+
+        self.assertEqual(document.status, "failed")
+        self.assertIn("resource limits", document.error)
+        document = DataroomIndexService.index(self.deal.id, force=True)
+        self.assertEqual(document.status, "complete")
+
+    def test_search_deals(self):
+        """Test finding deals by dataroom text, with the matching pages."""
+        Deal.objects.create(name="Other Deal", startup=self.startup, status="approved")
+        DataroomIndexService.index(self.deal.id)
+
+        response = InvestorService.search_deals(self.investor.id, "san francisco")
+
+        results = response.data["data"]
+        self.assertEqual([result["id"] for result in results], [str(self.deal.id)])
+        self.assertEqual(results[0]["meta"]["dataroom_pages"], [1])
+        with self.assertRaises(InvestorError):
+            InvestorService.search_deals(self.investor.id, " ")
+
+    def test_dataroom_preview(self):
+        """Test the preview of an indexed dataroom."""
+        with self.assertRaises(InvestorError):
+            InvestorService.get_dataroom_preview(self.investor.id, self.deal.id)
+        DataroomIndexService.index(self.deal.id)
+
+        response = InvestorService.get_dataroom_preview(self.investor.id, self.deal.id)
+
+        attributes = response.data["attributes"]
+        self.assertEqual(attributes["page_count"], 2)
+        self.assertTrue(attributes["thumbnail_url"].startswith("/media/"))
+        self.assertEqual([page["number"] for page in attributes["pages"]], [1, 2])
+        self.assertLessEqual(len(attributes["pages"][0]["excerpt"]), 300)
+
+    def test_dataroom_preview_of_unapproved_deal(self):
+        """Test that the preview of a pending or rejected deal is not shown."""
+        DataroomIndexService.index(self.deal.id)
+
+        for deal_status in ("pending", "rejected"):
+            Deal.objects.filter(id=self.deal.id).update(status=deal_status)
+            with self.assertRaises(ObjectDoesNotExist):
+                InvestorService.get_dataroom_preview(self.investor.id, self.deal.id)
@@ -0,0 +1,112 @@
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.signing import Signer
+from django.test import TestCase, override_settings
+
+from b2d_ventures.app.models import Deal, Investor, Startup
+from b2d_ventures.app.services import (
+    DataroomError,
+    DataroomService,
+    InvestorService,
+)
+from b2d_ventures.app.services.dataroom_service import (
+    SIGNER_SALT,
+    RangeNotSatisfiableError,
+)
+
+
+class DataroomServiceTestCase(TestCase):
+    """Test case for the DataroomService class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        cache.clear()
+        self.investor = Investor.objects.create(
+            email="investor@example.com", username="investor"
+        )
+        self.startup = Startup.objects.create(
+            email="startup@example.com",
+            username="startup",
+            name="Test Startup",
+            description="A test startup",
+        )
+        self.deal = Deal.objects.create(
+            name="Test Deal", startup=self.startup, status="approved"
+        )
+        self.deal.dataroom.name = "datarooms/Test Startup/deck.pdf"
+
+    def test_sign_and_verify(self):
+        """Test that a signed token decodes without database queries."""
+        token, expires_at = DataroomService.sign_download(self.investor, self.deal)
+        with self.assertNumQueries(0):
+            link = DataroomService.verify_token(token)
+        self.assertEqual(link.deal_id, str(self.deal.id))
+        self.assertEqual(link.investor_id, str(self.investor.id))
+        self.assertEqual(link.name, "datarooms/Test Startup/deck.pdf")
+        self.assertEqual(link.expires_at, int(expires_at.timestamp()))
+        self.assertTrue(
+            DataroomService.download_path(token).startswith("/api/datarooms/")
+        )
+
+    def test_verify_tampered_token(self):
+        """Test that a modified token is rejected."""
+        token, _ = DataroomService.sign_download(self.investor, self.deal)
+        payload = Signer(salt=SIGNER_SALT).unsign_object(token)
+        payload["i"] = "someone-else"
+        forged = Signer(salt="other").sign_object(payload)
+        with self.assertRaises(DataroomError):
+            DataroomService.verify_token(forged)
+        with self.assertRaises(DataroomError):
+            DataroomService.verify_token(token[:-2])
+
+    @override_settings(DATAROOM_LINK_TTL_SECONDS=-1)
+    def test_verify_expired_token(self):
+        """Test that an expired token is rejected."""
+        token, _ = DataroomService.sign_download(self.investor, self.deal)
+        with self.assertRaises(DataroomError):
+            DataroomService.verify_token(token)
+
+    def test_verify_uses_cache(self):
+        """Test that a verified token is not checked again until it expires."""
+        token, _ = DataroomService.sign_download(self.investor, self.deal)
+        DataroomService.verify_token(token)
+        with patch.object(Signer, "unsign_object") as unsign:
+            link = DataroomService.verify_token(token)
+        unsign.assert_not_called()
+        self.assertEqual(link.deal_id, str(self.deal.id))
+
+        with patch("b2d_ventures.app.services.dataroom_service.time.time") as now:
+            now.return_value = link.expires_at + 1
+            with self.assertRaises(DataroomError):
+                DataroomService.verify_token(token)
+
+    def test_parse_range(self):
+        """Test parsing of single byte ranges."""
+        self.assertIsNone(DataroomService.parse_range(None, 100))
+        self.assertIsNone(DataroomService.parse_range("bytes=0-1,5-6", 100))
+        self.assertIsNone(DataroomService.parse_range("bytes=-", 100))
+        self.assertEqual(DataroomService.parse_range("bytes=10-19", 100), (10, 19))
+        self.assertEqual(DataroomService.parse_range("bytes=90-", 100), (90, 99))
+        self.assertEqual(DataroomService.parse_range("bytes=90-500", 100), (90, 99))
+        self.assertEqual(DataroomService.parse_range("bytes=-30", 100), (70, 99))
+        self.assertEqual(DataroomService.parse_range("bytes=-500", 100), (0, 99))
+        for header in ("bytes=100-", "bytes=20-10", "bytes=-0"):
+            with self.assertRaises(RangeNotSatisfiableError):
+                DataroomService.parse_range(header, 100)
+
+    @patch("b2d_ventures.utils.email_service.EmailService.send_email_with_attachment")
+    def test_request_dataroom_sends_signed_link(self, mock_email):
+        """Test that request_dataroom emails a signed link, not the file URL."""
+        self.deal.save()
+        response = InvestorService.request_dataroom(self.investor.id, self.deal.id)
+
+        self.assertEqual(response.status_code, 200)
+        body = mock_email.call_args.args[2]
+        url = next(line for line in body.splitlines() if "/api/datarooms/" in line)
+        token = url.rstrip("/").rsplit("/", 1)[1]
+        link = DataroomService.verify_token(token)
+        self.assertEqual(link.investor_id, str(self.investor.id))
+        self.assertGreater(link.expires_at, time.time())
+        self.assertIn("expires on", body)
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from django.db import connections
+from django.test import SimpleTestCase
+
+from b2d_ventures.utils.db_pool import pool_metrics
+
+
+class PoolMetricsTestCase(SimpleTestCase):
+    """Test case for the connection pool metrics."""
+
+    def _with_pool(self, pool):
+        return patch.object(
+            type(connections["default"]),
+            "pool",
+            new_callable=PropertyMock,
+            return_value=pool,
+            create=True,
+        )
+
+    def test_no_pool(self):
+        """Test that databases without a pool are left out."""
+        self.assertEqual(pool_metrics(), {})
+
+    def test_closed_pool(self):
+        """Test that a pool not opened yet reports no usage."""
+        with self._with_pool(MagicMock(closed=True)):
+            self.assertEqual(pool_metrics(), {"default": {"open": False}})
+
+    def test_saturation_and_wait(self):
+        """Test that saturation and the average wait are derived from the stats."""
+        pool = MagicMock(closed=False)
+        pool.get_stats.return_value = {
+            "pool_min": 2,
+            "pool_max": 10,
+            "pool_size": 10,
+            "pool_available": 2,
+            "requests_waiting": 3,
+            "requests_num": 500,
+            "requests_queued": 40,
+            "requests_wait_ms": 1000,
+            "requests_errors": 1,
+        }
+
+        with self._with_pool(pool):
+            metrics = pool_metrics()["default"]
+
+        self.assertEqual(metrics["in_use"], 8)
+        self.assertEqual(metrics["saturation"], 0.8)
+        self.assertEqual(metrics["requests_waiting"], 3)
+        self.assertEqual(metrics["average_wait_ms"], 25)
+        self.assertEqual(metrics["requests_timed_out"], 1)
+        self.assertEqual(metrics["connections_lost"], 0)
@@ -0,0 +1,139 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TransactionTestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from b2d_ventures.app.models import Deal, Investment, Investor, Startup
+from b2d_ventures.utils.db_router import (
+    PIN_COOKIE,
+    PIN_HEADER,
+    ReplicaPinningMiddleware,
+)
+
+REPLICA = "replica_0"
+
+
+class ReplicaRouterTestCase(TransactionTestCase):
+    """
+    Test case for the read-replica router.
+
+    The test database is the primary and a copy of it in a second SQLite
+    file is the replica. Rows written after the copy stand for replication
+    lag: they are only visible on the primary.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Register a replica database in a second SQLite file."""
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, "replica.sqlite3")
+        connections.settings[REPLICA] = connections.configure_settings(
+            {
+                DEFAULT_DB_ALIAS: dict(connections[DEFAULT_DB_ALIAS].settings_dict),
+                REPLICA: {"ENGINE": "django.db.backends.sqlite3", "NAME": cls.path},
+            }
+        )[REPLICA]
+        # Added here, not in the class body, so that the test runner does not
+        # try to set the replica up as a test database.
+        cls.databases = {DEFAULT_DB_ALIAS, REPLICA}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections[REPLICA].close()
+        del connections[REPLICA]
+        del connections.settings[REPLICA]
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        """Copy the primary into the replica, then write one more row."""
+        cache.clear()
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        self.investor = Investor.objects.create(
+            email="investor@example.com", username="investor"
+        )
+        self.deal = Deal.objects.create(
+            name="Deal", startup=self.startup, status="approved"
+        )
+
+        connections[REPLICA].close()
+        primary = connections[DEFAULT_DB_ALIAS]
+        primary.ensure_connection()
+        replica = sqlite3.connect(self.path)
+        primary.connection.backup(replica)
+        replica.close()
+
+        Investment.objects.create(
+            deal=self.deal, investor=self.investor, investment_amount=5000
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.investor)
+        self.url = f"/api/investor/{self.investor.id}/investments/"
+
+    def test_get_reads_replica(self):
+        """Test that GET requests read from the lagging replica."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 0)
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_recent_write_reads_primary(self):
+        """Test that a recent-write cookie or header pins reads to the primary."""
+        until = str(int(time.time()) + 5)
+
+        self.client.cookies[PIN_COOKIE] = until
+        self.assertEqual(len(self.client.get(self.url).data), 1)
+
+        self.client.cookies.clear()
+        response = self.client.get(self.url, HTTP_X_PRIMARY_PIN_UNTIL=until)
+        self.assertEqual(len(response.data), 1)
+
+        expired = str(int(time.time()) - 1)
+        response = self.client.get(self.url, HTTP_X_PRIMARY_PIN_UNTIL=expired)
+        self.assertEqual(len(response.data), 0)
+
+    def test_write_pins_request_and_client(self):
+        """Test that a request reads its own writes and pins the client."""
+        seen = []
+
+        def view(request):
+            seen.append(Deal.objects.get(id=self.deal.id).name)
+            Deal.objects.filter(id=self.deal.id).update(name="Renamed")
+            seen.append(Deal.objects.get(id=self.deal.id).name)
+            return HttpResponse()
+
+        request = RequestFactory().get("/")
+        response = ReplicaPinningMiddleware(view)(request)
+
+        self.assertEqual(seen, ["Deal", "Renamed"])
+        self.assertIn(PIN_COOKIE, response.cookies)
+        self.assertGreater(int(response[PIN_HEADER]), time.time())
+
+    def test_transaction_reads_primary(self):
+        """Test that reads in transactions, like create_investment's, stay put."""
+
+        def view(request):
+            with transaction.atomic():
+                count = Investment.objects.count()
+            return HttpResponse(str(count))
+
+        response = ReplicaPinningMiddleware(view)(RequestFactory().get("/"))
+
+        self.assertEqual(response.content, b"1")
+
+    def test_reads_outside_requests_use_primary(self):
+        """Test that commands and workers read from the primary."""
+        self.assertEqual(Investment.objects.count(), 1)
+        self.assertEqual(Investment.objects.using(REPLICA).count(), 0)
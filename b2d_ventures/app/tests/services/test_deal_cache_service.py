@@ -0,0 +1,148 @@
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from b2d_ventures.app.models import Deal, Investment, Investor, Startup
+from b2d_ventures.app.services import DealCacheService
+from b2d_ventures.utils.model_cache import model_cache
+
+SHARED_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": tempfile.mkdtemp(prefix="b2d-deal-cache-"),
+    }
+}
+
+
+@override_settings(CACHES=SHARED_CACHES)
+class DealCacheServiceTestCase(TestCase):
+    """Test case for the read-through deal payload cache."""
+
+    def setUp(self):
+        """Start every test with an empty cache and zeroed counters."""
+        cache.clear()
+        DealCacheService.reset_metrics()
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        self.deal = Deal.objects.create(name="Deal", startup=self.startup)
+
+    @staticmethod
+    def _entry(deal_id):
+        return cache.get(f"deal_payload:{deal_id}:{model_cache.version(Deal, deal_id)}")
+
+    def test_read_through(self):
+        """Test that payloads are stored as bytes and served without queries."""
+        DealCacheService.get_payload(self.deal.id)
+
+        with CaptureQueriesContext(connection) as queries:
+            payload = DealCacheService.get_payload(self.deal.id)
+
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(payload["name"], "Deal")
+        self.assertEqual(payload["startup"]["name"], "Startup")
+        self.assertIsInstance(self._entry(self.deal.id)[0], bytes)
+        metrics = DealCacheService.metrics()
+        self.assertEqual(metrics["hits"], 1)
+        self.assertEqual(metrics["misses"], 1)
+        self.assertEqual(metrics["hit_rate"], 0.5)
+
+    def test_missing_deal(self):
+        """Test that a missing deal raises and is not cached."""
+        missing = "00000000-0000-0000-0000-000000000000"
+        with self.assertRaises(Deal.DoesNotExist):
+            DealCacheService.get_payload(missing)
+
+        self.assertIsNone(self._entry(missing))
+
+    def test_deal_save_invalidates(self):
+        """Test that saving a deal makes its payload stale."""
+        DealCacheService.get_payload(self.deal.id)
+        self.deal.name = "Renamed"
+        self.deal.save()
+
+        self.assertEqual(DealCacheService.get_payload(self.deal.id)["name"], "Renamed")
+
+    def test_investment_invalidates(self):
+        """Test that writing an investment makes the deal's payload stale."""
+        investor = Investor.objects.create(
+            email="investor@example.com", username="investor"
+        )
+        DealCacheService.get_payload(self.deal.id)
+        investment = Investment.objects.create(
+            deal=self.deal, investor=investor, investment_amount=5000
+        )
+        DealCacheService.get_payload(self.deal.id)
+        investment.delete()
+        DealCacheService.get_payload(self.deal.id)
+
+        self.assertEqual(DealCacheService.metrics()["misses"], 3)
+
+    def test_startup_save_invalidates(self):
+        """Test that renaming the startup updates its deals' payloads."""
+        DealCacheService.get_payload(self.deal.id)
+        self.startup.name = "Renamed"
+        self.startup.save()
+
+        payload = DealCacheService.get_payload(self.deal.id)
+
+        self.assertEqual(payload["startup"]["name"], "Renamed")
+
+    def test_single_flight(self):
+        """Test that concurrent misses rebuild the payload once."""
+        calls = []
+
+        def slow_serialize(deal_id):
+            calls.append(deal_id)
+            time.sleep(0.2)
+            return b'{"name": "Deal"}', 0.2
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def read():
+            barrier.wait()
+            results.append(DealCacheService.get_payload(self.deal.id))
+
+        with patch.object(DealCacheService, "_serialize", slow_serialize):
+            threads = [threading.Thread(target=read) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"name": "Deal"}] * 8)
+        self.assertEqual(DealCacheService.metrics()["waits"], 7)
+
+    @override_settings(DEAL_CACHE_EARLY_REFRESH_BETA=1e9)
+    def test_early_refresh(self):
+        """Test that a payload near expiry is refreshed before it expires."""
+        DealCacheService.get_payload(self.deal.id)
+        Deal.objects.filter(id=self.deal.id).update(name="Renamed")
+
+        payload = DealCacheService.get_payload(self.deal.id)
+
+        self.assertEqual(payload["name"], "Renamed")
+        self.assertEqual(DealCacheService.metrics()["early_refreshes"], 1)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_local_cache_is_bypassed(self):
+        """Test that payloads are not cached with a per-process cache."""
+        DealCacheService.get_payload(self.deal.id)
+        Deal.objects.filter(id=self.deal.id).update(name="Renamed elsewhere")
+
+        payload = DealCacheService.get_payload(self.deal.id)
+
+        self.assertEqual(payload["name"], "Renamed elsewhere")
+        self.assertIsNone(self._entry(self.deal.id))
+        metrics = DealCacheService.metrics()
+        self.assertEqual((metrics["bypasses"], metrics["misses"]), (2, 0))
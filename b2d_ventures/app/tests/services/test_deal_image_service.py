@@ -0,0 +1,163 @@
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from b2d_ventures.app.models import Deal, Startup
+from b2d_ventures.app.serializers import DealSerializer
+from b2d_ventures.app.services import DealImageService, StartupService
+from b2d_ventures.app.services.deal_image_service import IMAGE_FIELDS
+from b2d_ventures.utils.image_variants import render_variants
+
+RENDER = "b2d_ventures.app.services.deal_image_service.render_variants"
+
+
+def image_bytes(size, mode="RGB", image_format="PNG"):
+    buffer = BytesIO()
+    Image.new(mode, size, (40, 120, 200, 128)[: len(mode)]).save(buffer, image_format)
+    return buffer.getvalue()
+
+
+class RenderVariantsTestCase(TestCase):
+    """Test case for resizing images into variants."""
+
+    def test_render_variants(self):
+        """Test WebP and JPEG variants at each width, without upscaling."""
+        result = render_variants(image_bytes((1000, 500), "RGBA"), [320, 640, 1280])
+
+        self.assertEqual((result["width"], result["height"]), (1000, 500))
+        self.assertTrue(result["placeholder"].startswith("data:image/webp;base64,"))
+        self.assertEqual(
+            [
+                (variant_format, width)
+                for variant_format, width, _ in result["variants"]
+            ],
+            [
+                ("webp", 320),
+                ("jpeg", 320),
+                ("webp", 640),
+                ("jpeg", 640),
+                ("webp", 1000),
+                ("jpeg", 1000),
+            ],
+        )
+        with Image.open(BytesIO(result["variants"][1][2])) as jpeg:
+            self.assertEqual(
+                (jpeg.format, jpeg.size, jpeg.mode), ("JPEG", (320, 160), "RGB")
+            )
+
+
+@override_settings(DEAL_IMAGE_VARIANTS_ASYNC=False, DEAL_IMAGE_WIDTHS=[320, 640])
+class DealImageServiceTestCase(TestCase):
+    """Test case for the DealImageService class."""
+
+    def setUp(self):
+        """Store deal images in a temporary local storage."""
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        self.storage = FileSystemStorage(location=self.media_root, base_url="/media/")
+        for field in IMAGE_FIELDS:
+            storage_patch = patch.object(
+                Deal._meta.get_field(field), "storage", self.storage
+            )
+            storage_patch.start()
+            self.addCleanup(storage_patch.stop)
+
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        self.deal = Deal.objects.create(name="Deal", startup=self.startup)
+        self.deal.image_logo.save("logo.png", ContentFile(image_bytes((400, 400))))
+
+    def test_generate(self):
+        """Test that variants are stored and recorded on the deal."""
+        self.assertEqual(DealImageService.generate(self.deal.id), ["image_logo"])
+
+        self.deal.refresh_from_db()
+        entry = self.deal.image_variants["image_logo"]
+        self.assertEqual(entry["source"], self.deal.image_logo.name)
+        self.assertEqual(sorted(entry["webp"]), ["320", "400"])
+        for name in list(entry["webp"].values()) + list(entry["jpeg"].values()):
+            self.assertTrue(self.storage.exists(name))
+
+        srcset = DealSerializer(self.deal).data["image_variants"]["image_logo"]
+        self.assertEqual(
+            srcset["srcset"]["webp"],
+            f"/media/{entry['webp']['320']} 320w, /media/{entry['webp']['400']} 400w",
+        )
+
+    @override_settings(DEAL_IMAGE_VARIANTS_ASYNC=True)
+    def test_generate_in_process_pool(self):
+        """Test rendering the variants in worker processes."""
+        self.assertEqual(DealImageService.generate(self.deal.id), ["image_logo"])
+        self.deal.refresh_from_db()
+        self.assertEqual(
+            sorted(self.deal.image_variants["image_logo"]["jpeg"]), ["320", "400"]
+        )
+
+    def test_generate_is_idempotent(self):
+        """Test that unchanged images are not rendered again."""
+        DealImageService.generate(self.deal.id)
+        with patch(RENDER) as render:
+            self.assertEqual(DealImageService.generate(self.deal.id), [])
+        render.assert_not_called()
+
+        with patch(RENDER, wraps=render_variants) as render:
+            DealImageService.generate(self.deal.id, force=True)
+        render.assert_called_once()
+
+    def test_replaced_image(self):
+        """Test that a new upload replaces the variants of the old image."""
+        DealImageService.generate(self.deal.id)
+        self.deal.refresh_from_db()
+        old_names = list(self.deal.image_variants["image_logo"]["webp"].values())
+
+        self.deal.image_logo.save("new_logo.png", ContentFile(image_bytes((200, 100))))
+        DealImageService.generate(self.deal.id)
+
+        self.deal.refresh_from_db()
+        entry = self.deal.image_variants["image_logo"]
+        self.assertEqual(entry["width"], 200)
+        self.assertEqual(list(entry["webp"]), ["200"])
+        self.assertFalse(any(self.storage.exists(name) for name in old_names))
+
+        self.deal.image_logo = None
+        self.deal.save()
+        DealImageService.generate(self.deal.id)
+        self.deal.refresh_from_db()
+        self.assertEqual(self.deal.image_variants, {})
+
+    def test_update_deal_schedules_variants_after_commit(self):
+        """Test that an upload only generates variants once it commits."""
+        upload = ContentFile(image_bytes((700, 300), image_format="JPEG"), "bg.jpg")
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = StartupService.update_deal(
+                self.startup.id, self.deal.id, {"image_background": upload}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.deal.refresh_from_db()
+        self.assertEqual(self.deal.image_variants, {})
+
+        for callback in callbacks:
+            callback()
+        self.deal.refresh_from_db()
+        self.assertEqual(
+            sorted(self.deal.image_variants), ["image_background", "image_logo"]
+        )
+
+    def test_backfill_command(self):
+        """Test the generate_deal_image_variants command."""
+        Deal.objects.create(name="No images", startup=self.startup)
+        out = StringIO()
+        call_command("generate_deal_image_variants", stdout=out)
+        self.assertIn("Generated image variants for 1 deals", out.getvalue())
+
+        out = StringIO()
+        call_command("generate_deal_image_variants", stdout=out)
+        self.assertIn("Generated image variants for 0 deals", out.getvalue())
@@ -0,0 +1,155 @@
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from b2d_ventures.utils.email_sender import EmailSenderPool, TokenBucket
+
+SMTP_SSL = "b2d_ventures.utils.email_sender.smtplib.SMTP_SSL"
+
+
+def message(to_email):
+    msg = EmailMessage()
+    msg["From"] = "noreply@example.com"
+    msg["To"] = to_email
+    msg["Subject"] = "Test"
+    msg.set_content("Hello")
+    return msg
+
+
+class TokenBucketTestCase(SimpleTestCase):
+    """Test case for the TokenBucket rate limiter."""
+
+    def test_burst_then_rate(self):
+        """Test that a full bucket allows a burst and then refills at rate."""
+        now = [0.0]
+        bucket = TokenBucket(rate=2, capacity=3, clock=lambda: now[0])
+
+        self.assertEqual([bucket.try_acquire() for _ in range(3)], [0, 0, 0])
+        self.assertAlmostEqual(bucket.try_acquire(), 0.5)
+        now[0] = 0.5
+        self.assertEqual(bucket.try_acquire(), 0)
+        now[0] = 100
+        self.assertEqual([bucket.try_acquire() for _ in range(3)], [0, 0, 0])
+        self.assertGreater(bucket.try_acquire(), 0)
+
+
+class EmailSenderPoolTestCase(SimpleTestCase):
+    """Test case for the EmailSenderPool class."""
+
+    def make_pool(self, **kwargs):
+        options = dict(workers=2, rate=1000, burst=1000, retry_base=0.01)
+        options.update(kwargs)
+        pool = EmailSenderPool("smtp.example.com", 465, "user", "secret", **options)
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    @patch(SMTP_SSL)
+    def test_send_reuses_sessions(self, mock_smtp):
+        """Test that one SMTP session is reused for consecutive messages."""
+        pool = self.make_pool(workers=1)
+        futures = [pool.submit(message(f"user{i}@example.com")) for i in range(5)]
+
+        self.assertTrue(all(future.result(timeout=5) for future in futures))
+        mock_smtp.assert_called_once_with("smtp.example.com", 465)
+        server = mock_smtp.return_value
+        server.login.assert_called_once_with("user", "secret")
+        self.assertEqual(server.send_message.call_count, 5)
+        metrics = pool.metrics()
+        self.assertEqual(metrics["sent"], 5)
+        self.assertEqual(metrics["sent_last_minute"], 5)
+        self.assertEqual(metrics["pending"], 0)
+
+    @patch(SMTP_SSL)
+    def test_retry_transient_failure(self, mock_smtp):
+        """Test that 4xx replies are retried with a fresh session."""
+        mock_smtp.return_value.send_message.side_effect = [
+            smtplib.SMTPDataError(421, b"Try again later"),
+            smtplib.SMTPServerDisconnected("Connection closed"),
+            {},
+        ]
+        pool = self.make_pool()
+
+        self.assertTrue(pool.submit(message("a@example.com")).result(timeout=5))
+        self.assertEqual(mock_smtp.call_count, 3)
+        self.assertEqual(pool.metrics()["retried"], 2)
+
+    @patch(SMTP_SSL)
+    def test_permanent_failure(self, mock_smtp):
+        """Test that 5xx replies fail without a retry."""
+        mock_smtp.return_value.send_message.side_effect = smtplib.SMTPRecipientsRefused(
+            {"a@example.com": (550, b"No such user")}
+        )
+        pool = self.make_pool()
+
+        self.assertFalse(pool.submit(message("a@example.com")).result(timeout=5))
+        metrics = pool.metrics()
+        self.assertEqual((metrics["failed"], metrics["retried"]), (1, 0))
+
+    @patch(SMTP_SSL)
+    def test_retries_exhausted(self, mock_smtp):
+        """Test that a message fails after EMAIL_SEND_MAX_ATTEMPTS attempts."""
+        mock_smtp.return_value.send_message.side_effect = smtplib.SMTPDataError(
+            451, b"Local error"
+        )
+        pool = self.make_pool(max_attempts=3)
+
+        self.assertFalse(pool.submit(message("a@example.com")).result(timeout=5))
+        self.assertEqual(mock_smtp.return_value.send_message.call_count, 3)
+        self.assertEqual(pool.metrics()["retried"], 2)
+
+    @patch(SMTP_SSL)
+    def test_domain_concurrency(self, mock_smtp):
+        """Test that a recipient domain never exceeds its concurrency cap."""
+        lock = threading.Lock()
+        in_flight = {"gmail.com": 0, "example.com": 0}
+        peak = dict(in_flight)
+
+        def send_message(msg):
+            domain = msg["To"].split("@")[1]
+            with lock:
+                in_flight[domain] += 1
+                peak[domain] = max(peak[domain], in_flight[domain])
+            time.sleep(0.01)
+            with lock:
+                in_flight[domain] -= 1
+
+        mock_smtp.return_value.send_message.side_effect = send_message
+        pool = self.make_pool(workers=4, domain_concurrency=1)
+        futures = [
+            pool.submit(message(f"user{i}@{domain}"))
+            for i in range(6)
+            for domain in ("gmail.com", "example.com")
+        ]
+
+        self.assertTrue(all(future.result(timeout=5) for future in futures))
+        self.assertEqual(peak, {"gmail.com": 1, "example.com": 1})
+
+    @patch(SMTP_SSL)
+    def test_busy_domain_queues_without_polling(self, mock_smtp):
+        """Test that messages for a busy domain wait in order, without timers."""
+        release = threading.Event()
+        sent = []
+
+        def send_message(msg):
+            release.wait(timeout=5)
+            sent.append(msg["To"])
+
+        mock_smtp.return_value.send_message.side_effect = send_message
+        pool = self.make_pool(workers=2, domain_concurrency=1)
+        with patch("b2d_ventures.utils.email_sender.threading.Timer") as timer:
+            futures = [pool.submit(message(f"user{i}@gmail.com")) for i in range(4)]
+            for _ in range(100):
+                if pool.metrics()["domains_waiting"] == 3:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(pool.metrics()["domains_waiting"], 3)
+            release.set()
+
+            self.assertTrue(all(future.result(timeout=5) for future in futures))
+        timer.assert_not_called()
+        self.assertEqual(sent, [f"user{i}@gmail.com" for i in range(4)])
+        self.assertEqual(pool.metrics()["domains_in_flight"], 0)
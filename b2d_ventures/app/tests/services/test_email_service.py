@@ -0,0 +1,81 @@
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from b2d_ventures.utils import EmailSenderPool, EmailService
+from b2d_ventures.utils.email_templates import EmailTemplateRegistry
+
+
+@override_settings(SMTP_USER="noreply@example.com", SMTP_PASSWORD="password")
+class EmailServiceTestCase(SimpleTestCase):
+    """Test case for notification templates in EmailService."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        EmailTemplateRegistry.clear()
+        EmailSenderPool.reset()
+        self.addCleanup(EmailSenderPool.reset)
+        startup = SimpleNamespace(username="acme")
+        self.deal = SimpleNamespace(
+            name="Seed <Round>",
+            startup=startup,
+            amount_raised=Decimal("970.00"),
+            investor_count=1,
+        )
+        self.investment = SimpleNamespace(
+            deal=self.deal,
+            investor=SimpleNamespace(username="bob"),
+            investment_amount=Decimal("1000"),
+        )
+
+    def test_deal_notification(self):
+        """Test the plain-text and HTML parts of a deal notification."""
+        email = EmailService.build_deal_notification_content(self.deal, "approved")
+        self.assertEqual(email.subject, "Deal Update: Seed <Round>")
+        self.assertTrue(email.text.startswith("Dear acme,\n\nYour deal 'Seed <Round>'"))
+        self.assertTrue(email.text.endswith("The B2D Ventures Team\n"))
+        self.assertIn("<strong>Seed &lt;Round&gt;</strong>", email.html)
+
+    def test_investment_notification_amounts(self):
+        """Test that fees are computed and shown in cents."""
+        email = EmailService.build_investment_notification_content(
+            self.investment, "investor"
+        )
+        self.assertIn("- Platform fee: $30.00\n", email.text)
+        self.assertIn("- Net investment: $970.00\n", email.text)
+        with self.assertRaises(ValueError):
+            EmailService.build_investment_notification_content(self.investment, "x")
+
+    def test_templates_compiled_once(self):
+        """Test that repeated renders reuse the compiled template."""
+        EmailService.build_deal_notification_content(self.deal, "approved")
+        engine = EmailTemplateRegistry._get_engine()
+        with patch.object(engine, "get_template", wraps=engine.get_template) as get:
+            template = EmailTemplateRegistry.get("deal_update")
+            emails = list(
+                template.render_many(
+                    {"recipient_name": f"user{i}", "deal_name": "Deal", "action": a}
+                    for i, a in enumerate(["approved", "rejected", "updated"])
+                )
+            )
+        get.assert_not_called()
+        self.assertEqual(len(emails), 3)
+        self.assertIn("rejected", emails[1].text)
+        self.assertIn("There has been an update", emails[2].text)
+
+    @patch("b2d_ventures.utils.email_sender.smtplib.SMTP_SSL")
+    def test_send_rendered_email_multipart(self, mock_smtp):
+        """Test that a rendered email is sent as plain-text/HTML alternatives."""
+        email = EmailService.build_deal_notification_content(self.deal, "rejected")
+        self.assertTrue(EmailService().send_rendered_email("acme@example.com", email))
+
+        server = mock_smtp.return_value
+        message = server.send_message.call_args.args[0]
+        alternative = message.get_payload()[0]
+        self.assertEqual(alternative.get_content_type(), "multipart/alternative")
+        self.assertEqual(
+            [part.get_content_type() for part in alternative.get_payload()],
+            ["text/plain", "text/html"],
+        )
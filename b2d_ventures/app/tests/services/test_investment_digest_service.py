@@ -0,0 +1,165 @@
+from concurrent.futures import Future
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from b2d_ventures.app.models import (
+    Deal,
+    Investment,
+    InvestmentNotification,
+    Investor,
+    Startup,
+)
+from b2d_ventures.app.services import InvestmentDigestService, InvestorService
+
+SEND_EMAIL = "b2d_ventures.utils.email_service.EmailService.send_email_with_attachment"
+
+
+def sent(result):
+    """Mock send_email_with_attachment returning a Future of result."""
+
+    def send(*args, **kwargs):
+        future = Future()
+        future.set_result(result)
+        return future
+
+    return send
+
+
+class InvestmentDigestServiceTestCase(TestCase):
+    """Test case for the InvestmentDigestService class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.startup = Startup.objects.create(
+            email="startup@example.com",
+            username="startup",
+            name="Test Startup",
+            description="A test startup",
+            investment_digest_enabled=True,
+        )
+        self.deals = [
+            Deal.objects.create(
+                name=name, startup=self.startup, status="approved", minimum_investment=0
+            )
+            for name in ("Seed", "Series A")
+        ]
+        self.investors = [
+            Investor.objects.create(
+                email=f"investor{i}@example.com", username=f"investor{i}"
+            )
+            for i in range(3)
+        ]
+
+    def _invest(self, investor, deal, amount):
+        with patch(SEND_EMAIL, side_effect=sent(True)) as send:
+            InvestorService.create_investment(
+                investor.id, deal.id, {"investment_amount": amount}
+            )
+        return send
+
+    def test_create_investment_queues_notification(self):
+        """Test that opted-in startups are not emailed per investment."""
+        send = self._invest(self.investors[0], self.deals[0], 1000)
+
+        self.assertEqual(send.call_count, 1)
+        self.assertEqual(send.call_args.args[0], "investor0@example.com")
+        notification = InvestmentNotification.objects.get()
+        self.assertEqual(notification.startup, self.startup)
+        self.assertEqual(notification.net_investment, Decimal("970.00"))
+        self.assertIsNone(notification.sent_at)
+
+    def test_create_investment_without_digest(self):
+        """Test that other startups still get one email per investment."""
+        self.startup.investment_digest_enabled = False
+        self.startup.save()
+        send = self._invest(self.investors[0], self.deals[0], 1000)
+
+        self.assertEqual(send.call_count, 2)
+        self.assertFalse(InvestmentNotification.objects.exists())
+
+    def test_send_digests(self):
+        """Test that one aggregated email is sent per startup."""
+        self._invest(self.investors[0], self.deals[0], 1000)
+        self._invest(self.investors[1], self.deals[0], 3000)
+        self._invest(self.investors[2], self.deals[1], 2000)
+
+        with patch(SEND_EMAIL, side_effect=sent(True)) as send:
+            results = InvestmentDigestService.send_digests(top_count=2)
+
+        self.assertEqual(results, {"startups": 1, "failed": 0, "notifications": 3})
+        send.assert_called_once()
+        to_email, subject, body = send.call_args.args[:3]
+        self.assertEqual(to_email, "startup@example.com")
+        self.assertEqual(subject, "3 New Investments Received")
+        self.assertIn("totalling $5820.00", body)
+        self.assertIn("Seed:\n- New investments: 2 ($3880.00)", body)
+        self.assertIn("- Total amount raised: $3880.00\n", body)
+        self.assertIn("- $2910.00 from investor1 in Seed\n", body)
+        self.assertIn("- $1940.00 from investor2 in Series A\n", body)
+        self.assertNotIn("from investor0", body)
+        self.assertFalse(
+            InvestmentNotification.objects.filter(sent_at__isnull=True).exists()
+        )
+
+        with patch(SEND_EMAIL) as send:
+            results = InvestmentDigestService.send_digests()
+        send.assert_not_called()
+        self.assertEqual(results["notifications"], 0)
+
+    def test_send_digests_failure_releases_notifications(self):
+        """Test that notifications are retried when the email fails."""
+        self._invest(self.investors[0], self.deals[0], 1000)
+
+        with patch(SEND_EMAIL, side_effect=sent(False)):
+            results = InvestmentDigestService.send_digests()
+
+        self.assertEqual(results["failed"], 1)
+        self.assertTrue(
+            InvestmentNotification.objects.filter(sent_at__isnull=True).exists()
+        )
+
+    def test_send_digests_error_releases_notifications(self):
+        """Test that notifications are retried when sending raises."""
+        self._invest(self.investors[0], self.deals[0], 1000)
+
+        with patch(SEND_EMAIL, side_effect=ValueError("SMTP credentials not set")):
+            results = InvestmentDigestService.send_digests()
+
+        self.assertEqual(results["failed"], 1)
+        self.assertFalse(
+            InvestmentNotification.objects.filter(sent_at__isnull=False).exists()
+        )
+
+    def test_send_digests_failed_future_releases_notifications(self):
+        """Test that notifications are retried when the send fails later."""
+        self._invest(self.investors[0], self.deals[0], 1000)
+
+        def send(*args, **kwargs):
+            future = Future()
+            future.set_exception(ConnectionError("SMTP connection lost"))
+            return future
+
+        with patch(SEND_EMAIL, side_effect=send):
+            results = InvestmentDigestService.send_digests()
+
+        self.assertEqual(results["failed"], 1)
+        self.assertFalse(
+            InvestmentNotification.objects.filter(sent_at__isnull=False).exists()
+        )
+
+    def test_send_digests_query_count(self):
+        """Test that the digest is aggregated in a fixed number of queries."""
+        for i in range(6):
+            investment = Investment.objects.create(
+                deal=self.deals[i % 2],
+                investor=self.investors[i % 3],
+                investment_amount=Decimal(1000 + i),
+            )
+            InvestmentDigestService.queue_notification(
+                investment, investment.investment_amount
+            )
+
+        with patch(SEND_EMAIL, side_effect=sent(True)), self.assertNumQueries(4):
+            InvestmentDigestService.send_digests()
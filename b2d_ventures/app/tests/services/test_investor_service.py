@@ -1,12 +1,13 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import patch
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.test import TestCase
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
 from rest_framework import status
 
-from b2d_ventures.app.models import Investor, Deal, Investment, Startup
+from b2d_ventures.app.models import Investor, Deal, Investment, Startup, Meeting
 from b2d_ventures.app.services import InvestorService, InvestorError
 
 
@@ -182,3 +183,173 @@ class InvestorServiceTestCase(TestCase):
             InvestorService.schedule_meeting(
                 self.investor.id, self.startup.id, attributes
             )
+
+    @patch("b2d_ventures.app.services.AuthService.refresh_access_token")
+    @patch(
+        "b2d_ventures.app.services.CalendarService.schedule_investor_startup_meeting"
+    )
+    def test_schedule_meeting_overlapping_stored_meeting(
+        self, mock_schedule, mock_refresh
+    ):
+        """Test that a slot overlapping a stored meeting never reaches Google."""
+        Meeting.objects.create(
+            investor=self.investor,
+            startup=self.startup,
+            start_time=datetime(2024, 1, 1, 10, tzinfo=timezone.utc),
+            end_time=datetime(2024, 1, 1, 11, tzinfo=timezone.utc),
+        )
+        attributes = {
+            "start_time": "2024-01-01T10:30:00+00:00",
+            "end_time": "2024-01-01T11:30:00+00:00",
+        }
+        with self.assertRaises(InvestorError):
+            InvestorService.schedule_meeting(
+                self.investor.id, self.startup.id, attributes
+            )
+        mock_refresh.assert_not_called()
+        mock_schedule.assert_not_called()
+        self.assertEqual(Meeting.objects.count(), 1)
+
+    @patch("b2d_ventures.app.services.AuthService.refresh_access_token")
+    @patch(
+        "b2d_ventures.app.services.CalendarService.schedule_investor_startup_meeting"
+    )
+    def test_schedule_meeting_adjacent_slot(self, mock_schedule, mock_refresh):
+        """Test that a slot starting when another meeting ends is accepted."""
+        mock_refresh.return_value = "mock_access_token"
+        mock_schedule.return_value = {"id": "mock_event_id"}
+        Meeting.objects.create(
+            investor=self.investor,
+            startup=self.startup,
+            start_time=datetime(2024, 1, 1, 10, tzinfo=timezone.utc),
+            end_time=datetime(2024, 1, 1, 11, tzinfo=timezone.utc),
+        )
+        attributes = {
+            "start_time": "2024-01-01T11:00:00+00:00",
+            "end_time": "2024-01-01T12:00:00+00:00",
+        }
+        response = InvestorService.schedule_meeting(
+            self.investor.id, self.startup.id, attributes
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        mock_schedule.assert_called_once()
+
+    @patch("b2d_ventures.app.services.AuthService.refresh_access_token")
+    @patch("b2d_ventures.app.services.CalendarService.cancel_investor_startup_meeting")
+    @patch(
+        "b2d_ventures.app.services.CalendarService.schedule_investor_startup_meeting"
+    )
+    def test_schedule_meeting_lost_race(self, mock_schedule, mock_cancel, mock_refresh):
+        """Test that the event is deleted when the slot was taken meanwhile."""
+        mock_refresh.return_value = "mock_access_token"
+        mock_schedule.return_value = {"id": "mock_event_id"}
+        attributes = {
+            "start_time": "2024-01-01T10:00:00+00:00",
+            "end_time": "2024-01-01T11:00:00+00:00",
+        }
+        with patch.object(Meeting.objects, "create", side_effect=IntegrityError):
+            with self.assertRaises(InvestorError):
+                InvestorService.schedule_meeting(
+                    self.investor.id, self.startup.id, attributes
+                )
+        mock_cancel.assert_called_once_with("mock_access_token", "mock_event_id")
+
+    def test_schedule_meeting_end_before_start(self):
+        """Test scheduling a meeting that ends before it starts."""
+        attributes = {
+            "start_time": "2024-01-01T11:00:00+00:00",
+            "end_time": "2024-01-01T10:00:00+00:00",
+        }
+        with self.assertRaises(InvestorError):
+            InvestorService.schedule_meeting(
+                self.investor.id, self.startup.id, attributes
+            )
+
+    @override_settings(MEETING_SYNC_ASYNC=True)
+    @patch("b2d_ventures.app.services.AuthService.refresh_access_token")
+    @patch(
+        "b2d_ventures.app.services.CalendarService.schedule_investor_startup_meeting"
+    )
+    def test_schedule_meeting_async(self, mock_schedule, mock_refresh):
+        """Test that async scheduling stores a pending meeting and answers 202."""
+        attributes = {
+            "start_time": "2024-01-01T10:00:00+00:00",
+            "end_time": "2024-01-01T11:00:00+00:00",
+        }
+        response = InvestorService.schedule_meeting(
+            self.investor.id, self.startup.id, attributes
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["attributes"]["status"], Meeting.PENDING_SYNC)
+        mock_refresh.assert_not_called()
+        mock_schedule.assert_not_called()
+        meeting = Meeting.objects.get()
+        self.assertIsNone(meeting.investor_event_id)
+        self.assertIsNotNone(meeting.next_sync_at)
+
+    def test_schedule_meeting_ignores_failed_meeting(self):
+        """Test that a failed meeting does not block its slot."""
+        Meeting.objects.create(
+            investor=self.investor,
+            startup=self.startup,
+            start_time=datetime(2024, 1, 1, 10, tzinfo=timezone.utc),
+            end_time=datetime(2024, 1, 1, 11, tzinfo=timezone.utc),
+            status=Meeting.FAILED,
+        )
+        InvestorService.check_local_availability(
+            self.investor,
+            self.startup,
+            datetime(2024, 1, 1, 10, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 11, tzinfo=timezone.utc),
+        )
+
+    @patch("b2d_ventures.app.services.AuthService.refresh_access_token")
+    @patch("b2d_ventures.app.services.CalendarService.get_free_busy")
+    def test_suggest_meeting_slots(self, mock_free_busy, mock_refresh):
+        """Test suggesting slots around calendar events and stored meetings."""
+        mock_refresh.return_value = "mock_access_token"
+        mock_free_busy.return_value = {
+            "calendars": {
+                "primary": {
+                    "busy": [
+                        {"start": "2024-01-01T09:00:00Z", "end": "2024-01-01T10:00:00Z"}
+                    ]
+                }
+            }
+        }
+        Meeting.objects.create(
+            investor=Investor.objects.create(
+                email="other@example.com", username="other"
+            ),
+            startup=self.startup,
+            start_time=datetime(2024, 1, 1, 10, tzinfo=timezone.utc),
+            end_time=datetime(2024, 1, 1, 11, tzinfo=timezone.utc),
+        )
+        params = {
+            "start_time": "2024-01-01T09:00:00+00:00",
+            "end_time": "2024-01-01T13:00:00+00:00",
+            "duration": "60",
+            "limit": "2",
+        }
+
+        response = InvestorService.suggest_meeting_slots(
+            self.investor.id, self.startup.id, params
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [slot["attributes"]["start_time"] for slot in response.data],
+            ["2024-01-01T11:00:00+00:00", "2024-01-01T12:00:00+00:00"],
+        )
+        mock_free_busy.assert_called_once()
+
+    def test_suggest_meeting_slots_invalid_range(self):
+        """Test suggesting slots with an end before the start."""
+        params = {
+            "start_time": "2024-01-02T09:00:00+00:00",
+            "end_time": "2024-01-01T09:00:00+00:00",
+        }
+        with self.assertRaises(InvestorError):
+            InvestorService.suggest_meeting_slots(
+                self.investor.id, self.startup.id, params
+            )
@@ -0,0 +1,27 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from b2d_ventures.app.models import Deal, Startup
+from b2d_ventures.utils.keyset import keyset_chunks
+
+
+class KeysetChunksTestCase(TestCase):
+    """Test case for keyset pagination over ids."""
+
+    def setUp(self):
+        startup = Startup.objects.create(email="startup@example.com", username="s")
+        self.ids = sorted(
+            Deal.objects.create(name=f"Deal {i}", startup=startup).id for i in range(5)
+        )
+
+    def test_chunks(self):
+        """Test that every id is returned once, in order, one query per page."""
+        deals = Deal.objects.order_by("id").values_list("id", flat=True)
+
+        with CaptureQueriesContext(connection) as queries:
+            chunks = list(keyset_chunks(deals, 2))
+
+        self.assertEqual(chunks, [self.ids[:2], self.ids[2:4], self.ids[4:]])
+        self.assertEqual(len(queries), 4)
+        self.assertNotIn("OFFSET", queries[-1]["sql"])
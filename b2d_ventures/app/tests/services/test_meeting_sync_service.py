@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from b2d_ventures.app.models import Investor, Startup, Meeting
+from b2d_ventures.app.services import MeetingSyncService, AuthError, CalendarError
+from b2d_ventures.app.services.calendar_service import CalendarSlotUnavailableError
+
+
+@override_settings(
+    MEETING_SYNC_MAX_ATTEMPTS=3,
+    MEETING_SYNC_RETRY_BASE_SECONDS=30,
+    MEETING_SYNC_RETRY_MAX_SECONDS=3600,
+    MEETING_SYNC_LEASE_SECONDS=300,
+)
+@patch(
+    "b2d_ventures.app.services.meeting_sync_service.AuthService.refresh_access_token",
+    return_value="mock_access_token",
+)
+@patch(
+    "b2d_ventures.app.services.meeting_sync_service.CalendarService.schedule_investor_startup_meeting"
+)
+class MeetingSyncServiceTestCase(TestCase):
+    """Test case for the MeetingSyncService class."""
+
+    def setUp(self):
+        """Set up the test environment."""
+        self.investor = Investor.objects.create(
+            email="investor@example.com",
+            username="investor",
+            refresh_token="mock_refresh_token",
+        )
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Test Startup"
+        )
+        self.meeting = Meeting.objects.create(
+            investor=self.investor,
+            startup=self.startup,
+            start_time=datetime(2024, 1, 1, 10, tzinfo=dt_timezone.utc),
+            end_time=datetime(2024, 1, 1, 11, tzinfo=dt_timezone.utc),
+            status=Meeting.PENDING_SYNC,
+            next_sync_at=timezone.now(),
+        )
+
+    def test_confirms_meeting(self, mock_schedule, mock_refresh):
+        """Test that a successful sync stores the event and confirms."""
+        mock_schedule.return_value = {"id": self.meeting.id.hex}
+        results = MeetingSyncService.process_pending()
+
+        self.assertEqual(results[Meeting.CONFIRMED], 1)
+        self.meeting.refresh_from_db()
+        self.assertEqual(self.meeting.status, Meeting.CONFIRMED)
+        self.assertEqual(self.meeting.investor_event_id, self.meeting.id.hex)
+        self.assertEqual(self.meeting.sync_attempts, 1)
+        self.assertIsNone(self.meeting.next_sync_at)
+        self.assertEqual(
+            mock_schedule.call_args.kwargs["event_id"], self.meeting.id.hex
+        )
+
+    def test_retries_with_backoff(self, mock_schedule, mock_refresh):
+        """Test that a transient error schedules a retry."""
+        mock_schedule.side_effect = CalendarError("Backend error")
+        before = timezone.now()
+        results = MeetingSyncService.process_pending()
+
+        self.assertEqual(results[Meeting.PENDING_SYNC], 1)
+        self.meeting.refresh_from_db()
+        self.assertEqual(self.meeting.status, Meeting.PENDING_SYNC)
+        self.assertEqual(self.meeting.last_sync_error, "Backend error")
+        self.assertGreaterEqual(
+            self.meeting.next_sync_at, before + timedelta(seconds=30)
+        )
+
+        # Not due yet, so the next run leaves it alone.
+        self.assertEqual(sum(MeetingSyncService.process_pending().values()), 0)
+        self.assertEqual(mock_schedule.call_count, 1)
+
+    def test_fails_after_max_attempts(self, mock_schedule, mock_refresh):
+        """Test that a meeting is marked failed once retries are exhausted."""
+        mock_refresh.side_effect = AuthError("Token revoked")
+        for _ in range(3):
+            Meeting.objects.filter(id=self.meeting.id).update(
+                next_sync_at=timezone.now()
+            )
+            MeetingSyncService.process_pending()
+
+        self.meeting.refresh_from_db()
+        self.assertEqual(self.meeting.status, Meeting.FAILED)
+        self.assertEqual(self.meeting.sync_attempts, 3)
+        self.assertEqual(self.meeting.last_sync_error, "Token revoked")
+
+    def test_fails_when_slot_taken(self, mock_schedule, mock_refresh):
+        """Test that a calendar conflict fails the meeting without retrying."""
+        mock_schedule.side_effect = CalendarSlotUnavailableError("Slot taken")
+        MeetingSyncService.process_pending()
+
+        self.meeting.refresh_from_db()
+        self.assertEqual(self.meeting.status, Meeting.FAILED)
+        self.assertEqual(self.meeting.sync_attempts, 1)
+
+    def test_claim_skips_leased_meetings(self, mock_schedule, mock_refresh):
+        """Test that a claimed meeting is leased and not claimed twice."""
+        claimed = MeetingSyncService.claim_due_meetings(10)
+        self.assertEqual([meeting.id for meeting in claimed], [self.meeting.id])
+        self.assertEqual(MeetingSyncService.claim_due_meetings(10), [])
+
+    def test_retry_delay(self, mock_schedule, mock_refresh):
+        """Test the exponential backoff schedule."""
+        self.assertEqual(MeetingSyncService.retry_delay(1), timedelta(seconds=30))
+        self.assertEqual(MeetingSyncService.retry_delay(3), timedelta(seconds=120))
+        self.assertEqual(MeetingSyncService.retry_delay(20), timedelta(seconds=3600))
@@ -0,0 +1,103 @@
+import tempfile
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from b2d_ventures.app.models import Deal, Investor, Startup, User
+from b2d_ventures.utils.model_cache import model_cache
+
+SHARED_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": tempfile.mkdtemp(prefix="b2d-model-cache-"),
+    }
+}
+
+
+@override_settings(CACHES=SHARED_CACHES)
+class ModelCacheTestCase(TestCase):
+    """Test case for the versioned model cache."""
+
+    def setUp(self):
+        """Start every test with an empty cache and zeroed counters."""
+        cache.clear()
+        model_cache.reset_metrics()
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        self.deal = Deal.objects.create(name="Deal", startup=self.startup)
+
+    def test_read_through(self):
+        """Test that a second read is served without queries."""
+        model_cache.get(Deal, self.deal.id, related=("startup",))
+
+        with CaptureQueriesContext(connection) as queries:
+            deal = model_cache.get(Deal, self.deal.id, related=("startup",))
+
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(deal.name, "Deal")
+        self.assertEqual(deal.startup.name, "Startup")
+        metrics = model_cache.metrics()
+        self.assertEqual(metrics["app.deal"]["hits"], 1)
+        self.assertEqual(metrics["app.deal"]["misses"], 1)
+        self.assertEqual(metrics["app.deal"]["hit_rate"], 0.5)
+
+    def test_save_invalidates(self):
+        """Test that saving or deleting a row makes its entry stale."""
+        model_cache.get(Deal, self.deal.id)
+        self.deal.name = "Renamed"
+        self.deal.save()
+
+        self.assertEqual(model_cache.get(Deal, self.deal.id).name, "Renamed")
+        self.deal.delete()
+        with self.assertRaises(Deal.DoesNotExist):
+            model_cache.get(Deal, self.deal.id)
+
+    def test_user_save_invalidates_startup(self):
+        """Test that a save through the parent User row is picked up."""
+        model_cache.get(Startup, self.startup.id)
+        user = User.objects.get(id=self.startup.id)
+        user.username = "renamed"
+        user.save()
+
+        self.assertEqual(model_cache.get(Startup, self.startup.id).username, "renamed")
+
+    def test_related_startup_is_versioned(self):
+        """Test that a deal's cached startup follows the startup's version."""
+        model_cache.get(Deal, self.deal.id, related=("startup",))
+        self.startup.name = "Renamed"
+        self.startup.save()
+
+        deal = model_cache.get(Deal, self.deal.id, related=("startup",))
+
+        self.assertEqual(deal.startup.name, "Renamed")
+
+    def test_cache_unavailable(self):
+        """Test that reads fall back to the database if the cache fails."""
+        investor = Investor.objects.create(
+            email="investor@example.com", username="investor"
+        )
+        with patch.object(cache, "get", side_effect=ConnectionError("down")):
+            self.assertEqual(model_cache.get(Investor, investor.id), investor)
+
+        self.assertEqual(model_cache.metrics()["app.investor"]["errors"], 1)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_local_cache_is_bypassed(self):
+        """Test that rows are read from the database with a per-process cache."""
+        model_cache.get(Deal, self.deal.id)
+        Deal.objects.filter(id=self.deal.id).update(name="Renamed elsewhere")
+
+        with CaptureQueriesContext(connection) as queries:
+            deal = model_cache.get(Deal, self.deal.id, related=("startup",))
+
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(deal.name, "Renamed elsewhere")
+        self.assertEqual(deal.startup.name, "Startup")
+        metrics = model_cache.metrics()["app.deal"]
+        self.assertEqual((metrics["bypasses"], metrics["hits"]), (2, 0))
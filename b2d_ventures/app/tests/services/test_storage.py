@@ -0,0 +1,122 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from cloudinary_storage.storage import MediaCloudinaryStorage
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+
+from b2d_ventures.app.models import StoredBlob
+from b2d_ventures.utils.storage import (
+    ContentAddressedStorage,
+    DedupeMediaCloudinaryStorage,
+    media_storage,
+)
+
+
+class ContentAddressedStorageTestCase(TestCase):
+    """Test case for the content-addressed local storage."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.storage = ContentAddressedStorage(location=self.root)
+        self.data = b"pitch deck " * 1000
+        self.sha256 = hashlib.sha256(self.data).hexdigest()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_identical_uploads_share_one_blob(self):
+        """Test that the same content under two names is stored once."""
+        first = self.storage.save("deals/a/logo.png", ContentFile(self.data))
+        second = self.storage.save("deals/b/logo.png", ContentFile(self.data))
+
+        blob = self.storage.blob_path(self.sha256)
+        self.assertTrue(os.path.samefile(self.storage.path(first), blob))
+        self.assertTrue(os.path.samefile(self.storage.path(second), blob))
+        self.assertEqual(os.stat(blob).st_nlink, 3)
+        with self.storage.open(second) as file:
+            self.assertEqual(file.read(), self.data)
+
+        blob_row = StoredBlob.objects.get(backend="local", sha256=self.sha256)
+        self.assertEqual((blob_row.name, blob_row.size), (first, len(self.data)))
+        self.assertEqual(os.listdir(os.path.join(self.root, "tmp")), [])
+
+    def test_resave_same_content_adds_a_name(self):
+        """Test that every save is a separate reference to the content."""
+        name = self.storage.save("datarooms/s/room.pdf", ContentFile(self.data))
+        again = self.storage.save("datarooms/s/room.pdf", ContentFile(self.data))
+
+        self.assertNotEqual(again, name)
+        self.storage.delete(name)
+        with self.storage.open(again) as file:
+            self.assertEqual(file.read(), self.data)
+
+    def test_link_failure(self):
+        """Test that a failed hard link raises instead of leaving a copy."""
+        with patch("os.link", side_effect=OSError("Invalid cross-device link")):
+            with self.assertRaises(OSError):
+                self.storage.save("a.txt", ContentFile(self.data))
+
+        self.assertFalse(self.storage.exists("a.txt"))
+        self.assertFalse(os.path.exists(self.storage.blob_path(self.sha256)))
+        self.assertFalse(StoredBlob.objects.exists())
+
+    def test_delete_removes_unused_blob(self):
+        """Test that a blob is kept while linked and removed with its last name."""
+        first = self.storage.save("a.txt", ContentFile(self.data))
+        second = self.storage.save("b.txt", ContentFile(self.data))
+        blob = self.storage.blob_path(self.sha256)
+
+        self.storage.delete(first)
+        self.assertTrue(os.path.exists(blob))
+        self.assertTrue(StoredBlob.objects.filter(sha256=self.sha256).exists())
+
+        self.storage.delete(second)
+        self.assertFalse(os.path.exists(blob))
+        self.assertFalse(StoredBlob.objects.filter(sha256=self.sha256).exists())
+
+    @override_settings(MEDIA_STORAGE_BACKEND="local")
+    def test_media_storage_setting(self):
+        """Test that MEDIA_STORAGE_BACKEND selects the local storage."""
+        self.assertIsInstance(media_storage(), ContentAddressedStorage)
+
+
+class DedupeCloudinaryStorageTestCase(TestCase):
+    """Test case for skipping repeated Cloudinary uploads."""
+
+    @patch.object(MediaCloudinaryStorage, "_save", return_value="media/logo_x1")
+    def test_upload_skipped_for_known_content(self, upload):
+        """Test that known content returns the existing public ID."""
+        storage = DedupeMediaCloudinaryStorage()
+
+        first = storage._save("deals/a/logo.png", ContentFile(b"logo"))
+        second = storage._save("deals/b/logo.png", ContentFile(b"logo"))
+
+        self.assertEqual((first, second), ("media/logo_x1", "media/logo_x1"))
+        upload.assert_called_once()
+        self.assertEqual(
+            StoredBlob.objects.get(backend="cloudinary_media").sha256,
+            hashlib.sha256(b"logo").hexdigest(),
+        )
+
+    @patch.object(MediaCloudinaryStorage, "delete")
+    @patch.object(MediaCloudinaryStorage, "_save", return_value="media/logo_x1")
+    def test_file_deleted_with_last_reference(self, upload, delete):
+        """Test that a shared file is deleted once no saved name refers to it."""
+        storage = DedupeMediaCloudinaryStorage()
+        for deal in ("a", "b"):
+            storage._save(f"deals/{deal}/logo.png", ContentFile(b"logo"))
+
+        storage.delete("media/logo_x1")
+        delete.assert_not_called()
+        self.assertEqual(StoredBlob.objects.get().references, 1)
+
+        storage.delete("media/logo_x1")
+        delete.assert_called_once_with("media/logo_x1")
+        self.assertFalse(StoredBlob.objects.exists())
+
+        storage.delete("media/other")
+        delete.assert_called_with("media/other")
@@ -0,0 +1,47 @@
+import time
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from b2d_ventures.app.models import Deal, Investment, Investor, Startup
+from b2d_ventures.app.models.abstract_model import uuid7
+
+
+class UUID7TestCase(TestCase):
+    """Test case for time-ordered UUIDv7 ids."""
+
+    def test_layout(self):
+        """Test the version, variant and timestamp bits."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, "specified in RFC 4122")
+        self.assertGreaterEqual(value.int >> 80, before)
+
+    def test_monotonic(self):
+        """Test that ids increase within a millisecond and across clock steps."""
+        with patch("time.time_ns", return_value=1_700_000_000_000_000_000):
+            same_ms = [uuid7() for _ in range(5000)]
+        with patch("time.time_ns", return_value=1_600_000_000_000_000_000):
+            after_step_back = uuid7()
+
+        self.assertEqual(same_ms, sorted(same_ms))
+        self.assertEqual(len(set(same_ms)), len(same_ms))
+        self.assertGreater(after_step_back, same_ms[-1])
+
+    def test_opt_in(self):
+        """Test that only time-ordered models get UUIDv7 ids."""
+        startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        investor = Investor.objects.create(
+            email="investor@example.com", username="investor"
+        )
+        deal = Deal.objects.create(name="Deal", startup=startup)
+        investment = Investment.objects.create(
+            deal=deal, investor=investor, investment_amount=5000
+        )
+
+        self.assertEqual(deal.id.version, 4)
+        self.assertEqual(investment.id.version, 7)
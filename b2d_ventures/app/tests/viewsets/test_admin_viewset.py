@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -14,6 +15,7 @@ from b2d_ventures.app.models import (
     Startup,
     Investor,
 )
+from b2d_ventures.app.services import ArchiveService, StartupService
 
 User = get_user_model()
 
@@ -176,6 +178,188 @@ class AdminViewSetTest(APITestCase):
         self.assertTrue(isinstance(response.data.get("data"), list))
         self.assertEqual(len(response.data.get("data")), Meeting.objects.count())
 
+    @patch(
+        "b2d_ventures.app.services.admin_service.CalendarService.batch_schedule_investor_startup_meetings"
+    )
+    @patch(
+        "b2d_ventures.app.services.admin_service.AuthService.refresh_access_token",
+        return_value="mock_access_token",
+    )
+    def test_bulk_schedule_meetings(self, mock_refresh, mock_batch):
+        """Test bulk scheduling meetings with one invalid item."""
+        self.investor_user.refresh_token = "mock_refresh_token"
+        self.investor_user.save()
+        mock_batch.side_effect = lambda token, meetings: [
+            {"id": meeting["event_id"]} for meeting in meetings
+        ]
+        start = timezone.now() + timezone.timedelta(days=7)
+        meeting = {
+            "investor_id": str(self.investor_user.pk),
+            "startup_id": str(self.startup_user.pk),
+            "start_time": start.isoformat(),
+            "end_time": (start + timezone.timedelta(hours=1)).isoformat(),
+        }
+        data = {
+            "data": {
+                "attributes": {"meetings": [meeting, dict(meeting, end_time="bad")]}
+            }
+        }
+        url = "/api/admin/meetings/bulk-schedule/"
+        response = self.client.post(url, data, format="vnd.api+json")
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        attributes = response.data["attributes"]
+        self.assertEqual(attributes["created"], 1)
+        self.assertEqual(attributes["failed"], 1)
+        self.assertEqual(
+            attributes["results"][0]["meeting"]["investor_event_id"],
+            attributes["results"][0]["meeting"]["id"].replace("-", ""),
+        )
+        self.assertEqual(Meeting.objects.count(), 2)
+
+    def test_allocate_meetings_dry_run(self):
+        """Test allocating demo-day meetings without storing them."""
+        data = {
+            "data": {
+                "attributes": {
+                    "start_time": "2024-01-01T09:00:00Z",
+                    "slot_minutes": 20,
+                    "slot_count": 3,
+                    "preferences": [
+                        {
+                            "investor_id": str(self.investor_user.pk),
+                            "startup_ids": [str(self.startup_user.pk)],
+                        }
+                    ],
+                }
+            }
+        }
+        url = "/api/admin/meetings/allocate/"
+        response = self.client.post(url, data, format="vnd.api+json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        attributes = response.data["attributes"]
+        self.assertFalse(attributes["committed"])
+        self.assertEqual(attributes["metrics"]["meetings"], 1)
+        self.assertEqual(len(attributes["meetings"]), 1)
+        self.assertEqual(Meeting.objects.count(), 1)
+
+    def _allocation(self, commit):
+        return {
+            "data": {
+                "attributes": {
+                    "start_time": "2024-01-01T09:00:00Z",
+                    "slot_count": 3,
+                    "preferences": [
+                        {
+                            "investor_id": str(self.investor_user.pk),
+                            "startup_ids": [str(self.startup_user.pk)],
+                        }
+                    ],
+                    "commit": commit,
+                }
+            }
+        }
+
+    def test_allocate_meetings_commit_false_string(self):
+        """Test that a "false" commit flag does not store the meetings."""
+        url = "/api/admin/meetings/allocate/"
+        response = self.client.post(
+            url, self._allocation("false"), format="vnd.api+json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data["attributes"]["committed"])
+        self.assertEqual(Meeting.objects.count(), 1)
+
+    def test_allocate_meetings_commit_conflict(self):
+        """Test that a commit losing the overlap race answers 409."""
+        url = "/api/admin/meetings/allocate/"
+        with patch.object(Meeting.objects, "bulk_create", side_effect=IntegrityError):
+            response = self.client.post(
+                url, self._allocation(True), format="vnd.api+json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+    def test_allocate_meetings_invalid(self):
+        """Test allocating demo-day meetings with a missing slot grid."""
+        data = {"data": {"attributes": {"preferences": []}}}
+        url = "/api/admin/meetings/allocate/"
+        response = self.client.post(url, data, format="vnd.api+json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_email_metrics(self):
+        """Test retrieving the email sender metrics."""
+        url = "/api/admin/email/metrics/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for counter in ("queued", "sent", "failed", "retried", "sent_last_minute"):
+            self.assertIn(counter, response.data["attributes"])
+
+    def test_cache_metrics(self):
+        """Test retrieving the model cache metrics with the local test cache."""
+        StartupService.get_profile(self.startup_user.id)
+        StartupService.get_profile(self.startup_user.id)
+        url = "/api/admin/cache/metrics/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        counters = response.data["attributes"]["app.startup"]
+        self.assertGreaterEqual(counters["bypasses"], 2)
+        self.assertIn("deal_payload", response.data["attributes"])
+
+    def test_db_pool_metrics(self):
+        """Test retrieving the database pool metrics without pooling."""
+        url = "/api/admin/db/pool/metrics/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["type"], "db_pool_metrics")
+        self.assertEqual(response.data["attributes"], {})
+
+    def _archive_deal_and_meeting(self):
+        long_ago = timezone.now() - timezone.timedelta(days=800)
+        Deal.objects.filter(id=self.deal.id).update(status="closed", end_date=long_ago)
+        Meeting.objects.filter(id=self.meeting.id).update(
+            start_time=long_ago, end_time=long_ago
+        )
+        ArchiveService.archive()
+
+    def test_list_archived_deals(self):
+        """Test listing archived deals."""
+        self._archive_deal_and_meeting()
+        url = f"/api/admin/archive/deals/?startup_id={self.startup_user.id}"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["attributes"]["id"], str(self.deal.id))
+        self.assertEqual(response.data[0]["attributes"]["status"], "closed")
+
+    def test_list_archived_deals_invalid_limit(self):
+        """Test listing archived deals with an invalid limit."""
+        url = "/api/admin/archive/deals/?limit=0"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_archived_deal(self):
+        """Test retrieving an archived deal with its investments."""
+        self._archive_deal_and_meeting()
+        url = f"/api/admin/archive/deals/{self.deal.id}/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        investments = response.data["attributes"]["investments"]
+        self.assertEqual([i["id"] for i in investments], [str(self.investment.id)])
+
+    def test_get_archived_deal_not_found(self):
+        """Test retrieving a deal that is not archived."""
+        url = f"/api/admin/archive/deals/{self.deal.id}/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_archived_meetings(self):
+        """Test listing archived meetings of an investor."""
+        self._archive_deal_and_meeting()
+        url = f"/api/admin/archive/meetings/?investor_id={self.investor_user.id}"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["data"]), 1)
+        self.assertEqual(response.data["data"][0]["type"], "archived_meeting")
+
     def test_dashboard(self):
         """Test retrieving the admin dashboard."""
         url = "/api/admin/dashboard/"
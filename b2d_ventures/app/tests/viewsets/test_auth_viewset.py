@@ -61,6 +61,43 @@ class AuthViewSetTest(APITestCase):
         self.assertTrue(response.data["is_new_user"])
         self.assertEqual(Investor.objects.count(), 1)
 
+    @patch("b2d_ventures.app.services.AuthService.extract_authorization_code")
+    @patch("b2d_ventures.app.services.AuthService.exchange_code_for_token")
+    @patch("b2d_ventures.app.services.AuthService.verify_id_token")
+    @patch("b2d_ventures.app.services.AuthService.get_user_profile")
+    def test_create_new_user_from_id_token(
+        self, mock_get_profile, mock_verify, mock_exchange_token, mock_extract_code
+    ):
+        """Test that a verified ID token replaces the userinfo request."""
+        mock_extract_code.return_value = "test_code"
+        mock_exchange_token.return_value = {
+            "access_token": "test_token",
+            "refresh_token": "test_refresh",
+            "id_token": "signed.id.token",
+        }
+        mock_verify.return_value = {
+            "sub": "1234567890",
+            "email": "test@example.com",
+            "email_verified": True,
+            "name": "Test User",
+        }
+
+        url = "/api/auths/"
+        data = {
+            "data": {
+                "attributes": {
+                    "full_url": "http://example.com?code=test_code",
+                    "role": "investor",
+                }
+            }
+        }
+        response = self.client.post(url, data, format="vnd.api+json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Investor.objects.get().username, "Test User")
+        mock_verify.assert_called_once_with("signed.id.token")
+        mock_get_profile.assert_not_called()
+
     def test_create_user_missing_url(self):
         """Test creating a user with missing URL."""
         url = "/api/auths/"
@@ -0,0 +1,145 @@
+import hashlib
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.core.files.storage import FileSystemStorage
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from b2d_ventures.app.models import DataroomUpload, Deal, Startup
+from b2d_ventures.app.services.dataroom_upload_service import _hash_states
+
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 40 + b"%%EOF"
+CHUNK = 4096
+
+
+@override_settings(DATAROOM_UPLOAD_CHUNK_MAX_BYTES=CHUNK)
+class DataroomUploadViewSetTest(APITestCase):
+    """Test suite for chunked, resumable dataroom uploads."""
+
+    def setUp(self):
+        """Stage and store uploads in temporary directories."""
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        settings_patch = override_settings(
+            DATAROOM_UPLOAD_STAGING_DIR=f"{self.media_root}/staging"
+        )
+        settings_patch.enable()
+        self.addCleanup(settings_patch.disable)
+        storage_patch = patch.object(
+            Deal._meta.get_field("dataroom"),
+            "storage",
+            FileSystemStorage(location=f"{self.media_root}/media"),
+        )
+        storage_patch.start()
+        self.addCleanup(storage_patch.stop)
+
+        self.startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        self.deal = Deal.objects.create(name="Deal", startup=self.startup)
+        self.client.force_authenticate(user=self.startup)
+        self.url = f"/api/startup/{self.startup.id}/dataroom-uploads/"
+
+    def start(self, size=len(PDF), filename="deck.pdf"):
+        data = {
+            "data": {
+                "attributes": {
+                    "deal_id": str(self.deal.id),
+                    "filename": filename,
+                    "size": size,
+                }
+            }
+        }
+        return self.client.post(self.url, data, format="vnd.api+json")
+
+    def put_chunk(self, upload_id, offset, data):
+        return self.client.put(
+            f"{self.url}{upload_id}/",
+            data,
+            content_type="application/octet-stream",
+            HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def test_chunked_upload(self):
+        """Test uploading in chunks and finalizing into the deal's dataroom."""
+        response = self.start()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        upload_id = response.data["id"]
+
+        for offset in range(0, len(PDF), CHUNK):
+            response = self.put_chunk(upload_id, offset, PDF[offset : offset + CHUNK])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Upload-Offset"], str(len(PDF)))
+
+        response = self.client.post(f"{self.url}{upload_id}/finalize/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["attributes"]["sha256"], hashlib.sha256(PDF).hexdigest()
+        )
+        self.deal.refresh_from_db()
+        self.assertEqual(self.deal.dataroom.name, "datarooms/Startup/deck.pdf")
+        with self.deal.dataroom.open("rb") as file:
+            self.assertEqual(file.read(), PDF)
+        self.assertEqual(DataroomUpload.objects.get().status, "complete")
+
+    def test_resume_after_interrupted_chunk(self):
+        """Test resuming from the reported offset with a rebuilt hash state."""
+        upload_id = self.start().data["id"]
+        self.put_chunk(upload_id, 0, PDF[:CHUNK])
+
+        response = self.put_chunk(upload_id, 0, PDF[:CHUNK])
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response["Upload-Offset"], str(CHUNK))
+
+        # Another worker without the cached hash state takes over.
+        _hash_states.clear()
+        offset = int(self.client.get(f"{self.url}{upload_id}/")["Upload-Offset"])
+        for start in range(offset, len(PDF), CHUNK):
+            self.put_chunk(upload_id, start, PDF[start : start + CHUNK])
+        response = self.client.post(f"{self.url}{upload_id}/finalize/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["attributes"]["sha256"], hashlib.sha256(PDF).hexdigest()
+        )
+
+    def test_chunk_size_limit(self):
+        """Test that oversized chunks are rejected before being read."""
+        upload_id = self.start().data["id"]
+
+        response = self.put_chunk(upload_id, 0, PDF[: CHUNK + 1])
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual(DataroomUpload.objects.get().offset, 0)
+
+    def test_finalize_incomplete_or_invalid(self):
+        """Test that incomplete and non-PDF uploads are not finalized."""
+        upload_id = self.start().data["id"]
+        self.put_chunk(upload_id, 0, PDF[:CHUNK])
+        response = self.client.post(f"{self.url}{upload_id}/finalize/")
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        upload_id = self.start(size=4).data["id"]
+        self.put_chunk(upload_id, 0, b"MZ\x90\x00")
+        response = self.client.post(f"{self.url}{upload_id}/finalize/")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Deal.objects.get(id=self.deal.id).dataroom)
+
+    def test_start_rejects_non_pdf(self):
+        """Test that only PDF datarooms can be uploaded."""
+        response = self.start(filename="deck.exe")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_abort(self):
+        """Test that cancelling deletes the upload."""
+        upload_id = self.start().data["id"]
+
+        response = self.client.delete(f"{self.url}{upload_id}/")
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(DataroomUpload.objects.exists())
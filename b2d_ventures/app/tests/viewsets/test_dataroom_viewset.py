@@ -0,0 +1,106 @@
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from b2d_ventures.app.models import DataroomAccessLog, Deal, Investor, Startup
+from b2d_ventures.app.services import DataroomService
+
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 4 + b"%%EOF"
+
+
+@override_settings(DATAROOM_ACCESS_LOG_ASYNC=False)
+class DataroomViewSetTest(APITestCase):
+    """Test suite for downloading datarooms through signed links."""
+
+    def setUp(self):
+        """Store a dataroom in local storage and sign a link to it."""
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        field = Deal._meta.get_field("dataroom")
+        storage_patch = patch.object(
+            field, "storage", FileSystemStorage(location=self.media_root)
+        )
+        storage_patch.start()
+        self.addCleanup(storage_patch.stop)
+
+        self.investor = Investor.objects.create(
+            email="investor@example.com", username="investor"
+        )
+        startup = Startup.objects.create(
+            email="startup@example.com", username="startup", name="Startup"
+        )
+        self.deal = Deal.objects.create(name="Deal", startup=startup)
+        self.deal.dataroom.name = field.storage.save(
+            "datarooms/deck.pdf", ContentFile(PDF)
+        )
+        token, _ = DataroomService.sign_download(self.investor, self.deal)
+        self.url = DataroomService.download_path(token)
+
+    def test_download(self):
+        """Test downloading the whole file without authentication."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(response.streaming_content), PDF)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response["Content-Length"], str(len(PDF)))
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn('filename="deck.pdf"', response["Content-Disposition"])
+        log = DataroomAccessLog.objects.get()
+        self.assertEqual(log.investor_id, self.investor.id)
+        self.assertEqual(log.status_code, 200)
+        self.assertIsNone(log.range_start)
+
+    def test_download_range(self):
+        """Test resuming a download with a Range request."""
+        response = self.client.get(self.url, HTTP_RANGE="bytes=100-")
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(response.streaming_content), PDF[100:])
+        self.assertEqual(
+            response["Content-Range"], f"bytes 100-{len(PDF) - 1}/{len(PDF)}"
+        )
+        log = DataroomAccessLog.objects.get()
+        self.assertEqual((log.range_start, log.range_end), (100, len(PDF) - 1))
+
+    def test_download_if_range(self):
+        """Test that a stale If-Range validator returns the whole file."""
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(response.streaming_content), PDF[:10])
+
+        response = self.client.get(
+            self.url, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"stale"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_download_range_not_satisfiable(self):
+        """Test a Range request past the end of the file."""
+        response = self.client.get(self.url, HTTP_RANGE=f"bytes={len(PDF)}-")
+
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+        self.assertEqual(response["Content-Range"], f"bytes */{len(PDF)}")
+
+    def test_download_queries(self):
+        """Test that serving a download only writes the access log."""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_RANGE="bytes=0-99")
+            b"".join(response.streaming_content)
+
+    def test_download_invalid_link(self):
+        """Test that a tampered link is rejected."""
+        response = self.client.get(self.url.rstrip("/") + "x/")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(DataroomAccessLog.objects.exists())
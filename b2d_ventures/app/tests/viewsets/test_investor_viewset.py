@@ -165,6 +165,22 @@ class InvestorViewSetTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_get_deal(self):
+        """Test getting an approved deal, and not a pending one."""
+        deal = Deal.objects.create(
+            name="Approved Deal", startup=self.startup, status="approved"
+        )
+        pending = Deal.objects.create(name="Pending Deal", startup=self.startup)
+        url = f"/api/investor/{self.investor.id}/deals/"
+
+        response = self.client.get(f"{url}{deal.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["attributes"]["name"], "Approved Deal")
+        self.assertIn("ETag", response)
+
+        response = self.client.get(f"{url}{pending.id}/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     # @patch("b2d_ventures.utils.email_service.EmailService.send_email_with_attachment")
     # def test_request_dataroom(self, mock_email):
     #     """Test requesting access to a deal's dataroom."""
@@ -238,6 +254,34 @@ class InvestorViewSetTest(APITestCase):
     #
     #     self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    @patch("b2d_ventures.app.services.AuthService.refresh_access_token")
+    @patch("b2d_ventures.app.services.CalendarService.get_free_busy")
+    def test_suggest_slots(self, mock_free_busy, mock_refresh):
+        """Test suggesting meeting slots shared with a startup."""
+        mock_refresh.return_value = "mock_access_token"
+        mock_free_busy.return_value = {"calendars": {"primary": {"busy": []}}}
+
+        url = f"/api/investor/{self.investor.id}/suggest-slots/{self.startup.id}/"
+        response = self.client.get(
+            url,
+            {
+                "start_time": "2024-01-01T09:00:00",
+                "end_time": "2024-01-01T12:00:00",
+                "duration": 60,
+                "limit": 3,
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+
+    def test_suggest_slots_missing_range(self):
+        """Test suggesting meeting slots without a search range."""
+        url = f"/api/investor/{self.investor.id}/suggest-slots/{self.startup.id}/"
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_meetings(self):
         """Test getting all meetings that belong to the investor."""
 
@@ -265,6 +309,36 @@ class InvestorViewSetTest(APITestCase):
         self.assertIsInstance(response.data, list)
         self.assertEqual(len(response.data), 2)
 
+    def test_meetings_not_modified(self):
+        """Test conditional GETs of the investor's meetings."""
+        meeting = Meeting.objects.create(
+            investor=self.investor,
+            startup=self.startup,
+            title="First Meeting",
+            start_time=timezone.now(),
+            end_time=timezone.now() + timezone.timedelta(hours=1),
+        )
+        url = f"/api/investor/{self.investor.id}/meetings/"
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        meeting.title = "Moved Meeting"
+        meeting.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["attributes"]["title"], "Moved Meeting")
+
+    def test_get_profile_not_modified(self):
+        """Test that a matching If-None-Match on the profile returns 304."""
+        url = f"/api/investor/{self.investor.id}/profile/"
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
     def test_dashboard(self):
         """Test getting the investor's dashboard."""
         deal = Deal.objects.create(
@@ -93,6 +93,49 @@ class StartupViewSetTest(APITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["attributes"]["name"], "Test Deal")
 
+    def test_list_deals_not_modified(self):
+        """
+        Test that a matching If-None-Match on the deal list returns 304.
+        """
+        deal = Deal.objects.create(startup=self.startup, name="Test Deal")
+        url = f"/api/startup/{self.startup.id}/deals/"
+        etag = self.client.get(url)["ETag"]
+
+        with patch("b2d_ventures.app.services.StartupService.list_deals") as mock:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        mock.assert_not_called()
+
+        deal.delete()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data, [])
+
+    def test_get_deal_details_conditional(self):
+        """
+        Test the validators of a deal and of the startup it includes.
+        """
+        deal = Deal.objects.create(startup=self.startup, name="Test Deal")
+        url = f"/api/startup/{self.startup.id}/deals/{deal.id}/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["attributes"]["name"], "Test Deal")
+        etag = response["ETag"]
+
+        response = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.startup.name = "Renamed Startup"
+        self.startup.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["attributes"]["startup"]["name"], "Renamed Startup"
+        )
+
     def test_create_deal(self):
         """
         Test creating a new deal for the startup using form-data.
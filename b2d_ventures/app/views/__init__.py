@@ -6,3 +6,4 @@ from b2d_ventures.app.views.investor_viewset import (
     DataroomRequestThrottle,
     ScheduleMeetingThrottle,
 )
+from b2d_ventures.app.views.dataroom_viewset import DataroomViewSet
@@ -10,10 +10,24 @@ from b2d_ventures.app.serializers import (
     DealSerializer,
     InvestmentSerializer,
     MeetingSerializer,
+    ArchivedDealSerializer,
+    ArchivedDealDetailSerializer,
+    ArchivedMeetingSerializer,
 )
-from b2d_ventures.app.services import AdminService, AdminError
-from b2d_ventures.utils import JSONParser, VndJsonParser
+from b2d_ventures.app.services import (
+    AdminService,
+    AdminError,
+    AllocationService,
+    AllocationError,
+    AllocationConflictError,
+    DealCacheService,
+    ArchiveService,
+    ArchiveError,
+)
+from b2d_ventures.utils import JSONParser, VndJsonParser, EmailSenderPool
+from b2d_ventures.utils.db_pool import pool_metrics
 from b2d_ventures.utils.logger import CustomLogger
+from b2d_ventures.utils.model_cache import model_cache
 
 logger = CustomLogger().logger
 
@@ -234,6 +248,240 @@ class AdminViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @action(detail=False, methods=["post"], url_path="meetings/bulk-schedule")
+    def bulk_schedule_meetings(self, request):
+        """Schedule many investor-startup meetings at once."""
+        logger.info("Bulk scheduling meetings")
+        try:
+            attributes = request.data.get("data", {}).get("attributes", {})
+            service = AdminService()
+            results = service.bulk_schedule_meetings(attributes.get("meetings"))
+
+            created = 0
+            for result in results:
+                if result["status"] == "created":
+                    result["meeting"] = MeetingSerializer(result.pop("meeting")).data
+                    created += 1
+            response_data = {
+                "type": "meeting_bulk_schedule",
+                "attributes": {
+                    "created": created,
+                    "failed": len(results) - created,
+                    "results": results,
+                },
+            }
+            response_status = (
+                status.HTTP_201_CREATED
+                if created == len(results)
+                else status.HTTP_207_MULTI_STATUS
+            )
+            return Response(response_data, status=response_status)
+        except AdminError as e:
+            logger.error(f"Admin error: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {"errors": [{"detail": "Internal Server Error"}]},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=["post"], url_path="meetings/allocate")
+    def allocate_meetings(self, request):
+        """
+        Allocate demo-day meetings from investor preferences.
+
+        Returns the proposed schedule and its quality metrics; the meetings
+        are only stored when ``commit`` is true.
+        """
+        logger.info("Allocating demo-day meetings")
+        try:
+            attributes = request.data.get("data", {}).get("attributes", {})
+            commit = attributes.get("commit", False) in (True, "true")
+            result = AllocationService.allocate_demo_day(attributes, commit=commit)
+            meetings = [
+                {
+                    "investor_id": str(meeting.investor_id),
+                    "startup_id": str(meeting.startup_id),
+                    "start_time": meeting.start_time,
+                    "end_time": meeting.end_time,
+                }
+                for meeting in result["meetings"]
+            ]
+            response_data = {
+                "type": "meeting_allocation",
+                "attributes": {
+                    "committed": commit,
+                    "metrics": result["metrics"],
+                    "meetings": meetings,
+                },
+            }
+            response_status = status.HTTP_201_CREATED if commit else status.HTTP_200_OK
+            return Response(response_data, status=response_status)
+        except AllocationConflictError as e:
+            logger.warning(f"Allocation conflict: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_409_CONFLICT
+            )
+        except AllocationError as e:
+            logger.error(f"Allocation error: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {"errors": [{"detail": "Internal Server Error"}]},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=["get"], url_path="email/metrics")
+    def email_metrics(self, request):
+        """Get throughput and failure counters of the email sender pool."""
+        logger.info("Fetching email sender metrics")
+        try:
+            response_data = {
+                "type": "email_metrics",
+                "attributes": EmailSenderPool.instance().metrics(),
+            }
+            return Response(response_data, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {"errors": [{"detail": "Internal Server Error"}]},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=["get"], url_path="cache/metrics")
+    def cache_metrics(self, request):
+        """Get hit and miss counters of the model and deal caches in this worker."""
+        logger.info("Fetching model cache metrics")
+        try:
+            response_data = {
+                "type": "cache_metrics",
+                "attributes": {
+                    **model_cache.metrics(),
+                    "deal_payload": DealCacheService.metrics(),
+                },
+            }
+            return Response(response_data, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {"errors": [{"detail": "Internal Server Error"}]},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=["get"], url_path="db/pool/metrics")
+    def db_pool_metrics(self, request):
+        """Get the database connection pool usage of this worker."""
+        logger.info("Fetching database pool metrics")
+        try:
+            response_data = {
+                "type": "db_pool_metrics",
+                "attributes": pool_metrics(),
+            }
+            return Response(response_data, status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {"errors": [{"detail": "Internal Server Error"}]},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=["get"], url_path="archive/deals")
+    def list_archived_deals(self, request):
+        """List archived deals, optionally of one startup, with limit and offset."""
+        logger.info("Listing archived deals")
+        try:
+            deals = ArchiveService.list_deals(
+                startup_id=request.query_params.get("startup_id"),
+                limit=request.query_params.get("limit", 100),
+                offset=request.query_params.get("offset", 0),
+            )
+            serializer = ArchivedDealSerializer(deals, many=True)
+            response_data = [{"attributes": deal_data} for deal_data in serializer.data]
+            return Response(response_data, status=status.HTTP_200_OK)
+        except ArchiveError as e:
+            logger.error(f"Archive error: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {"errors": [{"detail": "Internal Server Error"}]},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="archive/deals/(?P<deal_id>[0-9a-f-]{36})",
+    )
+    def get_archived_deal(self, request, deal_id=None):
+        """Get an archived deal with its investments."""
+        logger.info(f"Fetching archived deal with ID: {deal_id}")
+        try:
+            deal = ArchiveService.get_deal(deal_id)
+            serializer = ArchivedDealDetailSerializer(deal)
+            response_data = {"attributes": serializer.data}
+            return Response(response_data, status=status.HTTP_200_OK)
+        except ObjectDoesNotExist:
+            logger.error(f"Archived deal with ID: {deal_id} not found")
+            return Response(
+                {"errors": [{"detail": "Archived deal not found"}]},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        except ArchiveError as e:
+            logger.error(f"Archive error: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {"errors": [{"detail": "Internal Server Error"}]},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=["get"], url_path="archive/meetings")
+    def list_archived_meetings(self, request):
+        """List archived meetings, optionally of one investor or startup."""
+        logger.info("Listing archived meetings")
+        try:
+            meetings = ArchiveService.list_meetings(
+                investor_id=request.query_params.get("investor_id"),
+                startup_id=request.query_params.get("startup_id"),
+                limit=request.query_params.get("limit", 100),
+                offset=request.query_params.get("offset", 0),
+            )
+            serializer = ArchivedMeetingSerializer(meetings, many=True)
+            response_data = {
+                "data": [
+                    {
+                        "type": "archived_meeting",
+                        "id": meeting["id"],
+                        "attributes": meeting,
+                    }
+                    for meeting in serializer.data
+                ]
+            }
+            return Response(response_data, status=status.HTTP_200_OK)
+        except ArchiveError as e:
+            logger.error(f"Archive error: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {"errors": [{"detail": "Internal Server Error"}]},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
     @action(detail=False, methods=["get"], url_path="dashboard")
     def dashboard(self, request):
         """
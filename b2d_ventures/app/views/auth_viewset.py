@@ -60,7 +60,7 @@ class AuthViewSet(viewsets.ViewSet):
                 raise AuthError("Authorization code not found in URL")
             tokens = self.auth_service.exchange_code_for_token(authorization_code)
             refresh_token = tokens.get("refresh_token", "")
-            user_profile = self.auth_service.get_user_profile(tokens["access_token"])
+            user_profile = self.auth_service.get_user_profile_from_tokens(tokens)
             user_email = user_profile.get("email")
             user, created, actual_role = self._create_or_update_user(
                 role, user_email, user_profile, refresh_token, not_update=True
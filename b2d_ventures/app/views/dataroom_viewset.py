@@ -0,0 +1,52 @@
+from rest_framework import status, viewsets
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from b2d_ventures.app.services import DataroomService, DataroomError
+from b2d_ventures.utils.logger import CustomLogger
+
+logger = CustomLogger().logger
+
+
+class DataroomViewSet(viewsets.ViewSet):
+    """
+    ViewSet for downloading datarooms through signed links.
+
+    The signed token in the URL is the credential, so the links emailed
+    by request-dataroom work without a JWT.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    lookup_value_regex = "[^/]+"
+
+    def retrieve(self, request, pk=None):
+        """Download the dataroom file of a signed link."""
+        try:
+            link = DataroomService.verify_token(pk)
+            logger.info(
+                f"Dataroom download for investor ID: {link.investor_id}, "
+                f"deal ID: {link.deal_id}"
+            )
+            return DataroomService.download(link, request)
+        except DataroomError as e:
+            logger.warning(f"Dataroom download rejected: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_403_FORBIDDEN
+            )
+        except FileNotFoundError as e:
+            logger.error(f"Dataroom file not found: {e}")
+            return Response(
+                {"errors": [{"detail": "Dataroom file not found"}]},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {
+                    "errors": [
+                        {"detail": "Internal Server Error", "meta": {"message": str(e)}}
+                    ]
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
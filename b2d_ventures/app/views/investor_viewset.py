@@ -7,6 +7,7 @@ from rest_framework.exceptions import Throttled
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.throttling import UserRateThrottle
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
@@ -18,6 +19,7 @@ from b2d_ventures.app.serializers import (
 )
 from b2d_ventures.app.services import InvestorService, InvestorError
 from b2d_ventures.utils import JSONParser, VndJsonParser, IsInvestor
+from b2d_ventures.utils.conditional import Validators, conditional_get
 from b2d_ventures.utils.logger import CustomLogger
 
 logger = CustomLogger().logger
@@ -47,7 +49,14 @@ class InvestorViewSet(viewsets.ModelViewSet):
         """Get investor's profile."""
         logger.info(f"Fetching profile for investor ID: {pk}")
         try:
-            return InvestorService.get_profile(pk)
+            return conditional_get(
+                self,
+                "get_profile",
+                lambda: Validators.for_object(
+                    Investor.objects.filter(pk=pk), "updated_at"
+                ),
+                lambda: InvestorService.get_profile(pk),
+            )
         except ObjectDoesNotExist as e:
             logger.error(f"Profile not found for investor ID: {pk} - {e}")
             return Response(
@@ -139,7 +148,7 @@ class InvestorViewSet(viewsets.ModelViewSet):
             f"Requesting dataroom access for investor ID: {pk}, deal ID: {deal_id}"
         )
         try:
-            return InvestorService.request_dataroom(pk, deal_id)
+            return InvestorService.request_dataroom(pk, deal_id, request)
         except Throttled as e:
             logger.warning(f"Dataroom request throttled for investor ID: {pk} - {e}")
             return Response(
@@ -175,6 +184,110 @@ class InvestorViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @action(detail=True, methods=["get"], url_path="deals/search")
+    def search_deals(self, request, pk=None):
+        """Search approved deals, including the text of their datarooms."""
+        term = request.query_params.get(api_settings.SEARCH_PARAM, "")
+        logger.info(f"Searching deals for investor ID: {pk}")
+        try:
+            return InvestorService.search_deals(pk, term)
+        except ObjectDoesNotExist as e:
+            logger.error(f"Investor not found for ID: {pk} - {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        except InvestorError as e:
+            logger.error(f"Investor error: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {
+                    "errors": [
+                        {"detail": "Internal Server Error", "meta": {"message": str(e)}}
+                    ]
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="deals/(?P<deal_id>[0-9a-f-]{36})",
+    )
+    def get_deal(self, request, pk=None, deal_id=None):
+        """Get details of an approved deal."""
+        logger.info(f"Fetching deal ID: {deal_id} for investor ID: {pk}")
+        try:
+            return conditional_get(
+                self,
+                "get_deal",
+                lambda: Validators.for_object(
+                    Deal.objects.filter(pk=deal_id, status="approved"),
+                    "updated_at",
+                    "startup__updated_at",
+                ),
+                lambda: InvestorService.get_deal(pk, deal_id),
+            )
+        except ObjectDoesNotExist as e:
+            logger.error(f"Deal not found for ID: {deal_id} - {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        except InvestorError as e:
+            logger.error(f"Investor error: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {
+                    "errors": [
+                        {"detail": "Internal Server Error", "meta": {"message": str(e)}}
+                    ]
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="deals/(?P<deal_id>[^/.]+)/dataroom-preview",
+    )
+    def dataroom_preview(self, request, pk=None, deal_id=None):
+        """Preview a deal's dataroom before requesting it."""
+        logger.info(
+            f"Fetching dataroom preview for investor ID: {pk}, deal ID: {deal_id}"
+        )
+        try:
+            return InvestorService.get_dataroom_preview(pk, deal_id)
+        except ObjectDoesNotExist as e:
+            logger.error(f"Deal not found for ID: {deal_id} - {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        except InvestorError as e:
+            logger.error(f"Investor error: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {
+                    "errors": [
+                        {"detail": "Internal Server Error", "meta": {"message": str(e)}}
+                    ]
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
     @action(
         detail=True,
         methods=["post"],
@@ -224,19 +337,59 @@ class InvestorViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="suggest-slots/(?P<startup_id>[^/.]+)",
+    )
+    def suggest_slots(self, request, pk=None, startup_id=None):
+        """Suggest meeting slots that are free for the investor and a startup."""
+        logger.info(
+            f"Suggesting meeting slots for investor ID: {pk}, startup ID: {startup_id}"
+        )
+        try:
+            return InvestorService.suggest_meeting_slots(
+                pk, startup_id, request.query_params
+            )
+        except ObjectDoesNotExist as e:
+            logger.error(f"Startup not found for ID: {startup_id} - {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        except InvestorError as e:
+            logger.error(f"Investor error: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Internal Server Error: {e}")
+            return Response(
+                {
+                    "errors": [
+                        {"detail": "Internal Server Error", "meta": {"message": str(e)}}
+                    ]
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
     @action(detail=True, methods=["get"], url_path="meetings")
     def meetings(self, request, pk=None):
         """Get all meetings that belong to the investor."""
         logger.info(f"Fetching meetings for investor ID: {pk}")
         try:
-            investor = Investor.objects.get(pk=pk)
-            meetings = investor.meetings.all().order_by("start_time")
-            serializer = MeetingSerializer(meetings, many=True)
-            response_data = [
-                {"type": "meeting", "id": meeting["id"], "attributes": meeting}
-                for meeting in serializer.data
-            ]
-            return Response(response_data, status=status.HTTP_200_OK)
+            return conditional_get(
+                self,
+                "meetings",
+                lambda: Validators.for_collection(
+                    Investor.objects.filter(pk=pk),
+                    "meetings",
+                    "updated_at",
+                    "meetings__updated_at",
+                    "meetings__startup__updated_at",
+                ),
+                lambda: self._list_meetings(pk),
+            )
         except Investor.DoesNotExist:
             logger.error(f"Investor with ID: {pk} does not exist")
             return Response(
@@ -329,3 +482,14 @@ class InvestorViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    @staticmethod
+    def _list_meetings(pk):
+        investor = Investor.objects.get(pk=pk)
+        meetings = investor.meetings.all().order_by("start_time")
+        serializer = MeetingSerializer(meetings, many=True)
+        response_data = [
+            {"type": "meeting", "id": meeting["id"], "attributes": meeting}
+            for meeting in serializer.data
+        ]
+        return Response(response_data, status=status.HTTP_200_OK)
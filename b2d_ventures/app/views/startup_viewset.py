@@ -14,8 +14,19 @@ from b2d_ventures.app.serializers import (
 )
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.permissions import IsAuthenticated
-from b2d_ventures.app.services import StartupService, StartupError
+from b2d_ventures.app.services import (
+    StartupService,
+    StartupError,
+    DataroomUploadService,
+    DataroomUploadError,
+    DataroomIndexService,
+)
+from b2d_ventures.app.services.dataroom_upload_service import (
+    UploadOffsetError,
+    UploadTooLargeError,
+)
 from b2d_ventures.utils import JSONParser, VndJsonParser, IsStartup
+from b2d_ventures.utils.conditional import Validators, conditional_get
 from b2d_ventures.utils.logger import CustomLogger
 
 logger = CustomLogger().logger
@@ -36,7 +47,14 @@ class StartupViewSet(viewsets.ModelViewSet):
         logger.info(f"Fetching profile for startup ID: {pk}")
         try:
             if request.method == "GET":
-                return StartupService.get_profile(pk)
+                return conditional_get(
+                    self,
+                    "profile",
+                    lambda: Validators.for_object(
+                        Startup.objects.filter(pk=pk), "updated_at"
+                    ),
+                    lambda: StartupService.get_profile(pk),
+                )
             elif request.method == "PUT":
                 attributes = request.data.get("data", {}).get("attributes", {})
                 return StartupService.update_profile(pk, attributes)
@@ -68,7 +86,17 @@ class StartupViewSet(viewsets.ModelViewSet):
         logger.info(f"Listing or creating deals for startup ID: {pk}")
         try:
             if request.method == "GET":
-                return StartupService.list_deals(pk)
+                return conditional_get(
+                    self,
+                    "deals",
+                    lambda: Validators.for_collection(
+                        Startup.objects.filter(pk=pk),
+                        "deals",
+                        "updated_at",
+                        "deals__updated_at",
+                    ),
+                    lambda: StartupService.list_deals(pk),
+                )
             elif request.method == "POST":
                 return self._create_deal(request, pk)
         except ObjectDoesNotExist as e:
@@ -95,7 +123,7 @@ class StartupViewSet(viewsets.ModelViewSet):
 
     @action(
         detail=True,
-        methods=["put", "delete"],
+        methods=["get", "put", "delete"],
         url_path="deals/(?P<deal_id>[^/.]+)",
     )
     def deal_operations(self, request, pk=None, deal_id=None):
@@ -105,7 +133,18 @@ class StartupViewSet(viewsets.ModelViewSet):
         )
         try:
             service = StartupService()
-            if request.method == "PUT":
+            if request.method == "GET":
+                return conditional_get(
+                    self,
+                    "deal_operations",
+                    lambda: Validators.for_object(
+                        Deal.objects.filter(pk=deal_id, startup_id=pk),
+                        "updated_at",
+                        "startup__updated_at",
+                    ),
+                    lambda: service.get_deal_details(pk, deal_id),
+                )
+            elif request.method == "PUT":
                 attributes = request.data
                 return service.update_deal(pk, deal_id, attributes)
             elif request.method == "DELETE":
@@ -165,16 +204,18 @@ class StartupViewSet(viewsets.ModelViewSet):
         """List all meetings for the startup."""
         logger.info(f"Listing meetings for startup ID: {pk}")
         try:
-            startup = Startup.objects.get(pk=pk)
-            meetings = startup.meetings.all().order_by("start_time")
-            serializer = MeetingSerializer(meetings, many=True)
-            response_data = {
-                "data": [
-                    {"type": "meeting", "id": meeting["id"], "attributes": meeting}
-                    for meeting in serializer.data
-                ]
-            }
-            return Response(response_data, status=status.HTTP_200_OK)
+            return conditional_get(
+                self,
+                "list_meetings",
+                lambda: Validators.for_collection(
+                    Startup.objects.filter(pk=pk),
+                    "meetings",
+                    "updated_at",
+                    "meetings__updated_at",
+                    "meetings__investor__updated_at",
+                ),
+                lambda: self._list_meetings(pk),
+            )
         except Startup.DoesNotExist:
             logger.error(f"Startup with ID: {pk} does not exist")
             return Response(
@@ -289,6 +330,97 @@ class StartupViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @action(detail=True, methods=["post"], url_path="dataroom-uploads")
+    def start_dataroom_upload(self, request, pk=None):
+        """Start a chunked dataroom upload for one of the startup's deals."""
+        logger.info(f"Starting dataroom upload for startup ID: {pk}")
+        try:
+            attributes = request.data.get("data", {}).get("attributes", {})
+            return DataroomUploadService.start_upload(pk, attributes)
+        except Exception as e:
+            return self._dataroom_upload_error(e)
+
+    @action(
+        detail=True,
+        methods=["get", "put", "delete"],
+        url_path="dataroom-uploads/(?P<upload_id>[^/.]+)",
+    )
+    def dataroom_upload(self, request, pk=None, upload_id=None):
+        """Get the offset of, append a chunk to, or cancel a dataroom upload."""
+        try:
+            if request.method == "GET":
+                return DataroomUploadService.get_upload(pk, upload_id)
+            elif request.method == "PUT":
+                try:
+                    offset = int(request.headers["Upload-Offset"])
+                    length = int(request.META["CONTENT_LENGTH"])
+                except (KeyError, ValueError):
+                    raise DataroomUploadError(
+                        "Chunks need Upload-Offset and Content-Length headers."
+                    )
+                logger.info(
+                    f"Receiving {length} bytes at offset {offset} "
+                    f"for dataroom upload ID: {upload_id}"
+                )
+                return DataroomUploadService.write_chunk(
+                    pk, upload_id, offset, length, request.stream
+                )
+            elif request.method == "DELETE":
+                logger.info(f"Cancelling dataroom upload ID: {upload_id}")
+                return DataroomUploadService.abort_upload(pk, upload_id)
+        except Exception as e:
+            return self._dataroom_upload_error(e)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="dataroom-uploads/(?P<upload_id>[^/.]+)/finalize",
+    )
+    def finalize_dataroom_upload(self, request, pk=None, upload_id=None):
+        """Store a complete dataroom upload as the deal's dataroom."""
+        logger.info(f"Finalizing dataroom upload ID: {upload_id}")
+        try:
+            return DataroomUploadService.finalize_upload(pk, upload_id)
+        except Exception as e:
+            return self._dataroom_upload_error(e)
+
+    @staticmethod
+    def _dataroom_upload_error(e):
+        if isinstance(e, ObjectDoesNotExist):
+            logger.error(f"Dataroom upload not found - {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        elif isinstance(e, UploadOffsetError):
+            logger.warning(f"Dataroom upload offset mismatch: {e}")
+            response = Response(
+                {"errors": [{"detail": str(e), "meta": {"offset": e.offset}}]},
+                status=status.HTTP_409_CONFLICT,
+            )
+            response["Upload-Offset"] = str(e.offset)
+            return response
+        elif isinstance(e, UploadTooLargeError):
+            logger.warning(f"Dataroom upload too large: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        elif isinstance(e, DataroomUploadError):
+            logger.error(f"Dataroom upload error: {e}")
+            return Response(
+                {"errors": [{"detail": str(e)}]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        logger.error(f"Internal Server Error: {e}")
+        return Response(
+            {
+                "errors": [
+                    {"detail": "Internal Server Error", "meta": {"message": str(e)}}
+                ]
+            },
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
     @staticmethod
     def _create_deal(request, pk):
         logger.info(f"Creating deal for startup ID: {pk}")
@@ -302,7 +434,7 @@ class StartupViewSet(viewsets.ModelViewSet):
 
             serializer = DealSerializer(data=deal_data)
             if serializer.is_valid():
-                serializer.save()
+                DataroomIndexService.schedule(serializer.save())
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             else:
                 logger.error(
@@ -326,3 +458,16 @@ class StartupViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    @staticmethod
+    def _list_meetings(pk):
+        startup = Startup.objects.get(pk=pk)
+        meetings = startup.meetings.all().order_by("start_time")
+        serializer = MeetingSerializer(meetings, many=True)
+        response_data = {
+            "data": [
+                {"type": "meeting", "id": meeting["id"], "attributes": meeting}
+                for meeting in serializer.data
+            ]
+        }
+        return Response(response_data, status=status.HTTP_200_OK)
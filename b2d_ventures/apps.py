@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class B2DVenturesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "b2d_ventures"
+
+    def ready(self):
+        from b2d_ventures.app.services import DealCacheService
+        from b2d_ventures.utils.model_cache import connect_signals
+
+        connect_signals()
+        DealCacheService.connect_signals()
@@ -1,4 +1,5 @@
 from b2d_ventures.utils.request_handler import HTTPRequestHandler
 from b2d_ventures.utils.custom_parser import VndJsonParser, JSONParser
+from b2d_ventures.utils.email_sender import EmailSenderPool
 from b2d_ventures.utils.email_service import EmailService
 from b2d_ventures.utils.permissions import IsInvestor, IsStartup, IsInvestorOrStartup
@@ -0,0 +1,134 @@
+"""ETag and Last-Modified validators for conditional GETs.
+
+Validators are computed from ``updated_at`` columns with one aggregate query,
+so a request whose If-None-Match or If-Modified-Since still matches is
+answered with 304 Not Modified before anything is serialized.
+"""
+
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+
+
+class Validators:
+    """
+    ETag and Last-Modified of a resource.
+
+    A resource that does not exist has neither, so the request falls
+    through to the service, which answers it as before.
+    """
+
+    def __init__(self, etag=None, last_modified=None):
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def for_object(cls, queryset, *timestamps):
+        """
+        Get the validators of a single row.
+
+        :param queryset: Queryset matching the row
+        :param timestamps: updated_at lookups of the row and of the related
+            rows its payload includes, e.g. ``startup__updated_at``
+        :return: Validators with an ETag and Last-Modified
+        """
+        values = cls._aggregate(queryset, timestamps)
+        stamps = [stamp for stamp in values.values() if stamp is not None]
+        if values.get("updated_0") is None:
+            return cls()
+        return cls(cls._etag(stamps), max(stamps))
+
+    @classmethod
+    def for_collection(cls, queryset, count, *timestamps):
+        """
+        Get the validators of the rows related to a parent row.
+
+        The ETag combines the number of rows with their latest updated_at, so
+        it also changes when a row is deleted. Deletions do not move the
+        latest updated_at, so collections have no Last-Modified.
+
+        :param queryset: Queryset matching the parent row
+        :param count: Lookup of the related rows, e.g. ``deals``
+        :param timestamps: updated_at lookups of the parent, the related rows
+            and the rows their payload includes
+        :return: Validators with an ETag
+        """
+        values = cls._aggregate(queryset, timestamps, count)
+        if values.get("updated_0") is None:
+            return cls()
+        return cls(cls._etag(list(values.values())))
+
+    def not_modified(self, request):
+        """
+        Answer a conditional GET whose validators still match.
+
+        :param request: The request
+        :return: 304 response, or None if the full response is needed
+        """
+        if self.etag is None:
+            return None
+        last_modified = None
+        if self.last_modified is not None:
+            # HTTP dates have a resolution of one second.
+            last_modified = int(self.last_modified.timestamp())
+        return get_conditional_response(
+            request, etag=self.etag, last_modified=last_modified
+        )
+
+    def apply(self, response):
+        """
+        Set the ETag and Last-Modified headers of a successful response.
+
+        :param response: Response built by the service
+        :return: The same response
+        """
+        if self.etag is None or response.status_code != status.HTTP_200_OK:
+            return response
+        response["ETag"] = self.etag
+        if self.last_modified is not None:
+            response["Last-Modified"] = http_date(int(self.last_modified.timestamp()))
+        return response
+
+    @staticmethod
+    def _aggregate(queryset, timestamps, count=None):
+        aggregates = {
+            f"updated_{index}": Max(lookup) for index, lookup in enumerate(timestamps)
+        }
+        if count is not None:
+            aggregates["count"] = Count(count, distinct=True)
+        try:
+            return queryset.aggregate(**aggregates)
+        except (ValidationError, ValueError):
+            # Malformed IDs are reported by the service.
+            return {}
+
+    @staticmethod
+    def _etag(values):
+        data = "|".join(
+            value.isoformat() if hasattr(value, "isoformat") else str(value)
+            for value in values
+        )
+        return "W/" + quote_etag(hashlib.sha256(data.encode()).hexdigest()[:32])
+
+
+def conditional_get(view, action, get_validators, build):
+    """
+    Build the response of a GET, or 304 if the client's copy is current.
+
+    Only applies when ``action`` is the action being dispatched, so actions
+    reused by another one, like the dashboards, still return full payloads.
+
+    :param view: The viewset
+    :param action: Name of the action the validators belong to
+    :param get_validators: Callable returning the Validators
+    :param build: Callable returning the full response
+    :return: Response
+    """
+    if getattr(view, "action", None) != action:
+        return build()
+    validators = get_validators()
+    return validators.not_modified(view.request) or validators.apply(build())
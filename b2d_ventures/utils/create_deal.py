@@ -1,148 +1,498 @@
-import os
-import django
+"""Seeding of mock deals from the files in ``contentMockup/``.
 
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "b2d_ventures.settings")
-django.setup()
+Used by ``manage.py create_mock_deals``. Deals are matched by startup and
+name, so running the seeder again updates them instead of adding
+duplicates, and files whose content the deal already stores are not saved
+again.
+"""
 
-from django.utils import timezone
-from decimal import Decimal
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from django.core.files.base import ContentFile
-from django.core.files.storage import default_storage
-from b2d_ventures.app.models import Startup, Deal
+from decimal import Decimal
 
+from django.conf import settings
+from django.core.files import File
+from django.db import connection, transaction
+from django.utils import timezone
 
-def create_placeholder_image(folder, filename):
-    content = ContentFile(b"placeholder_image_content")
-    path = default_storage.save(
-        f"/Users/krittinsetdhavanich/Downloads/b2d-ventures-backend/contentMockup/{folder}/{filename}",
-        content,
-    )
-    return path
+from b2d_ventures.app.models import Deal, Startup, StoredBlob
+from b2d_ventures.app.services import DataroomIndexService
+from b2d_ventures.utils.storage import hash_content
 
+DEFAULT_CONTENT_DIR = os.path.join(settings.ROOT_DIR, "contentMockup")
+DEFAULT_UPLOAD_WORKERS = 4
+FILE_FIELDS = ("image_background", "image_logo", "image_content", "dataroom")
+
+MOCK_DEALS = [
+    {
+        "name": "GreenSpark Series B",
+        "description": "Leading the transition to renewable energy sources",
+        "content": (
+            "GreenSpark is a transformative force in the renewable energy sector, dedicated to revolutionizing the way communities produce "
+            "and consume energy. Our flagship product line includes ultra-efficient solar panels that utilize quantum dot technology to achieve "
+            "over 95% energy conversion efficiency, alongside compact wind turbines specifically designed for urban landscapes. GreenSpark’s innovative "
+            "approach also extends to hydroelectric systems optimized for low-flow rivers, enabling renewable energy generation in previously untapped regions. "
+            "Beyond our product offerings, GreenSpark actively collaborates with global governments and NGOs to implement clean energy initiatives tailored to developing nations. "
+            "By integrating AI and IoT solutions, our smart grids ensure optimal distribution of energy, minimizing losses and enhancing reliability. "
+            "Our commitment to sustainability is evident in our closed-loop manufacturing processes, which prioritize recycled materials and renewable energy in production. "
+            "With GreenSpark, the vision of a carbon-neutral future is not only possible but within reach. \n\n"
+            "Expanding on our innovations, GreenSpark is actively developing community-level microgrid solutions to bring affordable energy to underserved regions. "
+            "These systems empower communities to generate, store, and share power autonomously, fostering energy independence. Our cutting-edge research in energy storage "
+            "has also yielded next-generation batteries with extended lifespans and unparalleled performance, further enhancing the utility of renewable energy sources. "
+            "GreenSpark’s holistic approach to clean energy incorporates educational programs aimed at raising awareness about sustainability and training future generations "
+            "in renewable energy technologies. By pushing the boundaries of green innovation and forging strategic partnerships, GreenSpark continues to lead the charge toward "
+            "a sustainable and equitable energy future."
+        ),
+        "folder": "GreenSpark",
+        "files": {
+            "image_background": "greenspark_background.png",
+            "image_logo": "greenspark_logo.png",
+            "image_content": "greenspark_content.png",
+            "dataroom": "greenspark_dataroom.pdf",
+        },
+        "target_amount": Decimal("10000000.00"),
+        "price_per_unit": Decimal("50.00"),
+        "minimum_investment": Decimal("5000.00"),
+        "type": "Renewable Energy",
+        "start_days": -20,
+        "end_days": 90,
+        "status": "approved",
+    },
+    {
+        "name": "LifeGene Series A",
+        "description": "Pioneering the future of personalized medicine",
+        "content": (
+            "LifeGene is redefining the future of healthcare with a revolutionary platform that enables precise genetic editing to treat and potentially cure a wide range of conditions. "
+            "Our flagship gene therapy, GenomicX™, targets inherited disorders like sickle cell anemia and cystic fibrosis, delivering life-changing results. Beyond medical applications, "
+            "LifeGene is pioneering new frontiers in agriculture by engineering drought-resistant crops that can thrive in extreme climates, addressing food security on a global scale. "
+            "Partnering with leading pharmaceutical companies, LifeGene is accelerating the development of personalized treatments that consider an individual's unique genetic profile. "
+            "LifeGene’s ethical framework ensures all advancements are implemented with transparency and inclusivity, making cutting-edge treatments accessible worldwide. "
+            "With an extensive pipeline of therapies in development and a robust intellectual property portfolio, LifeGene is set to dominate the biotechnology landscape for decades to come. \n\n"
+            "Furthermore, LifeGene is investing heavily in precision medicine technologies that utilize AI to analyze genomic and epigenomic data, enabling real-time adaptation of treatment strategies. "
+            "Our state-of-the-art labs leverage CRISPR-based tools to pioneer innovations in cellular regeneration and immunity enhancement, offering new hope for cancer and autoimmune disease patients. "
+            "In the agricultural sector, LifeGene is leading efforts to combat the challenges of climate change by developing crops that are not only drought-resistant but also more nutritious and higher-yielding. "
+            "We are also advancing eco-friendly pest-resistant plant strains, reducing dependency on chemical pesticides. By continuously pushing the envelope of biotechnological advancement, "
+            "LifeGene is committed to transforming lives and ecosystems globally."
+        ),
+        "folder": "LifeGene",
+        "files": {
+            "image_background": "lifegene_background.jpeg",
+            "image_logo": "lifegene_logo.png",
+            "image_content": "lifegene_content.jpg",
+            "dataroom": "lifegene_dataroom.pdf",
+        },
+        "target_amount": Decimal("20000000.00"),
+        "price_per_unit": Decimal("200.00"),
+        "minimum_investment": Decimal("20000.00"),
+        "type": "Biotechnology",
+        "start_days": -45,
+        "end_days": 45,
+        "status": "approved",
+    },
+    {
+        "name": "BrainLink Seed Round",
+        "description": "Creating AI solutions to augment human intelligence",
+        "content": (
+            "BrainLink is revolutionizing artificial intelligence by creating solutions that augment human capabilities and transform industries. "
+            "CognitiveCore™, our flagship AI platform, uses advanced machine learning algorithms to analyze and interpret massive datasets in real-time, "
+            "providing actionable insights for businesses. In healthcare, BrainLink assists doctors in identifying complex patterns in medical imaging, "
+            "enhancing diagnostic accuracy. In finance, it forecasts market trends with unparalleled precision, empowering investors to make informed decisions. "
+            "BrainLink also prioritizes ethical AI development, ensuring fairness, accountability, and transparency in all its applications. \n\n"
+            "Our educational initiatives aim to close the AI skills gap, providing training resources to empower individuals and businesses to harness the potential of AI. "
+            "Beyond commercial applications, BrainLink is driving advancements in AI-assisted creative industries, enabling the generation of innovative art, music, and design. "
+            "We also support urban planning efforts with AI solutions that model sustainable cities, optimize transportation, and enhance energy distribution. "
+            "Through strategic collaborations with universities and research institutions, BrainLink is shaping the next generation of AI researchers and practitioners. "
+            "As we continue to push the boundaries of what AI can achieve, BrainLink remains committed to creating technology that enhances lives and drives global progress."
+        ),
+        "folder": "BrainLink",
+        "files": {
+            "image_background": "brainlink_background.jpeg",
+            "image_logo": "brainlink_logo.png",
+            "image_content": "brainlink_content.png",
+            "dataroom": "brainlink_dataroom.pdf",
+        },
+        "target_amount": Decimal("5000000.00"),
+        "price_per_unit": Decimal("100.00"),
+        "minimum_investment": Decimal("10000.00"),
+        "type": "Artificial Intelligence",
+        "start_days": -10,
+        "end_days": 70,
+        "status": "approved",
+    },
+    {
+        "name": "EcoThread Bridge Round",
+        "description": "AI-powered sustainable fashion manufacturing",
+        "content": (
+            "EcoThread is at the forefront of sustainable fashion, leveraging cutting-edge AI and advanced manufacturing techniques to create eco-friendly apparel "
+            "that minimizes environmental impact. Our AI-driven design platform optimizes fabric cutting patterns, reducing waste by over 70%. EcoThread exclusively uses "
+            "sustainable materials such as organic cotton, bamboo fibers, and recycled textiles, ensuring every garment is as environmentally friendly as it is stylish. "
+            "In addition, our production facilities operate on renewable energy, further reducing our carbon footprint. \n\n"
+            "EcoThread’s circular economy initiatives include a garment recycling program where customers can return old clothing to be transformed into new products, "
+            "closing the loop on fashion waste. Beyond manufacturing, EcoThread’s AI-based consumer insights platform empowers brands to predict trends and optimize inventory, "
+            "minimizing overproduction and unsold stock. We are also working on next-generation fabrics infused with nanotechnology for enhanced durability and performance. "
+            "Our collaboration with global fashion houses and independent designers underscores our commitment to bringing sustainability into mainstream fashion, "
+            "reshaping the industry into a force for environmental and social good."
+        ),
+        "folder": "EcoThread",
+        "files": {
+            "image_background": "ecothread_background.jpeg",
+            "image_logo": "ecothread_logo.png",
+            "image_content": "ecothread_content.png",
+            "dataroom": "ecothread_dataroom.pdf",
+        },
+        "target_amount": Decimal("4000000.00"),
+        "price_per_unit": Decimal("50.00"),
+        "minimum_investment": Decimal("10000.00"),
+        "type": "Sustainable Fashion",
+        "start_days": -15,
+        "end_days": 45,
+        "status": "approved",
+    },
+    {
+        "name": "OrbitX Series B",
+        "description": "Democratizing satellite launch services",
+        "content": (
+            "OrbitX is transforming space exploration by making satellite launch services more accessible and affordable than ever before. "
+            "Our reusable micro-satellite launch vehicles use cutting-edge propulsion systems that significantly reduce costs while maintaining unmatched reliability. "
+            "OrbitX's modular satellite components allow customers to customize their payloads with ease, making space accessible to startups, academic institutions, and smaller nations. "
+            "Our in-orbit refueling technology is a game-changer, enabling satellites to operate longer and reduce the accumulation of space debris. \n\n"
+            "In addition to satellite launches, OrbitX is pioneering space sustainability through satellite recycling and advanced orbital infrastructure development. "
+            "Our modular spacecraft components are designed to be easily upgraded or repaired in orbit, minimizing waste and extending mission lifespans. "
+            "We are also developing next-generation propulsion systems that leverage clean energy sources, reducing environmental impact even further. "
+            "OrbitX's vision includes establishing orbital repair and refueling stations, laying the groundwork for interplanetary missions. By collaborating with governmental and private stakeholders, "
+            "we are building a robust ecosystem to democratize access to space and drive humanity's expansion into the cosmos."
+        ),
+        "folder": "OrbitX",
+        "files": {
+            "image_background": "orbitx_background.png",
+            "image_logo": "orbitx_logo.png",
+            "image_content": "orbitx_content.png",
+            "dataroom": "orbitx_dataroom.pdf",
+        },
+        "target_amount": Decimal("25000000.00"),
+        "price_per_unit": Decimal("1000.00"),
+        "minimum_investment": Decimal("100000.00"),
+        "type": "Space Exploration",
+        "start_days": -20,
+        "end_days": 70,
+        "status": "approved",
+    },
+    {
+        "name": "MediMind Pre-Series A",
+        "description": "AI-powered medical diagnosis and treatment planning",
+        "content": (
+            "MediMind leverages advanced AI algorithms to assist healthcare providers in diagnosis and treatment planning. Our system analyzes medical imaging, patient history, and latest research "
+            "to provide accurate diagnostic suggestions and personalized treatment plans. MediMind’s algorithms are trained on diverse datasets, ensuring culturally and demographically inclusive medical insights. "
+            "Our technology reduces diagnostic errors, shortens hospital stays, and enhances patient outcomes. \n\n"
+            "Beyond diagnostics, MediMind is pioneering AI applications in drug discovery, accelerating the identification of potential therapeutic compounds. "
+            "We also integrate wearable health devices to provide real-time monitoring and predictive alerts for chronic conditions, enabling proactive healthcare. "
+            "Through strategic collaborations with hospitals and research institutions, MediMind is fostering a global network of knowledge-sharing to improve medical outcomes worldwide. "
+            "As healthcare challenges grow more complex, MediMind is dedicated to empowering providers with the tools they need to deliver exceptional care."
+        ),
+        "folder": "MediMind",
+        "files": {
+            "image_background": "medimind_background.png",
+            "image_logo": "medimind_logo.png",
+            "image_content": "medimind_content.png",
+            "dataroom": "medimind_dataroom.pdf",
+        },
+        "target_amount": Decimal("3000000.00"),
+        "price_per_unit": Decimal("75.00"),
+        "minimum_investment": Decimal("15000.00"),
+        "type": "Healthcare",
+        "start_days": -10,
+        "end_days": 80,
+        "status": "approved",
+    },
+    {
+        "name": "LearnVerse Seed Round",
+        "description": "Virtual reality education platform",
+        "content": (
+            "LearnVerse creates immersive VR educational experiences that make learning engaging and effective. Our platform covers K-12 curriculum with interactive 3D models "
+            "and virtual laboratories. Students can explore complex scientific phenomena, historical events, and mathematical concepts in a hands-on, virtual environment, "
+            "bridging the gap between theory and practice. LearnVerse’s adaptive learning algorithms personalize educational experiences to cater to individual learning styles "
+            "and speeds, ensuring maximum retention and engagement. \n\n"
+            "In addition to K-12 education, LearnVerse is expanding its offerings to include professional training programs, enabling workers in industries such as healthcare, engineering, "
+            "and manufacturing to upskill through realistic simulations. By collaborating with educators and institutions worldwide, LearnVerse aims to make cutting-edge educational resources "
+            "accessible in even the most underserved regions. With features such as multilingual support and low-bandwidth optimization, our platform is built to overcome barriers to learning. "
+            "As we continue to innovate, LearnVerse is setting the standard for the future of education through the power of virtual reality."
+        ),
+        "folder": "LearnVerse",
+        "files": {
+            "image_background": "learnverse_background.jpg",
+            "image_logo": "learnverse_logo.png",
+            "image_content": "learnverse_content.jpg",
+            "dataroom": "learnverse_dataroom.pdf",
+        },
+        "target_amount": Decimal("1500000.00"),
+        "price_per_unit": Decimal("25.00"),
+        "minimum_investment": Decimal("5000.00"),
+        "type": "Education Technology",
+        "start_days": 0,
+        "end_days": 60,
+        "status": "approved",
+    },
+    {
+        "name": "QuantumCore Series A",
+        "description": "Practical quantum computing solutions",
+        "content": (
+            "QuantumCore is developing room-temperature quantum computers for commercial applications. Our breakthrough in qubit stability enables practical quantum computing "
+            "solutions for optimization, cryptography, and drug discovery. Unlike traditional quantum systems requiring extreme cooling, QuantumCore's room-temperature design dramatically "
+            "reduces operational complexity and costs, making quantum technology accessible to a wider audience. \n\n"
+            "Our platforms are tailored for industry-specific needs, providing unparalleled computational power for logistics, financial modeling, and material science. "
+            "QuantumCore collaborates with leading research institutions and multinational corporations to co-develop applications that address real-world challenges. "
+            "Additionally, we are investing in developer-friendly tools and training programs to foster an ecosystem of innovation around quantum computing. "
+            "With a robust intellectual property portfolio and a vision for scalable, practical solutions, QuantumCore is poised to redefine industries with quantum advancements."
+        ),
+        "folder": "QuantumCore",
+        "files": {
+            "image_background": "quantumcore_background.png",
+            "image_logo": "quantumcore_logo.png",
+            "image_content": "quantumcore_content.png",
+            "dataroom": "quantumcore_dataroom.pdf",
+        },
+        "target_amount": Decimal("15000000.00"),
+        "price_per_unit": Decimal("300.00"),
+        "minimum_investment": Decimal("30000.00"),
+        "type": "Quantum Computing",
+        "start_days": -5,
+        "end_days": 85,
+        "status": "approved",
+    },
+    {
+        "name": "AquaTech Ventures Series A",
+        "description": "Revolutionizing water purification technology",
+        "content": (
+            "AquaTech Ventures is transforming the way we access and utilize clean water with advanced purification and desalination technologies. "
+            "Our proprietary filtration systems use graphene-based membranes that achieve 99.9% impurity removal, ensuring safe drinking water in areas affected by pollution and scarcity. "
+            "Our scalable desalination plants are designed to be energy-efficient, making seawater a viable resource for sustainable communities worldwide. \n\n"
+            "In addition to industrial applications, AquaTech’s smart water management systems employ AI-driven analytics to monitor usage patterns and predict shortages, "
+            "helping municipalities optimize water distribution. We also collaborate with NGOs and governments to implement portable purification units for disaster relief, "
+            "ensuring clean water access during emergencies. As water becomes one of the most critical resources of the 21st century, AquaTech Ventures is dedicated to pioneering "
+            "solutions that secure this vital resource for future generations."
+        ),
+        "folder": "AquaTech",
+        "files": {
+            "image_background": "aquatech_background.jpg",
+            "image_logo": "aquatech_logo.png",
+            "image_content": "aquatech_content.png",
+            "dataroom": "aquatech_dataroom.pdf",
+        },
+        "target_amount": Decimal("10000000.00"),
+        "price_per_unit": Decimal("50.00"),
+        "minimum_investment": Decimal("10000.00"),
+        "type": "Water Technology",
+        "start_days": -15,
+        "end_days": 60,
+    },
+    {
+        "name": "NeuroNet Seed Round",
+        "description": "AI-powered neuroscience breakthroughs",
+        "content": (
+            "NeuroNet is leading the charge in neuroscience with AI-powered platforms designed to unlock the mysteries of the human brain. "
+            "Our flagship product, SynapseAI™, provides researchers with tools to simulate neural activity, accelerating discoveries in mental health, neurodegenerative diseases, and cognitive enhancement. "
+            "NeuroNet’s technology has already helped identify biomarkers for conditions like Alzheimer’s and Parkinson’s, enabling earlier and more accurate diagnoses. \n\n"
+            "Our collaborations with leading hospitals and academic institutions allow us to bring cutting-edge research directly to clinical trials, bridging the gap between theory and practice. "
+            "Beyond healthcare, NeuroNet is innovating brain-computer interfaces that empower individuals with physical disabilities, enabling greater autonomy and interaction. "
+            "With a robust commitment to ethical AI, NeuroNet ensures that advancements are implemented responsibly, prioritizing human welfare above all else."
+        ),
+        "folder": "NeuroNet",
+        "files": {
+            "image_background": "neuronet_background.jpg",
+            "image_logo": "neuronet_logo.png",
+            "image_content": "neuronet_content.png",
+            "dataroom": "neuronet_dataroom.pdf",
+        },
+        "target_amount": Decimal("7000000.00"),
+        "price_per_unit": Decimal("75.00"),
+        "minimum_investment": Decimal("15000.00"),
+        "type": "Neuroscience AI",
+        "start_days": -20,
+        "end_days": 90,
+    },
+    {
+        "name": "AgroFusion Series B",
+        "description": "Innovating sustainable agriculture technology",
+        "content": (
+            "AgroFusion is a pioneer in sustainable agriculture technology, creating solutions that enhance crop yields while protecting the environment. "
+            "Our precision farming tools leverage satellite imagery and IoT sensors to monitor soil health, optimize irrigation, and reduce pesticide use. "
+            "AgroFusion’s bioengineered seeds are designed to thrive in arid and nutrient-depleted soils, addressing food security challenges worldwide. \n\n"
+            "In addition, our mobile app platform empowers farmers with real-time data on weather patterns, pest risks, and market prices, enabling informed decisions. "
+            "We also focus on regenerative farming practices that restore soil health and sequester carbon, contributing to climate change mitigation. "
+            "With a vision to transform agriculture into a sustainable and profitable industry, AgroFusion is committed to innovation and collaboration at every level of the supply chain."
+        ),
+        "folder": "AgroFusion",
+        "files": {
+            "image_background": "agrofusion_background.jpg",
+            "image_logo": "agrofusion_logo.png",
+            "image_content": "agrofusion_content.jpeg",
+            "dataroom": "agrofusion_dataroom.pdf",
+        },
+        "target_amount": Decimal("20000000.00"),
+        "price_per_unit": Decimal("100.00"),
+        "minimum_investment": Decimal("20000.00"),
+        "type": "Agriculture Technology",
+        "start_days": -10,
+        "end_days": 75,
+    },
+    {
+        "name": "CleanWave Pre-Series A",
+        "description": "Next-gen ocean cleanup technology",
+        "content": (
+            "CleanWave is revolutionizing ocean cleanup efforts with autonomous systems designed to remove plastic waste and restore marine ecosystems. "
+            "Our robotic fleets, powered by renewable energy, can operate continuously to collect debris and sort it for recycling. CleanWave’s innovative nanotechnology-based filters "
+            "prevent microplastics from reaching marine food chains, safeguarding aquatic life. \n\n"
+            "In partnership with coastal communities, CleanWave implements waste reduction programs and educates the public on sustainable practices. "
+            "Our advanced data analytics platform tracks pollution hotspots, enabling targeted cleanup efforts and policy recommendations. By addressing both prevention and remediation, "
+            "CleanWave is making significant strides toward a plastic-free ocean and a healthier planet."
+        ),
+        "folder": "CleanWave",
+        "files": {
+            "image_background": "cleanwave_background.jpeg",
+            "image_logo": "cleanwave_logo.png",
+            "image_content": "cleanwave_content.jpeg",
+            "dataroom": "cleanwave_dataroom.pdf",
+        },
+        "target_amount": Decimal("8000000.00"),
+        "price_per_unit": Decimal("60.00"),
+        "minimum_investment": Decimal("12000.00"),
+        "type": "Environmental Technology",
+        "start_days": -5,
+        "end_days": 85,
+    },
+]
 
-def create_placeholder_pdf(folder, filename):
-    content = ContentFile(b"placeholder_pdf_content")
-    path = default_storage.save(
-        f"/Users/krittinsetdhavanich/Downloads/b2d-ventures-backend/contentMockup/{folder}/{filename}",
-        content,
-    )
-    return path
 
+def seed_mock_deals(
+    startup_id, content_dir=DEFAULT_CONTENT_DIR, workers=DEFAULT_UPLOAD_WORKERS
+):
+    """
+    Create or update the mock deals of a startup.
 
-def create_mock_deals(startup_id):
+    The files of all deals are uploaded first by a pool of ``workers``
+    threads, streamed from disk, then the deals are upserted in one
+    transaction.
+
+    :param startup_id: ID of the startup owning the deals
+    :param content_dir: Directory with one folder of files per deal
+    :param workers: Number of concurrent uploads; 1 uploads serially
+    :return: Dictionary with the deals, the number created and updated,
+        and the upload and total time in seconds
+    """
+    started_at = time.perf_counter()
     startup = Startup.objects.get(id=startup_id)
 
+    uploads = {}
+    for index, spec in enumerate(MOCK_DEALS):
+        deal = Deal.objects.filter(startup=startup, name=spec["name"]).first()
+        for field, filename in spec["files"].items():
+            path = os.path.join(content_dir, spec["folder"], filename)
+            if not os.path.exists(path):
+                logging.warning(f"Skipping missing mock file {path}")
+                continue
+            if deal is not None and _is_stored(field, getattr(deal, field).name, path):
+                continue
+            uploads[(index, field)] = (field, f"{spec['folder']}/{filename}", path)
+
+    if workers > 1:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="mock-deal-upload"
+        ) as executor:
+            futures = {
+                key: executor.submit(_upload, *args, True)
+                for key, args in uploads.items()
+            }
+            names = {key: future.result() for key, future in futures.items()}
+    else:
+        names = {key: _upload(*args) for key, args in uploads.items()}
+    uploaded_at = time.perf_counter()
+
     deals = []
+    replaced = []
+    created_count = 0
+    now = timezone.now()
+    with transaction.atomic():
+        for index, spec in enumerate(MOCK_DEALS):
+            values = {
+                field: spec[field]
+                for field in (
+                    "description",
+                    "content",
+                    "target_amount",
+                    "price_per_unit",
+                    "minimum_investment",
+                    "type",
+                )
+            }
+            values["start_date"] = now + timedelta(days=spec["start_days"])
+            values["end_date"] = now + timedelta(days=spec["end_days"])
+            if "status" in spec:
+                values["status"] = spec["status"]
+            for field in FILE_FIELDS:
+                if (index, field) in names:
+                    values[field] = names[(index, field)]
 
-    # Deal 1: Tech Startup
-    deal1 = Deal.objects.create(
-        startup=startup,
-        name="NeurAI Series A",
-        description="Revolutionizing human-computer interaction with direct neural interfaces",
-        content="NeurAI is developing cutting-edge neural interface technology that allows direct communication between the human brain and computers. Our technology has applications in healthcare, gaming, and productivity tools.",
-        image_background=create_placeholder_image("NeurAI", "neurai_background.jpg"),
-        image_logo=create_placeholder_image("NeurAI", "neurai_logo.png"),
-        image_content=create_placeholder_image("NeurAI", "neurai_content.jpg"),
-        dataroom=create_placeholder_pdf("NeurAI", "neurai_dataroom.pdf"),
-        allocation=Decimal("5000000.00"),
-        price_per_unit=Decimal("100.00"),
-        minimum_investment=Decimal("10000.00"),
-        type="Equity",
-        start_date=timezone.now(),
-        end_date=timezone.now() + timedelta(days=90),
-    )
-    deals.append(deal1)
-
-    # Deal 2: Green Energy Startup
-    deal2 = Deal.objects.create(
-        startup=startup,
-        name="SolarFlare Seed Round",
-        description="Efficient and affordable solar solutions for residential use",
-        content="SolarFlare is developing a new generation of solar panels that are 50% more efficient and 30% cheaper than current market leaders. Our technology will make solar energy accessible to millions of homeowners.",
-        image_background=create_placeholder_image(
-            "SolarFlare", "solarflare_background.png"
-        ),
-        image_logo=create_placeholder_image("SolarFlare", "solarflare_logo.png"),
-        image_content=create_placeholder_image(
-            "SolarFlare", "solarflare_background.png"
-        ),
-        dataroom=create_placeholder_pdf("SolarFlare", "solarflare_dataroom.pdf"),
-        allocation=Decimal("2000000.00"),
-        price_per_unit=Decimal("50.00"),
-        minimum_investment=Decimal("5000.00"),
-        type="Convertible Note",
-        start_date=timezone.now() - timedelta(days=30),
-        end_date=timezone.now() + timedelta(days=60),
-    )
-    deals.append(deal2)
-
-    # Deal 3: Biotech Startup
-    deal3 = Deal.objects.create(
-        startup=startup,
-        name="GeneCure Series B",
-        description="Advancing personalized medicine through innovative gene therapies",
-        content="GeneCure is at the forefront of personalized medicine, developing gene therapies tailored to individual genetic profiles. Our treatments show promise in addressing previously incurable genetic disorders.",
-        image_background=create_placeholder_image(
-            "GeneCure", "genecure_background.jpg"
-        ),
-        image_logo=create_placeholder_image("GeneCure", "genecure_logo.jpg"),
-        image_content=create_placeholder_image("GeneCure", "genecure_background.jpg"),
-        dataroom=create_placeholder_pdf("GeneCure", "medimind_dataroom.pdf"),
-        allocation=Decimal("20000000.00"),
-        price_per_unit=Decimal("500.00"),
-        minimum_investment=Decimal("50000.00"),
-        type="Equity",
-        start_date=timezone.now() - timedelta(days=60),
-        end_date=timezone.now() + timedelta(days=30),
-    )
-    deals.append(deal3)
-
-    # Deal 4: Fintech Startup
-    deal4 = Deal.objects.create(
-        startup=startup,
-        name="CryptoBank ICO",
-        description="Bringing traditional banking services to the blockchain",
-        content="CryptoBank is building a decentralized banking platform that offers traditional banking services using blockchain technology. Our platform will provide secure, transparent, and accessible financial services to anyone with an internet connection.",
-        image_background=create_placeholder_image(
-            "CryptoBank", "cryptobank_background.jpeg"
-        ),
-        image_logo=create_placeholder_image("CryptoBank", "cryptobank_logo.jpeg"),
-        image_content=create_placeholder_image("CryptoBank", "cryptobank_content.jpeg"),
-        dataroom=create_placeholder_pdf("CryptoBank", "cryptobank_dataroom.pdf"),
-        allocation=Decimal("10000000.00"),
-        price_per_unit=Decimal("1.00"),
-        minimum_investment=Decimal("1000.00"),
-        type="Token Sale",
-        start_date=timezone.now() - timedelta(days=15),
-        end_date=timezone.now() + timedelta(days=15),
-    )
-    deals.append(deal4)
-
-    # Deal 5: AgTech Startup
-    deal5 = Deal.objects.create(
-        startup=startup,
-        name="VertiFarm Series A",
-        description="Revolutionizing urban agriculture with AI-powered vertical farms",
-        content="VertiFarm is developing AI-controlled vertical farming systems that can produce 100 times more food per square foot than traditional farming. Our technology enables fresh, local produce to be grown year-round in any urban environment.",
-        image_background=create_placeholder_image(
-            "VertiFarm", "vertifarm_background.png"
-        ),
-        image_logo=create_placeholder_image("VertiFarm", "vertifarm_logo.png"),
-        image_content=create_placeholder_image("VertiFarm", "vertifarm_background.png"),
-        dataroom=create_placeholder_pdf("VertiFarm", "vertifarm_dataroom.pdf"),
-        allocation=Decimal("8000000.00"),
-        price_per_unit=Decimal("200.00"),
-        minimum_investment=Decimal("20000.00"),
-        type="Equity",
-        start_date=timezone.now() - timedelta(days=45),
-        end_date=timezone.now() + timedelta(days=45),
-    )
-    deals.append(deal5)
-
-    return deals
-
-
-startup_id = "0d3b7d0e-9e10-4254-b94d-30cfbab66ed8"
-mock_deals = create_mock_deals(startup_id)
-print(f"Created {len(mock_deals)} mock deals for startup with ID: {startup_id}")
+            # filter().first() rather than update_or_create, so deals
+            # duplicated by earlier seeders are updated instead of failing.
+            deal = Deal.objects.filter(startup=startup, name=spec["name"]).first()
+            if deal is None:
+                deal = Deal.objects.create(startup=startup, name=spec["name"], **values)
+                created_count += 1
+            else:
+                for field, value in values.items():
+                    if field in FILE_FIELDS and getattr(deal, field).name:
+                        replaced.append((field, getattr(deal, field).name))
+                    setattr(deal, field, value)
+                deal.save()
+            DataroomIndexService.schedule(deal)
+            deals.append(deal)
+
+    # Each saved name holds a reference to its content, so the files the
+    # deals no longer point at are released.
+    for field, name in replaced:
+        Deal._meta.get_field(field).storage.delete(name)
+
+    finished_at = time.perf_counter()
+    return {
+        "deals": deals,
+        "created": created_count,
+        "updated": len(deals) - created_count,
+        "upload_seconds": uploaded_at - started_at,
+        "total_seconds": finished_at - started_at,
+    }
+
+
+def _is_stored(field, name, path):
+    """Check whether a stored file of a Deal field has the content of a file."""
+    if not name:
+        return False
+    storage = Deal._meta.get_field(field).storage
+    with open(path, "rb") as file:
+        sha256, _ = hash_content(file)
+    try:
+        stored_path = storage.path(name)
+    except NotImplementedError:
+        # Remote names are the public IDs recorded in the hash index.
+        return StoredBlob.objects.filter(
+            backend=storage.BACKEND, sha256=sha256, name=name
+        ).exists()
+    try:
+        with open(stored_path, "rb") as file:
+            return hash_content(file)[0] == sha256
+    except FileNotFoundError:
+        return False
+
+
+def _upload(field, name, path, close_connection=False):
+    """Stream a file into the storage of a Deal field."""
+    storage = Deal._meta.get_field(field).storage
+    try:
+        with open(path, "rb") as file:
+            return storage.save(name, File(file, name))
+    finally:
+        # Worker threads get their own connection for the hash index.
+        if close_connection:
+            connection.close()
@@ -0,0 +1,51 @@
+"""Metrics of the psycopg connection pools enabled with DATABASE_POOL."""
+
+from django.db import connections
+
+
+def pool_metrics():
+    """
+    Get the connection pool usage of this process, per database.
+
+    Counters are cumulative since the pool was opened. ``saturation`` is the
+    share of the maximum pool size checked out, and requests that found no
+    free connection are counted in ``requests_queued`` and their total wait
+    in ``requests_wait_ms``.
+
+    :return: Dictionary of database alias to pool metrics, empty if no
+        database is pooled
+    """
+    metrics = {}
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)
+        if pool is None:
+            continue
+        if pool.closed:
+            # Pools are opened by the first query of the process.
+            metrics[alias] = {"open": False}
+            continue
+        stats = pool.get_stats()
+        in_use = stats.get("pool_size", 0) - stats.get("pool_available", 0)
+        queued = stats.get("requests_queued", 0)
+        wait_ms = stats.get("requests_wait_ms", 0)
+        metrics[alias] = {
+            "open": True,
+            "min_size": stats.get("pool_min", 0),
+            "max_size": stats.get("pool_max", 0),
+            "size": stats.get("pool_size", 0),
+            "available": stats.get("pool_available", 0),
+            "in_use": in_use,
+            "saturation": (
+                round(in_use / stats["pool_max"], 4) if stats.get("pool_max") else None
+            ),
+            "requests_waiting": stats.get("requests_waiting", 0),
+            "requests": stats.get("requests_num", 0),
+            "requests_queued": queued,
+            "requests_wait_ms": wait_ms,
+            "average_wait_ms": round(wait_ms / queued, 2) if queued else 0,
+            "requests_timed_out": stats.get("requests_errors", 0),
+            "connections": stats.get("connections_num", 0),
+            "connection_errors": stats.get("connections_errors", 0),
+            "connections_lost": stats.get("connections_lost", 0),
+        }
+    return metrics
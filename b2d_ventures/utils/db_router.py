@@ -0,0 +1,121 @@
+"""Routing of GET traffic to read replicas.
+
+Replicas are the ``replica_<n>`` databases configured with
+DATABASE_REPLICA_URLS. Reads of a GET, HEAD or OPTIONS request go to one of
+them, picked once per request, except:
+
+- inside a transaction on the primary, like ``create_investment``;
+- after the request wrote, so it reads its own writes;
+- within REPLICA_PIN_SECONDS of a write by the same client. The response to
+  a request that wrote carries the end of that window in a cookie and a
+  header, and the client's next requests read from the primary until then,
+  so a lagging replica does not hide the write.
+
+Reads outside of requests, e.g. in management commands and worker threads,
+always go to the primary.
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_COOKIE = "primary_pin_until"
+PIN_HEADER = "X-Primary-Pin-Until"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_state = threading.local()
+
+
+def replica_aliases():
+    """
+    Get the aliases of the configured replicas.
+
+    :return: List of database aliases
+    """
+    return [alias for alias in connections if alias.startswith("replica_")]
+
+
+@contextmanager
+def use_primary():
+    """Send the reads made in the block to the primary."""
+    replica = getattr(_state, "replica", None)
+    _state.replica = None
+    try:
+        yield
+    finally:
+        if not getattr(_state, "wrote", False):
+            _state.replica = replica
+
+
+class ReplicaRouter:
+    """Database router sending the reads of safe requests to a replica."""
+
+    def db_for_read(self, model, **hints):
+        replica = getattr(_state, "replica", None)
+        if replica is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return replica
+
+    def db_for_write(self, model, **hints):
+        # Also covers rows read from a replica and saved.
+        _state.replica = None
+        _state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get the schema from the primary.
+        if db in replica_aliases():
+            return False
+        return None
+
+
+class ReplicaPinningMiddleware:
+    """Route each request's reads and pin clients to the primary after writes."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        replicas = replica_aliases()
+        _state.replica = None
+        _state.wrote = False
+        if replicas and request.method in SAFE_METHODS and not self._pinned(request):
+            _state.replica = random.choice(replicas)
+        try:
+            response = self.get_response(request)
+            wrote = _state.wrote
+        finally:
+            _state.replica = None
+            _state.wrote = False
+
+        if wrote and replicas:
+            until = int(time.time()) + settings.REPLICA_PIN_SECONDS
+            response.set_cookie(
+                PIN_COOKIE,
+                str(until),
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+            response[PIN_HEADER] = str(until)
+        return response
+
+    @staticmethod
+    def _pinned(request):
+        for value in (request.COOKIES.get(PIN_COOKIE), request.headers.get(PIN_HEADER)):
+            try:
+                if value and float(value) > time.time():
+                    return True
+            except ValueError:
+                continue
+        return False
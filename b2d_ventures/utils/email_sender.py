@@ -0,0 +1,351 @@
+"""The module defines the rate-limited EmailSenderPool."""
+
+import logging
+import smtplib
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from django.conf import settings
+
+THROUGHPUT_WINDOW_SECONDS = 60
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by the sender threads.
+
+    Tokens are refilled continuously at ``rate`` per second up to
+    ``capacity``; each message takes one token, so short bursts of up to
+    ``capacity`` messages go out at once and longer runs are smoothed to
+    ``rate``.
+    """
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.clock = clock
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    def try_acquire(self):
+        """
+        Take a token if one is available.
+
+        :return: 0 if a token was taken, otherwise seconds until one is
+        """
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Block until a token is available and take it."""
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
+
+
+class SMTPConnectionPool:
+    """
+    Pool of logged-in SMTP sessions reused across messages.
+
+    Sessions idle for longer than ``max_idle`` seconds are closed instead of
+    reused, since servers drop idle clients.
+    """
+
+    def __init__(self, host, port, user, password, size, max_idle):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.max_idle = max_idle
+        self.idle = deque(maxlen=size)
+        self.lock = threading.Lock()
+
+    def get(self):
+        """
+        Take an idle session or open a new one.
+
+        :return: Logged-in smtplib.SMTP_SSL connection
+        """
+        now = time.monotonic()
+        with self.lock:
+            while self.idle:
+                server, released_at = self.idle.pop()
+                if now - released_at < self.max_idle:
+                    return server
+                self._close(server)
+        server = smtplib.SMTP_SSL(self.host, self.port)
+        server.login(self.user, self.password)
+        return server
+
+    def release(self, server):
+        """Return a healthy session to the pool."""
+        with self.lock:
+            if len(self.idle) == self.idle.maxlen:
+                self._close(self.idle.popleft()[0])
+            self.idle.append((server, time.monotonic()))
+
+    def discard(self, server):
+        """Close a session after an error."""
+        self._close(server)
+
+    def close_all(self):
+        """Close every idle session."""
+        with self.lock:
+            while self.idle:
+                self._close(self.idle.pop()[0])
+
+    @staticmethod
+    def _close(server):
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+class EmailSenderPool:
+    """
+    Background sender for outgoing email.
+
+    Messages are sent by a small thread pool sharing pooled SMTP sessions.
+    A token bucket caps the overall send rate, each recipient domain is
+    limited to EMAIL_DOMAIN_CONCURRENCY messages in flight, with further
+    messages for a busy domain queued until a slot frees up, and transient
+    failures (4xx replies, dropped connections) are retried with
+    exponential backoff. Counters are available from metrics().
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        host,
+        port,
+        user,
+        password,
+        workers=4,
+        rate=5.0,
+        burst=10,
+        domain_concurrency=2,
+        max_attempts=4,
+        retry_base=2.0,
+        retry_max=300.0,
+        max_idle=60.0,
+    ):
+        self.connections = SMTPConnectionPool(
+            host, port, user, password, workers, max_idle
+        )
+        self.bucket = TokenBucket(rate, burst)
+        self.domain_concurrency = domain_concurrency
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="email-sender"
+        )
+        self.lock = threading.Lock()
+        self.domains_in_flight = {}
+        self.domains_waiting = {}
+        self.sent_times = deque()
+        self.started_at = time.time()
+        self.counters = {
+            "queued": 0,
+            "sent": 0,
+            "failed": 0,
+            "retried": 0,
+            "pending": 0,
+        }
+
+    @classmethod
+    def instance(cls):
+        """
+        Get the process-wide sender configured from settings.
+
+        :return: EmailSenderPool
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(
+                        settings.SMTP_HOST,
+                        settings.SMTP_PORT,
+                        settings.SMTP_USER,
+                        settings.SMTP_PASSWORD,
+                        workers=settings.EMAIL_SENDER_WORKERS,
+                        rate=settings.EMAIL_SEND_RATE,
+                        burst=settings.EMAIL_SEND_BURST,
+                        domain_concurrency=settings.EMAIL_DOMAIN_CONCURRENCY,
+                        max_attempts=settings.EMAIL_SEND_MAX_ATTEMPTS,
+                        retry_base=settings.EMAIL_SEND_RETRY_BASE_SECONDS,
+                        retry_max=settings.EMAIL_SEND_RETRY_MAX_SECONDS,
+                    )
+        return cls._instance
+
+    @classmethod
+    def reset(cls):
+        """Shut down the process-wide sender, e.g. after changing settings."""
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.shutdown()
+            cls._instance = None
+
+    def submit(self, message):
+        """
+        Queue a message for sending.
+
+        :param message: email.message.Message with a To header
+        :return: Future resolving to True once sent, or False if sending
+            failed permanently or ran out of attempts
+        """
+        future = Future()
+        with self.lock:
+            self.counters["queued"] += 1
+            self.counters["pending"] += 1
+        self._schedule(message, future, attempt=1)
+        return future
+
+    def metrics(self):
+        """
+        Get throughput and failure counters.
+
+        :return: Dictionary with queued, sent, failed, retried and pending
+            counts, messages sent in the last minute and uptime in seconds
+        """
+        with self.lock:
+            self._trim_sent_times(time.monotonic())
+            return dict(
+                self.counters,
+                sent_last_minute=len(self.sent_times),
+                domains_in_flight=sum(self.domains_in_flight.values()),
+                domains_waiting=sum(map(len, self.domains_waiting.values())),
+                uptime_seconds=int(time.time() - self.started_at),
+            )
+
+    def shutdown(self, wait=True):
+        """Stop the worker threads and close pooled SMTP sessions."""
+        self.executor.shutdown(wait=wait)
+        self.connections.close_all()
+
+    def _schedule(self, message, future, attempt, delay=0):
+        if delay > 0:
+            timer = threading.Timer(
+                delay, self._schedule, args=(message, future, attempt)
+            )
+            timer.daemon = True
+            timer.start()
+            return
+        try:
+            self.executor.submit(self._send, message, future, attempt)
+        except RuntimeError:
+            self._finish(future, False, f"sender shut down before {message['To']}")
+
+    def _send(self, message, future, attempt, domain=None):
+        # domain is passed when _release_domain hands over its slot.
+        if domain is None:
+            domain = message["To"].rsplit("@", 1)[-1].lower()
+            if not self._acquire_domain(domain, (message, future, attempt)):
+                return
+        try:
+            self.bucket.acquire()
+            self._deliver(message)
+        except Exception as e:
+            if self._is_transient(e) and attempt < self.max_attempts:
+                delay = min(self.retry_base * 2 ** (attempt - 1), self.retry_max)
+                logging.warning(
+                    f"Email to {message['To']} failed (attempt {attempt}), "
+                    f"retrying in {delay:.0f}s: {e}"
+                )
+                with self.lock:
+                    self.counters["retried"] += 1
+                self._schedule(message, future, attempt + 1, delay)
+            else:
+                self._finish(
+                    future, False, f"Error sending email to {message['To']}: {e}"
+                )
+        else:
+            self._finish(future, True)
+        finally:
+            self._release_domain(domain)
+
+    def _deliver(self, message):
+        server = self.connections.get()
+        try:
+            server.send_message(message)
+        except Exception:
+            self.connections.discard(server)
+            raise
+        self.connections.release(server)
+
+    @staticmethod
+    def _is_transient(error):
+        if isinstance(error, smtplib.SMTPRecipientsRefused):
+            codes = [code for code, _ in error.recipients.values()]
+            return bool(codes) and all(400 <= code < 500 for code in codes)
+        if isinstance(error, smtplib.SMTPResponseException):
+            return 400 <= error.smtp_code < 500
+        return isinstance(
+            error, (smtplib.SMTPServerDisconnected, socket.timeout, ConnectionError)
+        )
+
+    def _acquire_domain(self, domain, waiter):
+        """Take a slot for the domain, or queue the waiter if it is at its cap."""
+        with self.lock:
+            in_flight = self.domains_in_flight.get(domain, 0)
+            if in_flight >= self.domain_concurrency:
+                self.domains_waiting.setdefault(domain, deque()).append(waiter)
+                return False
+            self.domains_in_flight[domain] = in_flight + 1
+            return True
+
+    def _release_domain(self, domain):
+        """Hand the slot to the next queued message for the domain, or free it."""
+        while True:
+            with self.lock:
+                waiting = self.domains_waiting.get(domain)
+                if not waiting:
+                    in_flight = self.domains_in_flight[domain] - 1
+                    if in_flight:
+                        self.domains_in_flight[domain] = in_flight
+                    else:
+                        del self.domains_in_flight[domain]
+                    return
+                message, future, attempt = waiting.popleft()
+                if not waiting:
+                    del self.domains_waiting[domain]
+            try:
+                self.executor.submit(self._send, message, future, attempt, domain)
+                return
+            except RuntimeError:
+                self._finish(future, False, f"sender shut down before {message['To']}")
+
+    def _finish(self, future, sent, error=None):
+        with self.lock:
+            self.counters["pending"] -= 1
+            if sent:
+                self.counters["sent"] += 1
+                now = time.monotonic()
+                self.sent_times.append(now)
+                self._trim_sent_times(now)
+            else:
+                self.counters["failed"] += 1
+        if error:
+            logging.error(error)
+        future.set_result(sent)
+
+    def _trim_sent_times(self, now):
+        while self.sent_times and now - self.sent_times[0] > THROUGHPUT_WINDOW_SECONDS:
+            self.sent_times.popleft()
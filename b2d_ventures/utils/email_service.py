@@ -1,5 +1,4 @@
 import os
-import smtplib
 from decimal import Decimal
 
 from email.mime.application import MIMEApplication
@@ -8,6 +7,34 @@ from email.mime.text import MIMEText
 
 from django.conf import settings
 
+from b2d_ventures.utils.email_sender import EmailSenderPool
+from b2d_ventures.utils.email_templates import EmailTemplateRegistry
+
+PLATFORM_FEE_RATE = Decimal("0.03")
+CENTS = Decimal("0.01")
+
+
+def platform_fee(investment_amount):
+    """
+    Get the platform fee of an investment, rounded to the cent.
+
+    :param investment_amount: Gross amount of the investment
+    :return: Decimal fee
+    """
+    return (Decimal(investment_amount).quantize(CENTS) * PLATFORM_FEE_RATE).quantize(
+        CENTS
+    )
+
+
+def net_of_platform_fee(investment_amount):
+    """
+    Get the amount of an investment a startup raises, net of the platform fee.
+
+    :param investment_amount: Gross amount of the investment
+    :return: Decimal net amount, rounded to the cent
+    """
+    return Decimal(investment_amount).quantize(CENTS) - platform_fee(investment_amount)
+
 
 class EmailService:
     def __init__(self):
@@ -17,8 +44,28 @@ class EmailService:
         self.smtp_password = getattr(settings, "SMTP_PASSWORD")
 
     def send_email_with_attachment(
-        self, to_email, subject, body, attachment=None, filename=None
+        self,
+        to_email,
+        subject,
+        body,
+        attachment=None,
+        filename=None,
+        html_body=None,
+        wait=True,
     ):
+        """
+        Send an email through the shared EmailSenderPool.
+
+        :param to_email: Recipient address
+        :param subject: Subject line
+        :param body: Plain-text body
+        :param attachment: Optional file with a local path to attach
+        :param filename: Name of the attachment
+        :param html_body: Optional HTML alternative of the body
+        :param wait: Block until the email is sent; otherwise return at once
+        :return: True if the email was sent, False if it failed, or a Future
+            of that result when wait is False
+        """
         if not self.smtp_user or not self.smtp_password:
             raise ValueError("SMTP user and password must be set in the settings.")
 
@@ -27,7 +74,13 @@ class EmailService:
         msg["To"] = to_email
         msg["Subject"] = subject
 
-        msg.attach(MIMEText(body, "plain"))
+        if html_body:
+            alternative = MIMEMultipart("alternative")
+            alternative.attach(MIMEText(body, "plain"))
+            alternative.attach(MIMEText(html_body, "html"))
+            msg.attach(alternative)
+        else:
+            msg.attach(MIMEText(body, "plain"))
 
         if attachment and filename:
             with open(attachment.path, "rb") as file:
@@ -35,80 +88,99 @@ class EmailService:
             part["Content-Disposition"] = f'attachment; filename="{filename}"'
             msg.attach(part)
 
-        try:
-            with smtplib.SMTP_SSL(self.smtp_host, self.smtp_port) as server:
-                server.login(self.smtp_user, self.smtp_password)
-                server.send_message(msg)
-            print(f"Email sent successfully to {to_email}")
-            return True
-        except Exception as e:
-            print(f"Error sending email to {to_email}: {str(e)}")
-            return False
+        future = EmailSenderPool.instance().submit(msg)
+        return future.result() if wait else future
+
+    def send_rendered_email(
+        self, to_email, email, attachment=None, filename=None, wait=True
+    ):
+        """Send a RenderedEmail as a multipart plain-text/HTML message."""
+        return self.send_email_with_attachment(
+            to_email,
+            email.subject,
+            email.text,
+            attachment=attachment,
+            filename=filename,
+            html_body=email.html,
+            wait=wait,
+        )
 
     @staticmethod
     def build_deal_notification_content(deal, action, custom_message=None):
-        """Build the subject and body for a deal notification email."""
-        subject = f"Deal Update: {deal.name}"
-        body = f"Dear {deal.startup.username},\n\n"
-
-        if action == "approved":
-            body += f"Your deal '{deal.name}' has been approved. Congratulations! Your deal is now live on our platform."
-        elif action == "rejected":
-            body += f"Your deal '{deal.name}' has been rejected. We apologize for any inconvenience. If you have any questions, please contact our support team."
-        elif custom_message:
-            body += custom_message
-        else:
-            body += f"There has been an update regarding your deal '{deal.name}'."
-
-        body += "\n\nBest regards,\nThe B2D Ventures Team"
-
-        return subject, body
+        """Render the deal notification email for the deal's startup."""
+        return EmailTemplateRegistry.render(
+            "deal_update",
+            {
+                "recipient_name": deal.startup.username,
+                "deal_name": deal.name,
+                "action": action,
+                "custom_message": custom_message,
+            },
+        )
 
     @staticmethod
     def build_investment_notification_content(investment, recipient_type):
-        """Build the subject and body for an investment notification email."""
+        """Render the investment notification email for the investor or startup."""
         deal = investment.deal
-        investor = investment.investor
-        investment_amount = investment.investment_amount
-        platform_fee = investment_amount * Decimal("0.03")
-        net_investment = investment_amount - platform_fee
+        investment_amount = Decimal(investment.investment_amount).quantize(CENTS)
+        fee = platform_fee(investment_amount)
+        context = {
+            "deal_name": deal.name,
+            "investment_amount": investment_amount,
+            "platform_fee": fee,
+            "net_investment": investment_amount - fee,
+        }
 
         if recipient_type == "investor":
-            subject = f"Investment Confirmation: {deal.name}"
-            body = f"""
-                Dear {investor.username},
-
-                Your investment of ${investment_amount} in {deal.name} has been successfully processed.
-
-                Investment details:
-                - Deal: {deal.name}
-                - Amount: ${investment_amount}
-                - Platform fee: ${platform_fee}
-                - Net investment: ${net_investment}
-
-                Thank you for your investment!
-
-                Best regards,
-                The B2D Ventures Team
-                """
+            context["recipient_name"] = investment.investor.username
+            return EmailTemplateRegistry.render("investment_investor", context)
         elif recipient_type == "startup":
-            subject = f"New Investment Received: {deal.name}"
-            body = f"""
-                Dear {deal.startup.username},
-
-                Great news! Your deal {deal.name} has received a new investment.
-
-                Investment details:
-                - Amount: ${net_investment} (after platform fee)
-                - Total amount_raised: ${deal.amount_raised}
-                - Total investors: {deal.investor_count}
-
-                Congratulations on your progress!
-
-                Best regards,
-                The B2D Ventures Team
-                """
+            context["recipient_name"] = deal.startup.username
+            context["amount_raised"] = deal.amount_raised
+            context["investor_count"] = deal.investor_count
+            return EmailTemplateRegistry.render("investment_startup", context)
         else:
             raise ValueError("Invalid recipient_type. Must be 'investor' or 'startup'.")
 
-        return subject, body
+    @staticmethod
+    def build_dataroom_access_content(investor, deal, dataroom_url, expires_at=None):
+        """Render the email giving an investor the dataroom link of a deal."""
+        return EmailTemplateRegistry.render(
+            "dataroom_access",
+            {
+                "recipient_name": investor.username,
+                "deal_name": deal.name,
+                "dataroom_url": dataroom_url,
+                "expires_at": expires_at,
+            },
+        )
+
+    @staticmethod
+    def build_investment_digest_content(
+        startup, investment_count, total_investment, deals, top_investments
+    ):
+        """
+        Render the email summarizing a startup's new investments.
+
+        :param startup: Startup receiving the digest
+        :param investment_count: Number of investments in the digest
+        :param total_investment: Sum of their net investments
+        :param deals: Dictionaries with name, investments, total,
+            amount_raised and investor_count for each deal
+        :param top_investments: Dictionaries with amount, investor and
+            deal_name, largest first
+        :return: RenderedEmail
+        """
+        return EmailTemplateRegistry.render(
+            "investment_digest",
+            {
+                "recipient_name": startup.username,
+                "investment_count": investment_count,
+                "total_investment": Decimal(total_investment).quantize(CENTS),
+                "deals": [
+                    dict(deal, total=Decimal(deal["total"]).quantize(CENTS))
+                    for deal in deals
+                ],
+                "top_investments": top_investments,
+            },
+        )
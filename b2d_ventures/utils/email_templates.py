@@ -0,0 +1,113 @@
+"""The module for compiling and rendering notification email templates."""
+
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+from django.template import Context, Engine
+
+EMAIL_TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "emails"
+
+RenderedEmail = namedtuple("RenderedEmail", ["subject", "text", "html"])
+
+
+class EmailTemplate:
+    """
+    A compiled notification: a subject line plus a plain-text and HTML body.
+
+    The three parts are parsed once; rendering only evaluates the compiled
+    node trees, so one instance can render any number of contexts.
+    """
+
+    def __init__(self, engine, name):
+        self.name = name
+        self.subject = engine.get_template(f"{name}/subject.txt")
+        self.text = engine.get_template(f"{name}/body.txt")
+        self.html = engine.get_template(f"{name}/body.html")
+
+    def render(self, context):
+        """
+        Render the notification for one recipient.
+
+        :param context: Dictionary of template variables
+        :return: RenderedEmail with subject, text and html
+        """
+        plain = Context(context, autoescape=False)
+        subject = " ".join(self.subject.render(plain).split())
+        text = self.text.render(plain).strip() + "\n"
+        html = self.html.render(Context(context))
+        return RenderedEmail(subject, text, html)
+
+    def render_many(self, contexts):
+        """
+        Render the notification for many recipients, e.g. for bulk sends.
+
+        :param contexts: Iterable of template variable dictionaries
+        :return: Generator of RenderedEmail
+        """
+        for context in contexts:
+            yield self.render(context)
+
+
+class EmailTemplateRegistry:
+    """
+    Process-wide registry of compiled notification templates.
+
+    Templates live in ``b2d_ventures/templates/emails/<name>/`` as
+    ``subject.txt``, ``body.txt`` and ``body.html``. Each is compiled the
+    first time it is requested and reused afterwards; parent templates used
+    through ``{% extends %}`` are cached by the engine's cached loader.
+    """
+
+    _engine = None
+    _templates = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get_engine(cls):
+        if cls._engine is None:
+            cls._engine = Engine(
+                dirs=[str(EMAIL_TEMPLATE_DIR)],
+                loaders=[
+                    (
+                        "django.template.loaders.cached.Loader",
+                        ["django.template.loaders.filesystem.Loader"],
+                    )
+                ],
+            )
+        return cls._engine
+
+    @classmethod
+    def get(cls, name):
+        """
+        Get the compiled template for a notification.
+
+        :param name: Template name, e.g. "deal_update"
+        :return: EmailTemplate
+        """
+        template = cls._templates.get(name)
+        if template is None:
+            with cls._lock:
+                template = cls._templates.get(name)
+                if template is None:
+                    template = EmailTemplate(cls._get_engine(), name)
+                    cls._templates[name] = template
+        return template
+
+    @classmethod
+    def render(cls, name, context):
+        """
+        Render a notification by template name.
+
+        :param name: Template name
+        :param context: Dictionary of template variables
+        :return: RenderedEmail
+        """
+        return cls.get(name).render(context)
+
+    @classmethod
+    def clear(cls):
+        """Drop every compiled template, e.g. after editing template files."""
+        with cls._lock:
+            cls._templates = {}
+            cls._engine = None
@@ -0,0 +1,85 @@
+"""Resizing of uploaded images into responsive variants.
+
+The functions here only use Pillow, so they can run in worker processes
+without Django being set up.
+"""
+
+import base64
+from io import BytesIO
+
+from PIL import Image, ImageFilter, ImageOps
+
+VARIANT_FORMATS = {"webp": "WEBP", "jpeg": "JPEG"}
+PLACEHOLDER_WIDTH = 16
+PLACEHOLDER_BLUR_RADIUS = 1
+
+
+def variant_widths(width, widths):
+    """
+    Get the widths to render for an image, without upscaling.
+
+    :param width: Width of the original image
+    :param widths: Configured target widths
+    :return: Sorted list of distinct widths no larger than the original
+    """
+    return sorted({min(target, width) for target in widths})
+
+
+def render_variants(data, widths, quality=80):
+    """
+    Render WebP and JPEG variants of an image and a blurred placeholder.
+
+    :param data: Bytes of the original image
+    :param widths: Target widths in pixels
+    :param quality: Encoder quality for the variants
+    :return: Dictionary with the original width and height, the placeholder
+        as a data URI, and a list of (format, width, bytes) variants
+    """
+    with Image.open(BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)
+        image.load()
+    width, height = image.size
+
+    variants = []
+    for target in variant_widths(width, widths):
+        resized = _resize(image, target)
+        for variant_format, pil_format in VARIANT_FORMATS.items():
+            variants.append(
+                (variant_format, target, _encode(resized, pil_format, quality))
+            )
+
+    placeholder = _resize(image, min(PLACEHOLDER_WIDTH, width)).filter(
+        ImageFilter.GaussianBlur(PLACEHOLDER_BLUR_RADIUS)
+    )
+    placeholder_data = base64.b64encode(_encode(placeholder, "WEBP", 30)).decode()
+    return {
+        "width": width,
+        "height": height,
+        "placeholder": f"data:image/webp;base64,{placeholder_data}",
+        "variants": variants,
+    }
+
+
+def _resize(image, width):
+    if width == image.width:
+        return image
+    height = max(round(image.height * width / image.width), 1)
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def _encode(image, pil_format, quality):
+    if pil_format == "JPEG" and image.mode != "RGB":
+        image = _flatten(image)
+    elif image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA")
+    buffer = BytesIO()
+    image.save(buffer, pil_format, quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def _flatten(image):
+    """Composite transparent images onto white, since JPEG has no alpha."""
+    image = image.convert("RGBA")
+    background = Image.new("RGB", image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel("A"))
+    return background
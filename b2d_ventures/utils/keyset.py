@@ -0,0 +1,22 @@
+"""Keyset pagination over primary keys, for jobs that walk large tables."""
+
+
+def keyset_chunks(queryset, size):
+    """
+    Page through the ids of a queryset by keyset.
+
+    Each page is fetched with ``id > last id of the previous page``, so no
+    page rescans the rows before it, as OFFSET would.
+
+    :param queryset: ``values_list("id", flat=True)`` queryset ordered by id
+    :param size: Number of ids per page
+    :return: Generator of lists of ids
+    """
+    last = None
+    while True:
+        page = queryset if last is None else queryset.filter(id__gt=last)
+        chunk = list(page[:size])
+        if not chunk:
+            return
+        yield chunk
+        last = chunk[-1]
@@ -0,0 +1,210 @@
+"""Versioned read-through cache of model instances.
+
+Each cached row has a version key, ``model:<label>:<pk>:version``, and its
+instance is stored under a key that embeds the current version. Saving or
+deleting the row increments the version, so invalidation is one atomic
+``incr`` no matter how many entries were derived from the row; entries
+under old versions are never read again and expire on their own.
+
+The versions live in the configured cache, so invalidations only reach
+every gunicorn worker when CACHES points at a shared backend (file or
+Redis). With a local-memory cache a worker would keep serving a row
+another worker changed, so rows are then read from the database instead.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from b2d_ventures.utils.db_router import use_primary
+
+KEY_PREFIX = "model"
+CACHED_MODELS = ("app.deal", "app.startup", "app.investor")
+# Backends whose entries are private to each process.
+PROCESS_LOCAL_BACKENDS = (LocMemCache, DummyCache)
+
+
+def is_shared():
+    """
+    Check whether the default cache is shared by all worker processes.
+
+    :return: False for local-memory and dummy caches, True otherwise
+    """
+    return not isinstance(caches["default"], PROCESS_LOCAL_BACKENDS)
+
+
+def _version_label(model):
+    """
+    Get the label that versions of a model's rows are kept under.
+
+    Startup and Investor rows extend a User row with the same primary key,
+    so they share the User's version and saving either side invalidates
+    both.
+    """
+    parents = model._meta.get_parent_list()
+    root = parents[-1] if parents else model._meta.concrete_model
+    return root._meta.label_lower
+
+
+class ModelCache:
+    """
+    Process-wide cache of Deal, Startup and Investor rows.
+
+    get() reads through the cache and counts hits and misses per model;
+    rows are invalidated by the save and delete signals connected in
+    connect_signals(). Without a shared cache, see is_shared(), get()
+    reads from the database and counts a bypass.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def get(self, model, pk, related=()):
+        """
+        Get a row by primary key, from the cache if possible.
+
+        :param model: Model class, one of CACHED_MODELS
+        :param pk: Primary key
+        :param related: Names of foreign keys to fill from the cache too
+        :return: Model instance
+        :raises model.DoesNotExist: If there is no such row
+        """
+        label = model._meta.label_lower
+        if not is_shared():
+            self._count(label, "bypasses")
+            return model.objects.select_related(*related).get(pk=pk)
+        try:
+            entry_key = f"{KEY_PREFIX}:{label}:{pk}:{self.version(model, pk)}"
+            instance = cache.get(entry_key)
+        except Exception as e:
+            logging.warning(f"Model cache unavailable: {e}")
+            self._count(label, "errors")
+            entry_key, instance = None, None
+
+        if instance is None:
+            self._count(label, "misses")
+            # A lagging replica could fill the new version with the old row.
+            with use_primary():
+                instance = model.objects.get(pk=pk)
+            if entry_key is not None:
+                try:
+                    cache.set(entry_key, instance, settings.MODEL_CACHE_TIMEOUT)
+                except Exception as e:
+                    logging.warning(f"Model cache unavailable: {e}")
+                    self._count(label, "errors")
+        else:
+            self._count(label, "hits")
+
+        for name in related:
+            field = model._meta.get_field(name)
+            related_pk = getattr(instance, field.attname)
+            if related_pk is not None:
+                setattr(instance, name, self.get(field.related_model, related_pk))
+        return instance
+
+    def version(self, model, pk):
+        """
+        Get the current version of a row, for keys of data derived from it.
+
+        :param model: Model class of the row
+        :param pk: Primary key of the row
+        :return: Version number
+        """
+        key = self._version_key(model, pk)
+        version = cache.get(key)
+        if version is None:
+            version = self._new_version(key)
+        return version
+
+    def invalidate(self, model, pk):
+        """
+        Make the cached entries of a row stale.
+
+        :param model: Model class of the row
+        :param pk: Primary key of the row
+        """
+        key = self._version_key(model, pk)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # No version yet, so nothing of the row is cached.
+            pass
+        except Exception as e:
+            logging.warning(f"Could not invalidate model cache {key}: {e}")
+            self._count(model._meta.label_lower, "errors")
+            return
+        self._count(model._meta.label_lower, "invalidations")
+
+    def metrics(self):
+        """
+        Get the hit and miss counters of this process.
+
+        :return: Dictionary of model label to hits, misses, bypasses,
+            invalidations, errors and hit_rate
+        """
+        with self._lock:
+            counters = {label: dict(counts) for label, counts in self._counters.items()}
+        for counts in counters.values():
+            reads = counts["hits"] + counts["misses"]
+            counts["hit_rate"] = round(counts["hits"] / reads, 4) if reads else None
+        return counters
+
+    def reset_metrics(self):
+        """Zero the counters."""
+        with self._lock:
+            self._counters = {}
+
+    def _count(self, label, counter):
+        with self._lock:
+            counts = self._counters.setdefault(
+                label,
+                {
+                    "hits": 0,
+                    "misses": 0,
+                    "bypasses": 0,
+                    "invalidations": 0,
+                    "errors": 0,
+                },
+            )
+            counts[counter] += 1
+
+    @staticmethod
+    def _version_key(model, pk):
+        return f"{KEY_PREFIX}:{_version_label(model)}:{pk}:version"
+
+    @staticmethod
+    def _new_version(key):
+        # Start from the clock rather than 1, so entries written under an
+        # evicted version key are not picked up again.
+        version = time.time_ns()
+        if cache.add(key, version, timeout=None):
+            return version
+        return cache.get(key, version)
+
+
+model_cache = ModelCache()
+
+
+def _invalidate(sender, instance, **kwargs):
+    if sender._meta.label_lower not in CACHED_MODELS + ("app.user",):
+        return
+    model_cache.invalidate(sender, instance.pk)
+    # A reader may have cached the old row between the save and the commit,
+    # so the version is bumped again once the change is visible.
+    transaction.on_commit(
+        lambda: model_cache.invalidate(sender, instance.pk), robust=True
+    )
+
+
+def connect_signals():
+    """Invalidate cached rows whenever they are saved or deleted."""
+    post_save.connect(_invalidate, dispatch_uid="model_cache_save")
+    post_delete.connect(_invalidate, dispatch_uid="model_cache_delete")
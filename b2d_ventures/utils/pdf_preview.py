@@ -0,0 +1,123 @@
+"""Extraction of page text and a preview thumbnail from PDF datarooms.
+
+The functions here only use pypdfium2 and Pillow, so they can run in worker
+processes without Django being set up. Datarooms are untrusted input, so
+workers cap their own memory with limit_memory() and each file's CPU time
+with run_with_cpu_limit().
+"""
+
+import logging
+import re
+from io import BytesIO
+
+import pypdfium2 as pdfium
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def limit_memory(max_bytes):
+    """
+    Cap the address space of the current process.
+
+    Used as the worker initializer, so a PDF that makes the parser allocate
+    without bound fails with MemoryError instead of starving the host.
+
+    :param max_bytes: Limit in bytes, or 0 for none
+    """
+    if not max_bytes or resource is None:
+        return
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (max_bytes, max_bytes))
+    except (ValueError, OSError) as e:
+        logging.warning(f"Could not limit dataroom worker memory: {e}")
+
+
+def run_with_cpu_limit(seconds, function, *args):
+    """
+    Call a function, killing the process if it uses too much CPU time.
+
+    The soft RLIMIT_CPU is raised to the CPU time used so far plus
+    ``seconds``; exceeding it sends SIGXCPU, which ends the worker even
+    while PDFium is busy in native code. The limit is lifted afterwards.
+
+    :param seconds: CPU seconds allowed for this call
+    :param function: Function to call
+    :return: The function's return value
+    """
+    if resource is None:
+        return function(*args)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = int(usage.ru_utime + usage.ru_stime) + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    try:
+        resource.setrlimit(resource.RLIMIT_CPU, (used + seconds, hard))
+    except (ValueError, OSError) as e:
+        logging.warning(f"Could not limit dataroom worker CPU time: {e}")
+    try:
+        return function(*args)
+    finally:
+        resource.setrlimit(resource.RLIMIT_CPU, (resource.RLIM_INFINITY, hard))
+
+
+def normalize_text(text):
+    """
+    Collapse runs of whitespace, including PDF line breaks, to single spaces.
+
+    :param text: Extracted text
+    :return: Normalized text
+    """
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def extract_pdf(path, max_pages, max_page_chars, thumbnail_width, quality=70):
+    """
+    Extract the page count, page text and a first-page thumbnail of a PDF.
+
+    The file is opened by path, so pdfium reads the pages it needs rather
+    than a copy of the whole PDF.
+
+    :param path: Path of the PDF file
+    :param max_pages: Pages whose text is extracted; later pages are only
+        counted
+    :param max_page_chars: Characters of text kept per page
+    :param thumbnail_width: Width of the thumbnail in pixels
+    :param quality: WebP quality of the thumbnail
+    :return: Dictionary with page_count, pages (list of text per page) and
+        the thumbnail as WebP bytes
+    """
+    pdf = pdfium.PdfDocument(path)
+    try:
+        page_count = len(pdf)
+        pages = []
+        thumbnail = None
+        for index in range(min(page_count, max_pages)):
+            page = pdf[index]
+            try:
+                text_page = page.get_textpage()
+                try:
+                    text = text_page.get_text_range()
+                finally:
+                    text_page.close()
+                pages.append(normalize_text(text)[:max_page_chars])
+                if index == 0:
+                    thumbnail = _render_thumbnail(page, thumbnail_width, quality)
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+    return {"page_count": page_count, "pages": pages, "thumbnail": thumbnail}
+
+
+def _render_thumbnail(page, width, quality):
+    page_width, _ = page.get_size()
+    if page_width <= 0:
+        return None
+    image = page.render(scale=width / page_width).to_pil()
+    buffer = BytesIO()
+    image.convert("RGB").save(buffer, "WEBP", quality=quality)
+    return buffer.getvalue()
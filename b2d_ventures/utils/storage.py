@@ -0,0 +1,254 @@
+"""Pluggable, deduplicating storage backends for uploaded media.
+
+MEDIA_STORAGE_BACKEND selects where deal images and datarooms are kept:
+
+* ``cloudinary`` (default): Cloudinary, skipping uploads whose content was
+  uploaded before.
+* ``local``: content-addressed files under MEDIA_STORAGE_LOCAL_ROOT, so
+  development, CI and benchmarks run offline.
+
+Both backends hash each upload with SHA-256 and record it in the
+``StoredBlob`` hash index. Every save is a reference to the content and
+every delete releases one; the content itself is removed with its last
+reference.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+
+from cloudinary_storage.storage import MediaCloudinaryStorage, RawMediaCloudinaryStorage
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils.deconstruct import deconstructible
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_content(content):
+    """
+    Compute the SHA-256 of a file without loading it into memory.
+
+    :param content: Django File or file-like object; it is rewound
+    :return: Tuple of the hex digest and the size in bytes
+    """
+    digest = hashlib.sha256()
+    size = 0
+    if hasattr(content, "seek"):
+        content.seek(0)
+    chunks = content.chunks(HASH_CHUNK_SIZE) if hasattr(content, "chunks") else None
+    for chunk in chunks or iter(lambda: content.read(HASH_CHUNK_SIZE), b""):
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        digest.update(chunk)
+        size += len(chunk)
+    if hasattr(content, "seek"):
+        content.seek(0)
+    return digest.hexdigest(), size
+
+
+def _get_blob(backend, sha256):
+    from b2d_ventures.app.models import StoredBlob
+
+    return StoredBlob.objects.filter(backend=backend, sha256=sha256).first()
+
+
+def _record_blob(backend, sha256, size, name):
+    from b2d_ventures.app.models import StoredBlob
+
+    try:
+        with transaction.atomic():
+            return StoredBlob.objects.create(
+                backend=backend, sha256=sha256, size=size, name=name
+            )
+    except IntegrityError:
+        return _get_blob(backend, sha256)
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Local storage keeping each distinct file content once.
+
+    The content lives in ``blobs/<aa>/<sha256>``; every saved name is a hard
+    link to its blob, so reads, paths and URLs behave like plain
+    FileSystemStorage while identical uploads take no extra space. The link
+    count of a blob is its reference count: each save adds a name, and the
+    blob is removed once the last name linking to it is deleted.
+    """
+
+    BACKEND = "local"
+
+    def blob_path(self, sha256):
+        """
+        Get the path of the blob holding some content.
+
+        :param sha256: Hex SHA-256 of the content
+        :return: Absolute path
+        """
+        return os.path.join(self.location, "blobs", sha256[:2], sha256)
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            from django.core.files import File
+
+            content = File(content, name)
+        name = name.replace("\\", "/")
+
+        sha256, size = self._store_blob(content)
+        blob = self.blob_path(sha256)
+        name = self.get_available_name(name, max_length=max_length)
+        path = self.path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            os.link(blob, path)
+        except OSError:
+            # A copy would not count as a reference, so it would never be
+            # deleted with the blob; hard links are required.
+            if os.stat(blob).st_nlink == 1:
+                os.remove(blob)
+            raise
+        if _get_blob(self.BACKEND, sha256) is None:
+            _record_blob(self.BACKEND, sha256, size, name)
+        return name
+
+    def delete(self, name):
+        path = self.path(name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return
+        # With two links the other one is the blob, which goes with this name.
+        sha256 = None
+        if stat.st_nlink == 2:
+            with self.open(name, "rb") as file:
+                sha256, _ = hash_content(file)
+        super().delete(name)
+
+        if sha256 is not None:
+            blob = self.blob_path(sha256)
+            try:
+                blob_stat = os.stat(blob)
+            except FileNotFoundError:
+                return
+            if (blob_stat.st_ino, blob_stat.st_dev) != (stat.st_ino, stat.st_dev):
+                return
+            os.remove(blob)
+            from b2d_ventures.app.models import StoredBlob
+
+            StoredBlob.objects.filter(backend=self.BACKEND, sha256=sha256).delete()
+
+    def _store_blob(self, content):
+        """Stream the content into a temporary file while hashing it."""
+        tmp_dir = os.path.join(self.location, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        content.seek(0)
+        with tempfile.NamedTemporaryFile(dir=tmp_dir, delete=False) as tmp:
+            for chunk in content.chunks(HASH_CHUNK_SIZE):
+                if isinstance(chunk, str):
+                    chunk = chunk.encode()
+                digest.update(chunk)
+                tmp.write(chunk)
+                size += len(chunk)
+        sha256 = digest.hexdigest()
+
+        blob = self.blob_path(sha256)
+        if os.path.exists(blob):
+            os.remove(tmp.name)
+        else:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            os.chmod(tmp.name, self.file_permissions_mode or 0o644)
+            os.replace(tmp.name, blob)
+        return sha256, size
+
+
+class DedupeCloudinaryStorageMixin:
+    """
+    Skip Cloudinary uploads of content that was uploaded before.
+
+    The SHA-256 of each upload is looked up in the hash index first; a hit
+    returns the existing public ID instead of uploading the file again and
+    counts one more reference to it. Deleting a name releases a reference,
+    and the Cloudinary file and its index row are deleted with the last one.
+    """
+
+    BACKEND = None
+
+    def _save(self, name, content):
+        from b2d_ventures.app.models import StoredBlob
+
+        sha256, size = hash_content(content)
+        uploaded = None
+        while True:
+            blob = _get_blob(self.BACKEND, sha256)
+            if blob is not None:
+                if StoredBlob.objects.filter(id=blob.id).update(
+                    references=F("references") + 1
+                ):
+                    if uploaded is not None:
+                        # The same content was uploaded concurrently.
+                        super().delete(uploaded)
+                    return blob.name
+                # Deleted since the lookup.
+                continue
+            if uploaded is None:
+                uploaded = super()._save(name, content)
+            try:
+                with transaction.atomic():
+                    StoredBlob.objects.create(
+                        backend=self.BACKEND, sha256=sha256, size=size, name=uploaded
+                    )
+                return uploaded
+            except IntegrityError:
+                continue
+
+    def delete(self, name):
+        from b2d_ventures.app.models import StoredBlob
+
+        blobs = StoredBlob.objects.filter(backend=self.BACKEND, name=name)
+        while blobs.exists():
+            if blobs.filter(references__gt=1).update(references=F("references") - 1):
+                logging.info(f"Keeping deduplicated Cloudinary file {name}")
+                return False
+            if blobs.filter(references__lte=1).delete()[0]:
+                break
+        return super().delete(name)
+
+
+@deconstructible
+class DedupeMediaCloudinaryStorage(
+    DedupeCloudinaryStorageMixin, MediaCloudinaryStorage
+):
+    BACKEND = "cloudinary_media"
+
+
+@deconstructible
+class DedupeRawMediaCloudinaryStorage(
+    DedupeCloudinaryStorageMixin, RawMediaCloudinaryStorage
+):
+    BACKEND = "cloudinary_raw"
+
+
+def media_storage():
+    """Storage for deal images, selected by MEDIA_STORAGE_BACKEND."""
+    if settings.MEDIA_STORAGE_BACKEND == "local":
+        return ContentAddressedStorage(
+            location=settings.MEDIA_STORAGE_LOCAL_ROOT, base_url=settings.MEDIA_URL
+        )
+    return DedupeMediaCloudinaryStorage()
+
+
+def raw_media_storage():
+    """Storage for datarooms and other non-image files."""
+    if settings.MEDIA_STORAGE_BACKEND == "local":
+        return ContentAddressedStorage(
+            location=settings.MEDIA_STORAGE_LOCAL_ROOT, base_url=settings.MEDIA_URL
+        )
+    return DedupeRawMediaCloudinaryStorage()
@@ -6,6 +6,7 @@ from b2d_ventures.app.views import (
     AdminViewSet,
     StartupViewSet,
     InvestorViewSet,
+    DataroomViewSet,
 )
 
 if settings.DEBUG:
@@ -17,6 +18,7 @@ router.register("auths", AuthViewSet, basename="auth")
 router.register("admin", AdminViewSet, basename="admin")
 router.register("startup", StartupViewSet, basename="startup")
 router.register("investor", InvestorViewSet, basename="investor")
+router.register("datarooms", DataroomViewSet, basename="dataroom")
 
 app_name = "api"
 urlpatterns = router.urls
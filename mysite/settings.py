@@ -2,8 +2,11 @@ import os
 from pathlib import Path
 from datetime import timedelta
 
+import django
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 import dj_database_url
+from corsheaders.defaults import default_headers
 
 # Build paths inside the project like this: ROOT_DIR / 'subdir'.
 ROOT_DIR = Path(__file__).resolve(strict=True).parent.parent
@@ -55,6 +58,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "b2d_ventures.utils.db_router.ReplicaPinningMiddleware",
 ]
 
 ROOT_URLCONF = "mysite.urls"
@@ -94,6 +98,53 @@ else:
             "NAME": str(ROOT_DIR / "db.sqlite3"),
         }
     }
+# Read replicas, as comma-separated database URLs. The reads of GET requests
+# go to a replica, unless the request or, within REPLICA_PIN_SECONDS, the same
+# client wrote (see b2d_ventures.utils.db_router). Set REPLICA_PIN_SECONDS
+# above the replication lag.
+DATABASE_REPLICA_URLS = [
+    url.strip()
+    for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+    if url.strip()
+]
+for index, url in enumerate(DATABASE_REPLICA_URLS):
+    DATABASES[f"replica_{index}"] = {
+        **dj_database_url.parse(url, conn_max_age=600, conn_health_checks=True),
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["b2d_ventures.utils.db_router.ReplicaRouter"]
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", 5))
+# Postgres connection pools (psycopg 3), instead of a persistent connection per
+# worker thread. Each process keeps DATABASE_POOL_MIN_SIZE to
+# DATABASE_POOL_MAX_SIZE connections per database, requests wait up to
+# DATABASE_POOL_TIMEOUT seconds for a free one, connections idle for
+# DATABASE_POOL_MAX_IDLE seconds are closed and all are replaced after
+# DATABASE_POOL_MAX_LIFETIME. With DATABASE_POOL_HEALTH_CHECKS, connections are
+# checked before they are handed out. Usage is served at
+# /api/admin/db/pool/metrics/. Pools need Django 5.1 or later.
+DATABASE_POOL = os.getenv("DATABASE_POOL", "False") == "True"
+DATABASE_POOL_HEALTH_CHECKS = os.getenv("DATABASE_POOL_HEALTH_CHECKS", "True") == "True"
+DATABASE_POOL_OPTIONS = {
+    "min_size": int(os.getenv("DATABASE_POOL_MIN_SIZE", 2)),
+    "max_size": int(os.getenv("DATABASE_POOL_MAX_SIZE", 10)),
+    "timeout": float(os.getenv("DATABASE_POOL_TIMEOUT", 10)),
+    "max_idle": float(os.getenv("DATABASE_POOL_MAX_IDLE", 600)),
+    "max_lifetime": float(os.getenv("DATABASE_POOL_MAX_LIFETIME", 3600)),
+}
+if DATABASE_POOL and django.VERSION < (5, 1):
+    raise ImproperlyConfigured(
+        f"DATABASE_POOL requires Django 5.1 or later, found {django.get_version()}"
+    )
+if DATABASE_POOL:
+    for alias, database in DATABASES.items():
+        if database["ENGINE"] == "django.db.backends.postgresql":
+            # Connections go back to the pool at the end of each request.
+            database["CONN_MAX_AGE"] = 0
+            database["CONN_HEALTH_CHECKS"] = DATABASE_POOL_HEALTH_CHECKS
+            database.setdefault("OPTIONS", {})["pool"] = {
+                **DATABASE_POOL_OPTIONS,
+                "name": alias,
+            }
 # DATABASES = {
 #     'default': {
 #         'ENGINE': os.getenv('DB_ENGINE', 'django.db.backends.sqlite3'),
@@ -198,6 +249,16 @@ CORS_ALLOWED_ORIGINS = [
     "https://b2d-ventures.vercel.app",
     "http://localhost:3000",
 ]
+# Resumable dataroom uploads report and take offsets in Upload-Offset, and
+# conditional GETs are revalidated with ETag and Last-Modified.
+CORS_ALLOW_HEADERS = (
+    *default_headers,
+    "upload-offset",
+    "if-none-match",
+    "if-modified-since",
+    "x-primary-pin-until",
+)
+CORS_EXPOSE_HEADERS = ["Upload-Offset", "ETag", "Last-Modified", "X-Primary-Pin-Until"]
 
 SPECTACULAR_SETTINGS = {
     "TITLE": "B2D-Ventures API",
@@ -212,6 +273,117 @@ TOKEN_URL = os.getenv("TOKEN_URL", "")
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID", "")
 GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET", "")
 REDIRECT_URI = os.getenv("REDIRECT_URI", "")
+GOOGLE_JWKS_URL = os.getenv(
+    "GOOGLE_JWKS_URL", "https://www.googleapis.com/oauth2/v3/certs"
+)
+GOOGLE_JWKS_CACHE_SECONDS = int(os.getenv("GOOGLE_JWKS_CACHE_SECONDS", 6 * 60 * 60))
+GOOGLE_JWKS_MIN_REFRESH_SECONDS = int(os.getenv("GOOGLE_JWKS_MIN_REFRESH_SECONDS", 60))
+GOOGLE_ID_TOKEN_LEEWAY_SECONDS = int(os.getenv("GOOGLE_ID_TOKEN_LEEWAY_SECONDS", 30))
+
+# Meeting scheduling: when async, requests are answered with 202 and the
+# Google Calendar work is done by `python manage.py sync_meetings`.
+MEETING_SYNC_ASYNC = os.getenv("MEETING_SYNC_ASYNC", "False") == "True"
+MEETING_SYNC_MAX_ATTEMPTS = int(os.getenv("MEETING_SYNC_MAX_ATTEMPTS", 5))
+MEETING_SYNC_RETRY_BASE_SECONDS = int(os.getenv("MEETING_SYNC_RETRY_BASE_SECONDS", 30))
+MEETING_SYNC_RETRY_MAX_SECONDS = int(os.getenv("MEETING_SYNC_RETRY_MAX_SECONDS", 3600))
+MEETING_SYNC_LEASE_SECONDS = int(os.getenv("MEETING_SYNC_LEASE_SECONDS", 300))
+
+# Incremental Google Calendar sync (`python manage.py sync_calendars`). A full
+# resync after a sync token reset only looks back this many days and pages.
+CALENDAR_SYNC_PAGE_SIZE = int(os.getenv("CALENDAR_SYNC_PAGE_SIZE", 250))
+CALENDAR_FULL_SYNC_DAYS = int(os.getenv("CALENDAR_FULL_SYNC_DAYS", 30))
+CALENDAR_FULL_SYNC_MAX_PAGES = int(os.getenv("CALENDAR_FULL_SYNC_MAX_PAGES", 20))
+# Number of investors whose calendars are written concurrently by the admin
+# bulk-scheduling endpoint.
+CALENDAR_BULK_CONCURRENCY = int(os.getenv("CALENDAR_BULK_CONCURRENCY", 4))
+
+# Investment digests for startups that opted in (`python manage.py
+# send_investment_digests`, run once per digest window).
+INVESTMENT_DIGEST_TOP_INVESTMENTS = int(
+    os.getenv("INVESTMENT_DIGEST_TOP_INVESTMENTS", 5)
+)
+INVESTMENT_DIGEST_INTERVAL_SECONDS = int(
+    os.getenv("INVESTMENT_DIGEST_INTERVAL_SECONDS", 3600)
+)
+
+# Signed dataroom download links. Access rows are written by a background
+# thread unless DATAROOM_ACCESS_LOG_ASYNC is disabled.
+DATAROOM_LINK_TTL_SECONDS = int(os.getenv("DATAROOM_LINK_TTL_SECONDS", 60 * 60))
+DATAROOM_ACCESS_LOG_ASYNC = os.getenv("DATAROOM_ACCESS_LOG_ASYNC", "True") == "True"
+
+# Chunked dataroom uploads. Chunks are appended to a staging file under
+# DATAROOM_UPLOAD_STAGING_DIR, which must be shared by all web workers.
+DATAROOM_UPLOAD_MAX_BYTES = int(os.getenv("DATAROOM_UPLOAD_MAX_BYTES", 200 * 1024**2))
+DATAROOM_UPLOAD_CHUNK_MAX_BYTES = int(
+    os.getenv("DATAROOM_UPLOAD_CHUNK_MAX_BYTES", 5 * 1024**2)
+)
+DATAROOM_UPLOAD_TTL_SECONDS = int(os.getenv("DATAROOM_UPLOAD_TTL_SECONDS", 24 * 3600))
+DATAROOM_UPLOAD_STAGING_DIR = os.getenv(
+    "DATAROOM_UPLOAD_STAGING_DIR", os.path.join(MEDIA_ROOT, "uploads")
+)
+
+# Responsive deal images: each upload is resized to these widths as WebP and
+# JPEG by a pool of DEAL_IMAGE_WORKERS processes after the request commits.
+DEAL_IMAGE_WIDTHS = [
+    int(width) for width in os.getenv("DEAL_IMAGE_WIDTHS", "320,640,1280").split(",")
+]
+DEAL_IMAGE_QUALITY = int(os.getenv("DEAL_IMAGE_QUALITY", 80))
+DEAL_IMAGE_WORKERS = int(os.getenv("DEAL_IMAGE_WORKERS", 2))
+DEAL_IMAGE_VARIANTS_ASYNC = os.getenv("DEAL_IMAGE_VARIANTS_ASYNC", "True") == "True"
+
+# Dataroom previews: page text and a first-page thumbnail are extracted by a
+# pool of DATAROOM_INDEX_WORKERS processes, each capped to
+# DATAROOM_INDEX_MEMORY_BYTES of memory and DATAROOM_INDEX_CPU_SECONDS per file.
+DATAROOM_INDEX_ASYNC = os.getenv("DATAROOM_INDEX_ASYNC", "True") == "True"
+DATAROOM_INDEX_WORKERS = int(os.getenv("DATAROOM_INDEX_WORKERS", 2))
+DATAROOM_INDEX_CPU_SECONDS = int(os.getenv("DATAROOM_INDEX_CPU_SECONDS", 30))
+DATAROOM_INDEX_MEMORY_BYTES = int(os.getenv("DATAROOM_INDEX_MEMORY_BYTES", 1024**3))
+DATAROOM_INDEX_MAX_PAGES = int(os.getenv("DATAROOM_INDEX_MAX_PAGES", 500))
+DATAROOM_PAGE_TEXT_MAX_CHARS = int(os.getenv("DATAROOM_PAGE_TEXT_MAX_CHARS", 20000))
+DATAROOM_SEARCH_TEXT_MAX_CHARS = int(
+    os.getenv("DATAROOM_SEARCH_TEXT_MAX_CHARS", 200000)
+)
+DATAROOM_THUMBNAIL_WIDTH = int(os.getenv("DATAROOM_THUMBNAIL_WIDTH", 320))
+
+# Cache: "locmem" (the default, private to each process), "file" (a directory
+# shared by the workers on one host) or "redis" (any Redis-compatible server,
+# CACHE_LOCATION is its redis:// URL). Model cache invalidations only reach
+# other workers through a shared backend, so the model cache is bypassed and
+# rows are read from the database unless CACHE_BACKEND is "file" or "redis".
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "locmem")
+CACHE_BACKENDS = {
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "b2d-ventures"),
+    "file": (
+        "django.core.cache.backends.filebased.FileBasedCache",
+        "/var/tmp/b2d-ventures-cache",
+    ),
+    "redis": ("django.core.cache.backends.redis.RedisCache", "redis://localhost:6379"),
+}
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND][0],
+        "LOCATION": os.getenv("CACHE_LOCATION", CACHE_BACKENDS[CACHE_BACKEND][1]),
+        "KEY_PREFIX": os.getenv("CACHE_KEY_PREFIX", "b2d"),
+        "TIMEOUT": int(os.getenv("CACHE_TIMEOUT_SECONDS", 300)),
+    }
+}
+# Deal, Startup and Investor rows read through b2d_ventures.utils.model_cache
+# when the cache is shared.
+MODEL_CACHE_TIMEOUT = int(os.getenv("MODEL_CACHE_TIMEOUT", 600))
+# With a shared cache, serialized deal payloads are kept DEAL_CACHE_TIMEOUT
+# seconds and refreshed early with a probability scaled by
+# DEAL_CACHE_EARLY_REFRESH_BETA. A missing payload is rebuilt by one request
+# while the others wait for it, for up to DEAL_CACHE_LOCK_SECONDS.
+DEAL_CACHE_TIMEOUT = int(os.getenv("DEAL_CACHE_TIMEOUT", 300))
+DEAL_CACHE_EARLY_REFRESH_BETA = float(os.getenv("DEAL_CACHE_EARLY_REFRESH_BETA", 1))
+DEAL_CACHE_LOCK_SECONDS = int(os.getenv("DEAL_CACHE_LOCK_SECONDS", 10))
+
+# Closed and rejected deals that ended more than ARCHIVE_AFTER_DAYS ago are
+# moved, with their investments, to the archive tables by the archive_deals
+# command, as are meetings that ended as long ago.
+# Each transaction moves at most ARCHIVE_BATCH_SIZE deals or meetings.
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", 365))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", 200))
 
 # ALLOWED_HOSTS configuration
 ALLOWED_HOSTS = os.getenv("DJANGO_ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
@@ -228,6 +400,16 @@ SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
 SMTP_PORT = os.getenv("SMTP_PORT", 587)
 SMTP_USER = os.getenv("SMTP_USER", "")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
+# Outgoing email is sent by a background pool of EMAIL_SENDER_WORKERS threads
+# sharing SMTP sessions, at most EMAIL_SEND_RATE messages per second (bursts
+# of EMAIL_SEND_BURST) and EMAIL_DOMAIN_CONCURRENCY per recipient domain.
+EMAIL_SENDER_WORKERS = int(os.getenv("EMAIL_SENDER_WORKERS", 4))
+EMAIL_SEND_RATE = float(os.getenv("EMAIL_SEND_RATE", 5))
+EMAIL_SEND_BURST = int(os.getenv("EMAIL_SEND_BURST", 10))
+EMAIL_DOMAIN_CONCURRENCY = int(os.getenv("EMAIL_DOMAIN_CONCURRENCY", 2))
+EMAIL_SEND_MAX_ATTEMPTS = int(os.getenv("EMAIL_SEND_MAX_ATTEMPTS", 4))
+EMAIL_SEND_RETRY_BASE_SECONDS = float(os.getenv("EMAIL_SEND_RETRY_BASE_SECONDS", 2))
+EMAIL_SEND_RETRY_MAX_SECONDS = float(os.getenv("EMAIL_SEND_RETRY_MAX_SECONDS", 300))
 
 # Cloudinary credentials
 CLOUDINARY_STORAGE = {
@@ -238,6 +420,13 @@ CLOUDINARY_STORAGE = {
 # Set Cloudinary as the default file storage
 DEFAULT_FILE_STORAGE = "cloudinary_storage.storage.MediaCloudinaryStorage"
 
+# Storage for deal images and datarooms: "cloudinary", or "local" to keep
+# content-addressed files under MEDIA_STORAGE_LOCAL_ROOT (offline dev, CI
+# and benchmarks). Both skip storing content that was uploaded before, and
+# delete it with the last saved name referring to it.
+MEDIA_STORAGE_BACKEND = os.getenv("MEDIA_STORAGE_BACKEND", "cloudinary")
+MEDIA_STORAGE_LOCAL_ROOT = os.getenv("MEDIA_STORAGE_LOCAL_ROOT", MEDIA_ROOT)
+
 # Encryption key
 FIELD_ENCRYPTION_KEY = os.getenv(
     "FIELD_ENCRYPTION_KEY", "C2BchIU-wIOZIbvLjz0rPoa8SFLESFwSTgl6zVvnErU="